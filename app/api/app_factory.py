@@ -0,0 +1,176 @@
+# app/api/app_factory.py
+"""
+FastAPI application factory.
+
+Routers are imported only for the router groups the settings select, the
+database engine is created when the app starts serving rather than at import,
+and optional UI extras are imported inside the factory. Importing this module
+therefore costs little more than FastAPI itself.
+"""
+import importlib
+import logging
+from contextlib import asynccontextmanager
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+
+from app.core.config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class RouterSpec(NamedTuple):
+    """Where a router lives and how it is mounted."""
+    group: str
+    module: str
+    attribute: str
+    prefix: str
+    tags: List[str]
+
+
+# Mount order matters for routers sharing the bare /api/v1 prefix, so specs are
+# included in this order whichever groups are selected.
+ROUTER_SPECS: List[RouterSpec] = [
+    RouterSpec("world", "app.api.routes.world_routes", "router", "/api/v1/worlds", ["World"]),
+    RouterSpec("world", "app.api.routes.theme_routes", "router", "/api/v1/themes", ["Theme"]),
+    RouterSpec("settlements", "app.api.routes.settlement_routes", "router", "/api/v1/settlements", ["Settlement"]),
+    RouterSpec("characters", "app.api.routes.character_routes", "router", "/api/v1/characters", ["Character"]),
+    RouterSpec("resources", "app.api.routes.resource_routes", "router", "/api/v1/resources", ["Resource"]),
+    RouterSpec("characters", "app.api.routes.profession_routes", "router", "/api/v1/professions", ["Profession"]),
+    RouterSpec("characters", "app.api.routes.skill_definition_routes", "router", "/api/v1/skills", ["Skill"]),
+    RouterSpec("settlements", "app.api.routes.building_instance_routes", "router", "/api/v1/buildings", ["Buildings"]),
+    RouterSpec("settlements", "app.api.routes.building_blueprint_routes", "router", "/api/v1/building-blueprints", ["Building Blueprints"]),
+    RouterSpec("settlements", "app.api.routes.building_upgrade_blueprint_routes", "router", "/api/v1/building-upgrade-blueprints", ["Building Upgrade Blueprints"]),
+    RouterSpec("world", "app.api.routes.biome_routes", "router", "/api/v1/biomes", ["Biomes"]),
+    RouterSpec("world", "app.api.routes.zone_routes", "router", "/api/v1/zones", ["Zones"]),
+    RouterSpec("locations", "app.api.routes.location.location_type_routes", "router", "/api/v1/location-types", ["Location Types"]),
+    RouterSpec("locations", "app.api.routes.location.location_routes", "router", "/api/v1/locations", ["Locations"]),
+    RouterSpec("actions", "app.api.routes.action_routes", "router", "/api/v1", ["Actions"]),
+    RouterSpec("actions", "app.api.routes.action_template_routes", "router", "/api/v1/action-templates", ["Action Templates"]),
+    RouterSpec("actions", "app.api.routes.tool_tier_routes", "router", "/api/v1/tool-tiers", ["Tool Tiers"]),
+    RouterSpec("locations", "app.api.routes.location.location_sub_types", "router", "/api/v1/location-subtypes", ["Location Subtypes"]),
+    RouterSpec("resources", "app.api.routes.resource_node_blueprint_routes", "router", "/api/v1/resource-node-blueprints", ["Resource Node Blueprints"]),
+    RouterSpec("resources", "app.api.routes.resource_node_routes", "router", "/api/v1", ["Resource Nodes"]),
+    RouterSpec("economy", "app.api.routes.faction_routes", "router", "/api/v1", ["Factions"]),
+    RouterSpec("economy", "app.api.routes.pricing_routes", "router", "/api/v1/pricing", ["Pricing"]),
+    RouterSpec("search", "app.api.routes.search_routes", "router", "/api/v1/search", ["Search"]),
+]
+
+ROUTER_GROUPS: Dict[str, List[RouterSpec]] = {}
+for _spec in ROUTER_SPECS:
+    ROUTER_GROUPS.setdefault(_spec.group, []).append(_spec)
+
+
+def select_router_specs(groups: Optional[Iterable[str]] = None) -> List[RouterSpec]:
+    """Specs of the given groups in mount order; None selects every group."""
+    if groups is None:
+        return list(ROUTER_SPECS)
+    selected = set(groups)
+    unknown = selected - ROUTER_GROUPS.keys()
+    if unknown:
+        raise ValueError(f"Unknown router groups: {sorted(unknown)}. Known groups: {sorted(ROUTER_GROUPS)}")
+    return [spec for spec in ROUTER_SPECS if spec.group in selected]
+
+
+def include_routers(app: FastAPI, specs: Iterable[RouterSpec]) -> None:
+    """Import each spec's module and mount its router."""
+    for spec in specs:
+        router = getattr(importlib.import_module(spec.module), spec.attribute)
+        app.include_router(router, prefix=spec.prefix, tags=spec.tags)
+
+
+def add_compression(app: FastAPI, settings: Settings) -> None:
+    """Compress large responses for clients that accept it, as configured."""
+    method = settings.API_COMPRESSION.strip().lower()
+    if not method:
+        return
+    if method == "br":
+        try:
+            from brotli_asgi import BrotliMiddleware
+
+            app.add_middleware(BrotliMiddleware, minimum_size=settings.API_COMPRESSION_MINIMUM_SIZE, gzip_fallback=True)
+            return
+        except ImportError:
+            logger.warning("brotli-asgi is not installed; falling back to gzip compression")
+    elif method != "gzip":
+        raise ValueError(f"Unknown API_COMPRESSION {settings.API_COMPRESSION!r}; expected 'gzip', 'br' or ''")
+    app.add_middleware(GZipMiddleware, minimum_size=settings.API_COMPRESSION_MINIMUM_SIZE)
+
+
+def create_app(settings: Optional[Settings] = None, groups: Optional[Iterable[str]] = None) -> FastAPI:
+    """
+    Build the API application.
+
+    Args:
+        settings: Settings to build from; defaults to the process settings.
+        groups: Router groups to mount; defaults to settings.router_groups (all when unset).
+    """
+    settings = settings or get_settings()
+    specs = select_router_specs(groups if groups is not None else settings.router_groups)
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        from app.core.cache_invalidation import CacheInvalidationBus
+        from app.db.async_session import init_engine, dispose_engine, start_replica_probes
+
+        init_engine(settings)
+        start_replica_probes(settings)
+        CacheInvalidationBus.start_listener()
+        try:
+            yield
+        finally:
+            CacheInvalidationBus.stop()
+            await dispose_engine()
+
+    app = FastAPI(
+        docs_url=None,  # Disable default docs URL|
+        redoc_url=None,
+        lifespan=lifespan,
+    )
+    app.state.settings = settings
+    app.state.router_groups = sorted({spec.group for spec in specs})
+
+    if settings.API_SWAGGER_DARK:
+        try:
+            import fastapi_swagger_dark as fsd
+            # install the dark-mode plugin on the app
+            fsd.install(app)
+        except ImportError:
+            logger.warning("fastapi_swagger_dark is not installed; API docs are not served")
+
+    # CORS
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.cors_origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    add_compression(app, settings)
+
+    include_routers(app, specs)
+
+    @app.get("/status")
+    def status():
+        """Check the status of the API"""
+        return {"status": 200}
+
+    @app.get("/status/db")
+    def db_status():
+        """Request transaction metrics, read-replica routing and cache invalidation counters of this process"""
+        from app.core.cache_invalidation import CacheInvalidationBus
+        from app.db.async_session import get_replica_set
+        from app.db.transaction_metrics import TransactionMetrics
+
+        replicas = get_replica_set()
+        return {
+            "since": TransactionMetrics.since(),
+            "transactions": TransactionMetrics.get_stats(),
+            "replicas": dict(replicas.stats) if replicas else {},
+            "cache_invalidation": CacheInvalidationBus.get_stats(),
+        }
+
+    return app
@@ -0,0 +1,47 @@
+# app/api/responses.py
+"""
+Responses for pre-validated models.
+
+For a route with a response_model, FastAPI validates the returned value
+against it before serializing (older FastAPI versions then also run
+jsonable_encoder and json.dumps). Services already hand back validated
+schema models, so for large lists that work is repeated per row.
+
+`model_response(content, model_type)` serializes such models straight to
+JSON bytes with Pydantic's serializer for `model_type`, and returns a
+Response, which FastAPI passes through without touching response_model.
+Keep response_model on the route for the OpenAPI schema.
+"""
+from functools import lru_cache
+from typing import Any, Optional
+
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+
+
+@lru_cache(maxsize=256)
+def _adapter(model_type: Any) -> TypeAdapter:
+    return TypeAdapter(model_type)
+
+
+def dump_json(content: Any, model_type: Any) -> bytes:
+    """
+    Serialize content as `model_type` (e.g. List[LocationResponse]) without validating it.
+    Like response_model, only the fields of `model_type` are written, by alias.
+    """
+    return _adapter(model_type).dump_json(content, by_alias=True)
+
+
+def model_response(
+    content: Any,
+    model_type: Any,
+    status_code: int = 200,
+    headers: Optional[dict] = None,
+) -> Response:
+    """Response for pre-validated models; FastAPI skips response_model handling for it."""
+    return Response(
+        content=dump_json(content, model_type),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
@@ -14,6 +14,7 @@ from app.game_state.entities.action.character_action_pydantic import ActionStatu
 from app.game_state.repositories.action_repository import ActionRepository
 from app.game_state.repositories.character_repository import CharacterRepository  
 from app.game_state.managers.action_manager import ActionManager
+from app.game_state.services.world.calendar_service import CalendarService
 from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter(prefix="/characters", tags=["actions"])
@@ -26,6 +27,10 @@ async def get_character_repository(db: AsyncSession = Depends(get_async_db)) ->
     """Dependency to get character repository."""
     return CharacterRepository(db)
 
+async def get_calendar_service(db: AsyncSession = Depends(get_async_db)) -> CalendarService:
+    """Dependency to get calendar service."""
+    return CalendarService(db)
+
 async def get_action_manager(action_repo: ActionRepository = Depends(get_action_repository)) -> ActionManager:
     """Dependency to get action manager."""
     return ActionManager(action_repo)
@@ -36,7 +41,8 @@ async def create_character_action(
     action_request: CreateActionRequest,
     action_manager: ActionManager = Depends(get_action_manager),
     character_repo: CharacterRepository = Depends(get_character_repository),
-    action_repo: ActionRepository = Depends(get_action_repository)
+    action_repo: ActionRepository = Depends(get_action_repository),
+    calendar_service: CalendarService = Depends(get_calendar_service)
 ):
     """
     Create a new action for a character.
@@ -58,10 +64,12 @@ async def create_character_action(
     # Calculate duration if not provided
     duration = action_request.duration
     if duration is None:
+        snapshot = await calendar_service.get_snapshot(character.world_id)
         duration = action_manager.estimate_action_duration(
             character_id=character_id,
             action_type=action_request.action_type,
-            parameters=action_request.parameters
+            parameters=action_request.parameters,
+            season_name=snapshot.season_name if snapshot else None
         )
     
     # Create action entity
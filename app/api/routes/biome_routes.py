@@ -5,6 +5,7 @@ import uuid
 import logging
 
 from app.db.dependencies import get_async_db
+from app.api.responses import model_response
 from app.game_state.services.geography.biome_service import BiomeService
 from app.api.schemas.biome_schema import BiomeCreate, BiomeRead, BiomeUpdate
 from app.api.schemas.shared import PaginatedResponse
@@ -42,7 +43,8 @@ async def list_biomes(
     """
     try:
         biome_service = BiomeService(db=db)
-        return await biome_service.get_all_biomes_paginated(skip=skip, limit=limit)
+        page = await biome_service.get_all_biomes_paginated(skip=skip, limit=limit)
+        return model_response(page, PaginatedResponse[BiomeRead])
     except Exception as e:
         logging.exception(f"Error retrieving biomes: {e}")
         raise HTTPException(status_code=500, detail=f"Internal server error: {e}")
@@ -1,9 +1,11 @@
 from app.game_state.services.character.character_service import CharacterService
+from app.game_state.repositories.base_repository import ConcurrentUpdateError
 from app.game_state.enums.character import CharacterTypeEnum
 from app.api.schemas.character import CharacterCreate, CharacterTraitsUpdate, AddCharacterTraits
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.dependencies import get_async_db 
+from app.api.responses import model_response
 from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 from typing import Optional
@@ -106,7 +108,8 @@ async def get_characters_by_player(
         if not characters:
             return []
         
-        return [CharacterOutputResponse(character=character, message="Characters retrieved successfully") for character in characters]
+        responses = [CharacterOutputResponse(character=character, message="Characters retrieved successfully") for character in characters]
+        return model_response(responses, list[CharacterOutputResponse])
     except Exception as e:
         # Log the exception for debugging
         logging.exception(f"Error retrieving characters by player: {e}")
@@ -220,6 +223,9 @@ async def update_character_traits(
             raise HTTPException(status_code=404, detail="Failed to update character traits.")
         
         return {"message": "Character traits updated successfully.", "character": updated_character}
+    except ConcurrentUpdateError as e:
+        # The character changed between read and write; the client should reload and retry
+        raise HTTPException(status_code=409, detail=str(e))
     except ValueError as e:
         # Handle validation errors
         raise HTTPException(status_code=400, detail=str(e))
@@ -260,6 +266,9 @@ async def add_character_traits(
             raise HTTPException(status_code=404, detail="Failed to add character traits.")
         
         return {"message": "Traits added to character successfully.", "character": updated_character}
+    except ConcurrentUpdateError as e:
+        # The character changed between read and write; the client should reload and retry
+        raise HTTPException(status_code=409, detail=str(e))
     except ValueError as e:
         # Handle validation errors
         raise HTTPException(status_code=400, detail=str(e))
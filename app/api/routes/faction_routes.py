@@ -2,12 +2,19 @@
 API routes for factions.
 """
 import logging
-from typing import List
-from fastapi import APIRouter, Depends
+from typing import List, Literal, Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.dependencies import get_async_db
 from app.game_state.services.faction.faction_service import FactionService
-from app.api.schemas.faction_schema import FactionResponse, FactionCreate
+from app.game_state.services.faction.faction_influence_service import FactionInfluenceService
+from app.api.schemas.faction_schema import (
+    CharacterReputationsResponse,
+    FactionControlResponse,
+    FactionCreate,
+    FactionResponse,
+)
 
 
 router = APIRouter()
@@ -26,4 +33,30 @@ async def create_faction(
         faction_service = FactionService(db)
         faction = await faction_service.create_entity(faction_data.model_dump())
         logging.info(f"[FactionRoutes] Created faction: {faction.model_dump()}")
-        return FactionResponse.model_validate(faction.model_dump())
\ No newline at end of file
+        return FactionResponse.model_validate(faction.model_dump())
+
+@router.get("/factions/control/{world_id}", response_model=List[FactionControlResponse])
+async def get_faction_control(
+        world_id: UUID,
+        level: Literal["location", "zone", "world"] = Query("location", description="Aggregate per location, zone (parent location) or world"),
+        top_only: bool = Query(False, description="Only return the controlling faction of each scope"),
+        db: AsyncSession = Depends(get_async_db)):
+    influence_service = FactionInfluenceService(db)
+    return await influence_service.get_control(world_id, level, top_only)
+
+@router.post("/factions/control/{world_id}/refresh")
+async def refresh_faction_control(
+        world_id: UUID,
+        db: AsyncSession = Depends(get_async_db)):
+    influence_service = FactionInfluenceService(db)
+    updated = await influence_service.refresh_location_controllers(world_id)
+    return {"world_id": world_id, "locations_updated": updated}
+
+@router.get("/factions/reputations/{character_id}", response_model=CharacterReputationsResponse)
+async def get_character_reputations(
+        character_id: UUID,
+        faction_ids: Optional[List[UUID]] = Query(None, description="Only these factions; missing ones are neutral"),
+        db: AsyncSession = Depends(get_async_db)):
+    influence_service = FactionInfluenceService(db)
+    reputations = await influence_service.get_reputations(character_id, faction_ids)
+    return CharacterReputationsResponse(character_id=character_id, reputations=reputations)
@@ -10,6 +10,7 @@ from typing import Dict, Any
 from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 from app.db.dependencies import get_async_db
+from app.api.responses import model_response
 from app.api.schemas.location import (
     LocationCreate,
     LocationUpdate,
@@ -74,7 +75,8 @@ async def get_locations(
 
     locations = await location_service.find_all()
 
-    return [await build_location_response(loc, location_service) for loc in locations]
+    responses = [await build_location_response(loc, location_service) for loc in locations]
+    return model_response(responses, List[LocationResponse])
 
 
 @router.get("/{location_id}", response_model=LocationFullSchema)
@@ -33,7 +33,7 @@ async def get_location_subtype(
     db: AsyncSession = Depends(get_async_db)
 ):
     """Get location subtype by ID"""
-    service = LocationSubtypeService(db)
+    service = LocationSubTypeService(db)
     subtype = await service.get_subtype_by_id(subtype_id)
     if not subtype:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Location subtype not found")
@@ -46,7 +46,7 @@ async def get_location_subtype_by_code(
     db: AsyncSession = Depends(get_async_db)
 ):
     """Get location subtype by code"""
-    service = LocationSubtypeService(db)
+    service = LocationSubTypeService(db)
     subtype = await service.get_subtype_by_code(code)
     if not subtype:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Location subtype not found")
@@ -60,7 +60,7 @@ async def update_location_subtype(
     db: AsyncSession = Depends(get_async_db)
 ):
     """Update location subtype"""
-    service = LocationSubtypeService(db)
+    service = LocationSubTypeService(db)
     try:
         updated_subtype = await service.update_subtype(subtype_id, update_data)
         if not updated_subtype:
@@ -76,7 +76,7 @@ async def delete_location_subtype(
     db: AsyncSession = Depends(get_async_db)
 ):
     """Delete location subtype"""
-    service = LocationSubtypeService(db)
+    service = LocationSubTypeService(db)
     success = await service.delete_subtype(subtype_id)
     if not success:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Location subtype not found")
@@ -91,10 +91,11 @@ async def search_location_subtypes(
     match_all_tags: bool = Query(False),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    facets: bool = Query(False, description="Also return match counts per location type, theme, rarity and tag"),
     db: AsyncSession = Depends(get_async_db)
 ):
     """Search location subtypes with filters and pagination"""
-    service = LocationSubtypeService(db)
+    service = LocationSubTypeService(db)
     return await service.search_subtypes(
         location_type_id=location_type_id,
         theme_id=theme_id,
@@ -102,7 +103,8 @@ async def search_location_subtypes(
         tags=tags,
         match_all_tags=match_all_tags,
         skip=skip,
-        limit=limit
+        limit=limit,
+        include_facets=facets
     )
 
 
@@ -112,7 +114,7 @@ async def get_subtypes_by_location_type(
     db: AsyncSession = Depends(get_async_db)
 ):
     """Get all subtypes for a specific location type"""
-    service = LocationSubtypeService(db)
+    service = LocationSubTypeService(db)
     return await service.get_subtypes_by_location_type(location_type_id)
 
 
@@ -122,7 +124,7 @@ async def get_subtypes_by_theme(
     db: AsyncSession = Depends(get_async_db)
 ):
     """Get all subtypes for a specific theme"""
-    service = LocationSubtypeService(db)
+    service = LocationSubTypeService(db)
     return await service.get_subtypes_by_theme(theme_id)
 
 
@@ -133,7 +135,7 @@ async def get_subtypes_by_location_type_and_theme(
     db: AsyncSession = Depends(get_async_db)
 ):
     """Get subtypes for specific location type and theme combination"""
-    service = LocationSubtypeService(db)
+    service = LocationSubTypeService(db)
     return await service.get_subtypes_by_location_type_and_theme(location_type_id, theme_id)
 
 
@@ -143,7 +145,7 @@ async def get_subtypes_by_rarity(
     db: AsyncSession = Depends(get_async_db)
 ):
     """Get subtypes by rarity level"""
-    service = LocationSubtypeService(db)
+    service = LocationSubTypeService(db)
     return await service.get_subtypes_by_rarity(rarity)
 
 
@@ -153,7 +155,7 @@ async def bulk_create_location_subtypes(
     db: AsyncSession = Depends(get_async_db)
 ):
     """Bulk create location subtypes"""
-    service = LocationSubtypeService(db)
+    service = LocationSubTypeService(db)
     try:
         return await service.bulk_create_subtypes(subtypes_data)
     except ValueError as e:
@@ -0,0 +1,25 @@
+"""
+API routes for trade pricing.
+"""
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.dependencies import get_async_db
+from app.game_state.services.economy.pricing_service import PricingService
+from app.api.schemas.pricing_schema import PriceCatalogRequest, PriceCatalogResponse
+
+
+router = APIRouter()
+
+@router.post("/catalog", response_model=PriceCatalogResponse)
+async def price_catalog(
+        request: PriceCatalogRequest,
+        db: AsyncSession = Depends(get_async_db)):
+    pricing_service = PricingService(db)
+    catalog = await pricing_service.price_catalog(
+        player_id=request.player_id,
+        settlement_id=request.settlement_id,
+        trader_id=request.trader_id,
+        item_ids=request.item_ids,
+        player_race=request.player_race,
+    )
+    return PriceCatalogResponse.model_validate(catalog)
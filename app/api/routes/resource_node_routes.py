@@ -12,15 +12,19 @@ from fastapi import APIRouter, HTTPException, Query, Depends, status, Body
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.dependencies import get_async_db
+from app.api.responses import model_response
 from app.api.schemas.resource_node_schema import (
     ResourceNodeCreate,
     ResourceNodeUpdate,
     ResourceNodeRead,
     ResourceNodeSummary,
     ResourceExtractionRequest,
-    ResourceExtractionResult
+    ResourceExtractionResult,
+    ResourceNodePopulationRequest,
+    ResourceNodePopulationResult
 )
 from app.game_state.services.resource.resource_node_service import ResourceNodeService
+from app.game_state.services.resource.resource_node_population_service import ResourceNodePopulationService
 from app.game_state.enums.shared import StatusEnum
 from app.game_state.enums.resource import ResourceNodeVisibilityEnum
 
@@ -57,29 +61,9 @@ async def get_location_resource_nodes(
             # Get all nodes in location
             nodes = await service.get_nodes_by_location(location_id, offset, limit)
         
-        # Convert to summary format for listing
-        summaries = []
-        for node in nodes:
-            summary = ResourceNodeSummary(
-                id=node.id,
-                name=node.name,
-                description=node.description,
-                location_id=node.location_id,
-                location_name=node.location_name,
-                blueprint_id=node.blueprint_id,
-                blueprint_name=node.blueprint_name,
-                depleted=node.depleted,
-                status=node.status,
-                visibility=node.visibility,
-                total_resources=node.total_resources,
-                primary_resources=node.primary_resources,
-                total_extractions=node.total_extractions,
-                last_extraction_at=node.last_extraction_at,
-                created_at=node.created_at
-            )
-            summaries.append(summary)
-        
-        return summaries
+        # Serialized directly; FastAPI does not re-validate a Response against response_model
+        summaries = service.to_summaries(nodes)
+        return model_response(summaries, List[ResourceNodeSummary])
         
     except Exception as e:
         raise HTTPException(
@@ -179,6 +163,33 @@ async def create_resource_node_from_blueprint(
         )
 
 
+@router.post("/worlds/{world_id}/resource-nodes/populate", response_model=ResourceNodePopulationResult, status_code=status.HTTP_201_CREATED)
+async def populate_world_resource_nodes(
+    world_id: UUID,
+    population_request: ResourceNodePopulationRequest,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Spawn resource nodes from blueprints for every location in a world.
+    Blueprints are chosen per location by biome type and rows are inserted in bulk in one transaction.
+    """
+    service = ResourceNodePopulationService(db)
+
+    try:
+        return await service.populate_world(world_id, population_request)
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error populating resource nodes: {str(e)}"
+        )
+
+
 @router.patch("/locations/{location_id}/resource-nodes/{node_id}", response_model=ResourceNodeRead)
 async def update_location_resource_node(
     location_id: UUID,
@@ -378,11 +389,8 @@ async def deplete_resource_node(
                 detail=f"Resource node {node_id} not found in location {location_id}"
             )
         
-        # Update to depleted
-        update_data = ResourceNodeUpdate(depleted=True, status=StatusEnum.INACTIVE)
-        updated_node = await service.update_resource_node(node_id, update_data)
-        
-        return updated_node
+        # Deplete and queue the respawn
+        return await service.deplete_node(node_id)
         
     except HTTPException:
         raise
@@ -410,28 +418,9 @@ async def get_discovered_resource_nodes(
     try:
         nodes = await service.get_discovered_nodes_in_location(location_id, offset, limit)
         
-        summaries = []
-        for node in nodes:
-            summary = ResourceNodeSummary(
-                id=node.id,
-                name=node.name,
-                description=node.description,
-                location_id=node.location_id,
-                location_name=node.location_name,
-                blueprint_id=node.blueprint_id,
-                blueprint_name=node.blueprint_name,
-                depleted=node.depleted,
-                status=node.status,
-                visibility=node.visibility,
-                total_resources=node.total_resources,
-                primary_resources=node.primary_resources,
-                total_extractions=node.total_extractions,
-                last_extraction_at=node.last_extraction_at,
-                created_at=node.created_at
-            )
-            summaries.append(summary)
-        
-        return summaries
+        # Serialized directly; FastAPI does not re-validate a Response against response_model
+        summaries = service.to_summaries(nodes)
+        return model_response(summaries, List[ResourceNodeSummary])
         
     except Exception as e:
         raise HTTPException(
@@ -453,28 +442,9 @@ async def get_active_resource_nodes(
     try:
         nodes = await service.get_active_nodes_in_location(location_id, offset, limit)
         
-        summaries = []
-        for node in nodes:
-            summary = ResourceNodeSummary(
-                id=node.id,
-                name=node.name,
-                description=node.description,
-                location_id=node.location_id,
-                location_name=node.location_name,
-                blueprint_id=node.blueprint_id,
-                blueprint_name=node.blueprint_name,
-                depleted=node.depleted,
-                status=node.status,
-                visibility=node.visibility,
-                total_resources=node.total_resources,
-                primary_resources=node.primary_resources,
-                total_extractions=node.total_extractions,
-                last_extraction_at=node.last_extraction_at,
-                created_at=node.created_at
-            )
-            summaries.append(summary)
-        
-        return summaries
+        # Serialized directly; FastAPI does not re-validate a Response against response_model
+        summaries = service.to_summaries(nodes)
+        return model_response(summaries, List[ResourceNodeSummary])
         
     except Exception as e:
         raise HTTPException(
@@ -0,0 +1,47 @@
+# --- START OF FILE app/api/routes/search_routes.py ---
+
+import logging
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, HTTPException, Query, status
+
+from app.api.schemas.search_schema import SearchResponse
+from app.db.async_session import get_read_session_factory
+from app.game_state.repositories.core.search_repository import (
+    SEARCH_DEFAULT_LIMIT,
+    SEARCH_KINDS,
+    SEARCH_MAX_LIMIT,
+    SEARCH_MIN_QUERY_LENGTH,
+)
+from app.game_state.services.core.search_service import SearchService
+
+router = APIRouter()
+
+
+@router.get(
+    "/",
+    response_model=SearchResponse,
+    summary="Search By Name",
+    description="Fuzzy, typo-tolerant name search over " + ", ".join(SEARCH_KINDS) + ". "
+                "Kinds are searched concurrently; each returns its best matches first."
+)
+async def search_endpoint(
+    q: str = Query(..., min_length=SEARCH_MIN_QUERY_LENGTH, max_length=100, description="Text to search names for"),
+    kinds: Optional[str] = Query(None, description="Comma-separated kinds to search (default: all)"),
+    limit: int = Query(SEARCH_DEFAULT_LIMIT, ge=1, le=SEARCH_MAX_LIMIT, description="Matches per kind"),
+    world_id: Optional[UUID] = Query(None, description="Only match world content (characters, locations, settlements) of this world"),
+):
+    """Endpoint to search entity names across kinds."""
+    try:
+        selected = SearchService.resolve_kinds([k.strip() for k in kinds.split(",") if k.strip()] if kinds else None)
+        query = SearchService.normalize_query(q)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    # Each kind reads through its own session, so no request-scoped session is needed
+    results = await SearchService.search_kinds(get_read_session_factory(), selected, query, limit, world_id)
+    logging.debug(f"[SearchRoutes] '{query}': " + ", ".join(f"{kind}={len(rows)}" for kind, rows in results.items()))
+    return SearchResponse(query=query, results=results)
+
+# --- END OF FILE app/api/routes/search_routes.py ---
@@ -6,6 +6,7 @@ from pydantic import BaseModel, Field, ConfigDict # Added Field
 import random
 from app.game_state.services.core.world_service import WorldService
 from app.game_state.services.settlement_service import SettlementService
+from app.game_state.repositories.base_repository import ConcurrentUpdateError
 from uuid import UUID
 from typing import Optional, Dict # Added Dict for resource quantities
 from datetime import datetime
@@ -191,6 +192,9 @@ async def add_resource_to_settlement(
         )
     except HTTPException:
         raise
+    except ConcurrentUpdateError as e:
+        # Still conflicting after the repository's retries
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     except Exception as e:
         logging.exception(f"Error adding resource to settlement: {e}")
         raise HTTPException(
@@ -250,6 +254,9 @@ async def remove_resource_from_settlement(
         )
     except HTTPException:
         raise
+    except ConcurrentUpdateError as e:
+        # Still conflicting after the repository's retries
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     except Exception as e:
         logging.exception(f"Error removing resource from settlement: {e}")
         raise HTTPException(
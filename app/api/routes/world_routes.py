@@ -1,17 +1,21 @@
 # --- START OF FILE app/api/routes/world_routes.py ---
 
 from fastapi import APIRouter, Depends, HTTPException, Body, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.async_session import get_read_session_factory
 from app.db.dependencies import get_async_db
 import logging
 from pydantic import BaseModel
 import random
-from app.api.schemas.world import  WorldBase, WorldCreateRequest
+from app.api.schemas.world import  WorldBase, WorldCreateRequest, WorldGenerationRequest, WorldGenerationResult
 from app.game_state.services.core.world_service import WorldService
+from app.game_state.services.world.world_generation_service import WorldGenerationService
+from app.game_state.services.world.world_export_service import WorldExportService, NDJSON_MEDIA_TYPE
 # Import ThemeService if needed for separate theme endpoints (but not directly for world creation now)
 # from app.game_state.services.theme_service import ThemeService
 from uuid import UUID
-from typing import List
+from typing import List, Optional
 from fastapi import Query
 
 
@@ -195,4 +199,98 @@ async def delete_world_endpoint(
     return None
 
 
+@router.post(
+    "/{world_id}/generate",
+    response_model=WorldGenerationResult,
+    status_code=status.HTTP_201_CREATED,
+    summary="Generate World Content",
+    description="Procedurally generates locations, biomes, settlements, travel links and resource nodes for a world from a seed."
+)
+async def generate_world_endpoint(
+    world_id: UUID,
+    generation_request: WorldGenerationRequest = Body(...),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Endpoint to generate a world's content. Rows are streamed into the database in one transaction."""
+    logging.info(f"[WorldRoutes] Request to generate world {world_id} with seed {generation_request.seed}")
+    generation_service = WorldGenerationService(db=db)
+
+    try:
+        return await generation_service.generate_world(world_id, generation_request)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logging.exception(f"Error generating world {world_id}: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected internal server error occurred.")
+
+
+# --- Streaming export ---
+# The stream outlives the request's dependencies, so it reads through its own
+# session, opened when the first chunk is requested and closed after the last.
+
+async def _stream_world_export(world_id: UUID, kinds: List[str]):
+    async with get_read_session_factory()() as session:
+        async for chunk in WorldExportService(session).stream_world(world_id, kinds):
+            yield chunk
+
+async def _stream_kind_export(world_id: UUID, kind: str):
+    async with get_read_session_factory()() as session:
+        async for chunk in WorldExportService(session).stream_kind(world_id, kind):
+            yield chunk
+
+async def _ensure_world_exists(world_id: UUID, db: AsyncSession) -> None:
+    if not await WorldExportService(db).world_exists(world_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"World {world_id} not found")
+
+
+@router.get(
+    "/{world_id}/export",
+    response_class=StreamingResponse,
+    summary="Export World",
+    description="Streams the world and its locations, settlements, characters, resource nodes and buildings as NDJSON. "
+                "Every line is {\"kind\": ..., \"row\": ...}; the first line is the world itself."
+)
+async def export_world_endpoint(
+    world_id: UUID,
+    kinds: Optional[str] = Query(None, description="Comma-separated kinds to export (default: all)"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Endpoint to stream a full world export."""
+    try:
+        selected = WorldExportService.resolve_kinds([k.strip() for k in kinds.split(",") if k.strip()] if kinds else None)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    await _ensure_world_exists(world_id, db)
+
+    return StreamingResponse(
+        _stream_world_export(world_id, selected),
+        media_type=NDJSON_MEDIA_TYPE,
+        headers={"Content-Disposition": f'attachment; filename="world-{world_id}.ndjson"'},
+    )
+
+
+@router.get(
+    "/{world_id}/export/{kind}",
+    response_class=StreamingResponse,
+    summary="Export World Content",
+    description="Streams one kind of world content (locations, settlements, characters, resource_nodes or buildings) as NDJSON, one row per line."
+)
+async def export_world_kind_endpoint(
+    world_id: UUID,
+    kind: str,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Endpoint to stream one kind of a world's content."""
+    try:
+        WorldExportService.resolve_kinds([kind])
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    await _ensure_world_exists(world_id, db)
+
+    return StreamingResponse(
+        _stream_kind_export(world_id, kind),
+        media_type=NDJSON_MEDIA_TYPE,
+        headers={"Content-Disposition": f'attachment; filename="world-{world_id}-{kind}.ndjson"'},
+    )
+
 # --- END OF FILE app/api/routes/world_routes.py ---
\ No newline at end of file
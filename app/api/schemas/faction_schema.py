@@ -1,7 +1,7 @@
 # --- FILE: app/api/schemas/faction_schema.py ---
 
 import uuid
-from typing import Optional
+from typing import Dict, Optional
 from datetime import datetime
 from pydantic import BaseModel, Field, ConfigDict
 
@@ -71,3 +71,27 @@ class FactionResponse(BaseModel):
             }
         }
     )
+
+
+class FactionControlResponse(BaseModel):
+    """
+    Schema for one faction's control of a location, zone or world.
+    """
+    scope_id: uuid.UUID = Field(..., description="ID of the location, zone (parent location) or world.")
+    faction_id: uuid.UUID = Field(..., description="UUID of the faction.")
+    presence: float = Field(..., description="Summed presence_pct of the faction within the scope.")
+    share: Optional[float] = Field(None, description="Fraction (0-1) of the scope's total presence held by the faction.")
+    rank: int = Field(..., description="1 for the controlling faction, then by descending presence.")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class CharacterReputationsResponse(BaseModel):
+    """
+    Schema for a character's reputation with every relevant faction.
+    """
+    character_id: uuid.UUID = Field(..., description="UUID of the character.")
+    reputations: Dict[uuid.UUID, int] = Field(
+        default_factory=dict,
+        description="Reputation score (-100 to 100) by faction ID."
+    )
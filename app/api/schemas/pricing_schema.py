@@ -0,0 +1,63 @@
+# --- FILE: app/api/schemas/pricing_schema.py ---
+
+import uuid
+from typing import List, Optional
+from pydantic import BaseModel, Field, ConfigDict
+
+from app.game_state.enums.race import Race
+
+
+class PriceCatalogRequest(BaseModel):
+    """
+    Schema for incoming POST /pricing/catalog payload.
+    """
+    player_id: uuid.UUID = Field(..., description="Character buying or selling.")
+    settlement_id: uuid.UUID = Field(..., description="Settlement the trade happens in.")
+    trader_id: uuid.UUID = Field(..., description="Character running the shop.")
+    player_race: Optional[Race] = Field(None, description="Race of the player, for racial price modifiers.")
+    item_ids: Optional[List[uuid.UUID]] = Field(
+        None,
+        description="Items to price. Defaults to every item the trader owns."
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "player_id": "7c9e6679-7425-40de-944b-e07fc1f90ae7",
+                "settlement_id": "e42a10bc-fab7-4f83-977d-def25746acb7",
+                "trader_id": "3fa85f64-5717-4562-b3fc-2c963f66afa6",
+                "player_race": "dwarf"
+            }
+        }
+    )
+
+
+class PriceModifiers(BaseModel):
+    """
+    Schema for the resolved modifiers of a trade. Positive values are discounts, negative surcharges.
+    """
+    settlement_discount: float
+    trader_discount: float
+    race_discount: float
+    faction_modifier: float
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class PricedItem(BaseModel):
+    """
+    Schema for one priced catalog entry.
+    """
+    item_id: uuid.UUID
+    name: str
+    base_price: float
+    price: float
+
+
+class PriceCatalogResponse(BaseModel):
+    """
+    Schema for outgoing catalog prices.
+    """
+    modifiers: PriceModifiers
+    multiplier: float = Field(..., description="Combined multiplier applied to every base price.")
+    items: List[PricedItem] = Field(default_factory=list)
@@ -244,6 +244,7 @@ class ResourceExtractionResult(BaseModel):
     success: bool
     resources_extracted: List[Dict[str, Any]] = Field(default_factory=list)
     node_depleted: bool = False
+    respawn_at: Optional[datetime] = None
     message: str = ""
     
     model_config = {
@@ -262,4 +263,39 @@ class ResourceExtractionResult(BaseModel):
                 "message": "Successfully extracted 7 Iron Ore"
             }
         }
-    }
\ No newline at end of file
+    }
+
+class ResourceNodePopulationRequest(BaseModel):
+    """Schema for spawning resource nodes across a whole world from blueprints."""
+    seed: int = Field(..., description="World seed; the same seed always produces the same nodes")
+    nodes_per_location: int = Field(3, ge=1, le=50, description="Number of nodes to spawn in each location")
+    chunk_size: int = Field(1000, ge=1, le=10000, description="Rows per multi-row INSERT")
+    status: StatusEnum = Field(StatusEnum.PENDING, description="Initial status for spawned nodes")
+    visibility: ResourceNodeVisibilityEnum = Field(ResourceNodeVisibilityEnum.HIDDEN, description="Initial visibility for spawned nodes")
+
+
+class ResourceNodePopulationResult(BaseModel):
+    """Result of a bulk world population run."""
+    world_id: uuid.UUID
+    seed: int
+    locations_considered: int = 0
+    locations_populated: int = 0
+    nodes_created: int = 0
+    links_created: int = 0
+    elapsed_seconds: float = 0.0
+    nodes_per_second: float = 0.0
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "world_id": "550e8400-e29b-41d4-a716-446655440000",
+                "seed": 42,
+                "locations_considered": 1200,
+                "locations_populated": 1150,
+                "nodes_created": 3450,
+                "links_created": 6900,
+                "elapsed_seconds": 1.82,
+                "nodes_per_second": 1895.6
+            }
+        }
+    }
@@ -0,0 +1,18 @@
+# app/api/schemas/search_schema.py
+from typing import Dict, List
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class SearchHit(BaseModel):
+    """One name match."""
+    id: UUID = Field(..., description="Primary key of the matching row.")
+    name: str = Field(..., description="Name of the matching row.")
+    score: float = Field(..., description="pg_trgm word similarity between the query and the name (0-1).")
+
+
+class SearchResponse(BaseModel):
+    """Matches per requested kind, best first."""
+    query: str = Field(..., description="The normalized query.")
+    results: Dict[str, List[SearchHit]] = Field(default_factory=dict, description="Kind -> matches.")
@@ -1,6 +1,6 @@
 # app/api/schemas/world.py
-from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field
+from typing import Optional, Dict, Any, List
+from pydantic import BaseModel, Field, model_validator
 from datetime import datetime
 from uuid import UUID
 import uuid
@@ -82,3 +82,62 @@ class WorldCreateRequest(BaseModel):
             ]
         }
     }
+
+
+# Bounds on one generation request, which runs in a single request transaction
+MAX_GENERATION_TIERS = 6
+MAX_GENERATED_LOCATIONS = 250_000
+
+
+class WorldGenerationTier(BaseModel):
+    """One level of the generated location hierarchy."""
+    location_type_code: str = Field(..., description="Code of the location type for this level")
+    count: int = Field(..., ge=1, le=10000, description="Locations per parent (or number of roots for the first tier)")
+
+
+class WorldGenerationRequest(BaseModel):
+    """Schema for procedurally generating a world's locations, settlements, travel links and resource nodes."""
+    seed: int = Field(..., description="World seed; the same seed always produces the same layout")
+    tiers: List[WorldGenerationTier] = Field(..., min_length=1, max_length=MAX_GENERATION_TIERS, description="Hierarchy levels, top first")
+    settlement_chance: float = Field(0.05, ge=0.0, le=1.0, description="Chance that a habitable leaf location gets a settlement")
+    nodes_per_location: int = Field(1, ge=0, le=50, description="Resource nodes spawned per leaf location")
+    world_size_km: float = Field(1000.0, gt=0, description="Side length of the square world in km")
+    noise_scale: float = Field(150.0, gt=0, description="Feature size of the biome noise field in km")
+    batch_size: int = Field(5000, ge=100, le=50000, description="Rows per table buffered before a flush")
+    chunk_size: int = Field(1000, ge=1, le=10000, description="Rows per multi-row INSERT")
+
+    @model_validator(mode='after')
+    def validate_location_count(self):
+        # Every tier multiplies the one above it, so the total is the sum of the running products
+        total, per_tier = 0, 1
+        for tier in self.tiers:
+            per_tier *= tier.count
+            total += per_tier
+            if total > MAX_GENERATED_LOCATIONS:
+                raise ValueError(f"tiers would generate more than {MAX_GENERATED_LOCATIONS} locations")
+        return self
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "seed": 42,
+                    "tiers": [
+                        {"location_type_code": "region", "count": 10},
+                        {"location_type_code": "area", "count": 100},
+                        {"location_type_code": "site", "count": 100}
+                    ]
+                }
+            ]
+        }
+    }
+
+
+class WorldGenerationResult(BaseModel):
+    """Result of a world generation run."""
+    world_id: UUID
+    seed: int
+    rows_by_table: Dict[str, int] = Field(default_factory=dict)
+    locations_created: int = 0
+    elapsed_seconds: float = 0.0
+    locations_per_second: float = 0.0
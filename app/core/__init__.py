@@ -1 +1,7 @@
-from .celery_app import app as celery_app
\ No newline at end of file
+def __getattr__(name):
+    # Celery is only needed by workers and task producers; importing app.core.config
+    # or app.core.redis must not start it.
+    if name == "celery_app":
+        from .celery_app import app as celery_app
+        return celery_app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
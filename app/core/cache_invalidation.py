@@ -0,0 +1,236 @@
+# app/core/cache_invalidation.py
+"""
+Cross-process invalidation of the in-process caches, over Redis pub/sub.
+
+Repository writes record (entity_kind, id, version) on their session, the
+entity kind being the table name. When the session commits, the records are
+applied to this process's caches at once and published, one message per
+transaction, to every other process: uvicorn workers, Celery workers and the
+async job worker. Caches subscribe to the entity kinds they hold with
+CacheInvalidationBus.register().
+
+Each message carries a generation number from a Redis counter, incremented
+and published atomically. A process that sees a gap in the generations, or
+finds the counter moved while it was disconnected, clears every registered
+cache instead of trusting entries that may be stale. Cache TTLs still bound
+staleness if a publish itself fails.
+"""
+import json
+import logging
+import os
+import queue
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import redis
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.redis import redis_client
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "cache_invalidation"
+GENERATION_KEY = "cache_invalidation:generation"
+
+# session.info key holding the records of the current transaction
+PENDING_KEY = "cache_invalidations"
+
+# Seconds between reconnect attempts of the listener
+RECONNECT_DELAY = 1.0
+
+# INCR and PUBLISH in one step, so messages are published in generation order
+_PUBLISH_SCRIPT = """
+local generation = redis.call('INCR', KEYS[1])
+redis.call('PUBLISH', ARGV[1], generation .. '|' .. ARGV[2])
+return generation
+"""
+
+# (entity_kind, entity id as a string, version or None)
+Invalidation = Tuple[str, Optional[str], Optional[int]]
+
+
+class InvalidationHandler(NamedTuple):
+    """How a cache drops one entity (id, version) and everything it holds."""
+    evict: Callable[[Optional[str], Optional[int]], None]
+    clear: Callable[[], None]
+
+
+class CacheInvalidationBus:
+    """
+    Process-wide registry of cache handlers, publisher and subscriber.
+    Publishing and listening run on daemon threads so neither a commit nor
+    the event loop ever waits on Redis.
+    """
+
+    # Class-level state, shared across the process
+    _handlers: Dict[str, List[InvalidationHandler]] = {}
+    _origin: str = uuid.uuid4().hex
+    _pid: Optional[int] = None
+    _outbox: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+    _publisher: Optional[threading.Thread] = None
+    _listener: Optional[threading.Thread] = None
+    _stop = threading.Event()
+    _last_generation: Optional[int] = None
+    _stats: Dict[str, int] = {"published": 0, "publish_errors": 0, "received": 0, "evicted": 0, "resyncs": 0}
+
+    @classmethod
+    def register(
+        cls,
+        entity_kind: str,
+        evict: Callable[[Optional[str], Optional[int]], None],
+        clear: Callable[[], None],
+    ) -> None:
+        """Have writes to `entity_kind` (a table name) call evict(id, version); clear() on a resync."""
+        cls._handlers.setdefault(entity_kind, []).append(InvalidationHandler(evict, clear))
+
+    @classmethod
+    def record(cls, session: Any, entity_kind: str, entity_id: Any, version: Optional[int] = None) -> None:
+        """Note a write on the session; it is applied and published once the session commits."""
+        info = getattr(session, "info", None)
+        if not isinstance(info, dict):
+            return
+        info.setdefault(PENDING_KEY, []).append(
+            (entity_kind, str(entity_id) if entity_id is not None else None, version)
+        )
+
+    @classmethod
+    def apply(cls, invalidations: Iterable[Invalidation]) -> None:
+        """Evict the given entities from this process's caches."""
+        for entity_kind, entity_id, version in invalidations:
+            for handler in cls._handlers.get(entity_kind, ()):
+                try:
+                    handler.evict(entity_id, version)
+                    cls._stats["evicted"] += 1
+                except Exception as e:
+                    logger.error(f"[CacheInvalidation] Evicting {entity_kind} {entity_id} failed: {e}")
+
+    @classmethod
+    def clear_all(cls) -> None:
+        """Clear every registered cache."""
+        for handlers in cls._handlers.values():
+            for handler in handlers:
+                try:
+                    handler.clear()
+                except Exception as e:
+                    logger.error(f"[CacheInvalidation] Clearing a cache failed: {e}")
+
+    @classmethod
+    def publish(cls, invalidations: List[Invalidation]) -> None:
+        """Queue one message for the other processes; sent by the publisher thread."""
+        if not invalidations or not cls._enabled():
+            return
+        cls._ensure_threads(listen=False)
+        cls._outbox.put(json.dumps({"o": cls._origin, "e": invalidations}, separators=(",", ":")))
+
+    @classmethod
+    def start_listener(cls) -> None:
+        """Subscribe this process to invalidations from the others."""
+        if cls._enabled():
+            cls._ensure_threads(listen=True)
+
+    @classmethod
+    def stop(cls) -> None:
+        """Stop the listener (the publisher sends what is queued and stays idle)."""
+        cls._stop.set()
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Any]:
+        return {**cls._stats, "generation": cls._last_generation, "kinds": sorted(cls._handlers)}
+
+    # --- Session hooks ---
+
+    @classmethod
+    def _after_commit(cls, session: Session) -> None:
+        invalidations = session.info.pop(PENDING_KEY, None)
+        if invalidations:
+            cls.apply(invalidations)
+            cls.publish(invalidations)
+
+    @classmethod
+    def _after_transaction_end(cls, session: Session, transaction) -> None:
+        # The outermost transaction rolled back: its writes never became visible
+        if transaction.parent is None:
+            session.info.pop(PENDING_KEY, None)
+
+    # --- Threads ---
+
+    @staticmethod
+    def _enabled() -> bool:
+        from app.core.config import get_settings
+        return get_settings().CACHE_INVALIDATION_ENABLED
+
+    @classmethod
+    def _ensure_threads(cls, listen: bool) -> None:
+        # Threads don't survive a fork (Celery prefork children); start them again in the child
+        if cls._pid != os.getpid():
+            cls._pid = os.getpid()
+            cls._origin = uuid.uuid4().hex
+            cls._publisher = cls._listener = None
+            cls._stop = threading.Event()
+        if cls._publisher is None or not cls._publisher.is_alive():
+            cls._publisher = threading.Thread(target=cls._publish_loop, name="cache-invalidation-publisher", daemon=True)
+            cls._publisher.start()
+        if listen and (cls._listener is None or not cls._listener.is_alive()):
+            cls._stop.clear()
+            cls._listener = threading.Thread(target=cls._listen_loop, name="cache-invalidation-listener", daemon=True)
+            cls._listener.start()
+
+    @classmethod
+    def _publish_loop(cls) -> None:
+        script = redis_client.register_script(_PUBLISH_SCRIPT)
+        while True:
+            payload = cls._outbox.get()
+            try:
+                script(keys=[GENERATION_KEY], args=[CHANNEL, payload])
+                cls._stats["published"] += 1
+            except redis.RedisError as e:
+                cls._stats["publish_errors"] += 1
+                logger.warning(f"[CacheInvalidation] Publish failed, other processes rely on TTLs: {e}")
+
+    @classmethod
+    def _listen_loop(cls) -> None:
+        while not cls._stop.is_set():
+            pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+            try:
+                # Subscribe before reading the counter, so no message falls between the two
+                pubsub.subscribe(CHANNEL)
+                cls._resync(int(redis_client.get(GENERATION_KEY) or 0))
+                while not cls._stop.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message is not None:
+                        cls._receive(message["data"])
+            except redis.RedisError as e:
+                logger.warning(f"[CacheInvalidation] Listener disconnected, retrying: {e}")
+                time.sleep(RECONNECT_DELAY)
+            finally:
+                pubsub.close()
+
+    @classmethod
+    def _resync(cls, generation: int) -> None:
+        """Clear everything unless the counter is where this process left it."""
+        if cls._last_generation != generation:
+            if cls._last_generation is not None:
+                logger.info(f"[CacheInvalidation] Missed generations {cls._last_generation}..{generation}, clearing caches")
+            cls._stats["resyncs"] += 1
+            cls.clear_all()
+        cls._last_generation = generation
+
+    @classmethod
+    def _receive(cls, data: str) -> None:
+        generation, _, payload = data.partition("|")
+        generation = int(generation)
+        cls._stats["received"] += 1
+        if cls._last_generation is not None and generation > cls._last_generation + 1:
+            cls._resync(generation)
+        else:
+            cls._last_generation = max(generation, cls._last_generation or 0)
+        message = json.loads(payload)
+        if message["o"] != cls._origin:
+            cls.apply(tuple(entry) for entry in message["e"])
+
+
+event.listen(Session, "after_commit", CacheInvalidationBus._after_commit)
+event.listen(Session, "after_transaction_end", CacheInvalidationBus._after_transaction_end)
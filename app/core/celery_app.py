@@ -1,5 +1,6 @@
 # celery_app.py
 from celery import Celery
+from celery.signals import worker_process_init
 import os
 # from celery.schedules import crontab # Use simple floats for seconds interval
 
@@ -32,11 +33,10 @@ app.conf.update(
     timezone='UTC',
     enable_utc=True,
     # --- Asyncio Configuration ---
-    # Use 'prefork' (default) or 'gevent'/'eventlet' if needed.
-    # 'solo' is okay for simple testing but has limitations.
-    # 'prefork' is generally recommended for I/O-bound async tasks as it provides
-    # multiple event loops (one per worker process).
-    worker_pool='gevent', # Changed from 'solo' - usually better for async I/O
+    # 'prefork' gives each worker process its own event loop for run_async_task.
+    # gevent monkey-patching doesn't mix with asyncpg; concurrent async jobs run
+    # on the native asyncio worker instead (app.game_state.workers.async_worker).
+    worker_pool='prefork',
     # Let Celery manage the asyncio event loop within the worker process
     # No specific 'event_loop' setting needed in recent Celery versions when using async def tasks.
     # --- Other Settings ---
@@ -46,22 +46,27 @@ app.conf.update(
     worker_max_tasks_per_child=1000, # Restart worker process after 1000 tasks
     # Define includes for task auto-discovery
     # Point this to the modules where your @app.task definitions live
-    imports=('app.game_state.workers.world_worker',) # Updated path
+    imports=(
+        'app.game_state.workers.world_worker',
+        'app.game_state.workers.resource_worker',
+        'app.game_state.workers.snapshot_worker',
+    )
 )
 
 # Define the beat schedule (periodic tasks)
+# The game ticks (advance_game_day every 3660s, respawn_resource_nodes every 60s)
+# are scheduled by the async worker - see SCHEDULE in app.game_state.workers.async_worker.
+# They share their task locks with the Celery tasks, so a manual Celery run never overlaps a tick.
 app.conf.beat_schedule = {
-    'advance-game-day-every-10-seconds': {
-        # The task name string: 'module_path.function_name'
-        # This path MUST be importable by the Celery worker and beat.
-        'task': 'app.game_state.workers.world_worker.advance_game_day',
-        'schedule': 3660.0,  # Run every 10 seconds
-        'args': (None,),  # Arguments to pass to the task (advance all worlds)
-        # Optionally add options like: 'options': {'queue': 'periodic'}
-    },
     # Add other periodic tasks here if needed
 }
 
+@worker_process_init.connect
+def start_cache_invalidation_listener(**kwargs):
+    """Each worker process evicts its in-process caches on writes made elsewhere."""
+    from app.core.cache_invalidation import CacheInvalidationBus
+    CacheInvalidationBus.start_listener()
+
 # Optional: Set default queue, routing, etc.
 # app.conf.task_default_queue = 'default'
 # app.conf.task_routes = {'app.game_state.workers.world_worker.*': {'queue': 'world'}}
@@ -1 +1,105 @@
-current_day = 1
\ No newline at end of file
+"""
+Application settings.
+
+Values come from the environment (and a .env file when present) and are read
+once per process. Nothing here connects to anything; the database engine and
+the API routers are created from these settings only when they are needed.
+"""
+import os
+from functools import lru_cache
+from typing import List, Optional
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+current_day = 1
+
+
+class Settings(BaseSettings):
+    """Process-wide configuration read from environment variables."""
+
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+
+    # --- Database ---
+    DBNAME: Optional[str] = None
+    DBHOST: Optional[str] = None
+    DBPORT: Optional[str] = None
+    DBUSER: Optional[str] = None
+    DBPASSWORD: Optional[str] = None
+    DB_ECHO: bool = True
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    # SQLAlchemy compiled statement cache (per engine) and asyncpg prepared statements (per connection)
+    DB_QUERY_CACHE_SIZE: int = 1200
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 500
+    # Comma-separated asyncpg URLs of streaming replicas for read-only sessions (see app.db.replica_routing)
+    DB_REPLICA_URLS: str = ""
+    # Replicas further behind than this (seconds) are skipped in favour of the primary
+    DB_REPLICA_MAX_LAG: float = 5.0
+    DB_REPLICA_PROBE_INTERVAL: float = 2.0
+    # How read-only (GET) sessions read: "transaction" (BEGIN READ ONLY), "autocommit"
+    # (no BEGIN/ROLLBACK round trips, no snapshot across statements) or "" (plain transactions)
+    DB_READ_ONLY_MODE: str = "transaction"
+
+    # --- Redis ---
+    REDIS_HOST: str = "localhost"
+    REDIS_PORT: int = 6379
+    REDIS_DB: int = 0
+    REDIS_PASSWORD: str = ""
+    # Publish repository writes so other processes evict their cached copies (app.core.cache_invalidation)
+    CACHE_INVALIDATION_ENABLED: bool = True
+
+    # --- Async job worker (app.game_state.workers.async_worker) ---
+    ASYNC_WORKER_CONCURRENCY: int = 16
+    ASYNC_WORKER_QUEUE: str = "async_jobs:default"
+    # Seconds in-flight jobs get to finish after a shutdown signal
+    ASYNC_WORKER_SHUTDOWN_GRACE: float = 30.0
+
+    # --- World snapshots ---
+    # Relative snapshot paths given to the snapshot tasks and CLI resolve here
+    SNAPSHOT_DIR: str = "snapshots"
+
+    # --- API ---
+    # Comma-separated router groups to mount (see app.api.app_factory.ROUTER_GROUPS), or "all"
+    API_ROUTER_GROUPS: str = "all"
+    API_SWAGGER_DARK: bool = True
+    API_CORS_ORIGINS: str = "*"
+    # Response compression: "gzip", "br" (needs brotli-asgi, falls back to gzip) or "" to disable
+    API_COMPRESSION: str = "gzip"
+    # Bodies smaller than this are sent uncompressed
+    API_COMPRESSION_MINIMUM_SIZE: int = 1024
+
+    @property
+    def database_url(self) -> str:
+        """asyncpg URL of the main database. Raises ValueError if any part is missing."""
+        if not all([self.DBNAME, self.DBHOST, self.DBPORT, self.DBUSER, self.DBPASSWORD]):
+            raise ValueError("One or more database environment variables are not set.")
+        return f"postgresql+asyncpg://{self.DBUSER}:{self.DBPASSWORD}@{self.DBHOST}:{self.DBPORT}/{self.DBNAME}"
+
+    @property
+    def replica_urls(self) -> List[str]:
+        return [url.strip() for url in self.DB_REPLICA_URLS.split(",") if url.strip()]
+
+    def snapshot_path(self, path: str) -> str:
+        """Absolute path of a snapshot file; relative paths are taken from SNAPSHOT_DIR."""
+        return path if os.path.isabs(path) else os.path.join(os.path.abspath(self.SNAPSHOT_DIR), path)
+
+    @property
+    def router_groups(self) -> Optional[List[str]]:
+        """Router groups to mount; None means all of them."""
+        groups = [group.strip() for group in self.API_ROUTER_GROUPS.split(",") if group.strip()]
+        if not groups or "all" in groups:
+            return None
+        return groups
+
+    @property
+    def cors_origins(self) -> List[str]:
+        return [origin.strip() for origin in self.API_CORS_ORIGINS.split(",") if origin.strip()]
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Settings of this process, read from the environment on first use."""
+    return Settings()
+
+
+settings = get_settings()
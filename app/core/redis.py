@@ -4,7 +4,9 @@ Provides a shared Redis client instance for the application.
 """
 import os
 import redis
+import redis.asyncio
 import logging
+from typing import Optional
 
 
 # Get Redis configuration from environment variables with fallbacks
@@ -59,6 +61,31 @@ def create_task_lock(task_name, resource_id=None, timeout=60):
     lock_name = f"task_lock:{task_name}:{resource_id or 'all'}"
     return get_lock(lock_name, timeout=timeout)
 
+# asyncio client for code running on an event loop (the async job worker). Created on
+# first use, since a client's connections belong to the loop that opened them.
+_async_redis_client: Optional[redis.asyncio.Redis] = None
+
+def get_async_redis() -> redis.asyncio.Redis:
+    """The process's asyncio Redis client, created on first use."""
+    global _async_redis_client
+    if _async_redis_client is None:
+        _async_redis_client = redis.asyncio.Redis(
+            host=REDIS_HOST,
+            port=int(REDIS_PORT),
+            db=int(REDIS_DB),
+            password=REDIS_PASSWORD,
+            decode_responses=True
+        )
+    return _async_redis_client
+
+def create_async_task_lock(task_name, resource_id=None, timeout=60):
+    """
+    Like create_task_lock, on the asyncio client. Uses the same key, so a task
+    holds off the Celery and the async variants of itself alike.
+    """
+    lock_name = f"task_lock:{task_name}:{resource_id or 'all'}"
+    return get_async_redis().lock(name=lock_name, timeout=timeout, blocking=False)
+
 def health_check():
     """
     Check that Redis is working correctly.
@@ -0,0 +1,60 @@
+"""Added resource node yield tracking, respawn queue and partial depletion indexes
+
+Revision ID: b41c7e2d9a10
+Revises: 8988fbc5378d
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b41c7e2d9a10'
+down_revision: Union[str, None] = '8988fbc5378d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('resource_node_resources', sa.Column('remaining_yield', sa.Integer(), nullable=True))
+    op.add_column('resource_node_resources', sa.Column('max_yield', sa.Integer(), nullable=True))
+    op.add_column('resource_nodes', sa.Column('depleted_at', sa.DateTime(timezone=True), nullable=True))
+
+    op.create_index(
+        'ix_resource_nodes_location_active', 'resource_nodes', ['location_id'],
+        unique=False, postgresql_where=sa.text('depleted = false')
+    )
+    op.create_index(
+        'ix_resource_nodes_location_depleted', 'resource_nodes', ['location_id'],
+        unique=False, postgresql_where=sa.text('depleted = true')
+    )
+
+    op.create_table('resource_node_respawns',
+    sa.Column('node_id', sa.UUID(), nullable=False),
+    sa.Column('respawn_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('scheduled_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['node_id'], ['resource_nodes.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('node_id')
+    )
+    op.create_index('ix_resource_node_respawns_respawn_at', 'resource_node_respawns', ['respawn_at'], unique=False)
+
+    # Queue nodes that were already depleted so they come back on the normal schedule
+    op.execute(
+        "INSERT INTO resource_node_respawns (node_id, respawn_at) "
+        "SELECT id, now() + interval '6 hours' FROM resource_nodes WHERE depleted = true"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_resource_node_respawns_respawn_at', table_name='resource_node_respawns')
+    op.drop_table('resource_node_respawns')
+    op.drop_index('ix_resource_nodes_location_depleted', table_name='resource_nodes')
+    op.drop_index('ix_resource_nodes_location_active', table_name='resource_nodes')
+    op.drop_column('resource_nodes', 'depleted_at')
+    op.drop_column('resource_node_resources', 'max_yield')
+    op.drop_column('resource_node_resources', 'remaining_yield')
@@ -0,0 +1,50 @@
+"""Added pg_trgm GIN indexes on searchable name columns
+
+Revision ID: c7d3a1f08e42
+Revises: b41c7e2d9a10
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d3a1f08e42'
+down_revision: Union[str, None] = 'b41c7e2d9a10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index, table) - every index is a GIN trigram index on the table's name column
+TRIGRAM_INDEXES = [
+    ('ix_characters_name_trgm', 'characters'),
+    ('ix_location_entities_name_trgm', 'location_entities'),
+    ('ix_settlements_name_trgm', 'settlements'),
+    ('ix_resources_name_trgm', 'resources'),
+    ('ix_resource_node_blueprints_name_trgm', 'resource_node_blueprints'),
+    ('ix_building_blueprints_name_trgm', 'building_blueprints'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # CONCURRENTLY keeps large tables writable while the indexes build; it can't run in a transaction
+    with op.get_context().autocommit_block():
+        for index_name, table_name in TRIGRAM_INDEXES:
+            op.create_index(
+                index_name, table_name, ['name'], unique=False,
+                postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'},
+                postgresql_concurrently=True, if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The pg_trgm extension is left installed; other objects may depend on it
+    with op.get_context().autocommit_block():
+        for index_name, table_name in reversed(TRIGRAM_INDEXES):
+            op.drop_index(index_name, table_name=table_name, postgresql_concurrently=True, if_exists=True)
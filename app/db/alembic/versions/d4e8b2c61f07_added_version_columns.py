@@ -0,0 +1,31 @@
+"""Added version columns for optimistic concurrency on settlements and characters
+
+Revision ID: d4e8b2c61f07
+Revises: c7d3a1f08e42
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e8b2c61f07'
+down_revision: Union[str, None] = 'c7d3a1f08e42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A constant server default makes this a catalog-only change, without rewriting either table
+    op.add_column('settlements', sa.Column('version', sa.Integer(), server_default=sa.text('1'), nullable=False))
+    op.add_column('characters', sa.Column('version', sa.Integer(), server_default=sa.text('1'), nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('characters', 'version')
+    op.drop_column('settlements', 'version')
@@ -1,35 +1,32 @@
 # app/db/async_session.py
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
 import asyncio
-import os
+from typing import Optional
 from dotenv import load_dotenv
 import logging
 from contextlib import asynccontextmanager
 
+from app.core.config import Settings, get_settings
+from app.db.replica_routing import READ_ONLY, ReplicaSet, RoutingSession, create_replica_set, read_only_execution_options
+
 load_dotenv()  # Load environment variables from .env file
 
 logger = logging.getLogger(__name__)
 
-# --- Database Connection Details ---
-DBNAME = os.getenv("DBNAME")
-DBHOST = os.getenv("DBHOST")
-DBPORT = os.getenv("DBPORT")
-DBUSER = os.getenv("DBUSER")
-DBPASSWORD = os.getenv("DBPASSWORD")
-
-# Basic validation (optional but recommended)
-if not all([DBNAME, DBHOST, DBPORT, DBUSER, DBPASSWORD]):
-    raise ValueError("One or more database environment variables are not set.")
-
-DATABASE_URL = f"postgresql+asyncpg://{DBUSER}:{DBPASSWORD}@{DBHOST}:{DBPORT}/{DBNAME}"
+# The shared engine is created on first use (or at API startup), never at import,
+# so importing models, services or workers doesn't need a database configuration.
+_default_engine: Optional[AsyncEngine] = None
+_replica_set: Optional[ReplicaSet] = None
+_replica_probe_task: Optional[asyncio.Task] = None
 
 # --- Engine creation function to ensure proper event loop binding ---
-def get_engine():
+def get_engine(settings: Optional[Settings] = None, url: Optional[str] = None):
     """
     Creates an async engine bound to the current event loop.
     This ensures connections are properly managed within the context
-    of the current event loop.
+    of the current event loop. `url` overrides the primary's URL (replicas).
     """
+    settings = settings or get_settings()
     try:
         # Get current event loop or create one
         loop = asyncio.get_running_loop()
@@ -41,28 +38,102 @@ def get_engine():
     
     # Create engine with explicit loop binding
     engine = create_async_engine(
-        DATABASE_URL,
-        echo=True,
+        url or settings.database_url,
+        echo=settings.DB_ECHO,
         future=True,
-        pool_size=5,          # Smaller pool to reduce connection issues
-        max_overflow=10,      # Reduced overflow
+        pool_size=settings.DB_POOL_SIZE,          # Smaller pool to reduce connection issues
+        max_overflow=settings.DB_MAX_OVERFLOW,    # Reduced overflow
         pool_timeout=30,      # Connection acquisition timeout
         pool_pre_ping=True,   # Checks connection validity before use
         pool_use_lifo=True,   # Prefer recently used connections
         pool_recycle=1800,    # Recycle connections after 30 minutes
+        # Room for every repository/service statement shape, so hot queries never recompile
+        query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+        connect_args={"prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE},
     )
     
     return engine
 
-# Create a default engine
-async_engine = get_engine()
-
 # --- Create the Session Factory ---
 async_session_maker = async_sessionmaker(
     expire_on_commit=False,
     class_=AsyncSession,
 )
 
+# Session factories of the shared engine; bound by init_engine(). Sessions from
+# the read factory send their SELECTs to a replica when one is configured and current.
+_default_session_maker = async_sessionmaker(
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    expire_on_commit=False,
+)
+_read_session_maker = async_sessionmaker(
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    expire_on_commit=False,
+    info={READ_ONLY: True},
+)
+
+def init_engine(settings: Optional[Settings] = None) -> AsyncEngine:
+    """Create the shared engine (and replica engines) if they don't exist yet and bind the session factories."""
+    global _default_engine, _replica_set
+    if _default_engine is None:
+        settings = settings or get_settings()
+        _default_engine = get_engine(settings)
+        _replica_set = create_replica_set(
+            [(f"replica{number}", get_engine(settings, url)) for number, url in enumerate(settings.replica_urls, 1)],
+            max_lag=settings.DB_REPLICA_MAX_LAG,
+            probe_interval=settings.DB_REPLICA_PROBE_INTERVAL,
+        )
+        read_options = read_only_execution_options(settings.DB_READ_ONLY_MODE)
+        for maker in (_default_session_maker, _read_session_maker):
+            maker.configure(bind=_default_engine, replicas=_replica_set, read_execution_options=read_options)
+        logger.info(f"Initialized shared database engine ({len(_replica_set.engines)} read replicas)")
+    return _default_engine
+
+def start_replica_probes(settings: Optional[Settings] = None) -> None:
+    """
+    Start measuring replica lag in the background. Until the first probe
+    completes, and in processes that never call this, reads use the primary.
+    """
+    global _replica_probe_task
+    init_engine(settings)
+    if _replica_set and _replica_probe_task is None:
+        interval = (settings or get_settings()).DB_REPLICA_PROBE_INTERVAL
+        _replica_probe_task = asyncio.get_running_loop().create_task(_replica_set.run_probes(interval))
+
+def get_default_engine() -> AsyncEngine:
+    """The shared engine, created on first use."""
+    return init_engine()
+
+def get_session_factory() -> async_sessionmaker:
+    """Session factory bound to the shared engine, creating the engine on first use."""
+    init_engine()
+    return _default_session_maker
+
+def get_read_session_factory() -> async_sessionmaker:
+    """Like get_session_factory(), for sessions that only read (exports, search, context building)."""
+    init_engine()
+    return _read_session_maker
+
+def get_replica_set() -> Optional[ReplicaSet]:
+    """The shared engine's replicas, or None before init_engine()."""
+    return _replica_set
+
+async def dispose_engine() -> None:
+    """Close the shared engine's pool (and the replicas'). The next use creates a fresh engine."""
+    global _default_engine, _replica_set, _replica_probe_task
+    if _replica_probe_task is not None:
+        _replica_probe_task.cancel()
+        _replica_probe_task = None
+    if _replica_set is not None:
+        replicas, _replica_set = _replica_set, None
+        await replicas.dispose()
+    if _default_engine is not None:
+        engine, _default_engine = _default_engine, None
+        await engine.dispose()
+        logger.info("Disposed shared database engine")
+
 # --- Session creation function ---
 async def get_session():
     """
@@ -73,12 +144,16 @@ async def get_session():
     session = async_session_maker(bind=engine)
     return session
 
-# Backward compatibility for existing code
-async_session_local = async_sessionmaker(
-    bind=async_engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-)
+def __getattr__(name):
+    # Backward compatibility for code importing the old import-time objects;
+    # resolving them creates the shared engine on first access.
+    if name == "async_engine":
+        return get_default_engine()
+    if name == "async_session_local":
+        return get_session_factory()
+    if name == "DATABASE_URL":
+        return get_settings().database_url
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Context manager for safely using a session
 @asynccontextmanager
@@ -93,4 +168,4 @@ async def get_db_session():
     try:
         yield session
     finally:
-        await session.close()
\ No newline at end of file
+        await session.close()
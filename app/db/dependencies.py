@@ -1,35 +1,46 @@
 # Inside app/db/dependencies.py
 import logging
-from app.db.async_session import async_session_local # Use your factory
+import time
+from app.db.async_session import get_session_factory
+from app.db.replica_routing import READ_ONLY, WROTE
+from app.db.transaction_metrics import TransactionMetrics
+from fastapi import Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import AsyncGenerator
 
-async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
-    """FastAPI dependency using explicit commit/rollback for debugging."""
-    logging.info(">>> [Dependency] Creating session...")
-    session: AsyncSession = async_session_local()
-    session_closed = False
+logger = logging.getLogger(__name__)
+
+# Requests with these methods may read from a replica until they write
+READ_ONLY_METHODS = frozenset({"GET", "HEAD"})
+
+def session_has_writes(session: AsyncSession) -> bool:
+    """Whether the session sent a write (see RoutingSession) or holds unflushed changes."""
+    return bool(session.info.get(WROTE) or session.new or session.dirty or session.deleted)
+
+async def get_async_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Request-scoped session. Commits only if the request wrote through it;
+    otherwise the transaction is closed without a COMMIT. GET/HEAD sessions
+    are read-only (replica reads, BEGIN READ ONLY; see app.db.replica_routing).
+    """
+    read_only = request.method in READ_ONLY_METHODS
+    session: AsyncSession = get_session_factory()(info={READ_ONLY: read_only})
+    started = time.perf_counter()
+    outcome = "rolled_back"
     try:
-        # Begin isn't strictly necessary with autocommit=False (default)
-        # but can make transaction boundaries explicit if needed.
-        # await session.begin() # Optional explicit begin
-        logging.info(f">>> [Dependency] Session {id(session)} created.")
         yield session
-        # --- Explicit Commit ---
-        logging.info(f">>> [Dependency] Yield completed for session {id(session)}. Attempting explicit commit...")
-        await session.commit()
-        logging.info(f">>> [Dependency] Explicit commit successful for session {id(session)}.")
+        if session_has_writes(session):
+            await session.commit()
+            outcome = "committed"
+        else:
+            outcome = "read"
     except Exception as e:
-        logging.error(f">>> [Dependency] Exception escaped yield for session {id(session)}: {e}", exc_info=True)
-        logging.info(f">>> [Dependency] Attempting explicit rollback for session {id(session)}...")
+        logger.debug(f"Rolling back session {id(session)} after {type(e).__name__}: {e}")
         await session.rollback()
-        logging.info(f">>> [Dependency] Explicit rollback successful for session {id(session)}.")
-        raise # Re-raise exception for FastAPI
+        raise
     finally:
-        if not session_closed and session.is_active: # Check if active before closing
-             logging.info(f">>> [Dependency] Closing session {id(session)}...")
-             await session.close()
-             session_closed = True
-             logging.info(f">>> [Dependency] Session {id(session)} closed.")
-        else:
-             logging.info(f">>> [Dependency] Session {id(session)} already closed or inactive in finally block.")
\ No newline at end of file
+        # Ends a read transaction (rollback) and returns the connection to the pool
+        await session.close()
+        elapsed = time.perf_counter() - started
+        TransactionMetrics.record(outcome, read_only, elapsed)
+        logger.debug(f"{request.method} {request.url.path}: session {outcome} after {elapsed * 1000:.1f}ms")
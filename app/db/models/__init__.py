@@ -12,6 +12,7 @@ from app.db.models.resources.resource_node_blueprint_link import ResourceNodeBlu
 from app.db.models.resources.resource_instance import ResourceInstance
 from app.db.models.resources.resource_node import ResourceNode
 from app.db.models.resources.resource_node_link import ResourceNodeResource
+from app.db.models.resources.resource_node_respawn import ResourceNodeRespawn
 from .season import Season
 from .building_blueprint import BuildingBlueprint
 from .blueprint_stage import BlueprintStage
@@ -37,6 +38,7 @@ from .action_template import ActionTemplate
 from .tool_tier import ToolTier
 from .faction import Faction
 from .location_sub_type import LocationSubType
+from .outbox_event import OutboxEvent
 from .resources.resource_instance import ResourceInstance
 
 # The following models are DEPRECATED and will be replaced by LocationInstance:
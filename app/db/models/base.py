@@ -1,6 +1,7 @@
 # --- START - app/db/models/base.py ---
 
-from sqlalchemy.orm import DeclarativeBase, class_mapper
+from sqlalchemy import Integer, text
+from sqlalchemy.orm import DeclarativeBase, Mapped, class_mapper, mapped_column
 from sqlalchemy.inspection import inspect as sa_inspect
 
 # 1. Define the Mixin with the desired functionality
@@ -38,4 +39,13 @@ class Base(ReprMixin, DeclarativeBase):
     pass
 
 
+class VersionedMixin:
+    """
+    Opt-in optimistic concurrency. BaseRepository bumps `version` on every write
+    to a versioned model, and its versioned writes (update_versioned,
+    update_with_retry) only apply while the row still has the version they read.
+    """
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default=text("1"))
+
+
 # --- END - app/db/models/base.py ---
\ No newline at end of file
@@ -6,7 +6,7 @@ from typing import Optional, List, Dict, Any
 
 from sqlalchemy import (
     Integer, String, Text, Boolean, DateTime, Float,
-    ForeignKey, UniqueConstraint, func, text
+    ForeignKey, UniqueConstraint, Index, func, text
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID as pgUUID, JSONB
@@ -103,6 +103,8 @@ class BuildingBlueprint(Base):
 
     __table_args__ = (
         UniqueConstraint('name', 'theme_id', name='uq_bp_name_theme'), # Shortened constraint name
+        # Trigram index for fuzzy name search (pg_trgm)
+        Index("ix_building_blueprints_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
         # {'schema': 'my_schema'}
     )
 
@@ -6,12 +6,12 @@ from typing import Optional, List, Dict, Any
 
 from sqlalchemy import (
     Integer, String, DateTime, func, ForeignKey, Boolean,
-    Enum as SQLAlchemyEnum, Text, Table, Column, text
+    Enum as SQLAlchemyEnum, Text, Table, Column, text, Index
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects import postgresql as pg
 
-from .base import Base
+from .base import Base, VersionedMixin
 from app.game_state.enums.character import CharacterTypeEnum, CharacterStatusEnum, CharacterTraitEnum
 
 # TYPE CHECKING IMPORTS
@@ -34,8 +34,12 @@ character_skills_association = Table(
     Column("xp", Integer, nullable=False, default=0, server_default='0')
 )
 
-class Character(Base):
+class Character(VersionedMixin, Base):
     __tablename__ = 'characters'
+    __table_args__ = (
+        # Trigram index for fuzzy name search (pg_trgm)
+        Index("ix_characters_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(pg.UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     name: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
@@ -5,7 +5,7 @@ from uuid import UUID
 from datetime import datetime
 from typing import Optional, List, Dict, Any, TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, String, DateTime, func, Boolean, Integer, CheckConstraint
+from sqlalchemy import ForeignKey, String, DateTime, func, Boolean, Integer, CheckConstraint, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects import postgresql as pg
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
@@ -38,6 +38,8 @@ class LocationInstance(Base):
             "parent_id IS NULL OR parent_id <> id",
             name="ck_location_no_self_parent"
         ),
+        # Trigram index for fuzzy name search (pg_trgm)
+        Index("ix_location_entities_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
         {'extend_existing': True},
     )
 
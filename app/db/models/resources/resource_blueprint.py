@@ -6,7 +6,7 @@ from typing import Optional, TYPE_CHECKING, List
 
 # Core SQLAlchemy imports
 from sqlalchemy import (
-    Integer, String, DateTime, func, Enum, Text
+    Integer, String, DateTime, func, Enum, Text, Index
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
@@ -25,7 +25,11 @@ class ResourceBlueprint(Base):
     SQLAlchemy ORM Model for Resource Types.
     """
     __tablename__ = 'resources'
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # Trigram index for fuzzy name search (pg_trgm)
+        Index("ix_resources_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        {'extend_existing': True},
+    )
 
     resource_id: Mapped[uuid.UUID] = mapped_column(
         "id",
@@ -4,7 +4,7 @@ from typing import Optional, List, Dict, Any, TYPE_CHECKING
 
 from sqlalchemy import (
     String, Text, Boolean,
-    DateTime, Enum, func, ForeignKey
+    DateTime, Enum, func, ForeignKey, Index, text
 )
 
 from sqlalchemy.dialects.postgresql import UUID as PGUUID, JSONB, ARRAY
@@ -20,7 +20,12 @@ if TYPE_CHECKING:
 
 class ResourceNode(Base):
     __tablename__ = "resource_nodes"
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # Partial indexes so active/depleted lookups never scan the whole table
+        Index("ix_resource_nodes_location_active", "location_id", postgresql_where=text("depleted = false")),
+        Index("ix_resource_nodes_location_depleted", "location_id", postgresql_where=text("depleted = true")),
+        {'extend_existing': True},
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         PGUUID(as_uuid=True),
@@ -50,6 +55,11 @@ class ResourceNode(Base):
         default=False
     )
 
+    depleted_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True
+    )
+
     status: Mapped[StatusEnum] = mapped_column(
         Enum(StatusEnum, name="resource_node_status_enum", create_type=False),
         nullable=False,
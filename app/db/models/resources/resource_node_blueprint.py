@@ -4,7 +4,7 @@ from typing import Optional, List, Dict, Any, TYPE_CHECKING
 
 from sqlalchemy import (
     String, Text, Boolean,
-    DateTime, Enum, func
+    DateTime, Enum, func, Index
 )
 from sqlalchemy.dialects.postgresql import UUID as PGUUID, JSONB, ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -24,6 +24,10 @@ class ResourceNodeBlueprint(Base):
     These are templates that can be used to generate resource node instances.
     """
     __tablename__ = "resource_node_blueprints"
+    __table_args__ = (
+        # Trigram index for fuzzy name search (pg_trgm)
+        Index("ix_resource_node_blueprints_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+    )
 
     id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
@@ -23,6 +23,9 @@ class ResourceNodeResource(Base):
     amount_max: Mapped[int] = mapped_column(Integer, default=1)
     purity: Mapped[float] = mapped_column(Float, default=1.0)
     rarity: Mapped[str] = mapped_column(String, default="common")
+    # Units left before the link is exhausted; NULL until first extraction (see ResourceNodeLifecycleManager)
+    remaining_yield: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    max_yield: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     _metadata: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True, default=dict)
 
     node = relationship("ResourceNode", back_populates="resource_links")
@@ -0,0 +1,41 @@
+# app/db/models/resources/resource_node_respawn.py
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, func
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.models.base import Base
+
+
+class ResourceNodeRespawn(Base):
+    """
+    Respawn queue for depleted resource nodes.
+    One row per depleted node, ordered by respawn_at; rows are deleted when the node respawns.
+    """
+    __tablename__ = "resource_node_respawns"
+    __table_args__ = (
+        Index("ix_resource_node_respawns_respawn_at", "respawn_at"),
+    )
+
+    node_id: Mapped[uuid.UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("resource_nodes.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+
+    respawn_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False
+    )
+
+    scheduled_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<ResourceNodeRespawn(node_id={self.node_id}, respawn_at={self.respawn_at})>"
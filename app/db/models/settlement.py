@@ -3,13 +3,13 @@
 #
 # This file is kept temporarily for compatibility during transition.
 
-from sqlalchemy import Integer, String, DateTime, func, ForeignKey
+from sqlalchemy import Integer, String, DateTime, func, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects import postgresql as pg
 from sqlalchemy.dialects.postgresql import JSONB
 from app.db.models.building_instance import BuildingInstanceDB
 from sqlalchemy.sql import text
-from .base import Base
+from .base import Base, VersionedMixin
 import uuid
 from datetime import datetime
 from typing import Optional, List, TYPE_CHECKING
@@ -19,12 +19,16 @@ if TYPE_CHECKING:
     from .character import Character
     from .zone import Zone
 
-class Settlement(Base):
+class Settlement(VersionedMixin, Base):
     """
     DEPRECATED - Use LocationInstance with appropriate location_type instead.
     This model is kept only for backward compatibility during transition.
     """
     __tablename__ = 'settlements'
+    __table_args__ = (
+        # Trigram index for fuzzy name search (pg_trgm)
+        Index("ix_settlements_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+    )
 
     # --- Fields REQUIRED in Python __init__ (Non-Defaults first) ---
     # Foreign Key to worlds table (No Python default, required)
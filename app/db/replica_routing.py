@@ -0,0 +1,195 @@
+# app/db/replica_routing.py
+"""
+Read-replica routing for the async session.
+
+Sessions marked read-only (session.info["read_only"], set by get_async_db for
+GET requests and by get_read_session_factory() for exports and search) send
+their plain SELECTs to a streaming replica. Everything else goes to the
+primary: writes, SELECT ... FOR UPDATE, text() statements and explicit
+connections. Every session records in session.info["wrote"] whether it sent
+any of those; a read-only session that wrote reads from the primary for the
+rest of its life, so a request always reads its own writes.
+
+Reads of read-only sessions also run with DB_READ_ONLY_MODE's execution
+options, on replica and primary alike: "transaction" opens them with BEGIN
+READ ONLY (no extra round trip; asyncpg folds it into the BEGIN),
+"autocommit" skips BEGIN and ROLLBACK altogether, at the cost of each
+statement seeing its own snapshot.
+
+A replica is only used while a recent probe measured its replay lag at or
+under DB_REPLICA_MAX_LAG seconds; when none qualifies (or no probe has run,
+as in Celery workers) reads fall back to the primary. For local testing,
+DB_REPLICA_URLS can point at any second PostgreSQL instance: a server that
+isn't in recovery reports zero lag.
+"""
+import asyncio
+import itertools
+import logging
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.selectable import CompoundSelect, Select
+
+logger = logging.getLogger(__name__)
+
+# session.info keys
+READ_ONLY = "read_only"
+WROTE = "wrote"
+
+# Execution options applied to the reads of read-only sessions, by DB_READ_ONLY_MODE
+READ_ONLY_MODES: Dict[str, Dict[str, Any]] = {
+    "transaction": {"postgresql_readonly": True},
+    "autocommit": {"isolation_level": "AUTOCOMMIT"},
+    "": {},
+}
+
+# Seconds the replica is behind the primary; 0 when it has replayed everything it received
+REPLICA_LAG_SQL = text(
+    "SELECT COALESCE(CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END, 0)"
+)
+
+
+class ReplicaSet:
+    """
+    The replica engines and their last measured lag. Probes run in the
+    background (run_probes); picking a replica for a session only reads the
+    last measurements, so routing never waits on the network.
+    """
+
+    def __init__(self, engines: Sequence[Tuple[str, AsyncEngine]], max_lag: float, stale_after: float):
+        self.engines: Dict[str, AsyncEngine] = dict(engines)
+        self.max_lag = max_lag
+        self.stale_after = stale_after
+        self._lag: Dict[str, Tuple[float, float]] = {}      # name -> (lag seconds, measured at)
+        self._order = itertools.cycle(list(self.engines))
+        self.stats = {"replica_sessions": 0, "primary_fallbacks": 0}
+
+    def __bool__(self) -> bool:
+        return bool(self.engines)
+
+    def record_lag(self, name: str, lag: Optional[float], now: Optional[float] = None) -> None:
+        """Store a probe result; None marks the replica unreachable."""
+        if lag is None:
+            self._lag.pop(name, None)
+        else:
+            self._lag[name] = (lag, time.monotonic() if now is None else now)
+
+    def is_healthy(self, name: str, now: Optional[float] = None) -> bool:
+        measured = self._lag.get(name)
+        if measured is None:
+            return False
+        lag, measured_at = measured
+        now = time.monotonic() if now is None else now
+        return lag <= self.max_lag and now - measured_at <= self.stale_after
+
+    def pick(self, now: Optional[float] = None) -> Optional[str]:
+        """Next healthy replica in round-robin order, or None to use the primary."""
+        for _ in range(len(self.engines)):
+            name = next(self._order)
+            if self.is_healthy(name, now):
+                self.stats["replica_sessions"] += 1
+                return name
+        if self.engines:
+            self.stats["primary_fallbacks"] += 1
+        return None
+
+    def sync_engine(self, name: str) -> Engine:
+        return self.engines[name].sync_engine
+
+    async def probe(self) -> Dict[str, Optional[float]]:
+        """Measure every replica's lag once."""
+        async def measure(name: str, engine: AsyncEngine) -> Optional[float]:
+            try:
+                async with engine.connect() as connection:
+                    return float((await connection.execute(REPLICA_LAG_SQL)).scalar_one())
+            except Exception as e:
+                logger.warning(f"Replica {name} probe failed: {e}")
+                return None
+
+        names = list(self.engines)
+        lags = await asyncio.gather(*(measure(name, self.engines[name]) for name in names))
+        for name, lag in zip(names, lags):
+            self.record_lag(name, lag)
+            if lag is not None and lag > self.max_lag:
+                logger.info(f"Replica {name} is {lag:.1f}s behind; reading from the primary until it catches up")
+        return dict(zip(names, lags))
+
+    async def run_probes(self, interval: float) -> None:
+        """Probe forever, every `interval` seconds. Run as a task; cancel to stop."""
+        while True:
+            await self.probe()
+            await asyncio.sleep(interval)
+
+    async def dispose(self) -> None:
+        for engine in self.engines.values():
+            await engine.dispose()
+
+
+def read_only_execution_options(mode: str) -> Dict[str, Any]:
+    """Execution options for a DB_READ_ONLY_MODE. Raises ValueError for unknown modes."""
+    try:
+        return READ_ONLY_MODES[mode.strip().lower()]
+    except KeyError:
+        raise ValueError(f"Unknown DB_READ_ONLY_MODE {mode!r}; expected one of {sorted(READ_ONLY_MODES)}") from None
+
+
+# (engine, options) -> engine sharing the pool but applying the options; stable, so a
+# session keeps using the same connection for it
+_option_engines: Dict[Tuple[Engine, Tuple[Tuple[str, Any], ...]], Engine] = {}
+
+
+def _with_options(engine: Engine, options: Dict[str, Any]) -> Engine:
+    if not options:
+        return engine
+    key = (engine, tuple(sorted(options.items())))
+    option_engine = _option_engines.get(key)
+    if option_engine is None:
+        option_engine = _option_engines[key] = engine.execution_options(**options)
+    return option_engine
+
+
+class RoutingSession(Session):
+    """
+    Sync session behind AsyncSession that chooses the engine per statement.
+    Read-only sessions stick to one replica (chosen on their first read) so
+    their reads don't jump between replicas at different replay positions.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        replicas: Optional[ReplicaSet] = None,
+        read_execution_options: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ):
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas
+        self.read_execution_options = read_execution_options or {}
+        self._replica: Optional[str] = None
+
+    @staticmethod
+    def is_plain_read(clause: Any) -> bool:
+        if isinstance(clause, CompoundSelect):
+            return True
+        return isinstance(clause, Select) and clause._for_update_arg is None
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._flushing or not self.is_plain_read(clause):
+            # A write (or locking/opaque statement): from here on everything uses the primary
+            self.info[WROTE] = True
+        elif self.info.get(READ_ONLY) and not self.info.get(WROTE):
+            if self._replica is None:
+                self._replica = (self.replicas.pick() if self.replicas else None) or ""
+            engine = self.replicas.sync_engine(self._replica) if self._replica else super().get_bind(mapper, clause=clause, **kwargs)
+            return _with_options(engine, self.read_execution_options)
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+
+def create_replica_set(engines: List[Tuple[str, AsyncEngine]], max_lag: float, probe_interval: float) -> ReplicaSet:
+    """Replica set whose measurements go stale after three missed probes."""
+    return ReplicaSet(engines, max_lag=max_lag, stale_after=3 * probe_interval)
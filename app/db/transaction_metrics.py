@@ -0,0 +1,50 @@
+# app/db/transaction_metrics.py
+"""
+Process-wide counters for request-scoped transactions (get_async_db).
+"""
+import time
+from typing import Dict
+
+# How a request's session ended
+OUTCOMES = ("committed", "read", "rolled_back")
+
+
+class TransactionMetrics:
+    """
+    Per-outcome request counts and time spent holding the session, split by
+    whether the request was read-only. Served at /status/db.
+    """
+
+    # Class-level counters, shared across the process: key -> [count, total seconds, max seconds]
+    _counters: Dict[str, list] = {}
+    _since: float = time.time()
+
+    @classmethod
+    def record(cls, outcome: str, read_only: bool, seconds: float) -> None:
+        key = f"{'read_only' if read_only else 'read_write'}.{outcome}"
+        counter = cls._counters.setdefault(key, [0, 0.0, 0.0])
+        counter[0] += 1
+        counter[1] += seconds
+        if seconds > counter[2]:
+            counter[2] = seconds
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._counters = {}
+        cls._since = time.time()
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Dict[str, float]]:
+        """Count, mean and max session seconds for each request kind and outcome."""
+        return {
+            key: {
+                "count": count,
+                "mean_seconds": round(total / count, 6),
+                "max_seconds": round(longest, 6),
+            }
+            for key, (count, total, longest) in sorted(cls._counters.items())
+        }
+
+    @classmethod
+    def since(cls) -> float:
+        return cls._since
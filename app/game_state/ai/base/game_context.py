@@ -69,6 +69,7 @@ class GameContext(BaseModel):
         """
         Build context for location entities.
         """
+        from app.game_state.services.world.calendar_service import CalendarService
         from app.game_state.entities.geography.location_pydantic import LocationEntityPydantic
         
         # For now, only support locations
@@ -91,6 +92,13 @@ class GameContext(BaseModel):
         })
         context.metadata["settlement_buildings"] = entity.get_attribute("buildings", [])
         context.metadata["nearby_resource_types"] = entity.get_attribute("nearby_resources", ["wood", "stone"])
+
+        # Calendar state published by the daily tick, resolved read-only on a miss
+        snapshot = await CalendarService(db).get_snapshot(entity.world_id) if entity.world_id else None
+        if snapshot:
+            context.metadata["current_season"] = snapshot.season_name.lower()
+            context.metadata["day_of_season"] = snapshot.day_of_season
+            context.metadata["celestial_events"] = list(snapshot.celestial_events)
         
         # Set basic technologies
         context.available_technologies = ["basic_construction", "agriculture"]
@@ -0,0 +1,77 @@
+"""
+Cache for per-biome resource node alias tables so spawning doesn't re-query blueprints
+"""
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+from app.core.cache_invalidation import CacheInvalidationBus
+from app.game_state.managers.resource_distribution_manager import AliasTable
+
+
+class BiomeSamplerCache:
+    """
+    Cache for biome blueprint samplers, keyed by biome code (Biome.biome_id,
+    which is what ResourceNodeBlueprint.biome_type refers to).
+
+    A biome without blueprints is cached as None so it isn't reloaded on every
+    spawn. Entries are invalidated when a biome or any blueprint changes.
+    """
+
+    # Class-level cache, shared across all instances
+    _cache: Dict[str, Tuple[Optional[AliasTable], float]] = {}
+
+    # Default TTL in seconds
+    DEFAULT_TTL = 3600  # 1 hour
+
+    @classmethod
+    def _entry(cls, biome_type: str) -> Optional[Tuple[Optional[AliasTable], float]]:
+        entry = cls._cache.get(biome_type)
+        if entry is not None and entry[1] < time.time():
+            cls._cache.pop(biome_type, None)
+            return None
+        return entry
+
+    @classmethod
+    def get(cls, biome_type: str) -> Optional[AliasTable]:
+        """Get a biome's sampler if it is cached and has blueprints."""
+        entry = cls._entry(biome_type)
+        return entry[0] if entry else None
+
+    @classmethod
+    def missing(cls, biome_types: Iterable[str]) -> set:
+        """Biome codes without a live entry."""
+        return {biome_type for biome_type in biome_types if cls._entry(biome_type) is None}
+
+    @classmethod
+    def set(cls, biome_type: str, table: Optional[AliasTable], ttl: int = DEFAULT_TTL) -> None:
+        """Add or replace a biome's sampler; None records that the biome has no blueprints."""
+        cls._cache[biome_type] = (table, time.time() + ttl)
+
+    @classmethod
+    def invalidate(cls, biome_type: Optional[str]) -> None:
+        """Remove one biome's sampler, e.g. after its resource_types changed."""
+        if biome_type is not None:
+            cls._cache.pop(biome_type, None)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Clear the entire cache, e.g. after a blueprint changed biome or weights."""
+        cls._cache.clear()
+
+    @classmethod
+    def get_cache_stats(cls) -> Dict[str, int]:
+        """Get cache statistics"""
+        now = time.time()
+        active = sum(1 for _, expiry in cls._cache.values() if expiry >= now)
+        return {
+            "total_entries": len(cls._cache),
+            "active_entries": active,
+            "expired_entries": len(cls._cache) - active,
+            "empty_biomes": sum(1 for table, _ in cls._cache.values() if table is None),
+        }
+
+
+# Writes in any process drop the samplers here. Samplers are keyed by biome code,
+# not by row id, so any biome or blueprint write clears them all.
+for _entity_kind in ("biomes", "resource_node_blueprints", "resource_node_blueprint_resources"):
+    CacheInvalidationBus.register(_entity_kind, lambda entity_id, version: BiomeSamplerCache.clear(), BiomeSamplerCache.clear)
@@ -0,0 +1,144 @@
+"""
+Cache for precomputed theme calendars and per-world calendar snapshots
+"""
+import time
+from typing import Dict, Iterable, Optional, Tuple
+from uuid import UUID
+
+from app.core.cache_invalidation import CacheInvalidationBus
+
+from app.game_state.managers.calendar_manager import CalendarTable, WorldStateSnapshot
+
+
+class CalendarCache:
+    """
+    Cache for theme calendar tables.
+
+    Tables only change when a theme's seasons or celestial events change, so
+    they are kept for a long TTL and invalidated explicitly on edits.
+    The key None holds the default calendar for worlds without a theme.
+    """
+
+    # Class-level cache, shared across all instances
+    _cache: Dict[Optional[UUID], Tuple[CalendarTable, float]] = {}
+
+    # Default TTL in seconds
+    DEFAULT_TTL = 24 * 3600  # 1 day
+
+    @classmethod
+    def get(cls, theme_id: Optional[UUID]) -> Optional[CalendarTable]:
+        """Get a theme's table if it exists and is not expired."""
+        entry = cls._cache.get(theme_id)
+        if entry is None:
+            return None
+
+        table, expiry_time = entry
+        if expiry_time < time.time():
+            cls._cache.pop(theme_id, None)
+            return None
+
+        return table
+
+    @classmethod
+    def missing(cls, theme_ids: Iterable[Optional[UUID]]) -> set:
+        """Theme ids without a live table."""
+        return {theme_id for theme_id in theme_ids if cls.get(theme_id) is None}
+
+    @classmethod
+    def set(cls, theme_id: Optional[UUID], table: CalendarTable, ttl: int = DEFAULT_TTL) -> None:
+        """Add or replace a theme's table."""
+        cls._cache[theme_id] = (table, time.time() + ttl)
+
+    @classmethod
+    def invalidate(cls, theme_id: Optional[UUID]) -> None:
+        """Remove a theme's table, e.g. after its seasons changed."""
+        cls._cache.pop(theme_id, None)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Clear the entire cache"""
+        cls._cache.clear()
+
+
+class WorldStateCache:
+    """
+    Cache for the calendar snapshot of each world, published once per tick.
+    Wildlife, economy and action code read the current season from here
+    instead of querying the world.
+    """
+
+    # Class-level cache, shared across all instances
+    _cache: Dict[UUID, Tuple[WorldStateSnapshot, float]] = {}
+
+    # Default TTL in seconds
+    DEFAULT_TTL = 2 * 3660  # two world ticks
+
+    @classmethod
+    def get(cls, world_id: UUID) -> Optional[WorldStateSnapshot]:
+        """Get a world's snapshot if it exists and is not expired."""
+        entry = cls._cache.get(world_id)
+        if entry is None:
+            return None
+
+        snapshot, expiry_time = entry
+        if expiry_time < time.time():
+            cls._cache.pop(world_id, None)
+            return None
+
+        return snapshot
+
+    @classmethod
+    def publish(cls, snapshots: Iterable[WorldStateSnapshot], ttl: int = DEFAULT_TTL) -> None:
+        """Replace the snapshots of the given worlds."""
+        expiry_time = time.time() + ttl
+        for snapshot in snapshots:
+            cls._cache[snapshot.world_id] = (snapshot, expiry_time)
+
+    @classmethod
+    def invalidate(cls, world_id: UUID) -> None:
+        """Remove a world's snapshot."""
+        cls._cache.pop(world_id, None)
+
+    @classmethod
+    def invalidate_before(cls, world_id: UUID, day: Optional[int]) -> None:
+        """Remove a world's snapshot unless it is already for `day` or later."""
+        entry = cls._cache.get(world_id)
+        if entry is not None and (day is None or entry[0].day < day):
+            cls._cache.pop(world_id, None)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Clear the entire cache"""
+        cls._cache.clear()
+
+    @classmethod
+    def get_cache_stats(cls) -> Dict:
+        """Get statistics about the current cache state"""
+        current_time = time.time()
+        active_entries = sum(1 for _, expiry in cls._cache.values() if expiry > current_time)
+
+        return {
+            "total_entries": len(cls._cache),
+            "active_entries": active_entries,
+            "expired_entries": len(cls._cache) - active_entries
+        }
+
+
+def _uuid(entity_id: Optional[str]) -> Optional[UUID]:
+    return UUID(entity_id) if entity_id else None
+
+
+# Writes in any process drop the affected entries here. A season or celestial
+# event doesn't say which theme it belongs to, so those clear every table.
+CacheInvalidationBus.register("themes", lambda theme_id, version: CalendarCache.invalidate(_uuid(theme_id)), CalendarCache.clear)
+CacheInvalidationBus.register("seasons", lambda entity_id, version: CalendarCache.clear(), CalendarCache.clear)
+CacheInvalidationBus.register("celestial_events", lambda entity_id, version: CalendarCache.clear(), CalendarCache.clear)
+
+# Not a table: CalendarService.resolve_worlds records one per world it resolves,
+# with the resolved day as the version. Other processes drop their older
+# snapshot, while the tick's own process keeps the one it just published.
+# Generic "worlds" row writes don't touch snapshots.
+WORLD_STATE_KIND = "world_state"
+CacheInvalidationBus.register(
+    WORLD_STATE_KIND, lambda world_id, day: WorldStateCache.invalidate_before(_uuid(world_id), day), WorldStateCache.clear,
+)
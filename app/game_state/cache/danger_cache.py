@@ -0,0 +1,111 @@
+"""
+Cache for per-location danger scores so routing and travel ETA don't query for them
+"""
+import time
+from typing import Dict, Optional, Tuple
+from uuid import UUID
+
+from app.core.cache_invalidation import CacheInvalidationBus
+
+
+class DangerCache:
+    """
+    Cache for location danger maps, one per world.
+
+    Each world's map holds (day_danger, night_danger) per location and is
+    replaced wholesale by the wildlife tick, so readers always see one
+    consistent snapshot. Maps expire after a TTL a little longer than a tick.
+    """
+
+    # Class-level cache, shared across all instances
+    _cache: Dict[UUID, Tuple[Dict[UUID, Tuple[float, float]], float]] = {}
+
+    # Reverse index so a location can be looked up without knowing its world
+    _location_world: Dict[UUID, UUID] = {}
+
+    # World day each map was built for, where known
+    _map_days: Dict[UUID, int] = {}
+
+    # Default TTL in seconds
+    DEFAULT_TTL = 2 * 3660  # two world ticks
+
+    @classmethod
+    def get_world(cls, world_id: UUID) -> Optional[Dict[UUID, Tuple[float, float]]]:
+        """Get a world's danger map if it exists and is not expired."""
+        entry = cls._cache.get(world_id)
+        if entry is None:
+            return None
+
+        danger_map, expiry_time = entry
+        if expiry_time < time.time():
+            cls.invalidate(world_id)
+            return None
+
+        return danger_map
+
+    @classmethod
+    def get(cls, location_id: UUID, night: bool = False) -> Optional[float]:
+        """Danger of one location, or None if its world's map isn't cached."""
+        world_id = cls._location_world.get(location_id)
+        danger_map = cls.get_world(world_id) if world_id else None
+        if danger_map is None or location_id not in danger_map:
+            return None
+        return danger_map[location_id][1 if night else 0]
+
+    @classmethod
+    def set_world(
+        cls, world_id: UUID, danger_map: Dict[UUID, Tuple[float, float]], ttl: int = DEFAULT_TTL, day: Optional[int] = None,
+    ) -> None:
+        """Replace a world's danger map, built for the given world day if known."""
+        cls.invalidate(world_id)
+        cls._cache[world_id] = (danger_map, time.time() + ttl)
+        if day is not None:
+            cls._map_days[world_id] = day
+        for location_id in danger_map:
+            cls._location_world[location_id] = world_id
+
+    @classmethod
+    def invalidate(cls, world_id: UUID) -> None:
+        """Remove a world's map."""
+        entry = cls._cache.pop(world_id, None)
+        cls._map_days.pop(world_id, None)
+        if entry:
+            for location_id in entry[0]:
+                cls._location_world.pop(location_id, None)
+
+    @classmethod
+    def invalidate_before(cls, world_id: UUID, day: Optional[int]) -> None:
+        """Remove a world's map unless it was built for `day` or later."""
+        built_for = cls._map_days.get(world_id)
+        if day is None or built_for is None or built_for < day:
+            cls.invalidate(world_id)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Clear the entire cache"""
+        cls._cache.clear()
+        cls._location_world.clear()
+        cls._map_days.clear()
+
+    @classmethod
+    def get_cache_stats(cls) -> Dict:
+        """Get statistics about the current cache state"""
+        current_time = time.time()
+        active_entries = sum(1 for _, expiry in cls._cache.values() if expiry > current_time)
+
+        return {
+            "total_entries": len(cls._cache),
+            "active_entries": active_entries,
+            "expired_entries": len(cls._cache) - active_entries,
+            "locations": len(cls._location_world),
+        }
+
+
+# Not a table: the wildlife tick records one per world with the day it was
+# built for, so other processes drop older maps and the tick's process keeps its own
+LOCATION_DANGER_KIND = "location_danger"
+CacheInvalidationBus.register(
+    LOCATION_DANGER_KIND,
+    lambda world_id, day: DangerCache.invalidate_before(UUID(world_id), day) if world_id else DangerCache.clear(),
+    DangerCache.clear,
+)
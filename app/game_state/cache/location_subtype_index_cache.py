@@ -0,0 +1,84 @@
+"""
+Cache for the location subtype facet index so subtype queries don't hit the database
+"""
+import time
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache_invalidation import CacheInvalidationBus
+
+from app.game_state.managers.location_subtype_index_manager import SubtypeFacetIndex
+
+
+class LocationSubtypeIndexCache:
+    """
+    Cache for the process-wide location subtype index.
+
+    Subtype writes invalidate it and the next read rebuilds it. Writes are only
+    visible to other sessions once committed, so invalidate_on_commit also
+    drops any index rebuilt between the write and its commit. Every clear bumps
+    a generation number; an index built from data read before a clear is not
+    stored. Writes made by other processes clear it through
+    app.core.cache_invalidation; the TTL bounds staleness if a message is lost.
+    """
+
+    # Class-level cache, shared across all instances: (index, expiry)
+    _entry: Optional[Tuple[SubtypeFacetIndex, float]] = None
+    _generation: int = 0
+
+    # Default TTL in seconds
+    DEFAULT_TTL = 300  # 5 minutes
+
+    @classmethod
+    def get(cls) -> Optional[SubtypeFacetIndex]:
+        """The cached index, or None if there is none or it expired."""
+        entry = cls._entry
+        if entry is None:
+            return None
+        if entry[1] < time.time():
+            cls._entry = None
+            return None
+        return entry[0]
+
+    @classmethod
+    def generation(cls) -> int:
+        """Take before loading the rows to index; pass to set()."""
+        return cls._generation
+
+    @classmethod
+    def set(cls, index: SubtypeFacetIndex, generation: int, ttl: int = DEFAULT_TTL) -> bool:
+        """Store an index unless the cache was cleared after its rows were read. Returns whether it was stored."""
+        if generation != cls._generation:
+            return False
+        cls._entry = (index, time.time() + ttl)
+        return True
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop the index, e.g. after a subtype was created, updated or deleted."""
+        cls._generation += 1
+        cls._entry = None
+
+    @classmethod
+    def invalidate_on_commit(cls, db: Optional[AsyncSession]) -> None:
+        """Clear now and again once the session's transaction commits."""
+        cls.clear()
+        if db is not None:
+            event.listen(db.sync_session, "after_commit", lambda session: cls.clear(), once=True)
+
+    @classmethod
+    def get_cache_stats(cls) -> Dict[str, int]:
+        """Get cache statistics"""
+        index = cls.get()
+        return {
+            "cached": int(index is not None),
+            "subtypes": len(index) if index is not None else 0,
+            "tags": len(index.bits["tags"]) if index is not None else 0,
+            "generation": cls._generation,
+        }
+
+
+# Subtype writes in other processes drop the index here
+CacheInvalidationBus.register("location_sub_types", lambda entity_id, version: LocationSubtypeIndexCache.clear(), LocationSubtypeIndexCache.clear)
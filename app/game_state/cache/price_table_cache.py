@@ -0,0 +1,77 @@
+"""
+Cache for resolved price modifier vectors to reduce database loads
+"""
+import time
+from typing import Dict, Optional, Tuple
+from uuid import UUID
+
+from app.core.cache_invalidation import CacheInvalidationBus
+from app.game_state.managers.pricing_manager import ModifierVector
+
+# (player_id, settlement_id, trader_id, race)
+PriceKey = Tuple[UUID, UUID, UUID, Optional[str]]
+
+
+class PriceTableCache:
+    """
+    Cache for modifier vectors per (player, settlement, trader) triple.
+
+    A vector depends on the player's reputations, so every entry of a player
+    must be invalidated when any of their reputations change.
+    """
+
+    # Class-level cache, shared across all instances
+    _cache: Dict[PriceKey, Tuple[ModifierVector, float]] = {}
+
+    # Default TTL in seconds
+    DEFAULT_TTL = 300  # 5 minutes
+
+    @classmethod
+    def get(cls, key: PriceKey) -> Optional[ModifierVector]:
+        """Get a modifier vector if it exists and is not expired."""
+        entry = cls._cache.get(key)
+        if entry is None:
+            return None
+
+        modifiers, expiry_time = entry
+        if expiry_time < time.time():
+            cls._cache.pop(key, None)
+            return None
+
+        return modifiers
+
+    @classmethod
+    def set(cls, key: PriceKey, modifiers: ModifierVector, ttl: int = DEFAULT_TTL) -> None:
+        """Add or update a modifier vector."""
+        cls._cache[key] = (modifiers, time.time() + ttl)
+
+    @classmethod
+    def invalidate_player(cls, player_id: UUID) -> None:
+        """Remove every vector of a player, e.g. after their reputation changed."""
+        for key in [key for key in cls._cache if key[0] == player_id]:
+            cls._cache.pop(key, None)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Clear the entire cache"""
+        cls._cache.clear()
+
+    @classmethod
+    def get_cache_stats(cls) -> Dict:
+        """Get statistics about the current cache state"""
+        current_time = time.time()
+        active_entries = sum(1 for _, expiry in cls._cache.values() if expiry > current_time)
+
+        return {
+            "total_entries": len(cls._cache),
+            "active_entries": active_entries,
+            "expired_entries": len(cls._cache) - active_entries
+        }
+
+
+# Vectors are built from the player's reputations, so they go with them
+CacheInvalidationBus.register(
+    "character_faction_relationships",
+    lambda player_id, version: PriceTableCache.invalidate_player(UUID(player_id)) if player_id else PriceTableCache.clear(),
+    PriceTableCache.clear,
+)
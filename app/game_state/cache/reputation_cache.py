@@ -0,0 +1,81 @@
+"""
+Cache for character x faction reputation rows to reduce database loads
+"""
+import time
+from typing import Dict, Iterable, List, Tuple
+from uuid import UUID
+
+from app.core.cache_invalidation import CacheInvalidationBus
+
+
+class ReputationCache:
+    """
+    Cache for character reputation rows.
+
+    Each entry is a character's full {faction_id: reputation_score} row, so any
+    subset of factions can be answered from one entry. Entries expire after a
+    TTL and must be invalidated whenever a character's reputation changes.
+    """
+
+    # Class-level cache, shared across all instances
+    _cache: Dict[UUID, Tuple[Dict[UUID, int], float]] = {}
+
+    # Default TTL in seconds
+    DEFAULT_TTL = 300  # 5 minutes
+
+    @classmethod
+    def get_many(cls, character_ids: Iterable[UUID]) -> Tuple[Dict[UUID, Dict[UUID, int]], List[UUID]]:
+        """
+        Look up many characters at once.
+
+        Returns:
+            (hits, misses): cached rows by character id, and the ids that need loading
+        """
+        now = time.time()
+        hits: Dict[UUID, Dict[UUID, int]] = {}
+        misses: List[UUID] = []
+        for character_id in character_ids:
+            entry = cls._cache.get(character_id)
+            if entry is None or entry[1] < now:
+                cls._cache.pop(character_id, None)
+                misses.append(character_id)
+            else:
+                hits[character_id] = entry[0]
+        return hits, misses
+
+    @classmethod
+    def set_many(cls, rows: Dict[UUID, Dict[UUID, int]], ttl: int = DEFAULT_TTL) -> None:
+        """Add or replace the rows of several characters."""
+        expiry_time = time.time() + ttl
+        for character_id, row in rows.items():
+            cls._cache[character_id] = (dict(row), expiry_time)
+
+    @classmethod
+    def invalidate(cls, character_id: UUID) -> None:
+        """Remove a character's row, e.g. after their reputation changed."""
+        cls._cache.pop(character_id, None)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Clear the entire cache"""
+        cls._cache.clear()
+
+    @classmethod
+    def get_cache_stats(cls) -> Dict:
+        """Get statistics about the current cache state"""
+        current_time = time.time()
+        active_entries = sum(1 for _, expiry in cls._cache.values() if expiry > current_time)
+
+        return {
+            "total_entries": len(cls._cache),
+            "active_entries": active_entries,
+            "expired_entries": len(cls._cache) - active_entries
+        }
+
+
+# Reputation writes in any process drop the character's row once they commit
+CacheInvalidationBus.register(
+    "character_faction_relationships",
+    lambda character_id, version: ReputationCache.invalidate(UUID(character_id)) if character_id else ReputationCache.clear(),
+    ReputationCache.clear,
+)
@@ -3,6 +3,8 @@ Cache for world entities to reduce database loads
 """
 import time
 from typing import Dict, Optional, Tuple
+
+from app.core.cache_invalidation import CacheInvalidationBus
 from app.game_state.models.world import WorldEntity
 
 class WorldCache:
@@ -29,10 +31,12 @@ class WorldCache:
         Returns:
             The cached WorldEntity or None if not in cache or expired
         """
-        if world_id not in cls._cache:
+        # Looked up once: other threads may evict entries (see app.core.cache_invalidation)
+        entry = cls._cache.get(world_id)
+        if entry is None:
             return None
             
-        world, expiry_time = cls._cache[world_id]
+        world, expiry_time = entry
         
         # Check if cache entry has expired
         if expiry_time < time.time():
@@ -79,4 +83,8 @@ class WorldCache:
             "total_entries": len(cls._cache),
             "active_entries": active_entries,
             "expired_entries": len(cls._cache) - active_entries
-        }
\ No newline at end of file
+        }
+
+
+# Writes to a world in any process drop its cached entity here
+CacheInvalidationBus.register("worlds", lambda world_id, version: WorldCache.invalidate(world_id), WorldCache.clear)
@@ -43,6 +43,9 @@ class CharacterEntityPydantic(BaseEntityPydantic):
     # Note: created_at and updated_at are inherited from BaseEntityPydantic
     last_login: Optional[datetime] = None
 
+    # Row version for optimistic concurrency; None until loaded from the database
+    version: Optional[int] = None
+
     model_config = ConfigDict(
         from_attributes=True,
         arbitrary_types_allowed=True,
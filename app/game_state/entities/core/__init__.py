@@ -2,20 +2,39 @@
 
 This module contains the base entities and core functionality
 that are used by all other entity modules.
+
+Names are resolved on first access (PEP 562), so importing a core submodule
+doesn't import the legacy dataclasses or the Pydantic bridge.
 """
+import importlib
+
+# name -> (submodule, attribute)
+_EXPORTS = {
+    "BaseEntity": ("base", "BaseEntity"),
+    "BaseEntityPydantic": ("base_pydantic", "BaseEntityPydantic"),
+    "ThemeEntity": ("theme", "ThemeEntity"),
+    "ThemeEntityPydantic": ("theme_pydantic", "ThemeEntityPydantic"),
+    "dataclass_to_pydantic": ("pydantic_bridge", "dataclass_to_pydantic"),
+    "pydantic_to_dataclass": ("pydantic_bridge", "pydantic_to_dataclass"),
+    "is_pydantic": ("pydantic_bridge", "is_pydantic"),
+    "is_dataclass": ("pydantic_bridge", "is_dataclass"),
+    "ENTITY_TYPE_MAPPING": ("pydantic_bridge", "ENTITY_TYPE_MAPPING"),
+    "PYDANTIC_TYPE_MAPPING": ("pydantic_bridge", "PYDANTIC_TYPE_MAPPING"),
+    # Convenience aliases
+    "Theme": ("theme", "ThemeEntity"),
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module, attribute = _EXPORTS[name]
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), attribute)
+    globals()[name] = value
+    return value
+
 
-from app.game_state.entities.core.base import BaseEntity
-from app.game_state.entities.core.base_pydantic import BaseEntityPydantic
-from app.game_state.entities.core.theme import ThemeEntity
-from app.game_state.entities.core.theme_pydantic import ThemeEntityPydantic
-from app.game_state.entities.core.pydantic_bridge import (
-    dataclass_to_pydantic,
-    pydantic_to_dataclass,
-    is_pydantic,
-    is_dataclass,
-    ENTITY_TYPE_MAPPING,
-    PYDANTIC_TYPE_MAPPING
-)
-
-# Convenience aliases
-Theme = ThemeEntity
\ No newline at end of file
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
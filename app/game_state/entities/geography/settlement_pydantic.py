@@ -19,6 +19,8 @@ class SettlementEntityPydantic(BaseEntityPydantic):
     # Resources mapped as Dict[resource_uuid_str, quantity]
     resources: Dict[str, int] = Field(default_factory=dict)
     population: int = 0
+    # Row version for optimistic concurrency; None until loaded from the database
+    version: Optional[int] = None
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert SettlementEntity to a dictionary with safe serialization."""
@@ -7,6 +7,12 @@ from app.game_state.entities.action.character_action_pydantic import (
 )
 from app.game_state.repositories.action_repository import ActionRepository
 
+# Duration multipliers for outdoor actions per season name; other seasons take 1.0
+SEASONAL_DURATION_MODIFIERS = {
+    "winter": {ActionType.GATHER: 1.5, ActionType.BUILD: 1.25, ActionType.MOVE: 1.25},
+    "autumn": {ActionType.GATHER: 0.9},
+}
+
 class ActionManager:
     """Handles business logic for character actions - follows your manager pattern."""
     
@@ -63,11 +69,12 @@ class ActionManager:
         self,
         character_id: UUID,
         action_type: ActionType,
-        parameters: Dict[str, Any]
+        parameters: Dict[str, Any],
+        season_name: Optional[str] = None
     ) -> int:
         """
-        Calculate how long an action should take based on character stats/skills.
-        Returns duration in seconds.
+        Calculate how long an action should take based on character stats/skills
+        and the world's current season. Returns duration in seconds.
         """
         # Base durations by action type
         base_durations = {
@@ -80,6 +87,9 @@ class ActionManager:
         }
         
         base_duration = base_durations.get(action_type, 300)
+        if season_name:
+            modifier = SEASONAL_DURATION_MODIFIERS.get(season_name.lower(), {}).get(action_type, 1.0)
+            base_duration = int(round(base_duration * modifier))
         
         # TODO: Apply character skill modifiers
         # skill_modifier = self.get_character_skill_modifier(character_id, action_type)
@@ -0,0 +1,118 @@
+# --- START OF FILE app/game_state/managers/calendar_manager.py ---
+
+"""
+Calendar Manager - Contains the domain logic for world calendars: building a
+theme's day-of-year lookup table (season and celestial events for every day
+of its year) and resolving a world's day against it.
+
+A table is built once per theme; resolving a day is then two array lookups,
+so every world can be resolved in a single pass per tick.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple
+from uuid import UUID
+
+import numpy as np
+
+# Calendar used by themes without Season rows
+DEFAULT_SEASONS: Tuple[Tuple[str, int], ...] = (
+    ("spring", 90),
+    ("summer", 90),
+    ("autumn", 90),
+    ("winter", 90),
+)
+
+
+@dataclass(frozen=True)
+class CalendarTable:
+    """Precomputed calendar of one theme. Arrays are indexed by day of year (0-based)."""
+    season_names: Tuple[str, ...]
+    season_lengths: Tuple[int, ...]
+    season_index: np.ndarray      # (year_length,) season of each day
+    day_of_season: np.ndarray     # (year_length,) 1-based day within its season
+    events_by_day: Dict[int, Tuple[str, ...]]
+
+    @property
+    def year_length(self) -> int:
+        return len(self.season_index)
+
+
+@dataclass(frozen=True)
+class WorldStateSnapshot:
+    """A world's calendar state for the current tick."""
+    world_id: UUID
+    theme_id: Optional[UUID]
+    day: int
+    year: int
+    day_of_year: int
+    season_index: int
+    season_name: str
+    day_of_season: int
+    days_in_season: int
+    celestial_events: Tuple[str, ...] = ()
+
+
+class CalendarManager:
+    """
+    Manager for calendar domain logic.
+    Pure functions only; loading seasons and caching tables is the service's job.
+    """
+
+    @staticmethod
+    def build_table(
+        seasons: Sequence[Tuple[str, int]],
+        event_names: Sequence[str] = (),
+    ) -> CalendarTable:
+        """
+        Build a theme's calendar from its ordered (name, duration) seasons.
+
+        Celestial events have no schedule of their own, so each event falls
+        once a year, spread evenly through the year in the order given.
+        Seasons with a non-positive duration are skipped; a theme with no
+        usable seasons gets DEFAULT_SEASONS.
+        """
+        usable = [(name, int(duration)) for name, duration in seasons if duration and duration > 0]
+        if not usable:
+            usable = list(DEFAULT_SEASONS)
+
+        names = tuple(name for name, _ in usable)
+        lengths = tuple(duration for _, duration in usable)
+
+        season_index = np.repeat(np.arange(len(lengths), dtype=np.int16), lengths)
+        starts = np.repeat(np.cumsum((0,) + lengths[:-1]), lengths)
+        day_of_season = (np.arange(len(season_index)) - starts + 1).astype(np.int32)
+
+        year_length = len(season_index)
+        events_by_day: Dict[int, Tuple[str, ...]] = {}
+        for position, event_name in enumerate(event_names):
+            day = ((position + 1) * year_length) // (len(event_names) + 1)
+            events_by_day[day] = events_by_day.get(day, ()) + (event_name,)
+
+        return CalendarTable(
+            season_names=names,
+            season_lengths=lengths,
+            season_index=season_index,
+            day_of_season=day_of_season,
+            events_by_day=events_by_day,
+        )
+
+    @staticmethod
+    def resolve(table: CalendarTable, world_id: UUID, theme_id: Optional[UUID], day: int) -> WorldStateSnapshot:
+        """Resolve an absolute world day (1-based) against a theme's calendar."""
+        elapsed = max(day - 1, 0)
+        year, day_of_year = divmod(elapsed, table.year_length)
+        season_index = int(table.season_index[day_of_year])
+
+        return WorldStateSnapshot(
+            world_id=world_id,
+            theme_id=theme_id,
+            day=day,
+            year=year + 1,
+            day_of_year=day_of_year + 1,
+            season_index=season_index,
+            season_name=table.season_names[season_index],
+            day_of_season=int(table.day_of_season[day_of_year]),
+            days_in_season=table.season_lengths[season_index],
+            celestial_events=table.events_by_day.get(day_of_year, ()),
+        )
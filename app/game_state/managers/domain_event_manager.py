@@ -0,0 +1,76 @@
+# --- START OF FILE app/game_state/managers/domain_event_manager.py ---
+
+"""
+Domain Event Manager - Contains the shape of domain events and their encoding
+on the domain event stream.
+
+Services append events to the outbox in the transaction that made the change
+(OutboxRepository.append); the outbox relay publishes them to one Redis
+stream, and consumer groups process them asynchronously. Delivery is
+at-least-once, so consumers use the event id (the outbox row id) to
+recognise a repeat.
+"""
+
+import json
+from datetime import datetime
+from typing import Any, Dict, NamedTuple, Optional
+from uuid import UUID
+
+# Event types: "<aggregate>.<what happened>"
+SETTLEMENT_BUILDING_CONSTRUCTED = "settlement.building_constructed"
+WORLD_DAY_ADVANCED = "world.day_advanced"
+
+# Redis stream the outbox relay publishes to
+DOMAIN_EVENT_STREAM = "domain_events"
+
+# Approximate length the stream is trimmed to; consumers far behind lose the oldest events
+STREAM_MAX_LENGTH = 100_000
+
+# Outbox rows moved to the stream per relay batch
+OUTBOX_BATCH_SIZE = 500
+
+
+class DomainEvent(NamedTuple):
+    """Something that happened to an aggregate (settlement, world, ...)."""
+    event_id: int
+    event_type: str
+    aggregate_type: str
+    aggregate_id: Optional[UUID]
+    payload: Dict[str, Any]
+    occurred_at: datetime
+
+
+class DomainEventManager:
+    """
+    Manager for domain event encoding.
+    Pure functions only; the outbox lives in OutboxRepository and the stream in the outbox worker.
+    """
+
+    @staticmethod
+    def to_stream_fields(event: DomainEvent) -> Dict[str, str]:
+        """Flat string fields of a stream entry."""
+        return {
+            "id": str(event.event_id),
+            "type": event.event_type,
+            "aggregate_type": event.aggregate_type,
+            "aggregate_id": str(event.aggregate_id) if event.aggregate_id else "",
+            "payload": json.dumps(event.payload, separators=(",", ":"), default=str),
+            "occurred_at": event.occurred_at.isoformat(),
+        }
+
+    @staticmethod
+    def from_stream_fields(fields: Dict[str, str]) -> DomainEvent:
+        """The event of a stream entry written by to_stream_fields."""
+        return DomainEvent(
+            event_id=int(fields["id"]),
+            event_type=fields["type"],
+            aggregate_type=fields["aggregate_type"],
+            aggregate_id=UUID(fields["aggregate_id"]) if fields.get("aggregate_id") else None,
+            payload=json.loads(fields.get("payload") or "{}"),
+            occurred_at=datetime.fromisoformat(fields["occurred_at"]),
+        )
+
+    @staticmethod
+    def aggregate_type_of(event_type: str) -> str:
+        """The aggregate part of an event type ("settlement" for "settlement.building_constructed")."""
+        return event_type.split(".", 1)[0]
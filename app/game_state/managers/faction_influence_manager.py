@@ -0,0 +1,80 @@
+# --- START OF FILE app/game_state/managers/faction_influence_manager.py ---
+
+"""
+Faction Influence Manager - Contains the domain logic for faction control and
+character reputation: reputation thresholds and building the
+character x faction reputation matrix from raw relationship rows.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from app.db.models.character_faction_relationship import RelationshipStatusEnum
+
+# Reputation of a character with a faction they have no relationship row for
+NEUTRAL_REPUTATION = 0
+
+# Lower bound of each status, checked from the top down (scores run -100..100)
+REPUTATION_THRESHOLDS: Tuple[Tuple[int, RelationshipStatusEnum], ...] = (
+    (75, RelationshipStatusEnum.ALLY),
+    (25, RelationshipStatusEnum.FRIENDLY),
+    (-24, RelationshipStatusEnum.NEUTRAL),
+    (-74, RelationshipStatusEnum.HOSTILE),
+)
+
+ReputationMatrix = Dict[UUID, Dict[UUID, int]]
+
+
+class FactionInfluenceManager:
+    """
+    Manager for faction influence domain logic.
+    Pure functions only; queries and caching live in the repository and service.
+    """
+
+    @staticmethod
+    def clamp_reputation(score: int) -> int:
+        """Clamp a reputation score to the -100..100 range."""
+        return max(-100, min(100, int(score)))
+
+    @staticmethod
+    def status_for_score(score: int) -> RelationshipStatusEnum:
+        """Relationship status implied by a reputation score."""
+        for threshold, status in REPUTATION_THRESHOLDS:
+            if score >= threshold:
+                return status
+        return RelationshipStatusEnum.ENEMY
+
+    @staticmethod
+    def build_matrix(character_ids: Iterable[UUID], rows: Iterable[Tuple[UUID, UUID, int]]) -> ReputationMatrix:
+        """
+        Group (character_id, faction_id, score) rows into one row per character.
+        Every requested character gets a row, empty if they have no relationships,
+        so a cache can remember "nothing known" as well as known scores.
+        """
+        matrix: ReputationMatrix = {character_id: {} for character_id in character_ids}
+        for character_id, faction_id, score in rows:
+            matrix.setdefault(character_id, {})[faction_id] = score
+        return matrix
+
+    @staticmethod
+    def select_factions(row: Dict[UUID, int], faction_ids: Optional[Sequence[UUID]] = None) -> Dict[UUID, int]:
+        """
+        Project a character's reputation row onto the requested factions,
+        filling factions without a relationship with NEUTRAL_REPUTATION.
+        """
+        if faction_ids is None:
+            return dict(row)
+        return {faction_id: row.get(faction_id, NEUTRAL_REPUTATION) for faction_id in faction_ids}
+
+    @staticmethod
+    def to_dense(matrix: ReputationMatrix, character_ids: Sequence[UUID], faction_ids: Sequence[UUID]) -> List[List[int]]:
+        """Dense [character][faction] score grid in the given orders, for batch consumers such as AI scoring."""
+        return [
+            [matrix.get(character_id, {}).get(faction_id, NEUTRAL_REPUTATION) for faction_id in faction_ids]
+            for character_id in character_ids
+        ]
+
+    @staticmethod
+    def controllers(control_rows: Iterable[Dict[str, Any]]) -> Dict[UUID, UUID]:
+        """Map each scope to its controlling (rank 1) faction."""
+        return {row["scope_id"]: row["faction_id"] for row in control_rows if row["rank"] == 1}
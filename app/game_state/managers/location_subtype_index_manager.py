@@ -0,0 +1,174 @@
+# --- START OF FILE app/game_state/managers/location_subtype_index_manager.py ---
+
+"""
+Location Subtype Index Manager - In-memory faceted index over location subtypes.
+
+Subtypes are a few thousand mostly static rows that world generation filters
+constantly. The index keeps them in code order and, for every value of every
+facet (location type, theme, rarity, tag), a bitset of the positions holding
+it, as a Python int. A filter is a handful of ANDs/ORs of those ints, the
+total is a popcount, and a page is read off the set bits, so a query never
+touches the database.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Facets, in the order facet counts are reported
+SUBTYPE_FACETS = ("location_type_id", "theme_id", "rarity", "tags")
+
+
+try:
+    _popcount = int.bit_count  # Python 3.10+
+except AttributeError:
+    def _popcount(mask: int) -> int:
+        return bin(mask).count("1")
+
+
+@dataclass(frozen=True)
+class SubtypeFacetIndex:
+    """
+    Bitset index over a fixed list of subtypes. The subtypes are shared by
+    every reader of the index and must be treated as read-only.
+    """
+    items: Tuple[Any, ...]                  # subtypes in code order; bit i is items[i]
+    bits: Dict[str, Dict[Any, int]]         # facet -> value -> bitset of positions
+    positions: Dict[str, int]               # code -> position
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    @property
+    def all_bits(self) -> int:
+        return (1 << len(self.items)) - 1
+
+    def has_code(self, code: str) -> bool:
+        return code in self.positions
+
+    def get_by_code(self, code: str) -> Optional[Any]:
+        position = self.positions.get(code)
+        return self.items[position] if position is not None else None
+
+    def match(
+        self,
+        location_type_id: Optional[Any] = None,
+        theme_id: Optional[Any] = None,
+        rarity: Optional[str] = None,
+        tags: Optional[Sequence[str]] = None,
+        match_all_tags: bool = False,
+    ) -> int:
+        """
+        Bitset of the subtypes matching every given filter. Tags match if the
+        subtype has any of them, or all of them with match_all_tags; empty or
+        None filters are ignored.
+        """
+        mask = self.all_bits
+        if location_type_id:
+            mask &= self.bits["location_type_id"].get(location_type_id, 0)
+        if theme_id:
+            mask &= self.bits["theme_id"].get(theme_id, 0)
+        if rarity:
+            mask &= self.bits["rarity"].get(rarity, 0)
+        if tags:
+            tag_bits = self.bits["tags"]
+            if match_all_tags:
+                for tag in tags:
+                    mask &= tag_bits.get(tag, 0)
+            else:
+                any_tag = 0
+                for tag in tags:
+                    any_tag |= tag_bits.get(tag, 0)
+                mask &= any_tag
+        return mask
+
+    @staticmethod
+    def count(mask: int) -> int:
+        return _popcount(mask)
+
+    def page(self, mask: int, skip: int = 0, limit: Optional[int] = None) -> List[Any]:
+        """The matching subtypes in code order, after skipping `skip` of them."""
+        start = 0
+        if skip:
+            if _popcount(mask) <= skip:
+                return []
+            # First bit with exactly `skip` matches below it: binary search over prefix popcounts
+            low, high = 0, mask.bit_length()
+            while low < high:
+                middle = (low + high) // 2
+                if _popcount(mask & ((1 << middle) - 1)) < skip:
+                    low = middle + 1
+                else:
+                    high = middle
+            start = low
+
+        # Bit i is character i of the reversed binary string, so str.find walks the set bits in C
+        digits = bin(mask >> start)[:1:-1]
+        page: List[Any] = []
+        position = -1
+        while limit is None or len(page) < limit:
+            position = digits.find("1", position + 1)
+            if position < 0:
+                break
+            page.append(self.items[start + position])
+        return page
+
+    def facet_counts(self, mask: int) -> Dict[str, Dict[str, int]]:
+        """For each facet, how many of the matching subtypes have each value (zero counts left out)."""
+        counts: Dict[str, Dict[str, int]] = {}
+        for facet in SUBTYPE_FACETS:
+            values: Dict[str, int] = {}
+            for value, value_bits in self.bits[facet].items():
+                hits = _popcount(mask & value_bits)
+                if hits:
+                    values[str(value)] = hits
+            counts[facet] = values
+        return counts
+
+
+class LocationSubtypeIndexManager:
+    """
+    Manager for the location subtype facet index.
+    Pure functions only; loading subtypes and caching the index is the service's job.
+    """
+
+    @staticmethod
+    def build_index(subtypes: Iterable[Any]) -> SubtypeFacetIndex:
+        """
+        Index subtypes (anything with code, location_type_id, theme_id, rarity
+        and tags attributes). Raises ValueError on duplicate codes.
+        """
+        items = tuple(sorted(subtypes, key=lambda subtype: subtype.code))
+        bits: Dict[str, Dict[Any, int]] = {facet: {} for facet in SUBTYPE_FACETS}
+        positions: Dict[str, int] = {}
+
+        for position, subtype in enumerate(items):
+            if subtype.code in positions:
+                raise ValueError(f"Duplicate location subtype code '{subtype.code}'")
+            positions[subtype.code] = position
+            bit = 1 << position
+
+            for facet in ("location_type_id", "theme_id", "rarity"):
+                value = getattr(subtype, facet)
+                if value is not None:
+                    bits[facet][value] = bits[facet].get(value, 0) | bit
+            for tag in set(subtype.tags or ()):
+                bits["tags"][tag] = bits["tags"].get(tag, 0) | bit
+
+        return SubtypeFacetIndex(items=items, bits=bits, positions=positions)
+
+    @staticmethod
+    def find_existing_codes(index: SubtypeFacetIndex, codes: Iterable[str]) -> List[str]:
+        """Codes that are already taken, in the order given."""
+        return [code for code in codes if index.has_code(code)]
+
+    @staticmethod
+    def find_duplicate_codes(codes: Iterable[str]) -> List[str]:
+        """Codes given more than once, each listed once, in first-seen order."""
+        seen, duplicates = set(), {}
+        for code in codes:
+            if code in seen:
+                duplicates[code] = None
+            seen.add(code)
+        return list(duplicates)
+
+# --- END OF FILE app/game_state/managers/location_subtype_index_manager.py ---
@@ -0,0 +1,216 @@
+# --- START OF FILE app/game_state/managers/market_simulation_manager.py ---
+
+"""
+Market Simulation Manager - Contains the domain logic for the daily market
+clearing step: settlements consume stock, local prices follow supply and
+demand, and goods flow along trade routes from cheap to expensive markets.
+
+Everything is computed on dense NumPy arrays (settlements x resources), so a
+tick costs a handful of array operations however many settlements there are.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+import numpy as np
+
+# Units of each resource consumed per inhabitant per day
+CONSUMPTION_PER_CAPITA = 0.01
+
+# Price index bounds; 1.0 means supply exactly covers a day's demand
+MIN_PRICE_INDEX = 0.1
+MAX_PRICE_INDEX = 10.0
+
+# Fraction of a price gap that is closed by trade along a route in one day
+TRADE_RATE = 0.25
+
+# Price index a trade must beat per km travelled
+TRANSPORT_COST_PER_KM = 0.002
+
+# Days of demand a settlement keeps back before exporting
+RESERVE_DAYS = 3.0
+
+# Demand multiplier per season name; seasons not listed consume at 1.0
+SEASONAL_CONSUMPTION = {
+    "winter": 1.25,
+    "summer": 0.9,
+}
+
+
+@dataclass
+class MarketState:
+    """Dense market arrays for one world. Row i of every array belongs to settlement_ids[i]."""
+    settlement_ids: List[UUID]
+    resource_ids: List[str]
+    stock: np.ndarray        # (S, R) units held
+    population: np.ndarray   # (S,)
+
+    @property
+    def demand(self) -> np.ndarray:
+        """(S, R) units wanted per day."""
+        return np.repeat((self.population * CONSUMPTION_PER_CAPITA)[:, None], len(self.resource_ids), axis=1)
+
+
+@dataclass
+class MarketResult:
+    """Outcome of one market-clearing step."""
+    stock: np.ndarray          # (S, R) stock after the step
+    prices: np.ndarray         # (S, R) price index before trading
+    traded_units: int
+    consumed_units: int
+    satisfaction: np.ndarray   # (S,) share of demand met, 0-1
+
+
+class MarketSimulationManager:
+    """
+    Manager for settlement market simulation.
+    Pure functions only; loading and persisting arrays is the service's job.
+    """
+
+    @staticmethod
+    def build_state(rows: Sequence[Tuple[UUID, int, Optional[Dict[str, Any]]]]) -> MarketState:
+        """
+        Build dense arrays from (settlement_id, population, resources) rows.
+        Columns are the union of every settlement's resource keys, sorted for stable output.
+        """
+        resource_ids = sorted({str(key) for _, _, resources in rows for key in (resources or {})})
+        column = {resource_id: index for index, resource_id in enumerate(resource_ids)}
+
+        stock = np.zeros((len(rows), len(resource_ids)), dtype=np.float64)
+        population = np.zeros(len(rows), dtype=np.float64)
+        for row_index, (_, settlement_population, resources) in enumerate(rows):
+            population[row_index] = max(0, settlement_population or 0)
+            for key, quantity in (resources or {}).items():
+                stock[row_index, column[str(key)]] = max(0.0, float(quantity or 0))
+
+        return MarketState(
+            settlement_ids=[settlement_id for settlement_id, _, _ in rows],
+            resource_ids=resource_ids,
+            stock=stock,
+            population=population,
+        )
+
+    @staticmethod
+    def price_index(stock: np.ndarray, demand: np.ndarray) -> np.ndarray:
+        """Local price index: high where a day's demand outstrips stock, low where stock piles up."""
+        return np.clip((demand + 1.0) / (stock + 1.0), MIN_PRICE_INDEX, MAX_PRICE_INDEX)
+
+    @staticmethod
+    def edge_arrays(
+        settlement_ids: Sequence[UUID],
+        routes: Sequence[Tuple[UUID, UUID, Optional[float]]],
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Turn (from_settlement, to_settlement, distance_km) routes into index arrays.
+        Routes are treated as undirected and deduplicated; routes to settlements
+        outside the state are dropped.
+        """
+        row = {settlement_id: index for index, settlement_id in enumerate(settlement_ids)}
+        edges: Dict[Tuple[int, int], float] = {}
+        for from_id, to_id, distance in routes:
+            a, b = row.get(from_id), row.get(to_id)
+            if a is None or b is None or a == b:
+                continue
+            key = (min(a, b), max(a, b))
+            edges[key] = min(edges.get(key, float("inf")), float(distance or 0.0))
+
+        if not edges:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty, np.zeros(0, dtype=np.float64)
+
+        pairs = np.array(sorted(edges), dtype=np.int64)
+        distances = np.array([edges[tuple(pair)] for pair in pairs.tolist()], dtype=np.float64)
+        return pairs[:, 0], pairs[:, 1], distances
+
+    @staticmethod
+    def seasonal_consumption(season_name: Optional[str]) -> float:
+        """Demand multiplier for a season name; unknown or missing seasons give 1.0."""
+        if not season_name:
+            return 1.0
+        return SEASONAL_CONSUMPTION.get(season_name.lower(), 1.0)
+
+    @staticmethod
+    def clear_market(
+        state: MarketState,
+        sources: np.ndarray,
+        targets: np.ndarray,
+        distances: np.ndarray,
+        consumption_modifier: float = 1.0,
+    ) -> MarketResult:
+        """
+        Run one day of trade and consumption. consumption_modifier scales the
+        day's demand (see seasonal_consumption).
+
+        1. Price every (settlement, resource) from stock and demand.
+        2. Along each route, move goods from the cheaper to the dearer end when
+           the price gap beats transport cost, limited by the seller's surplus
+           above RESERVE_DAYS of demand. Exports of a settlement are scaled down
+           together if its routes ask for more than its surplus.
+        3. Consume up to a day's demand.
+
+        Flows are whole units, so stock stays integral and trade conserves goods.
+        """
+        stock = state.stock.copy()
+        demand = state.demand * consumption_modifier
+        prices = MarketSimulationManager.price_index(stock, demand)
+        traded_units = 0
+
+        if len(sources) and stock.size:
+            surplus = np.maximum(stock - RESERVE_DAYS * demand, 0.0)
+
+            gap = prices[targets] - prices[sources]                         # (E, R) > 0: goods flow source -> target
+            margin = np.abs(gap) - (distances * TRANSPORT_COST_PER_KM)[:, None]
+            forward = gap > 0
+            seller = np.where(forward, sources[:, None], targets[:, None])   # (E, R) exporting settlement
+            buyer = np.where(forward, targets[:, None], sources[:, None])
+            resource = np.broadcast_to(np.arange(stock.shape[1]), gap.shape)
+
+            # Share of the gap worth closing, times the seller's surplus
+            intensity = np.where(margin > 0, TRADE_RATE * margin / (prices[seller, resource] + prices[buyer, resource]), 0.0)
+            wanted = intensity * surplus[seller, resource]
+
+            # Scale each seller's exports so they never exceed its surplus
+            exports = np.zeros_like(stock)
+            np.add.at(exports, (seller, resource), wanted)
+            scale = np.divide(surplus, exports, out=np.ones_like(stock), where=exports > surplus)
+            flows = np.floor(wanted * scale[seller, resource])
+
+            np.subtract.at(stock, (seller, resource), flows)
+            np.add.at(stock, (buyer, resource), flows)
+            traded_units = int(flows.sum())
+
+        consumed = np.minimum(stock, np.floor(demand))
+        stock -= consumed
+
+        total_demand = np.floor(demand).sum(axis=1)
+        satisfaction = np.divide(consumed.sum(axis=1), total_demand, out=np.ones(len(total_demand)), where=total_demand > 0)
+
+        return MarketResult(
+            stock=stock,
+            prices=prices,
+            traded_units=traded_units,
+            consumed_units=int(consumed.sum()),
+            satisfaction=satisfaction,
+        )
+
+    @staticmethod
+    def resource_deltas(state: MarketState, result: MarketResult) -> List[Tuple[UUID, Dict[str, int]]]:
+        """
+        (settlement_id, {resource_id: change}) for every settlement whose stock
+        changed. Written back as deltas, so changes committed by other writers
+        since the tick read its rows are kept rather than overwritten.
+        """
+        change = result.stock.astype(np.int64) - state.stock.astype(np.int64)
+        changed_rows = np.flatnonzero(np.any(change != 0, axis=1))
+        return [
+            (
+                state.settlement_ids[row],
+                {
+                    resource_id: int(delta)
+                    for resource_id, delta in zip(state.resource_ids, change[row])
+                    if delta != 0
+                },
+            )
+            for row in changed_rows.tolist()
+        ]
@@ -0,0 +1,112 @@
+# --- START OF FILE app/game_state/managers/pricing_manager.py ---
+
+"""
+Pricing Manager - Contains the domain logic for trade prices: turning
+reputations into discounts and surcharges, and pricing a catalog of base
+prices against one resolved set of modifiers.
+"""
+
+from dataclasses import astuple, dataclass
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from app.game_state.enums.race import Race
+from app.game_state.managers.faction_influence_manager import NEUTRAL_REPUTATION
+
+# Discount at +100 reputation (and surcharge at -100) with a settlement's or trader's faction
+MAX_REPUTATION_DISCOUNT = 0.2
+
+# Surcharge for a player allied (+100) with a faction the seller dislikes
+MAX_FACTION_SURCHARGE = 0.25
+
+# Per-race discount (positive) or surcharge (negative); races not listed trade at base price
+RACE_PRICE_MODIFIERS: Dict[Race, float] = {}
+
+# Floor for a final price, so stacked discounts can never make a seller pay the buyer
+MIN_PRICE = 0.0
+
+
+@dataclass(frozen=True)
+class ModifierVector:
+    """
+    Every price modifier for one (player, settlement, trader) triple.
+    Positive values are discounts, negative values surcharges; they combine
+    multiplicatively into a single multiplier applied to base prices.
+    """
+    settlement_discount: float = 0.0
+    trader_discount: float = 0.0
+    race_discount: float = 0.0
+    faction_modifier: float = 0.0
+
+    def as_array(self) -> np.ndarray:
+        """The modifiers as one float array, in field order."""
+        return np.array(astuple(self), dtype=np.float64)
+
+    @property
+    def multiplier(self) -> float:
+        return float(np.prod(1.0 - self.as_array()))
+
+
+class PricingManager:
+    """
+    Manager for pricing domain logic.
+    Pure functions only; the service resolves reputations and caches vectors.
+    """
+
+    @staticmethod
+    def discount_for_reputation(score: Optional[int]) -> float:
+        """Linear discount for positive reputation, surcharge for negative."""
+        if score is None:
+            return 0.0
+        return max(-100, min(100, score)) / 100 * MAX_REPUTATION_DISCOUNT
+
+    @staticmethod
+    def surcharge_for_disliked(score: int) -> float:
+        """Surcharge for reputation with a faction the seller dislikes; only goodwill is penalised."""
+        return max(0, min(100, score)) / 100 * MAX_FACTION_SURCHARGE
+
+    @staticmethod
+    def build_modifiers(
+        reputations: Dict,
+        settlement_faction_id=None,
+        trader_faction_id=None,
+        disliked_faction_ids: Iterable = (),
+        player_race: Optional[Race] = None,
+    ) -> ModifierVector:
+        """
+        Resolve the modifier vector from the player's reputation row.
+
+        The faction modifier is the worst surcharge across every faction disliked
+        by the settlement's or trader's faction (0 when there are none).
+        """
+        settlement_rep = reputations.get(settlement_faction_id, NEUTRAL_REPUTATION) if settlement_faction_id else None
+        trader_rep = reputations.get(trader_faction_id, NEUTRAL_REPUTATION) if trader_faction_id else None
+
+        surcharges = [
+            PricingManager.surcharge_for_disliked(reputations.get(faction_id, NEUTRAL_REPUTATION))
+            for faction_id in disliked_faction_ids
+        ]
+
+        return ModifierVector(
+            settlement_discount=PricingManager.discount_for_reputation(settlement_rep),
+            trader_discount=PricingManager.discount_for_reputation(trader_rep),
+            race_discount=RACE_PRICE_MODIFIERS.get(player_race, 0.0) if player_race else 0.0,
+            faction_modifier=-max(surcharges) if surcharges else 0.0,
+        )
+
+    @staticmethod
+    def price_item(base_price: Optional[float], modifiers: ModifierVector) -> float:
+        """Price one base price; a missing base price counts as 0. Same rounding as price_catalog."""
+        price = max(float(base_price or 0.0) * modifiers.multiplier, MIN_PRICE)
+        return float(np.round(price, 2))
+
+    @staticmethod
+    def price_catalog(base_prices: Sequence[Optional[float]], modifiers: ModifierVector) -> List[float]:
+        """
+        Price a whole catalog in one array multiply and clip; missing base
+        prices count as 0. Matches price_item item by item.
+        """
+        base = np.array([price or 0.0 for price in base_prices], dtype=np.float64)
+        prices = np.clip(base * modifiers.multiplier, MIN_PRICE, None)
+        return np.round(prices, 2).tolist()
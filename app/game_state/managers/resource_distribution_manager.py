@@ -0,0 +1,142 @@
+# --- START OF FILE app/game_state/managers/resource_distribution_manager.py ---
+
+"""
+Resource Distribution Manager - Contains the domain logic for weighting a
+biome's resource node blueprints and sampling from them.
+
+Weights are compiled into a Walker/Vose alias table once per biome, after
+which every draw is O(1): one uniform index and one biased coin flip.
+"""
+
+import random
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class AliasTable:
+    """Walker/Vose alias table over a fixed list of items."""
+    items: Tuple[Any, ...]
+    weights: np.ndarray        # (N,) normalized probabilities, for inspection
+    probability: np.ndarray    # (N,) chance of keeping column i rather than its alias
+    alias: np.ndarray          # (N,) fallback item index of each column
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def draw(self, rng: random.Random) -> Any:
+        """Draw one item with a stdlib RNG."""
+        column = rng.randrange(len(self.items))
+        if rng.random() < self.probability[column]:
+            return self.items[column]
+        return self.items[self.alias[column]]
+
+    def sample_indices(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        """Draw `size` item indices at once with a numpy Generator."""
+        columns = rng.integers(0, len(self.items), size=size)
+        keep = rng.random(size) < self.probability[columns]
+        return np.where(keep, columns, self.alias[columns])
+
+    def sample(self, rng: np.random.Generator, size: int) -> List[Any]:
+        """Draw `size` items at once with a numpy Generator."""
+        return [self.items[i] for i in self.sample_indices(rng, size).tolist()]
+
+
+class ResourceDistributionManager:
+    """
+    Manager for biome resource distribution.
+    Pure functions only; loading biomes and blueprints and caching tables is the service's job.
+    """
+
+    @staticmethod
+    def build_alias_table(items: Sequence[Any], weights: Sequence[float]) -> AliasTable:
+        """
+        Build an alias table with Vose's method. Negative weights count as zero;
+        if no weight is positive every item is equally likely.
+
+        Raises:
+            ValueError: If items is empty or the lengths differ
+        """
+        if not items:
+            raise ValueError("Cannot build an alias table without items")
+        if len(items) != len(weights):
+            raise ValueError("Items and weights must have the same length")
+
+        count = len(items)
+        weights = np.clip(np.asarray(weights, dtype=np.float64), 0.0, None)
+        total = weights.sum()
+        normalized = weights / total if total > 0 else np.full(count, 1.0 / count)
+
+        scaled = normalized * count
+        probability = np.ones(count, dtype=np.float64)
+        alias = np.arange(count, dtype=np.int64)
+
+        small = [i for i in range(count) if scaled[i] < 1.0]
+        large = [i for i in range(count) if scaled[i] >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            probability[less] = scaled[less]
+            alias[less] = more
+            scaled[more] = scaled[more] + scaled[less] - 1.0
+            (small if scaled[more] < 1.0 else large).append(more)
+
+        # Whatever is left is 1.0 up to rounding error and keeps probability 1
+        return AliasTable(items=tuple(items), weights=normalized, probability=probability, alias=alias)
+
+    @staticmethod
+    def blueprint_weight(
+        blueprint: Any,
+        resource_types: Optional[Dict[str, float]],
+        resource_names: Iterable[str] = (),
+    ) -> float:
+        """
+        Spawn weight of a blueprint within a biome.
+
+        The base weight is the sum of its resource link chances (1.0 for a
+        blueprint without links). It is scaled by the largest abundance
+        multiplier in the biome's resource_types whose key appears in the
+        blueprint's name, tags or resource names; unmatched blueprints keep 1.0.
+        """
+        links = getattr(blueprint, "resource_links", None) or []
+        base = sum(max(float(link.chance or 0.0), 0.0) for link in links) if links else 1.0
+
+        if not resource_types:
+            return base
+
+        haystack = [blueprint.name.lower()]
+        haystack.extend(tag.lower() for tag in (getattr(blueprint, "tags", None) or []))
+        haystack.extend(name.lower() for name in resource_names)
+
+        multipliers = [
+            float(multiplier)
+            for key, multiplier in resource_types.items()
+            if multiplier is not None and any(key.lower() in text for text in haystack)
+        ]
+        return base * max(multipliers) if multipliers else base
+
+    @staticmethod
+    def build_biome_table(
+        blueprints: Sequence[Any],
+        resource_types: Optional[Dict[str, float]] = None,
+        resource_names: Optional[Dict[Any, List[str]]] = None,
+    ) -> Optional[AliasTable]:
+        """
+        Alias table over a biome's blueprints, or None if the biome has none.
+        Blueprints are ordered by id so draws don't depend on query order.
+        """
+        if not blueprints:
+            return None
+
+        resource_names = resource_names or {}
+        ordered = sorted(blueprints, key=lambda blueprint: str(blueprint.id))
+        weights = [
+            ResourceDistributionManager.blueprint_weight(
+                blueprint, resource_types, resource_names.get(blueprint.id, ())
+            )
+            for blueprint in ordered
+        ]
+        return ResourceDistributionManager.build_alias_table(ordered, weights)
+
+# --- END OF FILE app/game_state/managers/resource_distribution_manager.py ---
@@ -0,0 +1,80 @@
+# --- START OF FILE app/game_state/managers/resource_node_lifecycle_manager.py ---
+
+"""
+Resource Node Lifecycle Manager - Contains the domain rules for resource node
+yield, depletion and respawn.
+
+Every resource link of a node holds a finite yield. Extraction consumes it;
+a node is depleted once its primary links (or all links, for nodes without a
+primary link) are exhausted, and comes back with full yield after a delay
+that depends on the rarest resource it holds.
+"""
+
+import random
+from datetime import datetime, timedelta
+from typing import Iterable, Optional, Sequence, Tuple
+
+# A link holds this many maximum-size extractions before it is exhausted
+YIELD_EXTRACTIONS = 10
+
+# Hours until a depleted node respawns, by the rarest link rarity
+RESPAWN_HOURS_BY_RARITY = {
+    "common": 6,
+    "uncommon": 12,
+    "rare": 24,
+    "epic": 72,
+    "legendary": 168,
+}
+DEFAULT_RESPAWN_HOURS = 6
+
+# Respawn delays are spread by up to this fraction so nodes don't all return at once
+RESPAWN_JITTER = 0.1
+
+# Depleted nodes respawned per batch by the lifecycle task
+RESPAWN_BATCH_SIZE = 500
+
+
+class ResourceNodeLifecycleManager:
+    """
+    Manager for resource node lifecycle rules.
+    Pure functions only; the atomic SQL that applies them lives in ResourceNodeLifecycleRepository.
+    """
+
+    @staticmethod
+    def initial_yield(amount_max: Optional[int]) -> int:
+        """Full yield of a link whose largest single extraction is amount_max."""
+        return max(1, int(amount_max or 1)) * YIELD_EXTRACTIONS
+
+    @staticmethod
+    def is_exhausted(links: Sequence[Tuple[bool, Optional[int]]]) -> bool:
+        """
+        Whether a node with the given (is_primary, remaining_yield) links is depleted.
+        A remaining_yield of None means the link has never been extracted and is full.
+        """
+        if not links:
+            return False
+        primary = [remaining for is_primary, remaining in links if is_primary]
+        considered = primary if primary else [remaining for _, remaining in links]
+        return all(remaining is not None and remaining <= 0 for remaining in considered)
+
+    @staticmethod
+    def respawn_delay(rarities: Iterable[Optional[str]]) -> timedelta:
+        """Respawn delay of a node from the rarities of its links; the rarest one wins."""
+        hours = [
+            RESPAWN_HOURS_BY_RARITY.get((rarity or "common").lower(), DEFAULT_RESPAWN_HOURS)
+            for rarity in rarities
+        ]
+        return timedelta(hours=max(hours, default=DEFAULT_RESPAWN_HOURS))
+
+    @staticmethod
+    def respawn_at(
+        now: datetime,
+        rarities: Iterable[Optional[str]],
+        rng: Optional[random.Random] = None,
+    ) -> datetime:
+        """When a node depleted at `now` should respawn, with up to RESPAWN_JITTER spread."""
+        delay = ResourceNodeLifecycleManager.respawn_delay(rarities)
+        jitter = (rng or random).uniform(-RESPAWN_JITTER, RESPAWN_JITTER)
+        return now + delay * (1.0 + jitter)
+
+# --- END OF FILE app/game_state/managers/resource_node_lifecycle_manager.py ---
@@ -0,0 +1,131 @@
+# --- START OF FILE app/game_state/managers/resource_node_population_manager.py ---
+
+"""
+Resource Node Population Manager - Contains domain logic for spawning resource
+nodes from blueprints in bulk during world generation.
+"""
+
+import random
+import uuid
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from app.game_state.enums.resource import ResourceNodeVisibilityEnum
+from app.game_state.enums.shared import StatusEnum
+from app.game_state.managers.resource_distribution_manager import AliasTable
+
+# (location_id, biome_type) pairs as read from the database
+LocationBiomeRow = Tuple[UUID, Optional[str]]
+
+
+class ResourceNodePopulationManager:
+    """Manager class for generating resource node rows from blueprints"""
+
+    @staticmethod
+    def seeded_uuid(rng: random.Random) -> UUID:
+        """Draw a version 4 UUID from the given RNG so that ids are reproducible per seed."""
+        return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+    @staticmethod
+    def generate_rows(
+        locations: Sequence[LocationBiomeRow],
+        blueprints_by_biome: Dict[str, List[Any]],
+        seed: int,
+        nodes_per_location: int = 3,
+        status: StatusEnum = StatusEnum.PENDING,
+        visibility: ResourceNodeVisibilityEnum = ResourceNodeVisibilityEnum.HIDDEN,
+        samplers: Optional[Dict[str, AliasTable]] = None,
+        seed_per_location: bool = False,
+    ) -> Iterator[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """
+        Generate node rows and their resource-link rows for every location.
+
+        Blueprints are picked per location by the location's biome type, weighted
+        by the biome's alias table when one is given in samplers and uniformly
+        otherwise. Locations whose biome has no blueprints are skipped. The same
+        seed, locations and blueprints always produce the same rows.
+
+        With seed_per_location, each location draws from its own RNG seeded by
+        (seed, location_id), so a location's nodes don't depend on which other
+        locations are generated in the same call.
+
+        Args:
+            locations: (location_id, biome_type) pairs
+            blueprints_by_biome: Blueprint entities keyed by biome type
+            seed: World seed for the RNG
+            nodes_per_location: Number of nodes to spawn in each location
+            status: Initial node status
+            visibility: Initial node visibility
+            samplers: Optional alias tables keyed by biome type
+            seed_per_location: Seed the RNG per location instead of once per call
+
+        Yields:
+            (node_row, link_rows) tuples keyed by table column names
+        """
+        rng = random.Random(seed)
+        samplers = samplers or {}
+
+        # Order candidates by id so picks don't depend on query order
+        ordered_blueprints = {
+            biome: sorted(blueprints, key=lambda bp: str(bp.id))
+            for biome, blueprints in blueprints_by_biome.items()
+        }
+
+        # Sort so the output doesn't depend on the order rows came back from the DB
+        for location_id, biome_type in sorted(locations, key=lambda row: str(row[0])):
+            candidates = ordered_blueprints.get(biome_type) if biome_type else None
+            if not candidates:
+                continue
+
+            if seed_per_location:
+                # String seeds are hashed with SHA-512, so this is stable across processes
+                rng = random.Random(f"{seed}:{location_id}")
+            sampler = samplers.get(biome_type)
+            for _ in range(nodes_per_location):
+                blueprint = sampler.draw(rng) if sampler else rng.choice(candidates)
+                node_id = ResourceNodePopulationManager.seeded_uuid(rng)
+
+                node_row = {
+                    "id": node_id,
+                    # Node names are unique, so suffix with the node id
+                    "name": f"{blueprint.name[:63]} {node_id.hex[:12]}",
+                    "description": blueprint.description,
+                    "biome_type": biome_type,
+                    "depleted": False,
+                    "status": status,
+                    "visibility": visibility,
+                    "_metadata": {"blueprint_id": str(blueprint.id), "seed": seed},
+                    "tags": list(blueprint.tags or []),
+                    "location_id": location_id,
+                }
+
+                link_rows = [
+                    ResourceNodePopulationManager.roll_link(rng, node_id, link)
+                    for link in blueprint.resource_links
+                ]
+                yield node_row, link_rows
+
+    @staticmethod
+    def roll_link(rng: random.Random, node_id: UUID, blueprint_link: Any) -> Dict[str, Any]:
+        """
+        Build a resource-link row for a node from a blueprint link.
+        The instance amount range is rolled between the blueprint min and max.
+        """
+        amount_min = max(1, int(blueprint_link.amount_min))
+        amount_max = max(amount_min, int(blueprint_link.amount_max))
+        rolled_min = rng.randint(amount_min, amount_max)
+        rolled_max = rng.randint(rolled_min, amount_max)
+
+        return {
+            "node_id": node_id,
+            "resource_id": blueprint_link.resource_id,
+            "is_primary": blueprint_link.is_primary,
+            "chance": blueprint_link.chance,
+            "amount_min": rolled_min,
+            "amount_max": rolled_max,
+            "purity": round(blueprint_link.purity * rng.uniform(0.8, 1.0), 4),
+            "rarity": blueprint_link.rarity or "common",
+            "_metadata": {},
+        }
+
+# --- END OF FILE app/game_state/managers/resource_node_population_manager.py ---
@@ -0,0 +1,108 @@
+# --- START OF FILE app/game_state/managers/settlement_expansion_manager.py ---
+
+"""
+Settlement Expansion Manager - Contains the scoring rules the settlement
+expansion task uses to pick the next building for a settlement.
+
+Scores follow BuildingEvaluationService.get_weighted_building_score: the
+average trait affinity of a blueprint for the leader's traits, weighted
+with the (still placeholder) resource and needs scores. Blueprints are
+reduced once per run to their attribute sets, so ranking a settlement is
+set arithmetic with no database access.
+"""
+
+from typing import Any, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+from uuid import UUID
+
+from app.game_state.enums.building_attributes import get_attributes_for_trait
+
+# Weights of the score components (cf. BuildingEvaluationService)
+TRAIT_AFFINITY_WEIGHT = 0.6
+RESOURCE_AVAILABILITY_WEIGHT = 0.2
+SETTLEMENT_NEEDS_WEIGHT = 0.2
+
+# Placeholder component scores until resources and needs are evaluated
+RESOURCE_AVAILABILITY_SCORE = 1.0
+SETTLEMENT_NEEDS_SCORE = 0.5
+
+# Recommendations kept per settlement
+RECOMMENDATION_LIMIT = 5
+
+# Settlements per chunk streamed by the expansion task
+EXPANSION_CHUNK_SIZE = 200
+
+
+class BlueprintProfile(NamedTuple):
+    """The part of a blueprint the expansion scoring looks at."""
+    blueprint_id: UUID
+    attributes: FrozenSet[str]
+
+
+class SettlementExpansionManager:
+    """
+    Manager for settlement expansion scoring.
+    Pure functions only; the expansion task loads the rows and runs the chunks.
+    """
+
+    @staticmethod
+    def profile_blueprints(rows: Iterable[Tuple[UUID, Optional[Dict[str, Any]]]]) -> List[BlueprintProfile]:
+        """Profiles of (blueprint_id, metadata) rows, in row order."""
+        return [
+            BlueprintProfile(blueprint_id, frozenset((metadata or {}).get("attributes") or ()))
+            for blueprint_id, metadata in rows
+        ]
+
+    @staticmethod
+    def trait_affinity(attributes: FrozenSet[str], leader_traits: Sequence[str]) -> float:
+        """Average share of each trait's preferred attributes that the blueprint has."""
+        if not attributes or not leader_traits:
+            return 0.0
+        total = 0.0
+        for trait in leader_traits:
+            preferred = get_attributes_for_trait(trait)
+            if preferred:
+                total += len(attributes & preferred) / len(preferred)
+        return total / len(leader_traits)
+
+    @staticmethod
+    def score(attributes: FrozenSet[str], leader_traits: Sequence[str]) -> float:
+        """Weighted score of a blueprint for a leader, between 0.0 and 1.0."""
+        return (
+            SettlementExpansionManager.trait_affinity(attributes, leader_traits) * TRAIT_AFFINITY_WEIGHT
+            + RESOURCE_AVAILABILITY_SCORE * RESOURCE_AVAILABILITY_WEIGHT
+            + SETTLEMENT_NEEDS_SCORE * SETTLEMENT_NEEDS_WEIGHT
+        )
+
+    @staticmethod
+    def rank_blueprints(
+        profiles: Sequence[BlueprintProfile],
+        leader_traits: Sequence[str],
+        limit: int = RECOMMENDATION_LIMIT,
+    ) -> List[Tuple[UUID, float]]:
+        """
+        (blueprint_id, score) of the best blueprints for a leader, highest first.
+        Ties keep blueprint order. A leader without traits gets no recommendations.
+        """
+        if not leader_traits:
+            return []
+        # Blueprints with the same attributes score the same
+        scores: Dict[FrozenSet[str], float] = {}
+        ranked = []
+        for profile in profiles:
+            score = scores.get(profile.attributes)
+            if score is None:
+                score = scores[profile.attributes] = SettlementExpansionManager.score(profile.attributes, leader_traits)
+            ranked.append((profile.blueprint_id, score))
+        ranked.sort(key=lambda item: item[1], reverse=True)
+        return ranked[:limit]
+
+    @staticmethod
+    def summarize_timings(elapsed_ms: Sequence[float]) -> Dict[str, float]:
+        """Count, mean and max of per-settlement evaluation times."""
+        if not elapsed_ms:
+            return {"count": 0, "mean_ms": 0.0, "max_ms": 0.0}
+        return {
+            "count": len(elapsed_ms),
+            "mean_ms": round(sum(elapsed_ms) / len(elapsed_ms), 3),
+            "max_ms": round(max(elapsed_ms), 3),
+        }
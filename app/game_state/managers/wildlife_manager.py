@@ -0,0 +1,157 @@
+# --- START OF FILE app/game_state/managers/wildlife_manager.py ---
+
+"""
+Wildlife Manager - Contains the domain logic for the daily wildlife step:
+logistic population growth scaled by seasonal activity, respawning of
+wiped-out populations, and the per-location danger score derived from the
+wildlife living there and the location's biome.
+
+All wildlife rows of a world are processed together as NumPy arrays.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+import numpy as np
+
+# World.season index -> name used as a key in Wildlife.seasonal_activity
+SEASON_NAMES = ("spring", "summer", "autumn", "winter")
+
+# Danger score bounds, matching LocationInstance.base_danger_level
+MIN_DANGER = 1.0
+MAX_DANGER = 10.0
+
+# How strongly summed wildlife danger raises a location above its base danger (log scale)
+WILDLIFE_DANGER_SCALE = 1.5
+
+# Share of a nocturnal creature's danger that applies during the day
+NOCTURNAL_DAY_ACTIVITY = 0.5
+
+# Cap on the pack multiplier, as in Wildlife.get_effective_danger
+MAX_PACK_STEPS = 3
+
+
+@dataclass
+class WildlifeArrays:
+    """Column arrays for every active wildlife row of a world."""
+    ids: List[UUID]
+    location_ids: List[UUID]
+    population: np.ndarray       # (W,) int
+    max_population: np.ndarray   # (W,) int
+    spawn_rate: np.ndarray       # (W,) float
+    danger_rating: np.ndarray    # (W,) int
+    pack_behavior: np.ndarray    # (W,) bool
+    pack_size_min: np.ndarray    # (W,) int
+    nocturnal: np.ndarray        # (W,) bool
+    seasonal: np.ndarray         # (W,) float, activity multiplier for the current season
+
+
+class WildlifeManager:
+    """
+    Manager for wildlife population and danger.
+    Pure functions only; the service loads rows and persists results.
+    """
+
+    @staticmethod
+    def season_modifier(
+        seasonal_activity: Optional[Dict[str, Any]],
+        season: int,
+        season_name: Optional[str] = None,
+    ) -> float:
+        """
+        Activity multiplier for a season. seasonal_activity may be keyed by the
+        season index ("0".."3") or name ("spring".."winter"); missing means 1.0.
+        season_name overrides the default name for themes with their own calendar.
+        """
+        if not seasonal_activity:
+            return 1.0
+        name = (season_name or SEASON_NAMES[season % len(SEASON_NAMES)]).lower()
+        value = seasonal_activity.get(str(season), seasonal_activity.get(name, 1.0))
+        try:
+            return max(0.0, float(value))
+        except (TypeError, ValueError):
+            return 1.0
+
+    @staticmethod
+    def build_arrays(
+        rows: Sequence[Dict[str, Any]],
+        season: int,
+        season_name: Optional[str] = None,
+    ) -> WildlifeArrays:
+        """Build column arrays from wildlife rows (dicts keyed by Wildlife column name)."""
+        def column(name: str, dtype) -> np.ndarray:
+            return np.array([row[name] for row in rows], dtype=dtype)
+
+        return WildlifeArrays(
+            ids=[row["id"] for row in rows],
+            location_ids=[row["location_id"] for row in rows],
+            population=column("population", np.int64),
+            max_population=np.maximum(column("max_population", np.int64), 1),
+            spawn_rate=np.clip(column("spawn_rate", np.float64), 0.0, 1.0),
+            danger_rating=column("danger_rating", np.int64),
+            pack_behavior=column("pack_behavior", bool),
+            pack_size_min=np.maximum(column("pack_size_min", np.int64), 1),
+            nocturnal=column("nocturnal", bool),
+            seasonal=np.array(
+                [WildlifeManager.season_modifier(row.get("seasonal_activity"), season, season_name) for row in rows],
+                dtype=np.float64,
+            ),
+        )
+
+    @staticmethod
+    def grow(arrays: WildlifeArrays, rng: np.random.Generator) -> np.ndarray:
+        """
+        One day of logistic growth, N + r*s*N*(1 - N/K), with r the spawn rate and
+        s the seasonal modifier. Fractional growth is rounded stochastically so
+        small populations still change over time; a population of zero respawns
+        one creature with probability r*s. Results stay within [0, K].
+        """
+        population = arrays.population.astype(np.float64)
+        rate = arrays.spawn_rate * arrays.seasonal
+        capacity = arrays.max_population.astype(np.float64)
+
+        expected = population + rate * population * (1.0 - population / capacity)
+        expected = np.where(population <= 0, rate, expected)
+
+        whole = np.floor(expected)
+        grown = whole + (rng.random(len(expected)) < (expected - whole))
+        return np.clip(grown, 0, capacity).astype(np.int64)
+
+    @staticmethod
+    def effective_danger(arrays: WildlifeArrays, population: np.ndarray) -> np.ndarray:
+        """Vectorized Wildlife.get_effective_danger for the given populations, scaled by seasonal activity."""
+        base = arrays.danger_rating * population * arrays.seasonal
+        steps = np.minimum(population // arrays.pack_size_min, MAX_PACK_STEPS)
+        in_pack = arrays.pack_behavior & (population >= arrays.pack_size_min)
+        return np.where(in_pack, base * (1 + 0.5 * steps), base)
+
+    @staticmethod
+    def location_danger(
+        location_ids: Sequence[UUID],
+        base_danger: np.ndarray,
+        arrays: WildlifeArrays,
+        population: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Day and night danger score of every location.
+
+        A location starts from its base danger (the higher of its own base level
+        and its biome's danger_level_base) and rises with the log of the summed
+        effective danger of its wildlife. Nocturnal wildlife counts fully at
+        night and partially by day. Scores are clipped to 1-10.
+        """
+        index = {location_id: i for i, location_id in enumerate(location_ids)}
+        rows = np.array([index.get(location_id, -1) for location_id in arrays.location_ids], dtype=np.int64)
+        known = rows >= 0
+
+        danger = WildlifeManager.effective_danger(arrays, population)
+        day_weight = np.where(arrays.nocturnal, NOCTURNAL_DAY_ACTIVITY, 1.0)
+
+        night_total = np.bincount(rows[known], weights=danger[known], minlength=len(location_ids))
+        day_total = np.bincount(rows[known], weights=(danger * day_weight)[known], minlength=len(location_ids))
+
+        def score(total: np.ndarray) -> np.ndarray:
+            return np.clip(base_danger + WILDLIFE_DANGER_SCALE * np.log1p(total), MIN_DANGER, MAX_DANGER)
+
+        return score(day_total), score(night_total)
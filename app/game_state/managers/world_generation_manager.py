@@ -0,0 +1,401 @@
+# --- START OF FILE app/game_state/managers/world_generation_manager.py ---
+
+"""
+World Generation Manager - Contains the domain logic for procedurally generating
+a world: the location hierarchy, biome assignment, settlements, the TravelLink
+graph and the resource nodes of every leaf location.
+
+Output is streamed as (table_name, rows) batches so a caller can persist a world
+of any size with bounded memory.
+"""
+
+import math
+import random
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from app.game_state.managers.resource_node_population_manager import ResourceNodePopulationManager
+
+# (table_name, rows) batches, in an order that satisfies foreign keys
+GenerationBatch = Tuple[str, List[Dict[str, Any]]]
+
+# Flush order; each table only references tables earlier in the list
+TABLE_ORDER = (
+    "location_entities",
+    "settlements",
+    "travel_links",
+    "resource_nodes",
+    "resource_node_resources",
+)
+
+# Walking pace used to turn distance into base travel time
+BASE_TRAVEL_SPEED_KMH = 5.0
+
+# Measured spread of four-octave fractal_noise around its 0.5 mean
+FRACTAL_NOISE_STDDEV = 0.133
+
+NAME_PREFIXES = ("Ar", "Bel", "Cor", "Dun", "El", "Fen", "Gal", "Har", "Ith", "Kel",
+                 "Lor", "Mar", "Nor", "Ost", "Pra", "Quel", "Ros", "Sil", "Tor", "Val")
+NAME_MIDDLES = ("a", "e", "i", "o", "u", "ae", "ia", "or", "en", "ar")
+NAME_SUFFIXES = ("dor", "wick", "mere", "holm", "ford", "gard", "ton", "mar", "vale", "rith")
+
+
+@dataclass(frozen=True)
+class GenerationTier:
+    """One level of the location hierarchy: its type and how many children each parent gets."""
+    location_type_id: UUID
+    count: int
+
+
+@dataclass(frozen=True)
+class GenerationBiome:
+    """The biome fields the generator needs."""
+    id: UUID
+    code: str
+    danger_level_base: int = 1
+    movement_modifier: float = 1.0
+
+
+@dataclass
+class _PlacedLocation:
+    id: UUID
+    name: str
+    x: float
+    y: float
+    biome: Optional[GenerationBiome]
+
+
+@dataclass
+class _GenerationRun:
+    """Mutable state of one streaming run. Only holds the rows of the current batch."""
+    world_id: UUID
+    theme_id: Optional[UUID]
+    seed: int
+    tiers: Sequence[GenerationTier]
+    biomes: Sequence[GenerationBiome]
+    blueprints_by_biome: Dict[str, List[Any]]
+    settlement_chance: float
+    nodes_per_location: int
+    batch_size: int
+    noise_scale: float
+    layout_rng: random.Random
+    id_rng: random.Random
+    buffers: Dict[str, List[Dict[str, Any]]] = field(default_factory=lambda: {table: [] for table in TABLE_ORDER})
+    pending_leaves: List[Tuple[UUID, Optional[str]]] = field(default_factory=list)
+    previous_leaf: Optional[_PlacedLocation] = None
+
+
+class WorldGenerationManager:
+    """Manager class for deterministic procedural world generation"""
+
+    # ==============================================================================
+    # NOISE
+    # ==============================================================================
+
+    @staticmethod
+    def lattice_value(seed: int, ix: int, iy: int) -> float:
+        """Hash an integer lattice point to a value in [0, 1]. Pure integer math, so stable across processes."""
+        h = (ix * 374761393 + iy * 668265263 + (seed & 0xFFFFFFFF) * 2246822519) & 0xFFFFFFFF
+        h = ((h ^ (h >> 13)) * 1274126177) & 0xFFFFFFFF
+        h ^= h >> 16
+        return h / 0xFFFFFFFF
+
+    @staticmethod
+    def value_noise(seed: int, x: float, y: float) -> float:
+        """Smoothly interpolated value noise in [0, 1]."""
+        x0, y0 = math.floor(x), math.floor(y)
+        tx, ty = x - x0, y - y0
+        # Smoothstep so cell edges don't show
+        sx, sy = tx * tx * (3 - 2 * tx), ty * ty * (3 - 2 * ty)
+
+        lattice = WorldGenerationManager.lattice_value
+        v00, v10 = lattice(seed, x0, y0), lattice(seed, x0 + 1, y0)
+        v01, v11 = lattice(seed, x0, y0 + 1), lattice(seed, x0 + 1, y0 + 1)
+        top = v00 + sx * (v10 - v00)
+        bottom = v01 + sx * (v11 - v01)
+        return top + sy * (bottom - top)
+
+    @staticmethod
+    def fractal_noise(seed: int, x: float, y: float, octaves: int = 4, persistence: float = 0.5) -> float:
+        """Sum octaves of value noise, normalised back to [0, 1]."""
+        total, amplitude, frequency, norm = 0.0, 1.0, 1.0, 0.0
+        for octave in range(octaves):
+            total += amplitude * WorldGenerationManager.value_noise(seed + octave, x * frequency, y * frequency)
+            norm += amplitude
+            amplitude *= persistence
+            frequency *= 2.0
+        return total / norm
+
+    @staticmethod
+    def pick_biome(seed: int, x: float, y: float, biomes: Sequence[GenerationBiome], noise_scale: float) -> Optional[GenerationBiome]:
+        """Pick a biome from a noise field so neighbouring locations tend to share a biome."""
+        if not biomes:
+            return None
+        value = WorldGenerationManager.fractal_noise(seed, x / noise_scale, y / noise_scale)
+        # Octave sums bunch up around 0.5; push through a normal CDF so every biome gets a fair share
+        value = 0.5 * (1 + math.erf((value - 0.5) / (FRACTAL_NOISE_STDDEV * math.sqrt(2))))
+        return biomes[min(len(biomes) - 1, int(value * len(biomes)))]
+
+    # ==============================================================================
+    # LAYOUT HELPERS
+    # ==============================================================================
+
+    @staticmethod
+    def make_name(rng: random.Random) -> str:
+        """Build a pronounceable place name from syllables."""
+        return rng.choice(NAME_PREFIXES) + rng.choice(NAME_MIDDLES) + rng.choice(NAME_SUFFIXES)
+
+    @staticmethod
+    def grid_position(index: int, width: int) -> Tuple[int, int]:
+        """Row/column of the index-th cell in a serpentine walk, so consecutive cells are adjacent."""
+        row, col = divmod(index, width)
+        if row % 2:
+            col = width - 1 - col
+        return row, col
+
+    @staticmethod
+    def grid_index(row: int, col: int, width: int) -> int:
+        """Inverse of grid_position."""
+        return row * width + (width - 1 - col if row % 2 else col)
+
+    @staticmethod
+    def neighbour_pairs(count: int) -> List[Tuple[int, int]]:
+        """
+        Index pairs to connect among `count` siblings laid out in a serpentine grid:
+        each cell with the next one in the walk, plus the cell directly below.
+        """
+        width = max(1, math.ceil(math.sqrt(count)))
+        pairs = [(i, i + 1) for i in range(count - 1)]
+        for i in range(count):
+            row, col = WorldGenerationManager.grid_position(i, width)
+            below = WorldGenerationManager.grid_index(row + 1, col, width)
+            if below < count and below != i + 1:
+                pairs.append((i, below))
+        return pairs
+
+    @staticmethod
+    def travel_link_rows(a: _PlacedLocation, b: _PlacedLocation, link_id_ab: UUID, link_id_ba: UUID) -> List[Dict[str, Any]]:
+        """Both directions of a link between two locations."""
+        distance = round(math.hypot(a.x - b.x, a.y - b.y), 3)
+        terrain = round(((a.biome.movement_modifier if a.biome else 1.0) + (b.biome.movement_modifier if b.biome else 1.0)) / 2, 3)
+        danger = max(a.biome.danger_level_base if a.biome else 1, b.biome.danger_level_base if b.biome else 1)
+        biome_ids = sorted({loc.biome.id for loc in (a, b) if loc.biome}, key=str) or None
+        travel_time = round(distance * terrain / BASE_TRAVEL_SPEED_KMH, 3)
+
+        rows = []
+        for link_id, origin, destination in ((link_id_ab, a, b), (link_id_ba, b, a)):
+            rows.append({
+                "id": link_id,
+                "name": f"{origin.name} - {destination.name}",
+                "from_location_id": origin.id,
+                "to_location_id": destination.id,
+                "speed": 1.0,
+                "path_type": "trail",
+                "terrain_modifier": terrain,
+                "base_danger_level": danger,
+                "distance_km": distance,
+                "base_travel_time_hours": travel_time,
+                "visibility": "visible",
+                "is_active": True,
+                "weather_affected": True,
+                "seasonal_modifiers": None,
+                "biome_ids": biome_ids,
+                "faction_ids": None,
+                "description": None,
+                "notes": None,
+            })
+        return rows
+
+    # ==============================================================================
+    # GENERATION
+    # ==============================================================================
+
+    @staticmethod
+    def generate_batches(
+        world_id: UUID,
+        seed: int,
+        tiers: Sequence[GenerationTier],
+        biomes: Sequence[GenerationBiome],
+        theme_id: Optional[UUID] = None,
+        blueprints_by_biome: Optional[Dict[str, List[Any]]] = None,
+        settlement_chance: float = 0.05,
+        nodes_per_location: int = 1,
+        batch_size: int = 5000,
+        world_size_km: float = 1000.0,
+        noise_scale: float = 150.0,
+    ) -> Iterator[GenerationBatch]:
+        """
+        Generate a whole world as a stream of row batches.
+
+        The hierarchy is walked depth first, one top-level location at a time, so
+        only the current batch and one sibling list per level are held in memory.
+        Parents are always emitted before their children and every table is flushed
+        in TABLE_ORDER, so batches can be inserted as they arrive.
+
+        Layout, names, biomes and settlements depend only on the seed. Row ids and
+        resource node draws also mix in the world id, so one seed can be generated
+        into several worlds without primary key clashes.
+
+        Args:
+            world_id: World that owns the generated rows
+            seed: World seed
+            tiers: Hierarchy levels, top first. The first tier's count is the number of roots
+            biomes: Candidate biomes; order matters for reproducibility
+            theme_id: Theme stamped on every location
+            blueprints_by_biome: Resource node blueprints keyed by biome code
+            settlement_chance: Probability that a habitable leaf location gets a settlement
+            nodes_per_location: Resource nodes spawned in each leaf location
+            batch_size: Rows per table before a flush
+            world_size_km: Side length of the square world
+            noise_scale: Feature size of the biome noise field in km
+
+        Yields:
+            (table_name, rows) batches keyed by column name
+        """
+        if not tiers:
+            return
+
+        run = _GenerationRun(
+            world_id=world_id,
+            theme_id=theme_id,
+            seed=seed,
+            tiers=tiers,
+            biomes=sorted(biomes, key=lambda b: b.code),
+            blueprints_by_biome=blueprints_by_biome or {},
+            settlement_chance=settlement_chance,
+            nodes_per_location=nodes_per_location,
+            batch_size=batch_size,
+            noise_scale=noise_scale,
+            layout_rng=random.Random(seed),
+            id_rng=random.Random(world_id.int ^ seed),
+        )
+
+        yield from WorldGenerationManager._generate_children(
+            run, depth=0, parent=None, parent_type_id=None,
+            center=(world_size_km / 2, world_size_km / 2), cell=world_size_km,
+        )
+        yield from WorldGenerationManager._flush(run)
+
+    @staticmethod
+    def _generate_children(
+        run: _GenerationRun,
+        depth: int,
+        parent: Optional[_PlacedLocation],
+        parent_type_id: Optional[UUID],
+        center: Tuple[float, float],
+        cell: float,
+    ) -> Iterator[GenerationBatch]:
+        tier = run.tiers[depth]
+        is_leaf = depth == len(run.tiers) - 1
+        width = max(1, math.ceil(math.sqrt(tier.count)))
+        sub_cell = cell / width
+        origin_x, origin_y = center[0] - cell / 2, center[1] - cell / 2
+
+        children: List[_PlacedLocation] = []
+        for index in range(tier.count):
+            row, col = WorldGenerationManager.grid_position(index, width)
+            jitter_x = run.layout_rng.uniform(-0.3, 0.3) * sub_cell
+            jitter_y = run.layout_rng.uniform(-0.3, 0.3) * sub_cell
+            x = round(origin_x + (col + 0.5) * sub_cell + jitter_x, 3)
+            y = round(origin_y + (row + 0.5) * sub_cell + jitter_y, 3)
+
+            biome = WorldGenerationManager.pick_biome(run.seed, x, y, run.biomes, run.noise_scale)
+            location = _PlacedLocation(
+                id=ResourceNodePopulationManager.seeded_uuid(run.id_rng),
+                name=WorldGenerationManager.make_name(run.layout_rng),
+                x=x, y=y, biome=biome,
+            )
+            attributes: Dict[str, Any] = {"x": x, "y": y, "depth": depth, "seed": run.seed}
+
+            if is_leaf:
+                settlement = WorldGenerationManager._roll_settlement(run, location)
+                if settlement:
+                    attributes["settlement_id"] = str(settlement["id"])
+                    run.buffers["settlements"].append(settlement)
+                run.pending_leaves.append((location.id, biome.code if biome else None))
+
+            run.buffers["location_entities"].append({
+                "id": location.id,
+                "name": location.name,
+                "description": None,
+                "world_id": run.world_id,
+                "location_type_id": tier.location_type_id,
+                "parent_id": parent.id if parent else None,
+                "parent_type_id": parent_type_id,
+                "theme_id": run.theme_id,
+                "biome_id": biome.id if biome else None,
+                "sub_type_id": None,
+                "base_danger_level": max(1, min(10, biome.danger_level_base)) if biome else 1,
+                "controlled_by_faction_id": None,
+                "attributes": attributes,
+                "is_active": True,
+                "tags": ["generated"],
+            })
+            children.append(location)
+
+        if is_leaf:
+            # Chain the previous sibling group to this one so the graph stays connected
+            link_pairs = [(children[a], children[b]) for a, b in WorldGenerationManager.neighbour_pairs(len(children))]
+            if run.previous_leaf and children:
+                link_pairs.append((run.previous_leaf, children[0]))
+            for a, b in link_pairs:
+                run.buffers["travel_links"].extend(WorldGenerationManager.travel_link_rows(
+                    a, b,
+                    ResourceNodePopulationManager.seeded_uuid(run.id_rng),
+                    ResourceNodePopulationManager.seeded_uuid(run.id_rng),
+                ))
+            if children:
+                run.previous_leaf = children[-1]
+
+        if any(len(rows) >= run.batch_size for rows in run.buffers.values()) or len(run.pending_leaves) >= run.batch_size:
+            yield from WorldGenerationManager._flush(run)
+
+        if not is_leaf:
+            for child in children:
+                yield from WorldGenerationManager._generate_children(
+                    run, depth + 1, child, tier.location_type_id, (child.x, child.y), sub_cell,
+                )
+
+    @staticmethod
+    def _roll_settlement(run: _GenerationRun, location: _PlacedLocation) -> Optional[Dict[str, Any]]:
+        """Habitability comes from its own noise channel, so settlements cluster in hospitable land."""
+        habitability = WorldGenerationManager.fractal_noise(
+            run.seed + 7919, location.x / run.noise_scale, location.y / run.noise_scale, octaves=2,
+        )
+        danger = location.biome.danger_level_base if location.biome else 1
+        chance = run.settlement_chance * 2 * habitability / max(1, danger)
+        if run.layout_rng.random() >= chance:
+            return None
+
+        return {
+            "id": ResourceNodePopulationManager.seeded_uuid(run.id_rng),
+            "world_id": run.world_id,
+            "zone_id": None,
+            "name": location.name[:50],
+            "population": int(50 + habitability * run.layout_rng.randint(100, 2000)),
+            "resources": {},
+            "leader_id": None,
+        }
+
+    @staticmethod
+    def _flush(run: _GenerationRun) -> Iterator[GenerationBatch]:
+        """Emit every non-empty buffer in foreign-key order and reset them."""
+        if run.pending_leaves and run.nodes_per_location > 0 and run.blueprints_by_biome:
+            # Seeded per leaf, so the nodes don't depend on where batch boundaries fall
+            node_seed = (run.world_id.int ^ (run.seed * 1_000_003)) & 0xFFFFFFFFFFFF
+            for node_row, link_rows in ResourceNodePopulationManager.generate_rows(
+                run.pending_leaves, run.blueprints_by_biome, seed=node_seed,
+                nodes_per_location=run.nodes_per_location, seed_per_location=True,
+            ):
+                run.buffers["resource_nodes"].append(node_row)
+                run.buffers["resource_node_resources"].extend(link_rows)
+        run.pending_leaves = []
+
+        for table in TABLE_ORDER:
+            rows = run.buffers[table]
+            if rows:
+                yield table, rows
+                run.buffers[table] = []
+
+# --- END OF FILE app/game_state/managers/world_generation_manager.py ---
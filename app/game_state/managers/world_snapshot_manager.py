@@ -0,0 +1,325 @@
+# --- START OF FILE app/game_state/managers/world_snapshot_manager.py ---
+
+"""
+World Snapshot Manager - File format and row transforms for world snapshots.
+
+A snapshot is a framed binary file:
+
+    SWSNAP <version byte> <codec name>\\n
+    frame*                                  ; [1-byte kind][4-byte length][payload]
+
+- M (manifest): JSON with the world id, codec and each table's columns
+- B (batch):    one table's rows, column-oriented, encoded by the codec
+- E (end):      JSON row counts per table; a file without it is truncated
+
+Values are kept in their PostgreSQL text form (they are exported with
+`::text` casts), so every codec only stores strings and NULLs, and a
+restore feeds them straight to COPY ... (FORMAT csv) whatever the column
+type. Codecs, best first: Arrow IPC with zstd (pyarrow), zstd-framed
+msgpack (msgpack + zstandard), and zlib-compressed JSON (stdlib only).
+"""
+
+import importlib.util
+import json
+import os
+import struct
+import zlib
+from typing import IO, Any, Dict, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
+
+SNAPSHOT_MAGIC = b"SWSNAP"
+SNAPSHOT_FORMAT_VERSION = 1
+
+# Rows per batch frame (and per COPY on restore)
+SNAPSHOT_BATCH_SIZE = 10000
+
+FRAME_MANIFEST = b"M"
+FRAME_BATCH = b"B"
+FRAME_END = b"E"
+_FRAME_HEADER = struct.Struct(">cI")
+
+Columns = List[str]
+ColumnData = Dict[str, List[Optional[str]]]
+
+
+# ==============================================================================
+# CODECS
+# ==============================================================================
+
+class SnapshotCodec:
+    """Encodes one column-oriented batch of text values."""
+    name = ""
+
+    @staticmethod
+    def available() -> bool:
+        return True
+
+    def encode(self, columns: Columns, data: ColumnData) -> bytes:
+        raise NotImplementedError
+
+    def decode(self, payload: bytes) -> Tuple[Columns, ColumnData]:
+        raise NotImplementedError
+
+
+class JsonZlibCodec(SnapshotCodec):
+    """zlib-compressed JSON. Always available; the slowest and largest."""
+    name = "json"
+
+    # Level 1: higher levels cost several times the CPU for a few % of size
+    level = 1
+
+    def encode(self, columns: Columns, data: ColumnData) -> bytes:
+        return zlib.compress(json.dumps([columns, [data[c] for c in columns]], separators=(",", ":")).encode(), self.level)
+
+    def decode(self, payload: bytes) -> Tuple[Columns, ColumnData]:
+        columns, values = json.loads(zlib.decompress(payload))
+        return columns, dict(zip(columns, values))
+
+
+class MsgpackZstdCodec(SnapshotCodec):
+    """zstd-framed msgpack (needs msgpack and zstandard)."""
+    name = "msgpack"
+
+    @staticmethod
+    def available() -> bool:
+        return importlib.util.find_spec("msgpack") is not None and importlib.util.find_spec("zstandard") is not None
+
+    def encode(self, columns: Columns, data: ColumnData) -> bytes:
+        import msgpack
+        import zstandard
+        return zstandard.ZstdCompressor(level=3).compress(msgpack.packb([columns, [data[c] for c in columns]]))
+
+    def decode(self, payload: bytes) -> Tuple[Columns, ColumnData]:
+        import msgpack
+        import zstandard
+        columns, values = msgpack.unpackb(zstandard.ZstdDecompressor().decompress(payload))
+        return columns, dict(zip(columns, values))
+
+
+class ArrowCodec(SnapshotCodec):
+    """Arrow IPC stream with zstd buffer compression (needs pyarrow)."""
+    name = "arrow"
+
+    @staticmethod
+    def available() -> bool:
+        return importlib.util.find_spec("pyarrow") is not None
+
+    def encode(self, columns: Columns, data: ColumnData) -> bytes:
+        import pyarrow as pa
+        batch = pa.RecordBatch.from_arrays([pa.array(data[c], pa.string()) for c in columns], names=list(columns))
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, batch.schema, options=pa.ipc.IpcWriteOptions(compression="zstd")) as writer:
+            writer.write_batch(batch)
+        return sink.getvalue().to_pybytes()
+
+    def decode(self, payload: bytes) -> Tuple[Columns, ColumnData]:
+        import pyarrow as pa
+        table = pa.ipc.open_stream(payload).read_all()
+        return list(table.column_names), table.to_pydict()
+
+
+# Preference order for the default codec
+SNAPSHOT_CODECS = {codec.name: codec for codec in (ArrowCodec, MsgpackZstdCodec, JsonZlibCodec)}
+
+
+# ==============================================================================
+# FILE FORMAT
+# ==============================================================================
+
+class SnapshotFormatError(ValueError):
+    """The file is not a snapshot this version can read, or it is truncated."""
+
+
+class SnapshotWriter:
+    """Writes manifest, batch and end frames to a binary file object."""
+
+    def __init__(self, fileobj: IO[bytes], codec: SnapshotCodec):
+        self.fileobj = fileobj
+        self.codec = codec
+        self.counts: Dict[str, int] = {}
+        fileobj.write(SNAPSHOT_MAGIC + bytes([SNAPSHOT_FORMAT_VERSION]) + codec.name.encode() + b"\n")
+
+    def _frame(self, kind: bytes, payload: bytes) -> None:
+        self.fileobj.write(_FRAME_HEADER.pack(kind, len(payload)))
+        self.fileobj.write(payload)
+
+    def write_manifest(self, manifest: Mapping[str, Any]) -> None:
+        self._frame(FRAME_MANIFEST, json.dumps(dict(manifest, codec=self.codec.name)).encode())
+
+    def write_batch(self, table: str, columns: Columns, rows: Sequence[Sequence[Optional[str]]]) -> None:
+        if not rows:
+            return
+        data = {column: [row[i] for row in rows] for i, column in enumerate(columns)}
+        header = table.encode()
+        self._frame(FRAME_BATCH, bytes([len(header)]) + header + self.codec.encode(columns, data))
+        self.counts[table] = self.counts.get(table, 0) + len(rows)
+
+    def close(self) -> Dict[str, int]:
+        self._frame(FRAME_END, json.dumps({"counts": self.counts}).encode())
+        return dict(self.counts)
+
+
+class SnapshotReader:
+    """Reads a snapshot written by SnapshotWriter, one frame at a time."""
+
+    def __init__(self, fileobj: IO[bytes]):
+        self.fileobj = fileobj
+        header = fileobj.readline()
+        if not header.startswith(SNAPSHOT_MAGIC) or len(header) < len(SNAPSHOT_MAGIC) + 2:
+            raise SnapshotFormatError("Not a world snapshot file")
+        version = header[len(SNAPSHOT_MAGIC)]
+        if version != SNAPSHOT_FORMAT_VERSION:
+            raise SnapshotFormatError(f"Unsupported snapshot format version {version}")
+        codec_name = header[len(SNAPSHOT_MAGIC) + 1:].strip().decode()
+        self.codec = WorldSnapshotManager.get_codec(codec_name)
+
+        kind, payload = self._next_frame()
+        if kind != FRAME_MANIFEST:
+            raise SnapshotFormatError("Snapshot does not start with a manifest")
+        self.manifest: Dict[str, Any] = json.loads(payload)
+        self.counts: Optional[Dict[str, int]] = None
+
+    def _next_frame(self) -> Tuple[bytes, bytes]:
+        header = self.fileobj.read(_FRAME_HEADER.size)
+        if len(header) < _FRAME_HEADER.size:
+            raise SnapshotFormatError("Snapshot is truncated")
+        kind, length = _FRAME_HEADER.unpack(header)
+        payload = self.fileobj.read(length)
+        if len(payload) < length:
+            raise SnapshotFormatError("Snapshot is truncated")
+        return kind, payload
+
+    def batches(self) -> Iterator[Tuple[str, Columns, ColumnData]]:
+        """Yield (table, columns, data) per batch frame; validates the end frame."""
+        while True:
+            kind, payload = self._next_frame()
+            if kind == FRAME_END:
+                self.counts = json.loads(payload)["counts"]
+                return
+            if kind != FRAME_BATCH:
+                raise SnapshotFormatError(f"Unexpected frame {kind!r}")
+            size = payload[0]
+            table = payload[1:1 + size].decode()
+            columns, data = self.codec.decode(payload[1 + size:])
+            yield table, columns, data
+
+
+# ==============================================================================
+# MANAGER
+# ==============================================================================
+
+class WorldSnapshotManager:
+    """
+    Manager for world snapshot rules.
+    Pure functions only; reading and COPYing rows lives in WorldSnapshotRepository.
+    """
+
+    @staticmethod
+    def default_codec() -> SnapshotCodec:
+        """The best codec whose dependencies are installed."""
+        for codec in SNAPSHOT_CODECS.values():
+            if codec.available():
+                return codec()
+        return JsonZlibCodec()
+
+    @staticmethod
+    def get_codec(name: Optional[str]) -> SnapshotCodec:
+        """Codec by name (None for the default). Raises ValueError if unknown or not installed."""
+        if name is None:
+            return WorldSnapshotManager.default_codec()
+        codec = SNAPSHOT_CODECS.get(name)
+        if codec is None:
+            raise ValueError(f"Unknown snapshot codec '{name}'. Expected one of: {', '.join(SNAPSHOT_CODECS)}")
+        if not codec.available():
+            raise ValueError(f"Snapshot codec '{name}' needs packages that are not installed")
+        return codec()
+
+    @staticmethod
+    def deferred_columns(
+        table_order: Sequence[str],
+        foreign_keys: Mapping[str, Sequence[Tuple[str, str, bool]]],
+    ) -> Dict[str, List[str]]:
+        """
+        Foreign key columns that must be loaded after their table, because they
+        point at the same table or one restored later (FK cycles such as
+        settlements.leader_id -> characters). Takes table -> [(column,
+        referenced table, nullable)]; raises ValueError if such a column is NOT NULL.
+        """
+        position = {table: i for i, table in enumerate(table_order)}
+        deferred: Dict[str, List[str]] = {}
+        for table in table_order:
+            for column, referenced, nullable in foreign_keys.get(table, ()):
+                if referenced in position and position[referenced] >= position[table]:
+                    if not nullable:
+                        raise ValueError(f"{table}.{column} references {referenced}, restored later, but is NOT NULL")
+                    deferred.setdefault(table, []).append(column)
+        return deferred
+
+    @staticmethod
+    def remap_batch(
+        columns: Columns,
+        data: ColumnData,
+        uuid_columns: Set[str],
+        id_map: Dict[str, str],
+        remap_ids: bool = True,
+        pk_column: Optional[str] = "id",
+        deferred: Sequence[str] = (),
+    ) -> Tuple[List[List[Optional[str]]], Dict[str, List[Tuple[str, str]]]]:
+        """
+        Turn one batch into rows ready for COPY.
+
+        With remap_ids, each row's primary key gets a fresh UUID (recorded in
+        id_map) and every UUID value already in id_map is replaced, so rows
+        keep pointing at each other while references to shared data (themes,
+        biomes, blueprints, ...) are left alone. Deferred columns are written
+        as NULL and returned as {column: [(row id, old value)]}, to be mapped
+        and applied once every table is loaded.
+        """
+        count = len(data[columns[0]]) if columns else 0
+        out = {column: list(data[column]) for column in columns}
+
+        if remap_ids and pk_column in out:
+            fresh = iter(_fresh_uuids(count))
+            out[pk_column] = [id_map.setdefault(old, next(fresh)) if old is not None else None for old in out[pk_column]]
+
+        later: Dict[str, List[Tuple[str, str]]] = {}
+        for column in deferred:
+            if column in out:
+                values = out[column]
+                later[column] = [(out[pk_column][i], values[i]) for i in range(count) if values[i] is not None]
+                out[column] = [None] * count
+
+        if remap_ids:
+            for column in uuid_columns:
+                if column == pk_column or column in deferred or column not in out:
+                    continue
+                out[column] = [id_map.get(value, value) if value is not None else None for value in out[column]]
+
+        rows = [list(row) for row in zip(*(out[column] for column in columns))]
+        return rows, later
+
+    @staticmethod
+    def encode_csv(rows: Sequence[Sequence[Optional[str]]]) -> bytes:
+        """
+        CSV for COPY ... (FORMAT csv): every value quoted, NULL as an unquoted
+        empty field, which keeps NULL and '' distinct.
+        """
+        if not rows:
+            return b""
+        # Quote column by column, then join; far cheaper than per-value work per row
+        quoted = [
+            ["" if value is None else '"' + value.replace('"', '""') + '"' for value in column]
+            for column in zip(*rows)
+        ]
+        return ("\n".join(map(",".join, zip(*quoted))) + "\n").encode()
+
+
+def _fresh_uuids(count: int) -> List[str]:
+    """`count` random (version 4) UUID strings, from one urandom call instead of uuid4() per row."""
+    hexed = os.urandom(16 * count).hex()
+    out = []
+    for start in range(0, 32 * count, 32):
+        h = hexed[start:start + 32]
+        out.append(f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{'89ab'[int(h[16], 16) & 3]}{h[17:20]}-{h[20:]}")
+    return out
+
+# --- END OF FILE app/game_state/managers/world_snapshot_manager.py ---
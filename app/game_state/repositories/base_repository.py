@@ -1,25 +1,72 @@
 # --- START OF FILE app/game_state/repositories/base_repository.py ---
 
 
-from typing import Generic, Type, TypeVar, List, Optional, Any, Dict, cast, Union
-from sqlalchemy import func, or_, and_, literal_column, delete
+from typing import Callable, Generic, Type, TypeVar, List, Optional, Any, Dict, Tuple, cast, Union
+from sqlalchemy import bindparam, func, or_, and_, literal_column, delete, insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 from sqlalchemy import inspect as sa_inspect
 from pydantic import BaseModel, ValidationError
+import asyncio
 import logging
 import inspect
+import random
 
 from sqlalchemy.sql.elements import ColumnElement  # For type hinting SQL expressions
 from sqlalchemy.orm.attributes import InstrumentedAttribute  # To check if an attribute is a mapped column
 from sqlalchemy.sql import expression as sql_expr  # For sqlalchemy.true() and sqlalchemy.false()
 
+from app.core.cache_invalidation import CacheInvalidationBus
+from app.db.models.base import VersionedMixin
+
 # Define type variables
 EntityType = TypeVar('EntityType')
 ModelType = TypeVar('ModelType')
 PrimaryKeyType = TypeVar('PrimaryKeyType')
 
+
+def escape_like(value: str) -> str:
+    """Escape LIKE wildcards so a value only matches literally (use with escape='\\\\')."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+# Hot read statements, built once per model and query shape and executed with
+# bound parameters. SQLAlchemy memoizes a statement object's cache key, so a
+# reused statement skips both construction and cache-key generation and goes
+# straight to the compiled cache (and asyncpg's prepared statement cache).
+_statement_cache: Dict[Tuple[Any, ...], Any] = {}
+
+# Per model class: (column names, primary key column names, those with server defaults)
+_model_info_cache: Dict[type, Tuple[frozenset, frozenset, frozenset]] = {}
+
+# (model class, field name) -> validated mapped attribute
+_field_attribute_cache: Dict[Tuple[type, str], InstrumentedAttribute] = {}
+
+
+# Optimistic concurrency: attempts per update_with_retry call, and the first
+# backoff in seconds (doubled per attempt, with full jitter)
+OPTIMISTIC_MAX_ATTEMPTS = 5
+OPTIMISTIC_RETRY_BACKOFF = 0.005
+
+# Timestamps the database maintains (server_default / onupdate); versioned
+# writes never send them, so updated_at's onupdate=func.now() still fires
+SERVER_MANAGED_COLUMNS = frozenset({"created_at", "updated_at"})
+
+# asyncpg (the Postgres wire protocol) accepts at most 32767 bind parameters per statement
+MAX_BIND_PARAMETERS = 32767
+
+
+class ConcurrentUpdateError(ValueError):
+    """A versioned write found the row at a newer version than the one it read."""
+
+    def __init__(self, model_name: str, pk: Any, expected_version: Optional[int]):
+        super().__init__(f"{model_name} {pk} was modified concurrently (expected version {expected_version})")
+        self.model_name = model_name
+        self.pk = pk
+        self.expected_version = expected_version
+
+
 class BaseRepository(Generic[EntityType, ModelType, PrimaryKeyType]):
     """
     Generic base repository providing common CRUD operations.
@@ -36,22 +83,22 @@ class BaseRepository(Generic[EntityType, ModelType, PrimaryKeyType]):
         self.model_cls = model_cls
         self.entity_cls = entity_cls
 
-        self._pk_attr_names = set()
-        self._pk_server_default_names = set()
-        self._model_column_keys = set()
+        self._pk_attr_names = frozenset()
+        self._pk_server_default_names = frozenset()
+        self._model_column_keys = frozenset()
 
         try:
-            # Access the table directly - this is more reliable
-            table = self.model_cls.__table__
-
-            # Get all column names from the table
-            self._model_column_keys = {col.name for col in table.columns}
-
-            # Get primary key information
-            for col in table.primary_key.columns:
-                self._pk_attr_names.add(col.name)
-                if col.server_default is not None:
-                    self._pk_server_default_names.add(col.name)
+            # Repositories are created per request; the table is only inspected once per model
+            model_info = _model_info_cache.get(model_cls)
+            if model_info is None:
+                # Access the table directly - this is more reliable
+                table = self.model_cls.__table__
+                model_info = _model_info_cache[model_cls] = (
+                    frozenset(col.name for col in table.columns),
+                    frozenset(col.name for col in table.primary_key.columns),
+                    frozenset(col.name for col in table.primary_key.columns if col.server_default is not None),
+                )
+            self._model_column_keys, self._pk_attr_names, self._pk_server_default_names = model_info
 
             if not self._pk_attr_names:
                 logging.warning(f"No primary key columns found for model {self.model_cls.__name__}.")
@@ -83,6 +130,10 @@ class BaseRepository(Generic[EntityType, ModelType, PrimaryKeyType]):
 
     def _validate_field_attribute(self, field_name: str) -> InstrumentedAttribute:
         """Validate that a field exists and is queryable. Returns the field attribute."""
+        cached = _field_attribute_cache.get((self.model_cls, field_name))
+        if cached is not None:
+            return cached
+
         field_attr = getattr(self.model_cls, field_name, None)
         if field_attr is None:
             raise ValueError(f"Field '{field_name}' does not exist on model {self.model_cls.__name__}.")
@@ -94,8 +145,17 @@ class BaseRepository(Generic[EntityType, ModelType, PrimaryKeyType]):
                 f"It cannot be used directly in a database WHERE clause."
             )
 
+        _field_attribute_cache[(self.model_cls, field_name)] = field_attr
         return field_attr
 
+    def _cached_statement(self, key: Tuple[Any, ...], build: Callable[[], Any]) -> Any:
+        """The statement for this model and query shape, built by `build` on first use."""
+        cache_key = (self.model_cls,) + key
+        stmt = _statement_cache.get(cache_key)
+        if stmt is None:
+            stmt = _statement_cache[cache_key] = build()
+        return stmt
+
     @staticmethod
     def _create_safe_where_clause(comparison: Any, context: str = "") -> ColumnElement[bool]:
         """Convert a comparison to a safe SQLAlchemy WHERE clause.
@@ -116,6 +176,10 @@ class BaseRepository(Generic[EntityType, ModelType, PrimaryKeyType]):
                 f"Comparison {context} resulted in an unsupported type: {type(comparison)}."
             )
 
+    def _record_invalidation(self, pk: Any, version: Optional[int] = None) -> None:
+        """Have other processes' caches drop this row once the session commits."""
+        CacheInvalidationBus.record(self.db, self.model_cls.__tablename__, pk, version)
+
     async def _execute_db_operation(self, db_obj: ModelType, operation: str) -> ModelType:
         """Execute flush and refresh operations with proper error handling."""
         try:
@@ -170,7 +234,7 @@ class BaseRepository(Generic[EntityType, ModelType, PrimaryKeyType]):
                 raise ValueError(f"Entity with {pk_attr_name}={pk_value} already exists")
 
         # Prepare data for INSERT
-        model_data = entity.model_dump(include=self._model_column_keys)
+        model_data = self._strip_unset_version(entity.model_dump(include=self._model_column_keys))
 
         # Create new DB object
         db_obj = self.model_cls(**model_data)
@@ -180,6 +244,7 @@ class BaseRepository(Generic[EntityType, ModelType, PrimaryKeyType]):
         await self._execute_db_operation(db_obj, "Create")
 
         created_entity = await self._convert_to_entity(db_obj)
+        self._record_invalidation(getattr(created_entity, pk_attr_name, pk_value), getattr(created_entity, "version", None))
         logging.info(f"[Create] Entity created successfully")
         return created_entity
 
@@ -193,6 +258,15 @@ class BaseRepository(Generic[EntityType, ModelType, PrimaryKeyType]):
         if pk_value is None:
             raise ValueError("Cannot update entity without primary key value")
 
+        # Versioned entities that carry the version they were read at are compare-and-set
+        expected_version = getattr(entity, "version", None) if self.is_versioned else None
+        if expected_version is not None:
+            values = entity.model_dump(include=self._versioned_value_keys)
+            row = await self.update_versioned(pk_value, expected_version, values)
+            if row is None:
+                raise ValueError(f"Entity with {pk_attr_name}={pk_value} not found")
+            return self._merge_row(entity, row)
+
         # Get existing entity
         existing_db_obj = await self.db.get(self.model_cls, pk_value)
         if not existing_db_obj:
@@ -208,11 +282,15 @@ class BaseRepository(Generic[EntityType, ModelType, PrimaryKeyType]):
                     setattr(existing_db_obj, key, value)
                 except AttributeError:
                     logging.warning(f"[Update] Attribute '{key}' not found on DB object, skipping.")
+        if self.is_versioned:
+            # Unchecked, but still bumped so versioned writers see the change
+            existing_db_obj.version = self.model_cls.version + 1
 
         # Execute and refresh
         await self._execute_db_operation(existing_db_obj, "Update")
 
         updated_entity = await self._convert_to_entity(existing_db_obj)
+        self._record_invalidation(pk_value, getattr(updated_entity, "version", None))
         logging.info(f"[Update] Entity updated successfully")
         return updated_entity
 
@@ -286,6 +364,126 @@ class BaseRepository(Generic[EntityType, ModelType, PrimaryKeyType]):
             logging.error(f"[UpdateEntity] Error saving updated entity with ID {pk}: {e}", exc_info=True)
             raise
 
+    # OPTIMISTIC CONCURRENCY
+
+    @property
+    def is_versioned(self) -> bool:
+        """Whether the model opted in to optimistic concurrency (VersionedMixin)."""
+        return isinstance(self.model_cls, type) and issubclass(self.model_cls, VersionedMixin)
+
+    def _pk_table_column(self):
+        # Core statements work on table columns, which the ORM attribute may rename (Settlement.entity_id is "id")
+        if len(self._pk_attr_names) != 1:
+            raise ValueError(f"Versioned writes need a single-column primary key on {self.model_cls.__name__}")
+        return self.model_cls.__table__.c[next(iter(self._pk_attr_names))]
+
+    @property
+    def _versioned_value_keys(self) -> frozenset:
+        """Columns a versioned UPDATE may set: not the key, the version or the server-managed timestamps."""
+        return self._model_column_keys - self._pk_attr_names - SERVER_MANAGED_COLUMNS - {"version"}
+
+    def _strip_unset_version(self, model_data: Dict[str, Any]) -> Dict[str, Any]:
+        # A new entity has no version yet; let the column default set it rather than inserting NULL
+        if model_data.get("version", 0) is None:
+            model_data.pop("version")
+        return model_data
+
+    def _merge_row(self, entity: EntityType, row: Dict[str, Any]) -> EntityType:
+        """The entity with the columns of a RETURNING row (version, updated_at, ...) applied."""
+        fields = type(entity).model_fields
+        return entity.model_copy(update={key: value for key, value in row.items() if key in fields})
+
+    async def update_versioned(
+        self, pk: PrimaryKeyType, expected_version: int, values: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        UPDATE ... SET <values>, version = version + 1 WHERE pk = :pk AND version = :expected
+        RETURNING *, with no row lock held beyond the statement itself.
+
+        Returns the updated row (column name -> value), or None if there is no
+        row with that key. Raises ConcurrentUpdateError if the row has moved
+        past expected_version.
+        """
+        if not self.is_versioned:
+            raise TypeError(f"{self.model_cls.__name__} is not versioned (add VersionedMixin to the model)")
+
+        table = self.model_cls.__table__
+        pk_column = self._pk_table_column()
+        stmt = (
+            update(table)
+            .where(pk_column == pk, table.c.version == expected_version)
+            .values({table.c[key]: value for key, value in values.items() if key in self._versioned_value_keys})
+            .values(version=table.c.version + 1)
+            .returning(*table.columns)
+        )
+        result = await self.db.execute(stmt)
+        row = result.mappings().one_or_none()
+
+        # The session may hold this row from an earlier read; make the next ORM access reload it
+        identity = self.db.sync_session.identity_map.get(self.db.sync_session.identity_key(self.model_cls, pk))
+        if identity is not None:
+            self.db.expire(identity)
+
+        if row is not None:
+            self._record_invalidation(pk, row["version"])
+            return dict(row)
+        still_there = await self.db.execute(select(pk_column).where(pk_column == pk))
+        if still_there.first() is not None:
+            raise ConcurrentUpdateError(self.model_cls.__name__, pk, expected_version)
+        return None
+
+    async def update_with_retry(
+        self,
+        pk: PrimaryKeyType,
+        mutate: Callable[[EntityType], Optional[bool]],
+        max_attempts: int = OPTIMISTIC_MAX_ATTEMPTS,
+    ) -> Optional[EntityType]:
+        """
+        Read-modify-write without row locks. Reads the current row, lets
+        `mutate` change the entity in place (domain methods such as
+        add_resource), and writes only the changed columns with
+        update_versioned. On a version conflict the row is read again and
+        `mutate` re-applied, with jittered exponential backoff between attempts.
+
+        Returns the saved entity, or None if the row doesn't exist or `mutate`
+        returned False to leave it unchanged. Raises ConcurrentUpdateError
+        after max_attempts conflicts.
+        """
+        table = self.model_cls.__table__
+        pk_column = self._pk_table_column()
+        columns = self._versioned_value_keys
+
+        for attempt in range(1, max_attempts + 1):
+            # Straight from the table, so neither the identity map nor relationships get in the way
+            result = await self.db.execute(select(*table.columns).where(pk_column == pk))
+            row = result.mappings().one_or_none()
+            if row is None:
+                return None
+            # NULL columns fall back to the entity's defaults (e.g. an empty resources dict)
+            entity = self.entity_cls.model_validate({key: value for key, value in row.items() if value is not None})
+            version = row["version"]
+
+            before = entity.model_dump(include=columns)
+            if mutate(entity) is False:
+                return None
+            after = entity.model_dump(include=columns)
+            changes = {key: value for key, value in after.items() if before.get(key) != value}
+            if not changes:
+                return entity
+
+            try:
+                saved = await self.update_versioned(pk, version, changes)
+            except ConcurrentUpdateError:
+                if attempt == max_attempts:
+                    logging.warning(f"[UpdateWithRetry] {self.model_cls.__name__} {pk}: giving up after {attempt} conflicts")
+                    raise
+                logging.debug(f"[UpdateWithRetry] {self.model_cls.__name__} {pk}: version {version} is stale, retrying")
+                await asyncio.sleep(random.uniform(0, OPTIMISTIC_RETRY_BACKOFF * 2 ** (attempt - 1)))
+                continue
+            return self._merge_row(entity, saved) if saved is not None else None
+
+        return None
+
     # READ OPERATIONS
 
     async def find_by_id(self, pk: PrimaryKeyType) -> Optional[EntityType]:
@@ -379,16 +577,16 @@ class BaseRepository(Generic[EntityType, ModelType, PrimaryKeyType]):
         pk_attr_name, pk_col = self._get_pk_info()
         logging.debug(f"[Exists] Checking existence for {self.model_cls.__name__} with ID: {pk}")
 
-        potential_comparison = (pk_col == pk)
-        actual_comparison = self._create_safe_where_clause(
-            potential_comparison,
-            f"for {self.model_cls.__name__}.{pk_attr_name} == {pk!r}"
-        )
-
-        exists_subquery = select(literal_column("1")).select_from(self.model_cls).where(actual_comparison).exists()
-        stmt = select(exists_subquery)
+        def build():
+            actual_comparison = self._create_safe_where_clause(
+                pk_col == bindparam("pk"),
+                f"for {self.model_cls.__name__}.{pk_attr_name}"
+            )
+            exists_subquery = select(literal_column("1")).select_from(self.model_cls).where(actual_comparison).exists()
+            return select(exists_subquery)
 
-        result = await self.db.execute(stmt)
+        stmt = self._cached_statement(("exists",), build)
+        result = await self.db.execute(stmt, {"pk": pk})
         does_exist = result.scalar_one_or_none()
 
         logging.debug(f"[Exists] Result for ID {pk}: {does_exist}")
@@ -397,14 +595,16 @@ class BaseRepository(Generic[EntityType, ModelType, PrimaryKeyType]):
     async def get_by_field(self, field_name: str, value: Any) -> Optional[EntityType]:
         field_attr = self._validate_field_attribute(field_name)
 
-        potential_sql_filter = (field_attr == value)
-        actual_filter = self._create_safe_where_clause(
-            potential_sql_filter,
-            f"for {self.model_cls.__name__}.{field_name} == {value!r}"
-        )
+        if value is None:
+            # IS NULL, which a bound parameter can't express
+            stmt, params = select(self.model_cls).where(field_attr.is_(None)), None
+        else:
+            stmt = self._cached_statement(("field", field_name), lambda: select(self.model_cls).where(
+                self._create_safe_where_clause(field_attr == bindparam("value"), f"for {self.model_cls.__name__}.{field_name}")
+            ))
+            params = {"value": value}
 
-        stmt = select(self.model_cls).where(actual_filter)
-        result = await self.db.execute(stmt)
+        result = await self.db.execute(stmt, params)
         db_obj = result.scalar_one_or_none()
         return await self._convert_to_entity(db_obj) if db_obj else None
 
@@ -425,13 +625,15 @@ class BaseRepository(Generic[EntityType, ModelType, PrimaryKeyType]):
             f"[FindByNameInsensitive] Looking for {self.model_cls.__name__} with name (case-insensitive): '{name}'")
 
         field_attr = self._validate_field_attribute('name')
-        potential_sql_filter = (func.lower(field_attr) == name.lower())
-        actual_filter = self._create_safe_where_clause(
-            potential_sql_filter,
-            f"case-insensitive name comparison for {self.model_cls.__name__}"
-        )
+        # ILIKE without wildcards instead of lower(name) = ..., so trigram-indexed names use their index
+        stmt = self._cached_statement(("name_ilike",), lambda: select(self.model_cls).where(
+            self._create_safe_where_clause(
+                field_attr.ilike(bindparam("pattern"), escape='\\'),
+                f"case-insensitive name comparison for {self.model_cls.__name__}"
+            )
+        ))
 
-        result = await self.db.execute(select(self.model_cls).where(actual_filter))
+        result = await self.db.execute(stmt, {"pattern": escape_like(name)})
         db_obj = result.scalar_one_or_none()
         return await self._convert_to_entity(db_obj) if db_obj else None
 
@@ -441,18 +643,18 @@ class BaseRepository(Generic[EntityType, ModelType, PrimaryKeyType]):
 
         field_attr = self._validate_field_attribute('name')
 
-        if partial_match:
-            potential_sql_filter = field_attr.ilike(f'%{name}%')
-        else:
-            potential_sql_filter = (field_attr == name)
-
-        actual_filter = self._create_safe_where_clause(
-            potential_sql_filter,
-            f"name comparison (partial_match={partial_match}) for {self.model_cls.__name__}"
-        )
-
-        stmt = select(self.model_cls).where(actual_filter)
-        result = await self.db.execute(stmt)
+        def build():
+            if partial_match:
+                potential_sql_filter = field_attr.ilike(bindparam("name"), escape='\\')
+            else:
+                potential_sql_filter = (field_attr == bindparam("name"))
+            return select(self.model_cls).where(self._create_safe_where_clause(
+                potential_sql_filter,
+                f"name comparison (partial_match={partial_match}) for {self.model_cls.__name__}"
+            ))
+
+        stmt = self._cached_statement(("all_by_name", partial_match), build)
+        result = await self.db.execute(stmt, {"name": f'%{escape_like(name)}%' if partial_match else name})
         db_objs = result.scalars().all()
 
         entities = [await self._convert_to_entity(db_obj) for db_obj in db_objs if db_obj]
@@ -468,8 +670,11 @@ class BaseRepository(Generic[EntityType, ModelType, PrimaryKeyType]):
 
         field_attr = self._validate_field_attribute(field_name)
 
-        stmt = select(self.model_cls).where(field_attr.in_(values))
-        result = await self.db.execute(stmt)
+        # Expanding parameter: one cached statement whatever the list length
+        stmt = self._cached_statement(("field_in", field_name), lambda: select(self.model_cls).where(
+            field_attr.in_(bindparam("values", expanding=True))
+        ))
+        result = await self.db.execute(stmt, {"values": list(values)})
         db_objs = result.scalars().all()
 
         entities = [await self._convert_to_entity(db_obj) for db_obj in db_objs if db_obj]
@@ -484,20 +689,25 @@ class BaseRepository(Generic[EntityType, ModelType, PrimaryKeyType]):
         if not field_values:
             return []
 
-        conditions: List[ColumnElement[bool]] = []
-        for field_name, value in field_values.items():
-            field_attr = self._validate_field_attribute(field_name)
-            comparison = (field_attr == value)
-            safe_condition = self._create_safe_where_clause(comparison, f"for field {field_name}")
-            conditions.append(safe_condition)
-
-        stmt = select(self.model_cls)
-        if match_all:
-            stmt = stmt.where(and_(*conditions))
-        else:
-            stmt = stmt.where(or_(*conditions))
-
-        result = await self.db.execute(stmt)
+        # None values compare with IS NULL, so they are part of the query shape rather than parameters
+        shape = tuple((field_name, value is None) for field_name, value in field_values.items())
+        field_attrs = [self._validate_field_attribute(field_name) for field_name, _ in shape]
+
+        def build():
+            conditions: List[ColumnElement[bool]] = []
+            for position, ((field_name, is_null), field_attr) in enumerate(zip(shape, field_attrs)):
+                comparison = field_attr.is_(None) if is_null else (field_attr == bindparam(f"value_{position}"))
+                safe_condition = self._create_safe_where_clause(comparison, f"for field {field_name}")
+                conditions.append(safe_condition)
+
+            stmt = select(self.model_cls)
+            if match_all:
+                return stmt.where(and_(*conditions))
+            return stmt.where(or_(*conditions))
+
+        stmt = self._cached_statement(("fields", shape, match_all), build)
+        params = {f"value_{position}": value for position, value in enumerate(field_values.values()) if value is not None}
+        result = await self.db.execute(stmt, params)
         db_objs = result.scalars().all()
         entities = [await self._convert_to_entity(db_obj) for db_obj in db_objs if db_obj]
 
@@ -516,6 +726,7 @@ class BaseRepository(Generic[EntityType, ModelType, PrimaryKeyType]):
             await self.db.delete(db_obj)
             try:
                 await self.db.flush()
+                self._record_invalidation(pk)
                 logging.info(f"[Delete] Successfully deleted object with ID: {pk}")
                 return True
             except Exception as e:
@@ -606,7 +817,7 @@ class BaseRepository(Generic[EntityType, ModelType, PrimaryKeyType]):
             pk_value = getattr(entity, pk_attr_name, None)
 
             if pk_value is None:  # For UUID entities, None means new
-                model_dict = entity.model_dump(include=self._model_column_keys)
+                model_dict = self._strip_unset_version(entity.model_dump(include=self._model_column_keys))
                 new_entities_data.append(model_dict)
             else:
                 existing_entities_to_update.append(entity)
@@ -628,6 +839,7 @@ class BaseRepository(Generic[EntityType, ModelType, PrimaryKeyType]):
                     await self.db.refresh(db_obj)
                     saved_entity = await self._convert_to_entity(db_obj)
                     if saved_entity:
+                        self._record_invalidation(getattr(saved_entity, pk_attr_name, None), getattr(saved_entity, "version", None))
                         saved_entities_list.append(saved_entity)
 
                 logging.debug(f"[BulkSave] Successfully processed {len(db_objs_to_insert)} new entities.")
@@ -670,6 +882,8 @@ class BaseRepository(Generic[EntityType, ModelType, PrimaryKeyType]):
             await self.db.flush()
 
             deleted_count = result.rowcount or 0
+            for pk in pks:
+                self._record_invalidation(pk)
             logging.info(f"[BulkDelete] Successfully deleted {deleted_count} entities")
             return deleted_count
 
@@ -678,4 +892,32 @@ class BaseRepository(Generic[EntityType, ModelType, PrimaryKeyType]):
             await self.db.rollback()
             raise
 
+    async def bulk_insert_rows(self, rows: List[Dict[str, Any]], chunk_size: int = 1000, table: Any = None) -> int:
+        """
+        Insert raw rows keyed by column name, one multi-row INSERT ... VALUES per chunk.
+        Every row in a call must have the same keys. Chunks shrink when needed to stay
+        under the driver's bind parameter limit. Skips entity conversion and refreshes,
+        so it suits generated data. Defaults to this repository's table. Does not commit;
+        the caller owns the transaction.
+        """
+        if not rows:
+            return 0
+
+        table = table if table is not None else self.model_cls.__table__
+        # Every column of the table is rendered once per row
+        chunk_size = max(1, min(chunk_size, MAX_BIND_PARAMETERS // len(table.columns)))
+        inserted = 0
+
+        try:
+            for start in range(0, len(rows), chunk_size):
+                chunk = rows[start:start + chunk_size]
+                await self.db.execute(insert(table).values(chunk))
+                inserted += len(chunk)
+            logging.debug(f"[BulkInsert] Inserted {inserted} rows into {table.name}")
+            return inserted
+
+        except Exception as e:
+            logging.error(f"[BulkInsert] Error bulk inserting into {table.name}: {e}", exc_info=True)
+            raise
+
 # --- END OF FILE app/game_state/repositories/base_repository.py ---
\ No newline at end of file
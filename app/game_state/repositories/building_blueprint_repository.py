@@ -2,7 +2,7 @@
 
 import logging
 import uuid
-from typing import List, Optional, Dict, Any, cast
+from typing import List, Optional, Dict, Any, Tuple, cast
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
@@ -100,6 +100,12 @@ class BuildingBlueprintRepository(BaseRepository[BuildingBlueprintPydantic, Buil
         entities = [await self._convert_to_entity(db_obj) for db_obj in db_objs]
         return [entity for entity in entities if entity is not None]
 
+    async def find_metadata_rows(self) -> List[Tuple[uuid.UUID, Optional[Dict[str, Any]]]]:
+        """(id, metadata) of every blueprint, without loading stages."""
+        stmt = select(BuildingBlueprintDB.id, BuildingBlueprintDB._metadata).order_by(BuildingBlueprintDB.id)
+        result = await self.db.execute(stmt)
+        return [tuple(row) for row in result.all()]
+
     async def find_by_name(self, name: str, theme_id: Optional[uuid.UUID] = None) -> Optional[BuildingBlueprintPydantic]:
         """Finds a blueprint by its unique name, optionally within a theme."""
         stmt = select(self.model_cls).where(self.model_cls.name == name)
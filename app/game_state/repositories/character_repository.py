@@ -3,7 +3,9 @@ from app.db.models.character import Character
 from app.game_state.entities.resource.resource_pydantic import ResourceEntityPydantic
 from app.game_state.entities.character.character_pydantic import CharacterEntityPydantic
 from app.game_state.repositories.base_repository import BaseRepository
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, List, Sequence
 from uuid import UUID
 
 class CharacterRepository(BaseRepository[CharacterEntityPydantic, Character, UUID]):
@@ -19,4 +21,15 @@ class CharacterRepository(BaseRepository[CharacterEntityPydantic, Character, UUI
         arguments: character_id, resource_id, amount
         response: None
         """
-        pass
\ No newline at end of file
+        pass
+
+    async def find_traits_by_ids(self, character_ids: Sequence[UUID]) -> Dict[UUID, List[str]]:
+        """Trait values of many characters in one query. Missing characters are left out."""
+        if not character_ids:
+            return {}
+        stmt = select(Character.id, Character.character_traits).where(Character.id.in_(set(character_ids)))
+        result = await self.db.execute(stmt)
+        return {
+            character_id: [getattr(trait, "value", trait) for trait in traits or ()]
+            for character_id, traits in result.all()
+        }
@@ -0,0 +1,64 @@
+# app/game_state/repositories/core/outbox_repository.py
+
+import logging
+from typing import Any, List, Optional
+from uuid import UUID
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.outbox_event import OutboxEvent
+from app.game_state.managers.domain_event_manager import DomainEvent, DomainEventManager
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxRepository:
+    """
+    Statements of the domain event outbox.
+    Nothing here commits; events become visible with the transaction that appended them.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    def append(self, event_type: str, aggregate_id: Optional[UUID], **payload: Any) -> None:
+        """Add an event to the session's transaction. Inserted on the next flush or commit."""
+        self.db.add(OutboxEvent(
+            event_type=event_type,
+            aggregate_type=DomainEventManager.aggregate_type_of(event_type),
+            aggregate_id=aggregate_id,
+            payload=payload,
+        ))
+
+    async def take_batch(self, limit: int) -> List[DomainEvent]:
+        """
+        Delete and return the oldest `limit` events, in id order. Rows locked by a
+        concurrent relay are skipped; a rollback puts the batch back.
+        """
+        try:
+            oldest = (
+                select(OutboxEvent.id)
+                .order_by(OutboxEvent.id)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            stmt = (
+                delete(OutboxEvent)
+                .where(OutboxEvent.id.in_(oldest.scalar_subquery()))
+                .returning(
+                    OutboxEvent.id, OutboxEvent.event_type, OutboxEvent.aggregate_type,
+                    OutboxEvent.aggregate_id, OutboxEvent.payload, OutboxEvent.occurred_at,
+                )
+            )
+            result = await self.db.execute(stmt)
+            return sorted((DomainEvent(*row) for row in result.all()), key=lambda event: event.event_id)
+
+        except Exception as e:
+            logger.error(f"[OutboxRepository] Failed to take a batch of {limit} events: {e}", exc_info=True)
+            raise
+
+    async def count_pending(self) -> int:
+        """Events not yet relayed to the stream."""
+        result = await self.db.execute(select(func.count()).select_from(OutboxEvent))
+        return result.scalar_one()
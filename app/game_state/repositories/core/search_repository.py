@@ -0,0 +1,89 @@
+# app/game_state/repositories/core/search_repository.py
+
+import logging
+from uuid import UUID
+from typing import Any, Dict, List, NamedTuple, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Select, Table, func, literal, or_, select
+
+from app.db.models.building_blueprint import BuildingBlueprint
+from app.db.models.character import Character
+from app.db.models.location_instance import LocationInstance
+from app.db.models.resources.resource_blueprint import ResourceBlueprint
+from app.db.models.resources.resource_node_blueprint import ResourceNodeBlueprint
+from app.db.models.settlement import Settlement
+from app.game_state.repositories.base_repository import escape_like
+
+logger = logging.getLogger(__name__)
+
+# Trigram indexes need at least 3 characters to narrow anything down; shorter
+# queries would fall back to scanning the table.
+SEARCH_MIN_QUERY_LENGTH = 3
+SEARCH_DEFAULT_LIMIT = 10
+SEARCH_MAX_LIMIT = 50
+
+
+class SearchKind(NamedTuple):
+    """A searchable table and, for world content, its world column."""
+    table: Table
+    world_column: Optional[str] = None
+
+
+# Every kind has a pg_trgm GIN index on its name column (migration c7d3a1f08e42)
+SEARCH_KINDS: Dict[str, SearchKind] = {
+    "characters": SearchKind(Character.__table__, "world_id"),
+    "locations": SearchKind(LocationInstance.__table__, "world_id"),
+    "settlements": SearchKind(Settlement.__table__, "world_id"),
+    "resources": SearchKind(ResourceBlueprint.__table__),
+    "resource_node_blueprints": SearchKind(ResourceNodeBlueprint.__table__),
+    "building_blueprints": SearchKind(BuildingBlueprint.__table__),
+}
+
+
+class SearchRepository:
+    """
+    Ranked fuzzy name search over the trigram-indexed name columns.
+
+    A row matches when its name contains the query (ILIKE '%q%') or contains a
+    word similar to it (pg_trgm's `q <% name`), so typos still match. Both
+    predicates are served by the GIN index, and only the matching rows are
+    scored: by word_similarity, then by full-name similarity.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @staticmethod
+    def search_statement(kind: str, q: str, limit: int, world_id: Optional[UUID] = None) -> Select:
+        """The ranked search query for one kind. Raises ValueError for unknown kinds."""
+        spec = SEARCH_KINDS.get(kind)
+        if spec is None:
+            raise ValueError(f"Unknown search kind '{kind}'. Expected one of: {', '.join(SEARCH_KINDS)}")
+
+        name = spec.table.c.name
+        query = literal(q)
+        score = func.word_similarity(query, name)
+        stmt = (
+            select(spec.table.c.id, name.label("name"), score.label("score"))
+            .where(or_(name.ilike(f"%{escape_like(q)}%", escape="\\"), query.op("<%")(name)))
+            .order_by(score.desc(), func.similarity(name, query).desc(), name)
+            .limit(limit)
+        )
+        if world_id is not None and spec.world_column is not None:
+            stmt = stmt.where(spec.table.c[spec.world_column] == world_id)
+        return stmt
+
+    async def search(self, kind: str, q: str, limit: int = SEARCH_DEFAULT_LIMIT, world_id: Optional[UUID] = None) -> List[Dict[str, Any]]:
+        """
+        Best name matches of one kind as {"id", "name", "score"} rows, best first.
+        world_id narrows world content (characters, locations, settlements) and
+        is ignored for the shared kinds.
+        """
+        stmt = self.search_statement(kind, q, limit, world_id)
+        try:
+            result = await self.db.execute(stmt)
+            return [dict(row) for row in result.mappings()]
+
+        except Exception as e:
+            logger.error(f"Error searching {kind} for '{q}': {e}")
+            raise
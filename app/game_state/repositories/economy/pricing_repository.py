@@ -0,0 +1,93 @@
+# app/game_state/repositories/economy/pricing_repository.py
+
+import logging
+from uuid import UUID
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from sqlalchemy.orm import aliased
+
+from app.db.models.character import Character
+from app.db.models.faction import Faction
+from app.db.models.item import Item
+from app.db.models.settlement import Settlement
+
+logger = logging.getLogger(__name__)
+
+
+class PricingRepository:
+    """
+    Column-only lookups needed to price a trade.
+    Each method is one query, so resolving a (player, settlement, trader)
+    triple costs a fixed number of round trips however many items are priced.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def find_trade_factions(self, settlement_id: UUID, trader_id: UUID) -> Tuple[Optional[UUID], Optional[UUID]]:
+        """
+        Factions the settlement and the trader trade under.
+        A settlement trades under its leader's default faction, a trader under their own.
+        """
+        try:
+            leader = aliased(Character)
+            settlement_stmt = (
+                select(leader.default_faction_id)
+                .select_from(Settlement)
+                .join(leader, leader.id == Settlement.leader_id)
+                .where(Settlement.entity_id == settlement_id)
+                .scalar_subquery()
+            )
+            stmt = select(settlement_stmt, Character.default_faction_id).where(Character.id == trader_id)
+
+            row = (await self.db.execute(stmt)).first()
+            if row is None:
+                # Unknown trader: the settlement may still exist on its own
+                settlement_faction = (await self.db.execute(select(settlement_stmt))).scalar()
+                return settlement_faction, None
+            return row[0], row[1]
+
+        except Exception as e:
+            logger.error(f"Error resolving trade factions for settlement {settlement_id}, trader {trader_id}: {e}")
+            raise
+
+    async def find_disliked_factions(self, faction_ids: Sequence[UUID]) -> Dict[UUID, List[UUID]]:
+        """Disliked faction ids per faction, read from each faction's metadata['disliked_faction_ids']."""
+        faction_ids = [faction_id for faction_id in faction_ids if faction_id]
+        if not faction_ids:
+            return {}
+        try:
+            stmt = select(Faction.id, Faction._metadata).where(Faction.id.in_(faction_ids))
+            result = await self.db.execute(stmt)
+
+            disliked: Dict[UUID, List[UUID]] = {}
+            for faction_id, metadata in result.all():
+                disliked[faction_id] = [UUID(str(value)) for value in (metadata or {}).get("disliked_faction_ids", [])]
+            return disliked
+
+        except Exception as e:
+            logger.error(f"Error fetching disliked factions for {len(faction_ids)} factions: {e}")
+            raise
+
+    async def find_catalog_items(
+        self,
+        trader_id: Optional[UUID] = None,
+        item_ids: Optional[Sequence[UUID]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Id, name and base value of the given items, or of every item the trader owns."""
+        try:
+            stmt = select(Item.id, Item.name, Item.value).order_by(Item.name)
+            if item_ids is not None:
+                stmt = stmt.where(Item.id.in_(list(item_ids)))
+            elif trader_id is not None:
+                stmt = stmt.where(Item.owner_character_id == trader_id)
+            else:
+                return []
+
+            result = await self.db.execute(stmt)
+            return [dict(row) for row in result.mappings().all()]
+
+        except Exception as e:
+            logger.error(f"Error fetching catalog items for trader {trader_id}: {e}")
+            raise
@@ -0,0 +1,142 @@
+# app/game_state/repositories/faction/faction_influence_repository.py
+
+import logging
+from uuid import UUID
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, update
+
+from app.db.models.location_instance import LocationInstance
+from app.db.models.locations.location_faction_presence import LocationFactionPresence
+from app.db.models.character_faction_relationship import CharacterFactionRelationship
+
+logger = logging.getLogger(__name__)
+
+# Control is aggregated over a location itself, its parent (the zone) or the whole world
+CONTROL_LEVELS = {
+    "location": LocationInstance.id,
+    "zone": LocationInstance.parent_id,
+    "world": LocationInstance.world_id,
+}
+
+
+class FactionInfluenceRepository:
+    """
+    Read-side queries for faction influence.
+    Presence rows are aggregated in SQL with window functions, so control for a
+    whole world comes back in one round trip instead of one query per location.
+    Only columns are selected; no ORM models (and their selectin relationships) are loaded.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    # ==============================================================================
+    # FACTION CONTROL
+    # ==============================================================================
+
+    def _control_query(self, world_id: UUID, level: str):
+        """
+        Per-scope, per-faction presence totals with each faction's share of the
+        scope and its rank. Ties are broken by faction id so rank 1 is stable.
+        """
+        if level not in CONTROL_LEVELS:
+            raise ValueError(f"Unknown control level '{level}', expected one of {sorted(CONTROL_LEVELS)}")
+        scope_col = CONTROL_LEVELS[level]
+
+        totals = (
+            select(
+                scope_col.label("scope_id"),
+                LocationFactionPresence.faction_id.label("faction_id"),
+                func.sum(LocationFactionPresence.presence_pct).label("presence"),
+            )
+            .join(LocationInstance, LocationInstance.id == LocationFactionPresence.location_id)
+            .where(LocationInstance.world_id == world_id, scope_col.is_not(None))
+            .group_by(scope_col, LocationFactionPresence.faction_id)
+            .subquery("totals")
+        )
+
+        return select(
+            totals.c.scope_id,
+            totals.c.faction_id,
+            totals.c.presence,
+            (totals.c.presence / func.nullif(func.sum(totals.c.presence).over(partition_by=totals.c.scope_id), 0)).label("share"),
+            func.row_number().over(
+                partition_by=totals.c.scope_id,
+                order_by=(totals.c.presence.desc(), totals.c.faction_id),
+            ).label("rank"),
+        ).subquery("ranked")
+
+    async def find_control(self, world_id: UUID, level: str = "location", top_only: bool = False) -> List[Dict[str, Any]]:
+        """
+        Faction control for every location, zone or the world itself.
+
+        Returns rows of {scope_id, faction_id, presence, share, rank}, ordered by
+        scope and rank. With top_only, only each scope's controlling faction is returned.
+
+        Raises:
+            ValueError: If level is not 'location', 'zone' or 'world'
+        """
+        try:
+            ranked = self._control_query(world_id, level)
+            stmt = select(ranked).order_by(ranked.c.scope_id, ranked.c.rank)
+            if top_only:
+                stmt = stmt.where(ranked.c.rank == 1)
+
+            result = await self.db.execute(stmt)
+            return [dict(row) for row in result.mappings().all()]
+
+        except Exception as e:
+            logger.error(f"Error computing {level} faction control for world {world_id}: {e}")
+            raise
+
+    async def update_location_controllers(self, world_id: UUID) -> int:
+        """
+        Set controlled_by_faction_id on every location in the world to its
+        top-ranked present faction in a single UPDATE ... FROM.
+        Locations without presence rows are left unchanged. Does not commit.
+        """
+        try:
+            ranked = self._control_query(world_id, "location")
+            stmt = (
+                update(LocationInstance)
+                .where(LocationInstance.id == ranked.c.scope_id, ranked.c.rank == 1)
+                .where(LocationInstance.controlled_by_faction_id.is_distinct_from(ranked.c.faction_id))
+                .values(controlled_by_faction_id=ranked.c.faction_id)
+                .execution_options(synchronize_session=False)
+            )
+            result = await self.db.execute(stmt)
+            logger.info(f"[FactionControl] Updated controller of {result.rowcount} locations in world {world_id}")
+            return result.rowcount
+
+        except Exception as e:
+            logger.error(f"Error updating location controllers for world {world_id}: {e}")
+            raise
+
+    # ==============================================================================
+    # REPUTATION
+    # ==============================================================================
+
+    async def find_reputations(
+        self,
+        character_ids: Sequence[UUID],
+        faction_ids: Optional[Sequence[UUID]] = None,
+    ) -> List[Tuple[UUID, UUID, int]]:
+        """Fetch (character_id, faction_id, reputation_score) for many characters in one query."""
+        if not character_ids:
+            return []
+        try:
+            stmt = select(
+                CharacterFactionRelationship.character_id,
+                CharacterFactionRelationship.faction_id,
+                CharacterFactionRelationship.reputation_score,
+            ).where(CharacterFactionRelationship.character_id.in_(list(character_ids)))
+            if faction_ids is not None:
+                stmt = stmt.where(CharacterFactionRelationship.faction_id.in_(list(faction_ids)))
+
+            result = await self.db.execute(stmt)
+            return [tuple(row) for row in result.all()]
+
+        except Exception as e:
+            logger.error(f"Error fetching reputations for {len(character_ids)} characters: {e}")
+            raise
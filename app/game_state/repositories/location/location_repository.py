@@ -2,11 +2,13 @@
 Repository for locations.
 """
 from uuid import UUID
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.location_instance import LocationInstance as LocationEntityModel
+from app.db.models.biome import Biome
+from app.db.models.travel_link import TravelLink
 from app.game_state.entities.geography.location_pydantic import LocationEntityPydantic
 from app.game_state.repositories.location.location_type_repository import LocationTypeRepository
 from app.game_state.repositories.base_repository import BaseRepository
@@ -118,4 +120,28 @@ class LocationRepository(BaseRepository[LocationEntityPydantic, LocationEntityMo
         # TODO: Add methods to fetch buildings, resources, travel connections
         # This will be expanded once we have the related repositories/services
         
-        return location
\ No newline at end of file
+        return location
+
+    async def get_biome_types_by_world(self, world_id: UUID) -> List[Tuple[UUID, Optional[str]]]:
+        """
+        Get (location_id, biome code) pairs for every active location in a world.
+        Selects columns only, so none of the location relationships are loaded.
+        """
+        stmt = (
+            select(LocationEntityModel.id, Biome.biome_id)
+            .outerjoin(Biome, LocationEntityModel.biome_id == Biome.id)
+            .where(
+                LocationEntityModel.world_id == world_id,
+                LocationEntityModel.is_active.is_(True)
+            )
+        )
+
+        result = await self.db.execute(stmt)
+        return [(row[0], row[1]) for row in result.all()]
+
+    async def bulk_insert_travel_links(self, link_rows: List[Dict[str, Any]], chunk_size: int = 1000) -> int:
+        """
+        Insert raw travel link rows with chunked multi-row INSERTs.
+        Both endpoints must already be inserted in the same transaction.
+        """
+        return await self.bulk_insert_rows(link_rows, chunk_size, table=TravelLink.__table__)
@@ -29,6 +29,11 @@ class LocationSubtypeRepository(BaseRepository[LocationSubtype, LocationSubType,
         db_obj = result.scalar_one_or_none()
         return await self._convert_to_entity(db_obj) if db_obj else None
 
+    async def find_all_for_index(self) -> List[LocationSubtype]:
+        """Every subtype in one query, without relationships, for the in-memory facet index"""
+        result = await self.db.execute(select(self.model_cls).order_by(LocationSubType.code))
+        return [self.entity_cls.model_validate(db_obj, from_attributes=True) for db_obj in result.scalars().all()]
+
     async def find_by_location_type(self, location_type_id: UUID) -> List[LocationSubtype]:
         """Get all subtypes for a specific location type"""
         stmt = (
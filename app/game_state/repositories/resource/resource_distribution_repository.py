@@ -0,0 +1,60 @@
+# app/game_state/repositories/resource/resource_distribution_repository.py
+
+import logging
+from collections import defaultdict
+from uuid import UUID
+from typing import Dict, List, Sequence
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func
+
+from app.db.models.biome import Biome
+from app.db.models.resources.resource_blueprint import ResourceBlueprint
+from app.db.models.resources.resource_node_blueprint import ResourceNodeBlueprint
+from app.db.models.resources.resource_node_blueprint_link import ResourceNodeBlueprintResource
+
+logger = logging.getLogger(__name__)
+
+
+class ResourceDistributionRepository:
+    """
+    Column-only queries for building biome resource samplers.
+    Blueprint entities themselves come from ResourceNodeBlueprintRepository.find_grouped_by_biome_types.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def find_resource_types(self, biome_types: Sequence[str]) -> Dict[str, Dict[str, float]]:
+        """Biome.resource_types keyed by biome code, for the given codes."""
+        if not biome_types:
+            return {}
+        try:
+            stmt = select(Biome.biome_id, Biome.resource_types).where(Biome.biome_id.in_(list(biome_types)))
+            result = await self.db.execute(stmt)
+            return {biome_id: resource_types or {} for biome_id, resource_types in result.all()}
+
+        except Exception as e:
+            logger.error(f"Error fetching resource types for biomes {biome_types}: {e}")
+            raise
+
+    async def find_blueprint_resource_names(self, biome_types: Sequence[str]) -> Dict[UUID, List[str]]:
+        """Resource names linked to each blueprint of the given biome codes."""
+        if not biome_types:
+            return {}
+        try:
+            stmt = (
+                select(ResourceNodeBlueprintResource.blueprint_id, func.lower(ResourceBlueprint.name))
+                .join(ResourceBlueprint, ResourceBlueprint.resource_id == ResourceNodeBlueprintResource.resource_id)
+                .join(ResourceNodeBlueprint, ResourceNodeBlueprint.id == ResourceNodeBlueprintResource.blueprint_id)
+                .where(ResourceNodeBlueprint.biome_type.in_(list(biome_types)))
+            )
+            result = await self.db.execute(stmt)
+
+            names: Dict[UUID, List[str]] = defaultdict(list)
+            for blueprint_id, name in result.all():
+                names[blueprint_id].append(name)
+            return dict(names)
+
+        except Exception as e:
+            logger.error(f"Error fetching blueprint resource names for biomes {biome_types}: {e}")
+            raise
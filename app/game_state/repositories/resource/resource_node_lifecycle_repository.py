@@ -0,0 +1,235 @@
+# app/game_state/repositories/resource/resource_node_lifecycle_repository.py
+
+import json
+import logging
+from collections import defaultdict
+from datetime import datetime
+from uuid import UUID
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, delete, exists, func, or_, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import aliased
+
+from app.db.models.resources.resource_node import ResourceNode
+from app.db.models.resources.resource_node_link import ResourceNodeResource
+from app.db.models.resources.resource_node_respawn import ResourceNodeRespawn
+from app.game_state.enums.shared import StatusEnum
+from app.game_state.managers.resource_node_lifecycle_manager import YIELD_EXTRACTIONS
+
+logger = logging.getLogger(__name__)
+
+# Locks the node's links, consumes yield and reports what was actually taken.
+# A NULL remaining_yield is a link that was never extracted; it starts full.
+CONSUME_YIELD_SQL = text(
+    "WITH cur AS ("
+    "  SELECT l.resource_id, v.amount, "
+    "         coalesce(l.remaining_yield, l.max_yield, greatest(l.amount_max, 1) * :yield_factor) AS held, "
+    "         coalesce(l.max_yield, greatest(l.amount_max, 1) * :yield_factor) AS capacity "
+    "  FROM resource_node_resources AS l "
+    "  JOIN jsonb_to_recordset(CAST(:payload AS jsonb)) AS v(resource_id uuid, amount integer) "
+    "    ON v.resource_id = l.resource_id "
+    "  WHERE l.node_id = :node_id "
+    "  FOR UPDATE OF l"
+    ") "
+    "UPDATE resource_node_resources AS l "
+    "SET remaining_yield = greatest(cur.held - cur.amount, 0), max_yield = cur.capacity "
+    "FROM cur "
+    "WHERE l.node_id = :node_id AND l.resource_id = cur.resource_id "
+    "RETURNING l.resource_id, least(cur.held, cur.amount) AS taken, l.remaining_yield, l.rarity"
+)
+
+
+class ResourceNodeLifecycleRepository:
+    """
+    Atomic yield, depletion and respawn-queue statements for resource nodes.
+    Nothing here commits; the caller owns the transaction.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    # ==============================================================================
+    # YIELD AND DEPLETION
+    # ==============================================================================
+
+    async def consume_yield(
+        self, node_id: UUID, amounts: Mapping[UUID, int]
+    ) -> List[Tuple[UUID, int, int, Optional[str]]]:
+        """
+        Consume yield from a node's links in one locked statement.
+        Returns (resource_id, taken, remaining_yield, rarity) per link touched.
+        Concurrent extractions of the same node serialize on the row locks,
+        so the total taken never exceeds what the link held.
+        """
+        if not amounts:
+            return []
+        try:
+            payload = json.dumps([
+                {"resource_id": str(resource_id), "amount": int(amount)}
+                for resource_id, amount in amounts.items() if amount > 0
+            ])
+            result = await self.db.execute(
+                CONSUME_YIELD_SQL,
+                {"payload": payload, "node_id": node_id, "yield_factor": YIELD_EXTRACTIONS},
+            )
+            return [tuple(row) for row in result.all()]
+
+        except Exception as e:
+            logger.error(f"Error consuming yield of node {node_id}: {e}")
+            raise
+
+    async def deplete_if_exhausted(self, node_id: UUID, now: datetime) -> bool:
+        """
+        Mark a node depleted if none of its primary links (or of all links, when
+        it has no primary link) has yield left. Returns True only for the one
+        caller that flipped the flag.
+        """
+        try:
+            link = aliased(ResourceNodeResource)
+            primary = aliased(ResourceNodeResource)
+
+            has_primary = (
+                exists()
+                .where(primary.node_id == ResourceNode.id, primary.is_primary.is_(True))
+                .correlate(ResourceNode)
+            )
+            live_link = exists().where(
+                link.node_id == ResourceNode.id,
+                func.coalesce(link.remaining_yield, 1) > 0,
+                or_(link.is_primary.is_(True), ~has_primary),
+            )
+            has_links = exists().where(ResourceNodeResource.node_id == ResourceNode.id)
+
+            stmt = (
+                update(ResourceNode)
+                .where(ResourceNode.id == node_id, ResourceNode.depleted.is_(False), has_links, ~live_link)
+                .values(depleted=True, status=StatusEnum.INACTIVE, depleted_at=now)
+                .returning(ResourceNode.id)
+            )
+            result = await self.db.execute(stmt)
+            return result.first() is not None
+
+        except Exception as e:
+            logger.error(f"Error checking depletion of node {node_id}: {e}")
+            raise
+
+    async def mark_depleted(self, node_id: UUID, now: datetime) -> bool:
+        """Mark a node depleted regardless of its yield. Returns False if it already was."""
+        try:
+            stmt = (
+                update(ResourceNode)
+                .where(ResourceNode.id == node_id, ResourceNode.depleted.is_(False))
+                .values(depleted=True, status=StatusEnum.INACTIVE, depleted_at=now)
+                .returning(ResourceNode.id)
+            )
+            result = await self.db.execute(stmt)
+            return result.first() is not None
+
+        except Exception as e:
+            logger.error(f"Error depleting node {node_id}: {e}")
+            raise
+
+    async def find_link_rarities(self, node_ids: Sequence[UUID]) -> Dict[UUID, List[Optional[str]]]:
+        """Rarity of every link of the given nodes."""
+        if not node_ids:
+            return {}
+        try:
+            stmt = select(ResourceNodeResource.node_id, ResourceNodeResource.rarity).where(
+                ResourceNodeResource.node_id.in_(list(node_ids))
+            )
+            result = await self.db.execute(stmt)
+
+            rarities: Dict[UUID, List[Optional[str]]] = defaultdict(list)
+            for node_id, rarity in result.all():
+                rarities[node_id].append(rarity)
+            return dict(rarities)
+
+        except Exception as e:
+            logger.error(f"Error fetching link rarities for {len(node_ids)} nodes: {e}")
+            raise
+
+    # ==============================================================================
+    # RESPAWN QUEUE
+    # ==============================================================================
+
+    async def schedule_respawns(self, rows: Sequence[Tuple[UUID, datetime]]) -> int:
+        """Queue (node_id, respawn_at) rows; a node already queued is rescheduled."""
+        if not rows:
+            return 0
+        try:
+            stmt = pg_insert(ResourceNodeRespawn).values(
+                [{"node_id": node_id, "respawn_at": respawn_at} for node_id, respawn_at in rows]
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[ResourceNodeRespawn.node_id],
+                set_={"respawn_at": stmt.excluded.respawn_at, "scheduled_at": func.now()},
+            )
+            result = await self.db.execute(stmt)
+            return result.rowcount
+
+        except Exception as e:
+            logger.error(f"Error scheduling {len(rows)} respawns: {e}")
+            raise
+
+    async def pop_due_respawns(self, now: datetime, limit: int) -> List[UUID]:
+        """
+        Remove and return up to `limit` due nodes, earliest first. Rows locked by
+        another worker are skipped, so concurrent batches never overlap.
+        """
+        try:
+            due = (
+                select(ResourceNodeRespawn.node_id)
+                .where(ResourceNodeRespawn.respawn_at <= now)
+                .order_by(ResourceNodeRespawn.respawn_at)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            stmt = (
+                delete(ResourceNodeRespawn)
+                .where(ResourceNodeRespawn.node_id.in_(due.scalar_subquery()))
+                .returning(ResourceNodeRespawn.node_id)
+            )
+            result = await self.db.execute(stmt)
+            return list(result.scalars().all())
+
+        except Exception as e:
+            logger.error(f"Error popping due respawns: {e}")
+            raise
+
+    async def respawn_nodes(self, node_ids: Sequence[UUID]) -> int:
+        """Refill every link of the given nodes and reactivate them, in two statements."""
+        if not node_ids:
+            return 0
+        try:
+            node_ids = list(node_ids)
+            await self.db.execute(
+                update(ResourceNodeResource)
+                .where(ResourceNodeResource.node_id.in_(node_ids))
+                .values(remaining_yield=func.coalesce(
+                    ResourceNodeResource.max_yield,
+                    func.greatest(ResourceNodeResource.amount_max, 1) * YIELD_EXTRACTIONS,
+                ))
+            )
+            result = await self.db.execute(
+                update(ResourceNode)
+                .where(ResourceNode.id.in_(node_ids), ResourceNode.depleted.is_(True))
+                .values(depleted=False, status=StatusEnum.ACTIVE, depleted_at=None)
+            )
+            return result.rowcount
+
+        except Exception as e:
+            logger.error(f"Error respawning {len(node_ids)} nodes: {e}")
+            raise
+
+    async def count_due(self, now: datetime) -> int:
+        """Number of queued nodes whose respawn time has passed."""
+        try:
+            result = await self.db.execute(
+                select(func.count()).select_from(ResourceNodeRespawn).where(ResourceNodeRespawn.respawn_at <= now)
+            )
+            return result.scalar_one()
+
+        except Exception as e:
+            logger.error(f"Error counting due respawns: {e}")
+            raise
@@ -238,6 +238,38 @@ class ResourceNodeBlueprintRepository(BaseRepository[ResourceNodeEntityPydantic,
             logger.warning(f"Falling back to all blueprints due to world query failure: {e}")
             return await self.find_all(skip, limit)
 
+    async def find_grouped_by_biome_types(self, biome_types: List[str]) -> Dict[str, List[ResourceNodeEntityPydantic]]:
+        """
+        Load every blueprint for the given biome types in one query, keyed by biome type.
+        Used by bulk spawning so blueprints aren't re-fetched per node.
+        """
+        if not biome_types:
+            return {}
+
+        try:
+            stmt = (
+                select(ResourceNodeBlueprint)
+                .options(
+                    selectinload(ResourceNodeBlueprint.resource_links).selectinload(ResourceNodeBlueprintResource.resource),
+                    selectinload(ResourceNodeBlueprint.resource_links).selectinload(ResourceNodeBlueprintResource.theme)
+                )
+                .where(ResourceNodeBlueprint.biome_type.in_(biome_types))
+            )
+
+            result = await self.db.execute(stmt)
+            models = result.scalars().all()
+
+            grouped: Dict[str, List[ResourceNodeEntityPydantic]] = {}
+            for model in models:
+                entity = await self._model_to_entity_with_links(model)
+                grouped.setdefault(model.biome_type, []).append(entity)
+
+            return grouped
+
+        except Exception as e:
+            logger.error(f"Error finding blueprints for biome types {biome_types}: {e}")
+            raise
+
     # ==============================================================================
     # RESOURCE LINK MANAGEMENT
     # ==============================================================================
@@ -214,6 +214,41 @@ class ResourceNodeRepository(BaseRepository[ResourceNodeEntityPydantic, Resource
             logger.error(f"Error finding resource nodes by location and visibility: {e}")
             raise
 
+    async def find_active_in_location(self, location_id: UUID, skip: int = 0, limit: int = 100) -> List[ResourceNodeEntityPydantic]:
+        """Find active, non-depleted resource nodes in a location (served by the partial active index)."""
+        try:
+            stmt = (
+                select(ResourceNode)
+                .options(
+                    selectinload(ResourceNode.resource_links).selectinload(ResourceNodeResource.resource),
+                    selectinload(ResourceNode.location)
+                )
+                .where(
+                    and_(
+                        ResourceNode.location_id == location_id,
+                        ResourceNode.depleted == False,
+                        ResourceNode.status == StatusEnum.ACTIVE
+                    )
+                )
+                .offset(skip)
+                .limit(limit)
+                .order_by(ResourceNode.created_at.desc())
+            )
+            
+            result = await self.db.execute(stmt)
+            models = result.scalars().all()
+            
+            entities = []
+            for model in models:
+                entity = await self._model_to_entity_with_links(model)
+                entities.append(entity)
+            
+            return entities
+            
+        except Exception as e:
+            logger.error(f"Error finding active nodes in location {location_id}: {e}")
+            raise
+
     async def find_depleted_in_location(self, location_id: UUID, skip: int = 0, limit: int = 100) -> List[ResourceNodeEntityPydantic]:
         """Find depleted resource nodes in a location."""
         try:
@@ -364,6 +399,24 @@ class ResourceNodeRepository(BaseRepository[ResourceNodeEntityPydantic, Resource
             logger.error(f"Error updating extraction stats for node {node_id}: {e}")
             raise
 
+    # ==============================================================================
+    # BULK OPERATIONS
+    # ==============================================================================
+
+    async def bulk_insert_nodes(self, node_rows: List[Dict[str, Any]], chunk_size: int = 1000) -> int:
+        """
+        Insert raw node rows with chunked multi-row INSERTs.
+        Rows are keyed by column name. Does not commit; the caller owns the transaction.
+        """
+        return await self.bulk_insert_rows(node_rows, chunk_size)
+
+    async def bulk_insert_links(self, link_rows: List[Dict[str, Any]], chunk_size: int = 1000) -> int:
+        """
+        Insert raw resource-link rows with chunked multi-row INSERTs.
+        The referenced nodes must already be inserted in the same transaction.
+        """
+        return await self.bulk_insert_rows(link_rows, chunk_size, table=ResourceNodeResource.__table__)
+
     # ==============================================================================
     # CONVERSION HELPERS
     # ==============================================================================
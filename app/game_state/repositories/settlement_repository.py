@@ -1,13 +1,17 @@
 # START OF FILE settlement_repository.py
 
-from .base_repository import BaseRepository
+from .base_repository import OPTIMISTIC_MAX_ATTEMPTS, BaseRepository
 # Use aliases for clarity
 from app.game_state.entities.geography.settlement_pydantic import SettlementEntityPydantic
 from app.db.models.settlement import Settlement as SettlementModel
 from app.db.async_session import AsyncSession
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence, Tuple
+from sqlalchemy import text
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, selectinload
+from app.db.models.location_instance import LocationInstance
+from app.db.models.travel_link import TravelLink
+import json
 from uuid import UUID
 import logging
 
@@ -150,36 +154,17 @@ class SettlementRepository(BaseRepository[SettlementEntityPydantic, SettlementMo
         """
         logging.debug(f"[SettlementRepository] Adding {quantity} of resource {resource_id} to settlement {settlement_id}")
         
-        stmt = (
-            select(self.model_cls)
-            .where(self.model_cls.entity_id == settlement_id)
-            .options(selectinload(self.model_cls.building_instances))
-            .with_for_update()
+        # Versioned read-modify-write instead of SELECT ... FOR UPDATE; a concurrent change retries
+        saved = await self.update_with_retry(
+            settlement_id, lambda settlement: settlement.add_resource(resource_id, quantity)
         )
-        result = await self.db.execute(stmt)
-        db_obj = result.scalar_one_or_none()
-        
-        if db_obj:
-            # Convert UUID to string for JSONB storage
-            resource_id_str = str(resource_id)
-            
-            # Initialize resources dict if it's None
-            if db_obj.resources is None:
-                db_obj.resources = {}
-                
-            # Get current amount or default to 0
-            current_amount = db_obj.resources.get(resource_id_str, 0)
-            
-            # Update the resource quantity
-            db_obj.resources[resource_id_str] = current_amount + quantity
-            
-            await self.db.commit()
-            updated_entity = await self._convert_to_entity(db_obj)
-            logging.debug(f"[SettlementRepository] Successfully added resource to settlement {settlement_id}")
-            return updated_entity
-        else:
+        if saved is None:
             logging.warning(f"[SettlementRepository] Settlement {settlement_id} not found for adding resource")
             return None
+
+        await self.db.commit()
+        logging.debug(f"[SettlementRepository] Successfully added resource to settlement {settlement_id}")
+        return await self.find_by_id(settlement_id)
             
     async def remove_resource(self, settlement_id: UUID, resource_id: UUID, quantity: int = 1) -> Optional[SettlementEntityPydantic]:
         """
@@ -195,44 +180,17 @@ class SettlementRepository(BaseRepository[SettlementEntityPydantic, SettlementMo
         """
         logging.debug(f"[SettlementRepository] Removing {quantity} of resource {resource_id} from settlement {settlement_id}")
         
-        stmt = (
-            select(self.model_cls)
-            .where(self.model_cls.entity_id == settlement_id)
-            .with_for_update()
+        # The quantity check is re-done against every fresh read, so a retry can't overdraw
+        saved = await self.update_with_retry(
+            settlement_id, lambda settlement: settlement.remove_resource(resource_id, quantity)
         )
-        result = await self.db.execute(stmt)
-        db_obj = result.scalar_one_or_none()
-        
-        if db_obj:
-            # Convert UUID to string for JSONB storage
-            resource_id_str = str(resource_id)
-            
-            # Check if resources dict exists and has enough of the resource
-            if db_obj.resources is None or resource_id_str not in db_obj.resources:
-                logging.warning(f"[SettlementRepository] Resource {resource_id} not found in settlement {settlement_id}")
-                return None
-                
-            current_amount = db_obj.resources.get(resource_id_str, 0)
-            
-            if current_amount < quantity:
-                logging.warning(f"[SettlementRepository] Not enough of resource {resource_id} in settlement {settlement_id}")
-                return None
-                
-            # Update the resource quantity
-            new_amount = current_amount - quantity
-            if new_amount > 0:
-                db_obj.resources[resource_id_str] = new_amount
-            else:
-                # Remove the key entirely if quantity reaches zero
-                del db_obj.resources[resource_id_str]
-            
-            await self.db.commit()
-            updated_entity = await self._convert_to_entity(db_obj)
-            logging.debug(f"[SettlementRepository] Successfully removed resource from settlement {settlement_id}")
-            return updated_entity
-        else:
-            logging.warning(f"[SettlementRepository] Settlement {settlement_id} not found for removing resource")
+        if saved is None:
+            logging.warning(f"[SettlementRepository] Settlement {settlement_id} not found or lacks {quantity} of resource {resource_id}")
             return None
+
+        await self.db.commit()
+        logging.debug(f"[SettlementRepository] Successfully removed resource from settlement {settlement_id}")
+        return await self.find_by_id(settlement_id)
             
     async def get_resource_quantity(self, settlement_id: UUID, resource_id: UUID) -> Optional[int]:
         """
@@ -301,7 +259,9 @@ class SettlementRepository(BaseRepository[SettlementEntityPydantic, SettlementMo
     async def apply_resource_costs(self, settlement_id: UUID, costs: Dict[UUID, int]) -> Optional[SettlementEntityPydantic]:
         """
         Apply a set of resource costs to a settlement. This is an atomic operation -
-        either all costs are applied or none are.
+        either all costs are applied or none are. The deduction is flushed, not
+        committed, so it commits together with the rest of the caller's
+        transaction (e.g. the outbox event of the construction it pays for).
         
         Args:
             settlement_id: UUID of the settlement
@@ -312,40 +272,145 @@ class SettlementRepository(BaseRepository[SettlementEntityPydantic, SettlementMo
         """
         logging.debug(f"[SettlementRepository] Applying resource costs to settlement {settlement_id}")
         
-        # First check if the settlement has enough resources
-        has_enough = await self.has_resources(settlement_id, costs)
-        if not has_enough:
-            logging.warning(f"[SettlementRepository] Settlement {settlement_id} doesn't have enough resources")
-            return None
-            
-        # Then apply all costs atomically
-        stmt = (
-            select(self.model_cls)
-            .where(self.model_cls.entity_id == settlement_id)
-            .with_for_update()
+        # Check and deduct in one versioned write: either the balance read is still current or we retry
+        saved = await self.update_with_retry(
+            settlement_id, lambda settlement: settlement.apply_resource_costs(costs)
         )
-        result = await self.db.execute(stmt)
-        db_obj = result.scalar_one_or_none()
-        
-        if not db_obj:
-            logging.warning(f"[SettlementRepository] Settlement {settlement_id} not found when applying costs")
+        if saved is None:
+            logging.warning(f"[SettlementRepository] Settlement {settlement_id} not found or doesn't have enough resources")
             return None
-            
-        # Apply all costs
-        for resource_id, cost in costs.items():
-            resource_id_str = str(resource_id)
-            current_amount = db_obj.resources.get(resource_id_str, 0)
-            new_amount = current_amount - cost
-            
-            if new_amount > 0:
-                db_obj.resources[resource_id_str] = new_amount
-            else:
-                # Remove the key entirely if quantity reaches zero
-                del db_obj.resources[resource_id_str]
                 
-        await self.db.commit()
-        updated_entity = await self._convert_to_entity(db_obj)
+        await self.db.flush()
         logging.debug(f"[SettlementRepository] Successfully applied resource costs to settlement {settlement_id}")
-        return updated_entity
+        return await self.find_by_id(settlement_id)
+
+    # ==============================================================================
+    # MARKET SIMULATION
+    # ==============================================================================
+
+    async def find_market_rows(self, world_id: UUID) -> List[Tuple[UUID, int, Dict[str, Any], int]]:
+        """(id, population, resources, version) of every settlement in the world, without loading models."""
+        stmt = (
+            select(SettlementModel.entity_id, SettlementModel.population, SettlementModel.resources, SettlementModel.version)
+            .where(SettlementModel.world_id == world_id)
+            .order_by(SettlementModel.entity_id)
+        )
+        result = await self.db.execute(stmt)
+        return [tuple(row) for row in result.all()]
+
+    async def find_trade_routes(self, world_id: UUID) -> List[Tuple[UUID, UUID, Optional[float]]]:
+        """
+        (from_settlement_id, to_settlement_id, distance_km) for every active TravelLink
+        between two settlement locations in the world. A location hosts a settlement
+        when its attributes carry a 'settlement_id'.
+        """
+        origin = aliased(LocationInstance)
+        destination = aliased(LocationInstance)
+        from_settlement = origin.attributes["settlement_id"].astext
+        to_settlement = destination.attributes["settlement_id"].astext
+
+        stmt = (
+            select(from_settlement, to_settlement, TravelLink.distance_km)
+            .select_from(TravelLink)
+            .join(origin, origin.id == TravelLink.from_location_id)
+            .join(destination, destination.id == TravelLink.to_location_id)
+            .where(
+                origin.world_id == world_id,
+                TravelLink.is_active.is_(True),
+                from_settlement.is_not(None),
+                to_settlement.is_not(None),
+            )
+        )
+        result = await self.db.execute(stmt)
+        return [(UUID(a), UUID(b), distance) for a, b, distance in result.all()]
+
+    # ==============================================================================
+    # SETTLEMENT EXPANSION
+    # ==============================================================================
+
+    async def find_expansion_chunk(
+        self, world_id: Optional[UUID], after_id: Optional[UUID], limit: int
+    ) -> List[Tuple[UUID, str, Optional[UUID]]]:
+        """
+        (id, name, leader_id) of the next `limit` settlements by id after `after_id`,
+        in one world or all of them. Keyset pagination, so each chunk is an index range scan.
+        """
+        stmt = select(SettlementModel.entity_id, SettlementModel.name, SettlementModel.leader_id)
+        if world_id is not None:
+            stmt = stmt.where(SettlementModel.world_id == world_id)
+        if after_id is not None:
+            stmt = stmt.where(SettlementModel.entity_id > after_id)
+        result = await self.db.execute(stmt.order_by(SettlementModel.entity_id).limit(limit))
+        return [tuple(row) for row in result.all()]
+
+    async def bulk_apply_resource_deltas(
+        self,
+        rows: Sequence[Tuple[UUID, int, Dict[str, int]]],
+        max_attempts: int = OPTIMISTIC_MAX_ATTEMPTS,
+    ) -> Tuple[int, List[UUID]]:
+        """
+        Add per-resource deltas to many settlements with a single UPDATE ... FROM
+        jsonb_to_recordset, whatever the number of rows. The sums are computed in
+        SQL against the row being updated; quantities are floored at zero and
+        empty entries dropped. Does not commit.
+
+        Rows are (settlement_id, version read, deltas). Like update_versioned,
+        each row is only written at the version it was read at, and the version
+        is bumped, so versioned writers (add_resource, apply_resource_costs, ...)
+        and the tick see each other's changes. Rows that moved on are re-read and
+        the deltas re-applied, up to max_attempts times.
+
+        Returns (rows updated, ids skipped after max_attempts conflicts).
+        """
+        pending = {settlement_id: (version, deltas) for settlement_id, version, deltas in rows}
+        updated = 0
+        stmt = text(
+            "UPDATE settlements AS s SET resources = ("
+            "    SELECT COALESCE(jsonb_object_agg(key, total) FILTER (WHERE total > 0), '{}'::jsonb)"
+            "    FROM ("
+            "        SELECT key, CAST(SUM(CAST(value AS numeric)) AS bigint) AS total"
+            "        FROM ("
+            "            SELECT key, value FROM jsonb_each_text(COALESCE(s.resources, '{}'::jsonb))"
+            "            UNION ALL SELECT key, value FROM jsonb_each_text(v.deltas)"
+            "        ) AS parts GROUP BY key"
+            "    ) AS totals"
+            "), version = s.version + 1, updated_at = now() "
+            "FROM jsonb_to_recordset(CAST(:payload AS jsonb)) AS v(id uuid, version integer, deltas jsonb) "
+            "WHERE s.id = v.id AND s.version = v.version "
+            "RETURNING s.id, s.version"
+        )
+
+        for attempt in range(1, max_attempts + 1):
+            if not pending:
+                break
+            payload = json.dumps([
+                {"id": str(settlement_id), "version": version, "deltas": deltas}
+                for settlement_id, (version, deltas) in pending.items()
+            ])
+            result = await self.db.execute(stmt, {"payload": payload})
+            for settlement_id, version in result.all():
+                pending.pop(settlement_id, None)
+                self._record_invalidation(settlement_id, version)
+                updated += 1
+            if not pending or attempt == max_attempts:
+                break
+
+            # Another writer got there first: pick up the current versions and apply the deltas again
+            logging.debug(f"[SettlementRepository] {len(pending)} settlements changed since read, retrying")
+            current = await self.db.execute(
+                select(SettlementModel.entity_id, SettlementModel.version)
+                .where(SettlementModel.entity_id.in_(list(pending)))
+            )
+            versions = dict(current.all())
+            pending = {
+                settlement_id: (versions[settlement_id], deltas)
+                for settlement_id, (_, deltas) in pending.items() if settlement_id in versions
+            }
+
+        skipped = list(pending)
+        if skipped:
+            logging.warning(f"[SettlementRepository] Skipped resource deltas of {len(skipped)} settlements after {max_attempts} conflicts")
+        logging.info(f"[SettlementRepository] Applied resource deltas to {updated} settlements")
+        return updated, skipped
 
 # END OF FILE settlement_repository.py
\ No newline at end of file
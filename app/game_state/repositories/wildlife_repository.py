@@ -0,0 +1,102 @@
+# app/game_state/repositories/wildlife_repository.py
+
+import json
+import logging
+from datetime import datetime
+from uuid import UUID
+from typing import Any, Dict, List, Sequence, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, text
+
+from app.db.models.biome import Biome
+from app.db.models.location_instance import LocationInstance
+from app.db.models.wildlife import Wildlife
+
+logger = logging.getLogger(__name__)
+
+# Wildlife columns the daily tick needs
+TICK_COLUMNS = (
+    Wildlife.id,
+    Wildlife.location_id,
+    Wildlife.population,
+    Wildlife.max_population,
+    Wildlife.spawn_rate,
+    Wildlife.danger_rating,
+    Wildlife.pack_behavior,
+    Wildlife.pack_size_min,
+    Wildlife.nocturnal,
+    Wildlife.seasonal_activity,
+)
+
+
+class WildlifeRepository:
+    """
+    Column-only queries for the wildlife tick.
+    Wildlife models eagerly load their location, so bulk work never loads models.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def find_tick_rows(self, world_id: UUID) -> List[Dict[str, Any]]:
+        """Every active wildlife row of a world, as dicts keyed by column name."""
+        try:
+            stmt = (
+                select(*TICK_COLUMNS)
+                .join(LocationInstance, LocationInstance.id == Wildlife.location_id)
+                .where(LocationInstance.world_id == world_id, Wildlife.is_active.is_(True))
+                .order_by(Wildlife.id)
+            )
+            result = await self.db.execute(stmt)
+            return [dict(row) for row in result.mappings().all()]
+
+        except Exception as e:
+            logger.error(f"Error fetching wildlife for world {world_id}: {e}")
+            raise
+
+    async def find_location_base_danger(self, world_id: UUID) -> List[Tuple[UUID, int]]:
+        """
+        (location_id, base danger) for every location in the world, the base being
+        the higher of the location's own level and its biome's danger_level_base.
+        """
+        try:
+            stmt = (
+                select(
+                    LocationInstance.id,
+                    func.greatest(LocationInstance.base_danger_level, func.coalesce(Biome.danger_level_base, 1)),
+                )
+                .outerjoin(Biome, Biome.id == LocationInstance.biome_id)
+                .where(LocationInstance.world_id == world_id)
+            )
+            result = await self.db.execute(stmt)
+            return [tuple(row) for row in result.all()]
+
+        except Exception as e:
+            logger.error(f"Error fetching base danger for world {world_id}: {e}")
+            raise
+
+    async def bulk_update_populations(self, rows: Sequence[Tuple[UUID, int, bool]], now: datetime) -> int:
+        """
+        Write (wildlife_id, population, spawned) for many rows with a single
+        UPDATE ... FROM jsonb_to_recordset. last_spawn is set to now where spawned.
+        Does not commit.
+        """
+        if not rows:
+            return 0
+        try:
+            payload = json.dumps([
+                {"id": str(wildlife_id), "population": population, "spawned": spawned}
+                for wildlife_id, population, spawned in rows
+            ])
+            stmt = text(
+                "UPDATE wildlife AS w SET population = v.population, "
+                "last_spawn = CASE WHEN v.spawned THEN :now ELSE w.last_spawn END, updated_at = :now "
+                "FROM jsonb_to_recordset(CAST(:payload AS jsonb)) AS v(id uuid, population integer, spawned boolean) "
+                "WHERE w.id = v.id"
+            )
+            result = await self.db.execute(stmt, {"payload": payload, "now": now})
+            return result.rowcount
+
+        except Exception as e:
+            logger.error(f"Error bulk updating {len(rows)} wildlife populations: {e}")
+            raise
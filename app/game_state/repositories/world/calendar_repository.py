@@ -0,0 +1,99 @@
+# app/game_state/repositories/world/calendar_repository.py
+
+import json
+import logging
+from collections import defaultdict
+from uuid import UUID
+from typing import Dict, List, Optional, Sequence, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, text
+
+from app.db.models.celestial_events import CelestialEventDB, celestial_event_themes
+from app.db.models.season import Season
+from app.db.models.world import World
+
+logger = logging.getLogger(__name__)
+
+
+class CalendarRepository:
+    """
+    Column-only queries for the calendar engine.
+    Seasons and celestial events of any number of themes load in one query each.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def find_world_clocks(self, world_ids: Optional[Sequence[UUID]] = None) -> List[Tuple[UUID, Optional[UUID], int, int]]:
+        """(id, theme_id, day, season) of the given worlds, or of every world."""
+        try:
+            stmt = select(World.id, World.theme_id, World.day, World.season).order_by(World.id)
+            if world_ids is not None:
+                stmt = stmt.where(World.id.in_(list(world_ids)))
+            result = await self.db.execute(stmt)
+            return [tuple(row) for row in result.all()]
+
+        except Exception as e:
+            logger.error(f"Error fetching world clocks: {e}")
+            raise
+
+    async def find_seasons_by_theme(self, theme_ids: Sequence[UUID]) -> Dict[UUID, List[Tuple[str, int]]]:
+        """Ordered (name, duration) seasons per theme. Seasons are ordered by creation, then name."""
+        if not theme_ids:
+            return {}
+        try:
+            stmt = (
+                select(Season.theme_id, Season.name, Season.duration)
+                .where(Season.theme_id.in_(list(theme_ids)))
+                .order_by(Season.theme_id, Season.created_at, Season.name)
+            )
+            result = await self.db.execute(stmt)
+
+            seasons: Dict[UUID, List[Tuple[str, int]]] = defaultdict(list)
+            for theme_id, name, duration in result.all():
+                seasons[theme_id].append((name, duration))
+            return dict(seasons)
+
+        except Exception as e:
+            logger.error(f"Error fetching seasons for {len(theme_ids)} themes: {e}")
+            raise
+
+    async def find_event_names_by_theme(self, theme_ids: Sequence[UUID]) -> Dict[UUID, List[str]]:
+        """Celestial event names per theme, ordered by name."""
+        if not theme_ids:
+            return {}
+        try:
+            stmt = (
+                select(celestial_event_themes.c.theme_id, CelestialEventDB.name)
+                .join(CelestialEventDB, CelestialEventDB.id == celestial_event_themes.c.event_id)
+                .where(celestial_event_themes.c.theme_id.in_(list(theme_ids)))
+                .order_by(celestial_event_themes.c.theme_id, CelestialEventDB.name, CelestialEventDB.id)
+            )
+            result = await self.db.execute(stmt)
+
+            events: Dict[UUID, List[str]] = defaultdict(list)
+            for theme_id, name in result.all():
+                events[theme_id].append(name)
+            return dict(events)
+
+        except Exception as e:
+            logger.error(f"Error fetching celestial events for {len(theme_ids)} themes: {e}")
+            raise
+
+    async def bulk_update_seasons(self, rows: Sequence[Tuple[UUID, int]]) -> int:
+        """Write (world_id, season) for many worlds with a single UPDATE. Does not commit."""
+        if not rows:
+            return 0
+        try:
+            payload = json.dumps([{"id": str(world_id), "season": season} for world_id, season in rows])
+            stmt = text(
+                "UPDATE worlds AS w SET season = v.season "
+                "FROM jsonb_to_recordset(CAST(:payload AS jsonb)) AS v(id uuid, season integer) "
+                "WHERE w.id = v.id"
+            )
+            result = await self.db.execute(stmt, {"payload": payload})
+            return result.rowcount
+
+        except Exception as e:
+            logger.error(f"Error bulk updating seasons of {len(rows)} worlds: {e}")
+            raise
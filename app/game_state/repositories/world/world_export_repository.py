@@ -0,0 +1,84 @@
+# app/game_state/repositories/world/world_export_repository.py
+
+import logging
+from uuid import UUID
+from typing import Any, AsyncIterator, Dict, List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Select, select
+
+from app.db.models.building_instance import BuildingInstanceDB
+from app.db.models.character import Character
+from app.db.models.location_instance import LocationInstance
+from app.db.models.resources.resource_node import ResourceNode
+from app.db.models.settlement import Settlement
+from app.db.models.world import World
+
+logger = logging.getLogger(__name__)
+
+# Exportable kinds of world content, in export order
+EXPORT_KINDS = ("locations", "settlements", "characters", "resource_nodes", "buildings")
+
+
+class WorldExportRepository:
+    """
+    Server-side cursor reads of everything that belongs to a world.
+    Rows are plain column mappings (no ORM objects, no identity map), fetched
+    `chunk_size` at a time, so memory stays flat however big the world is.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def find_world_row(self, world_id: UUID) -> Optional[Dict[str, Any]]:
+        """Columns of the world itself, or None if it doesn't exist."""
+        try:
+            result = await self.db.execute(select(*World.__table__.columns).where(World.id == world_id))
+            row = result.mappings().first()
+            return dict(row) if row is not None else None
+
+        except Exception as e:
+            logger.error(f"Error fetching world {world_id} for export: {e}")
+            raise
+
+    def export_statement(self, kind: str, world_id: UUID) -> Select:
+        """Column select of one kind of world content, in primary key order."""
+        if kind == "locations":
+            table = LocationInstance.__table__
+            stmt = select(*table.columns).where(table.c.world_id == world_id)
+        elif kind == "settlements":
+            table = Settlement.__table__
+            stmt = select(*table.columns).where(table.c.world_id == world_id)
+        elif kind == "characters":
+            table = Character.__table__
+            stmt = select(*table.columns).where(table.c.world_id == world_id)
+        elif kind == "resource_nodes":
+            table = ResourceNode.__table__
+            locations = LocationInstance.__table__
+            stmt = (
+                select(*table.columns)
+                .join(locations, locations.c.id == table.c.location_id)
+                .where(locations.c.world_id == world_id)
+            )
+        elif kind == "buildings":
+            table = BuildingInstanceDB.__table__
+            settlements = Settlement.__table__
+            stmt = (
+                select(*table.columns)
+                .join(settlements, settlements.c.id == table.c.settlement_id)
+                .where(settlements.c.world_id == world_id)
+            )
+        else:
+            raise ValueError(f"Unknown export kind '{kind}'. Expected one of: {', '.join(EXPORT_KINDS)}")
+        return stmt.order_by(table.c.id)
+
+    async def stream_rows(self, kind: str, world_id: UUID, chunk_size: int) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield the rows of one kind in chunks of up to `chunk_size` as the cursor delivers them."""
+        stmt = self.export_statement(kind, world_id).execution_options(yield_per=chunk_size)
+        try:
+            result = await self.db.stream(stmt)
+            async for partition in result.mappings().partitions():
+                yield [dict(row) for row in partition]
+
+        except Exception as e:
+            logger.error(f"Error streaming {kind} of world {world_id}: {e}")
+            raise
@@ -0,0 +1,174 @@
+# app/game_state/repositories/world/world_snapshot_repository.py
+
+import json
+import logging
+from uuid import UUID
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Table, Text, Uuid, cast, select, text
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.db.models.base import Base
+from app.db.models.character_action import CharacterAction  # noqa: F401 - registers character_actions
+
+logger = logging.getLogger(__name__)
+
+# Tables holding a world's rows, in restore order, each with how its rows are
+# scoped: (column, parent table). A None parent means the column holds the
+# world id; otherwise the column points at an in-scope row of the parent.
+SNAPSHOT_SCOPES: Dict[str, Tuple[str, Optional[str]]] = {
+    "worlds": ("id", None),
+    "zones": ("world_id", None),
+    "location_entities": ("world_id", None),
+    "location_faction_presence": ("location_id", "location_entities"),
+    "travel_links": ("from_location_id", "location_entities"),
+    "resource_instances": ("location_id", "location_entities"),
+    "wildlife": ("location_id", "location_entities"),
+    "resource_nodes": ("location_id", "location_entities"),
+    "resource_node_resources": ("node_id", "resource_nodes"),
+    "resource_node_respawns": ("node_id", "resource_nodes"),
+    "settlements": ("world_id", None),
+    "building_instances": ("settlement_id", "settlements"),
+    "characters": ("world_id", None),
+    "character_skills": ("character_id", "characters"),
+    "character_faction_relationships": ("character_id", "characters"),
+    "character_actions": ("character_id", "characters"),
+    "items": ("owner_character_id", "characters"),
+}
+SNAPSHOT_TABLES = tuple(SNAPSHOT_SCOPES)
+
+
+class WorldSnapshotRepository:
+    """
+    Bulk reads and COPY-based writes of every row that belongs to a world.
+    Values travel as PostgreSQL text (`::text` on the way out, CSV COPY on
+    the way in), so no per-type conversion happens in Python. Nothing here
+    commits; the caller owns the transaction.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @staticmethod
+    def table(name: str) -> Table:
+        return Base.metadata.tables[name]
+
+    @staticmethod
+    def uuid_columns(name: str) -> List[str]:
+        return [column.name for column in WorldSnapshotRepository.table(name).columns if isinstance(column.type, Uuid)]
+
+    @staticmethod
+    def primary_key(name: str) -> Optional[str]:
+        """The single primary key column of a table, or None for composite keys."""
+        columns = list(WorldSnapshotRepository.table(name).primary_key.columns)
+        return columns[0].name if len(columns) == 1 else None
+
+    @staticmethod
+    def foreign_keys(name: str) -> List[Tuple[str, str, bool]]:
+        """(column, referenced table, nullable) of each foreign key of a table."""
+        return [
+            (fk.parent.name, fk.column.table.name, fk.parent.nullable)
+            for fk in WorldSnapshotRepository.table(name).foreign_keys
+        ]
+
+    def scope_clause(self, name: str, world_id: UUID) -> ColumnElement:
+        """WHERE clause selecting the rows of `name` that belong to the world."""
+        column, parent = SNAPSHOT_SCOPES[name]
+        table = self.table(name)
+        if parent is None:
+            return table.c[column] == world_id
+        parent_table = self.table(parent)
+        return table.c[column].in_(select(parent_table.c.id).where(self.scope_clause(parent, world_id)))
+
+    # ==============================================================================
+    # EXPORT
+    # ==============================================================================
+
+    async def find_alembic_revision(self) -> Optional[str]:
+        try:
+            result = await self.db.execute(text("SELECT version_num FROM alembic_version"))
+            return result.scalar_one_or_none()
+        except Exception as e:
+            logger.warning(f"Could not read alembic revision: {e}")
+            return None
+
+    async def stream_text_rows(
+        self, name: str, world_id: UUID, batch_size: int
+    ) -> AsyncIterator[List[Tuple[Optional[str], ...]]]:
+        """Yield the world's rows of one table as tuples of text values, batch_size at a time."""
+        table = self.table(name)
+        stmt = (
+            select(*[cast(column, Text) for column in table.columns])
+            .where(self.scope_clause(name, world_id))
+            .execution_options(yield_per=batch_size)
+        )
+        try:
+            result = await self.db.stream(stmt)
+            async for partition in result.partitions():
+                yield [tuple(row) for row in partition]
+
+        except Exception as e:
+            logger.error(f"Error reading {name} of world {world_id} for snapshot: {e}")
+            raise
+
+    # ==============================================================================
+    # RESTORE
+    # ==============================================================================
+
+    async def copy_csv(self, name: str, columns: Sequence[str], payload: bytes) -> int:
+        """COPY CSV rows into a table on the session's own connection and transaction."""
+        if not payload:
+            return 0
+        try:
+            connection = await self.db.connection()
+            raw = await connection.get_raw_connection()
+            status = await raw.driver_connection.copy_to_table(
+                name,
+                source=_BytesSource(payload),
+                columns=list(columns),
+                format="csv",
+            )
+            return int(status.split()[-1]) if status else 0
+
+        except Exception as e:
+            logger.error(f"Error copying rows into {name}: {e}")
+            raise
+
+    async def apply_deferred(self, name: str, column: str, pairs: Sequence[Tuple[str, str]], pk_column: str = "id") -> int:
+        """Set `column` for already-loaded rows from (row id, value) pairs in one statement."""
+        if not pairs:
+            return 0
+        try:
+            payload = json.dumps([{"id": row_id, "value": value} for row_id, value in pairs])
+            result = await self.db.execute(
+                text(
+                    f'UPDATE {name} AS t SET "{column}" = v.value '
+                    f"FROM jsonb_to_recordset(CAST(:payload AS jsonb)) AS v(id uuid, value uuid) "
+                    f'WHERE t."{pk_column}" = v.id'
+                ),
+                {"payload": payload},
+            )
+            return result.rowcount
+
+        except Exception as e:
+            logger.error(f"Error applying deferred {name}.{column}: {e}")
+            raise
+
+
+class _BytesSource:
+    """Minimal async file-like object asyncpg's copy_to_table can read from."""
+
+    def __init__(self, payload: bytes, chunk_size: int = 1 << 20):
+        self.payload = memoryview(payload)
+        self.chunk_size = chunk_size
+        self.offset = 0
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> bytes:
+        if self.offset >= len(self.payload):
+            raise StopAsyncIteration
+        chunk = self.payload[self.offset:self.offset + self.chunk_size]
+        self.offset += self.chunk_size
+        return bytes(chunk)
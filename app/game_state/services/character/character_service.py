@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.schemas.character import CharacterRead, CharacterCreate, CharacterTraitsUpdate, AddCharacterTraits
 from app.game_state.enums.character import CharacterTraitEnum
 from app.game_state.managers.character_manager import CharacterManager
+from app.game_state.repositories.base_repository import ConcurrentUpdateError
 from app.game_state.repositories.character_repository import CharacterRepository
 from app.game_state.services.core.world_service import WorldService
 
@@ -201,6 +202,10 @@ class CharacterService:
             updated_entity = await self.character_repository.save(character_entity)
             logging.info(f"Successfully updated traits for character ID: {character_id}")
             return CharacterRead.model_validate(updated_entity.to_dict())
+        except ConcurrentUpdateError:
+            # Someone else saved the character after we read it; let the caller decide whether to retry
+            logging.warning(f"Character ID: {character_id} changed while its traits were being saved")
+            raise
         except Exception as e:
             logging.error(f"Error updating traits for character ID: {character_id}: {e}", exc_info=True)
             raise ValueError(f"Could not update character traits: {e}") from e
@@ -260,6 +265,10 @@ class CharacterService:
             updated_entity = await self.character_repository.save(character_entity)
             logging.info(f"Successfully added traits for character ID: {character_id}")
             return CharacterRead.model_validate(updated_entity.to_dict())
+        except ConcurrentUpdateError:
+            # Someone else saved the character after we read it; let the caller decide whether to retry
+            logging.warning(f"Character ID: {character_id} changed while its traits were being saved")
+            raise
         except Exception as e:
             logging.error(f"Error adding traits for character ID: {character_id}: {e}", exc_info=True)
             raise ValueError(f"Could not add character traits: {e}") from e
\ No newline at end of file
@@ -0,0 +1,82 @@
+# app/game_state/services/core/search_service.py
+
+import asyncio
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.game_state.repositories.core.search_repository import (
+    SEARCH_DEFAULT_LIMIT,
+    SEARCH_KINDS,
+    SEARCH_MIN_QUERY_LENGTH,
+    SearchRepository,
+)
+
+# Most kinds one multi-kind search queries at once, each on its own pooled connection
+SEARCH_MAX_CONCURRENCY = 4
+
+
+class SearchService:
+    """
+    Service for fuzzy name search across entity kinds.
+    One instance searches through one session; `search_kinds` fans a query out
+    over several kinds concurrently, each kind on its own session.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.repository = SearchRepository(db)
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @staticmethod
+    def resolve_kinds(kinds: Optional[Iterable[str]] = None) -> List[str]:
+        """Requested kinds in SEARCH_KINDS order (all when None). Raises ValueError for unknown kinds."""
+        if kinds is None:
+            return list(SEARCH_KINDS)
+        requested = set(kinds)
+        unknown = requested - SEARCH_KINDS.keys()
+        if unknown:
+            raise ValueError(f"Unknown search kinds: {sorted(unknown)}. Expected any of: {', '.join(SEARCH_KINDS)}")
+        return [kind for kind in SEARCH_KINDS if kind in requested]
+
+    @staticmethod
+    def normalize_query(q: str) -> str:
+        """Trim and collapse whitespace. Raises ValueError if too short to use the trigram indexes."""
+        normalized = " ".join(q.split())
+        if len(normalized) < SEARCH_MIN_QUERY_LENGTH:
+            raise ValueError(f"Search query must be at least {SEARCH_MIN_QUERY_LENGTH} characters")
+        return normalized
+
+    async def search(
+        self, kind: str, q: str, limit: int = SEARCH_DEFAULT_LIMIT, world_id: Optional[UUID] = None
+    ) -> List[Dict[str, Any]]:
+        """Best matches of one kind, best first."""
+        return await self.repository.search(kind, self.normalize_query(q), limit, world_id)
+
+    @classmethod
+    async def search_kinds(
+        cls,
+        session_factory: Callable[[], AsyncSession],
+        kinds: List[str],
+        q: str,
+        limit: int = SEARCH_DEFAULT_LIMIT,
+        world_id: Optional[UUID] = None,
+        max_concurrency: int = SEARCH_MAX_CONCURRENCY,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Search several kinds at once. A session runs one statement at a time,
+        so each kind gets its own; at most max_concurrency run together so one
+        request can't drain the connection pool. Returns kind -> matches.
+        """
+        q = cls.normalize_query(q)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def search_one(kind: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                async with session_factory() as session:
+                    return await cls(session).repository.search(kind, q, limit, world_id)
+
+        results = await asyncio.gather(*(search_one(kind) for kind in kinds))
+        return dict(zip(kinds, results))
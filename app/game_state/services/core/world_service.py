@@ -12,14 +12,17 @@ from app.api.schemas.world import WorldRead, WorldUpdate, WorldCreateRequest
 
 # Repositories and other Services
 from app.game_state.repositories.world_repository import WorldRepository
+from app.game_state.repositories.core.outbox_repository import OutboxRepository
 from app.game_state.services.core.theme_service import ThemeService
 from app.game_state.managers.world_manager import WorldManager
+from app.game_state.managers.domain_event_manager import WORLD_DAY_ADVANCED
 
 class WorldService:
     """Service for world operations - orchestrates between repository and managers"""
     def __init__(self, db: AsyncSession):
         self.db = db
         self.repository = WorldRepository(db=self.db, entity_cls=WorldEntityPydantic)
+        self.outbox = OutboxRepository(self.db)
         # Instantiate ThemeService for internal use
         self._theme_service = ThemeService(db=self.db)
         logging.info("WorldService initialized with WorldRepository and ThemeService.")
@@ -168,6 +171,7 @@ class WorldService:
         # Save updated DOMAIN entity
         try:
             saved_domain_entity = await self.repository.save(updated_domain_entity)
+            self.outbox.append(WORLD_DAY_ADVANCED, world_id, day=saved_domain_entity.day)
             logging.info(f"[WorldService] advance_day finished for {world_id}. New day: {saved_domain_entity.day}")
         except Exception as e:
             logging.exception(f"Error saving world {world_id} after advancing day. {e}")
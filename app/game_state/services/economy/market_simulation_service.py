@@ -0,0 +1,68 @@
+# app/game_state/services/economy/market_simulation_service.py
+
+import logging
+import time
+from typing import Any, Dict
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.game_state.cache.calendar_cache import WorldStateCache
+from app.game_state.managers.market_simulation_manager import MarketSimulationManager
+from app.game_state.repositories.settlement_repository import SettlementRepository
+
+
+class MarketSimulationService:
+    """
+    Service for the daily settlement market step.
+    Loads every settlement's stock and the trade routes of a world in two
+    queries, clears the market on dense arrays, and writes the stock changes
+    back as deltas with one versioned bulk UPDATE, so concurrent trades,
+    construction costs and gathers committed meanwhile are not lost.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.settlement_repository = SettlementRepository(db)
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def run_market_tick(self, world_id: UUID) -> Dict[str, Any]:
+        """Run one day of trade and consumption for a world. Does not commit."""
+        started = time.perf_counter()
+
+        rows = await self.settlement_repository.find_market_rows(world_id)
+        if not rows:
+            return {"world_id": world_id, "settlements": 0, "updated": 0, "skipped": [], "traded_units": 0, "consumed_units": 0}
+
+        routes = await self.settlement_repository.find_trade_routes(world_id)
+
+        versions = {settlement_id: version for settlement_id, _, _, version in rows}
+        state = MarketSimulationManager.build_state([(settlement_id, population, resources) for settlement_id, population, resources, _ in rows])
+        sources, targets, distances = MarketSimulationManager.edge_arrays(state.settlement_ids, routes)
+        snapshot = WorldStateCache.get(world_id)
+        modifier = MarketSimulationManager.seasonal_consumption(snapshot.season_name if snapshot else None)
+        result = MarketSimulationManager.clear_market(state, sources, targets, distances, modifier)
+
+        deltas = MarketSimulationManager.resource_deltas(state, result)
+        updated, skipped = await self.settlement_repository.bulk_apply_resource_deltas(
+            [(settlement_id, versions[settlement_id], changes) for settlement_id, changes in deltas]
+        )
+
+        elapsed = time.perf_counter() - started
+        self.logger.info(
+            f"[MarketTick] World {world_id}: {len(rows)} settlements x {len(state.resource_ids)} resources, "
+            f"{len(sources)} routes, traded {result.traded_units}, consumed {result.consumed_units}, "
+            f"updated {updated} (skipped {len(skipped)}) in {elapsed * 1000:.1f} ms"
+        )
+
+        return {
+            "world_id": world_id,
+            "settlements": len(rows),
+            "updated": updated,
+            "skipped": [str(settlement_id) for settlement_id in skipped],
+            "traded_units": result.traded_units,
+            "consumed_units": result.consumed_units,
+            "consumption_modifier": modifier,
+            "mean_satisfaction": round(float(result.satisfaction.mean()), 4),
+            "elapsed_seconds": round(elapsed, 4),
+        }
@@ -1,64 +1,109 @@
-# app/game_state/services/pricing.py
+# app/game_state/services/economy/pricing_service.py
 
+import logging
+from typing import Any, Dict, Optional, Sequence
 from uuid import UUID
-from app.game_state.entities.character.item_pydantic import ItemEntityPydantic
-from app.game_state.entities.geography.settlement_pydantic import SettlementEntityPydantic
-#from app.game_state.entities.trader_entity import Trader
-from app.game_state.repositories.settlement_repository import SettlementRepository
-#from app.game_state.repositories.trader_repo import TraderRepo
-#from app.game_state.services.reputation import ReputationService
-#from app.game_state.services.discount_policies import (
-#    SettlementDiscountPolicy,
-#    TraderDiscountPolicy,
-#)
-#from app.game_state.services.race_pricing import RacePricePolicy
-#from app.game_state.services.faction_pricing import FactionSurchargePolicy
-#from app.game_state.services.theme import ThemeService
-from app.game_state.enums.theme import Theme
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache_invalidation import CacheInvalidationBus
+from app.game_state.cache.price_table_cache import PriceTableCache
 from app.game_state.enums.race import Race
+from app.game_state.managers.pricing_manager import ModifierVector, PricingManager
+from app.game_state.repositories.economy.pricing_repository import PricingRepository
+from app.game_state.services.faction.faction_influence_service import FactionInfluenceService
+
 
 class PricingService:
-    @staticmethod
-    def price_for(
-        item: Item,
+    """
+    Service for trade prices.
+    Every modifier of a (player, settlement, trader) triple is resolved once
+    into a cached ModifierVector: the trade factions, the factions they
+    dislike and all of the player's reputations with them come from a fixed
+    number of queries. A whole catalog is then priced with one multiplier.
+    Vectors are invalidated when the player's reputation changes.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.repository = PricingRepository(db)
+        self.influence_service = FactionInfluenceService(db)
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def get_modifiers(
+        self,
         player_id: UUID,
         settlement_id: UUID,
         trader_id: UUID,
-        player_race: Race,
-        theme: Theme,
-    ) -> float:
-        base = item.base_price or 0.0
+        player_race: Optional[Race] = None,
+    ) -> ModifierVector:
+        """Resolve (or fetch from cache) the modifier vector for a trade."""
+        key = (player_id, settlement_id, trader_id, player_race.value if player_race else None)
+        modifiers = PriceTableCache.get(key)
+        if modifiers is not None:
+            return modifiers
+
+        settlement_faction_id, trader_faction_id = await self.repository.find_trade_factions(settlement_id, trader_id)
+        disliked_by_faction = await self.repository.find_disliked_factions([settlement_faction_id, trader_faction_id])
+        disliked_faction_ids = {faction_id for disliked in disliked_by_faction.values() for faction_id in disliked}
 
-        # 1) Settlement & Trader entities (to read disliked_faction_ids)
-        settlement = SettlementRepository().get(settlement_id)
-        trader     = TraderRepo().get(trader_id)
+        relevant_faction_ids = {settlement_faction_id, trader_faction_id, *disliked_faction_ids} - {None}
+        reputations = await self.influence_service.get_reputations(player_id, list(relevant_faction_ids))
 
-        # 2) Reputations
-        rep_set = ReputationService.for_settlement(player_id, settlement_id)
-        rep_trd = ReputationService.for_trader(player_id, trader_id)
+        modifiers = PricingManager.build_modifiers(
+            reputations,
+            settlement_faction_id=settlement_faction_id,
+            trader_faction_id=trader_faction_id,
+            disliked_faction_ids=disliked_faction_ids,
+            player_race=player_race,
+        )
+        PriceTableCache.set(key, modifiers)
+        self.logger.debug(f"[Pricing] Resolved modifiers for {key}: multiplier {modifiers.multiplier:.4f}")
+        return modifiers
 
-        # 3) Discounts from rep
-        disc_set = SettlementDiscountPolicy.get_for(rep_set)
-        disc_trd = TraderDiscountPolicy.get_for(rep_trd)
+    async def price_catalog(
+        self,
+        player_id: UUID,
+        settlement_id: UUID,
+        trader_id: UUID,
+        item_ids: Optional[Sequence[UUID]] = None,
+        player_race: Optional[Race] = None,
+    ) -> Dict[str, Any]:
+        """
+        Price the given items, or the trader's whole stock, for this player.
 
-        # 4) Race modifier (only if player_race ∈ current theme)
-        if player_race not in ThemeService.races_for(theme):
-            raise ValueError(f"{player_race} not valid in theme {theme}")
-        race_mod = RacePricePolicy.get_for(player_race)
+        Returns the resolved modifiers and one {item_id, name, base_price, price} entry per item.
+        """
+        modifiers = await self.get_modifiers(player_id, settlement_id, trader_id, player_race)
+        items = await self.repository.find_catalog_items(trader_id=trader_id, item_ids=item_ids)
+        prices = PricingManager.price_catalog([item["value"] for item in items], modifiers)
 
-        # 5) Faction surcharges: take the worst (most negative) across all disliked factions
-        faction_surcharges = []
-        for faction_id in settlement.disliked_faction_ids + trader.disliked_faction_ids:
-            rep_f = ReputationService.for_faction(player_id, faction_id)
-            faction_surcharges.append(FactionSurchargePolicy.get_for(rep_f))
-        # default surcharge 0.0 if no disliked factions
-        fac_mod = min(faction_surcharges) if faction_surcharges else 0.0
+        return {
+            "modifiers": modifiers,
+            "multiplier": modifiers.multiplier,
+            "items": [
+                {
+                    "item_id": item["id"],
+                    "name": item["name"],
+                    "base_price": float(item["value"] or 0.0),
+                    "price": price,
+                }
+                for item, price in zip(items, prices)
+            ],
+        }
 
-        # 6) Combine multiplicatively:
-        price = base \
-            * (1 - disc_set) \
-            * (1 - disc_trd) \
-            * (1 - race_mod) \
-            * (1 - fac_mod)
+    async def price_for(
+        self,
+        base_price: Optional[float],
+        player_id: UUID,
+        settlement_id: UUID,
+        trader_id: UUID,
+        player_race: Optional[Race] = None,
+    ) -> float:
+        """Price a single base price; shares the cached modifiers with price_catalog."""
+        modifiers = await self.get_modifiers(player_id, settlement_id, trader_id, player_race)
+        return PricingManager.price_item(base_price, modifiers)
 
-        return round(price, 2)
+    def invalidate_player(self, player_id: UUID) -> None:
+        """Drop every cached price table of a player, in every process, once the session commits."""
+        CacheInvalidationBus.record(self.db, "character_faction_relationships", player_id)
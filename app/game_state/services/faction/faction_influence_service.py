@@ -0,0 +1,133 @@
+# app/game_state/services/faction/faction_influence_service.py
+
+import logging
+from typing import Dict, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import case, func, literal, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.schemas.faction_schema import FactionControlResponse
+from app.db.models.character_faction_relationship import CharacterFactionRelationship, RelationshipStatusEnum
+from app.core.cache_invalidation import CacheInvalidationBus
+from app.game_state.cache.reputation_cache import ReputationCache
+from app.game_state.managers.faction_influence_manager import (
+    REPUTATION_THRESHOLDS,
+    FactionInfluenceManager,
+    ReputationMatrix,
+)
+from app.game_state.repositories.faction.faction_influence_repository import FactionInfluenceRepository
+
+
+class FactionInfluenceService:
+    """
+    Service for faction control and character reputation lookups.
+    Control is aggregated in SQL per location, zone or world. Reputations are
+    served from a shared character x faction matrix cache; misses for any number
+    of characters are loaded with a single query.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.repository = FactionInfluenceRepository(db)
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    # ==============================================================================
+    # FACTION CONTROL
+    # ==============================================================================
+
+    async def get_control(self, world_id: UUID, level: str = "location", top_only: bool = False) -> List[FactionControlResponse]:
+        """
+        Faction control at the given level ('location', 'zone' or 'world').
+
+        Raises:
+            ValueError: If the level is unknown
+        """
+        rows = await self.repository.find_control(world_id, level, top_only)
+        return [FactionControlResponse.model_validate(row) for row in rows]
+
+    async def refresh_location_controllers(self, world_id: UUID) -> int:
+        """Recompute controlled_by_faction_id for every location in the world. Does not commit."""
+        return await self.repository.update_location_controllers(world_id)
+
+    # ==============================================================================
+    # REPUTATION
+    # ==============================================================================
+
+    async def get_reputation_matrix(
+        self,
+        character_ids: Sequence[UUID],
+        faction_ids: Optional[Sequence[UUID]] = None,
+    ) -> ReputationMatrix:
+        """
+        Reputation of each character with each faction.
+
+        Cached rows are reused; all uncached characters are loaded in one query
+        and cached. With faction_ids, every row contains exactly those factions,
+        neutral where no relationship exists.
+        """
+        character_ids = list(dict.fromkeys(character_ids))
+        hits, misses = ReputationCache.get_many(character_ids)
+
+        if misses:
+            rows = await self.repository.find_reputations(misses)
+            loaded = FactionInfluenceManager.build_matrix(misses, rows)
+            ReputationCache.set_many(loaded)
+            hits.update(loaded)
+            self.logger.debug(f"[Reputation] Loaded {len(misses)} characters, {len(character_ids) - len(misses)} cached")
+
+        return {
+            character_id: FactionInfluenceManager.select_factions(hits[character_id], faction_ids)
+            for character_id in character_ids
+        }
+
+    async def get_reputations(self, character_id: UUID, faction_ids: Optional[Sequence[UUID]] = None) -> Dict[UUID, int]:
+        """Every relevant reputation of one character, in one call."""
+        matrix = await self.get_reputation_matrix([character_id], faction_ids)
+        return matrix[character_id]
+
+    async def adjust_reputation(self, character_id: UUID, faction_id: UUID, delta: int) -> int:
+        """
+        Change a character's reputation with a faction and return the new score.
+        The score is updated in place in SQL, so concurrent adjustments don't
+        overwrite each other. Does not commit.
+        """
+        new_score = func.greatest(-100, func.least(100, CharacterFactionRelationship.reputation_score + delta))
+        status_type = CharacterFactionRelationship.__table__.c.relationship_status.type
+        new_status = case(
+            *((new_score >= threshold, literal(status, status_type)) for threshold, status in REPUTATION_THRESHOLDS),
+            else_=literal(RelationshipStatusEnum.ENEMY, status_type),
+        )
+        score = (
+            await self.db.execute(
+                update(CharacterFactionRelationship)
+                .where(
+                    CharacterFactionRelationship.character_id == character_id,
+                    CharacterFactionRelationship.faction_id == faction_id,
+                )
+                .values(reputation_score=new_score, relationship_status=new_status)
+                .returning(CharacterFactionRelationship.reputation_score)
+                .execution_options(synchronize_session=False)
+            )
+        ).scalar()
+
+        if score is None:
+            score = FactionInfluenceManager.clamp_reputation(delta)
+            self.db.add(CharacterFactionRelationship(
+                character_id=character_id,
+                faction_id=faction_id,
+                reputation_score=score,
+                relationship_status=FactionInfluenceManager.status_for_score(score),
+            ))
+            await self.db.flush()
+
+        self.invalidate_reputations(character_id)
+        return score
+
+    def invalidate_reputations(self, character_id: UUID) -> None:
+        """
+        Drop a character's cached reputation row and every price table derived
+        from it, in every process, once the session commits. Until then readers
+        keep the committed value, and a rollback evicts nothing.
+        """
+        CacheInvalidationBus.record(self.db, "character_faction_relationships", character_id)
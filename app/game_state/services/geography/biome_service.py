@@ -8,6 +8,7 @@ import logging
 from app.game_state.repositories.biome_repository import BiomeRepository
 from app.game_state.managers.biome_manager import BiomeManager
 from app.game_state.entities.geography.biome_pydantic import BiomeEntityPydantic
+from app.game_state.cache.biome_sampler_cache import BiomeSamplerCache
 
 # Import API schemas
 from app.api.schemas.shared import PaginatedResponse
@@ -145,6 +146,7 @@ class BiomeService:
         try:
             saved_entity = await self.repository.save(biome_entity)
             await self.db.commit()
+            BiomeSamplerCache.invalidate(saved_entity.biome_id)
             logging.info(f"[BiomeService] Biome '{saved_entity.name}' created successfully with UUID: {saved_entity.entity_id}")
             
             # Convert to API schema
@@ -171,6 +173,8 @@ class BiomeService:
             updated_entity = await self.repository.update_entity(biome_uuid, update_data)
             if updated_entity:
                 await self.db.commit()
+                # The biome code itself may have changed, so drop every sampler
+                BiomeSamplerCache.clear()
                 logging.info(f"[BiomeService] Biome {biome_uuid} updated successfully")
                 return BiomeRead.model_validate(updated_entity.to_dict())
             else:
@@ -201,6 +205,7 @@ class BiomeService:
         try:
             result = await self.repository.delete(biome_uuid)
             if result:
+                BiomeSamplerCache.clear()
                 logging.info(f"[BiomeService] Biome {biome_uuid} deleted successfully")
             else:
                 logging.warning(f"[BiomeService] Failed to delete biome {biome_uuid}")
@@ -288,6 +293,7 @@ class BiomeService:
             if imported_count > 0:
                 logging.info(f"💾 Committing transaction with {imported_count} new biomes...")
                 await self.db.commit()
+                BiomeSamplerCache.clear()
                 logging.info(f"🎉 Bulk import committed successfully!")
             else:
                 logging.info("ℹ️  No new biomes to commit.")
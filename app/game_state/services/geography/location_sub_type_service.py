@@ -7,10 +7,17 @@ from app.game_state.services.core.base_service import BaseService
 from app.api.schemas.location.location_sub_types import LocationSubtypeCreate, LocationSubtypeUpdate, LocationSubTypeResponse
 from app.game_state.repositories.location.location_sub_type_repository import LocationSubtypeRepository
 from app.game_state.entities.geography.location_sub_type import LocationSubtype
+from app.game_state.managers.location_subtype_index_manager import LocationSubtypeIndexManager, SubtypeFacetIndex
+from app.game_state.cache.location_subtype_index_cache import LocationSubtypeIndexCache
 
 
 class LocationSubTypeService(BaseService[LocationSubtype, LocationSubtypeCreate, LocationSubTypeResponse]):
-    """Service layer for location subtype business logic"""
+    """
+    Service layer for location subtype business logic.
+
+    Filtered reads are answered from the in-memory facet index
+    (LocationSubtypeIndexCache), built from one query and rebuilt after writes.
+    """
 
     def __init__(self, db: AsyncSession):
         repository = LocationSubtypeRepository(db)
@@ -21,6 +28,29 @@ class LocationSubTypeService(BaseService[LocationSubtype, LocationSubtypeCreate,
             response_class=LocationSubTypeResponse
         )
         self.logger = logging.getLogger(__name__)
+        # Set once this service has written; its uncommitted rows must not end up in the shared index
+        self._has_pending_writes = False
+
+    # ==============================================================================
+    # FACET INDEX
+    # ==============================================================================
+
+    async def get_index(self) -> SubtypeFacetIndex:
+        """The cached facet index, rebuilt from the database if missing or expired"""
+        if self._has_pending_writes:
+            return LocationSubtypeIndexManager.build_index(await self.repository.find_all_for_index())
+
+        index = LocationSubtypeIndexCache.get()
+        if index is None:
+            generation = LocationSubtypeIndexCache.generation()
+            index = LocationSubtypeIndexManager.build_index(await self.repository.find_all_for_index())
+            LocationSubtypeIndexCache.set(index, generation)
+            self.logger.debug(f"Rebuilt location subtype index: {len(index)} subtypes")
+        return index
+
+    def _invalidate_index(self) -> None:
+        self._has_pending_writes = True
+        LocationSubtypeIndexCache.invalidate_on_commit(self.db)
 
     async def create_subtype(self, subtype_data: LocationSubtypeCreate) -> LocationSubtype:
         """Create a new location subtype with validation"""
@@ -34,6 +64,7 @@ class LocationSubTypeService(BaseService[LocationSubtype, LocationSubtypeCreate,
         # Convert to entity and create
         subtype_entity = LocationSubtype(**subtype_data.model_dump())
         created_subtype = await self.repository.create(subtype_entity)
+        self._invalidate_index()
 
         logging.info(f"Created subtype entity: {created_subtype}")
 
@@ -61,6 +92,7 @@ class LocationSubTypeService(BaseService[LocationSubtype, LocationSubtypeCreate,
         updated_subtype = await self.repository.update_entity(subtype_id, update_data)
 
         if updated_subtype:
+            self._invalidate_index()
             self.logger.info(f"Successfully updated location subtype: {subtype_id}")
         else:
             self.logger.warning(f"Location subtype not found for update: {subtype_id}")
@@ -74,6 +106,7 @@ class LocationSubTypeService(BaseService[LocationSubtype, LocationSubtypeCreate,
         success = await self.repository.delete(subtype_id)
 
         if success:
+            self._invalidate_index()
             self.logger.info(f"Successfully deleted location subtype: {subtype_id}")
         else:
             self.logger.warning(f"Location subtype not found for deletion: {subtype_id}")
@@ -82,11 +115,13 @@ class LocationSubTypeService(BaseService[LocationSubtype, LocationSubtypeCreate,
 
     async def get_subtypes_by_location_type(self, location_type_id: UUID) -> List[LocationSubtype]:
         """Get all subtypes for a location type"""
-        return await self.repository.find_by_location_type(location_type_id)
+        index = await self.get_index()
+        return index.page(index.match(location_type_id=location_type_id))
 
     async def get_subtypes_by_theme(self, theme_id: UUID) -> List[LocationSubtype]:
         """Get all subtypes for a theme"""
-        return await self.repository.find_by_theme(theme_id)
+        index = await self.get_index()
+        return index.page(index.match(theme_id=theme_id))
 
     async def get_subtypes_by_location_type_and_theme(
             self,
@@ -94,11 +129,13 @@ class LocationSubTypeService(BaseService[LocationSubtype, LocationSubtypeCreate,
             theme_id: UUID
     ) -> List[LocationSubtype]:
         """Get subtypes for specific location type and theme combination"""
-        return await self.repository.find_by_location_type_and_theme(location_type_id, theme_id)
+        index = await self.get_index()
+        return index.page(index.match(location_type_id=location_type_id, theme_id=theme_id))
 
     async def get_subtypes_by_rarity(self, rarity: str) -> List[LocationSubtype]:
         """Get subtypes by rarity level"""
-        return await self.repository.find_by_rarity(rarity)
+        index = await self.get_index()
+        return index.page(index.match(rarity=rarity))
 
     async def search_subtypes(
             self,
@@ -108,18 +145,30 @@ class LocationSubTypeService(BaseService[LocationSubtype, LocationSubtypeCreate,
             tags: Optional[List[str]] = None,
             match_all_tags: bool = False,
             skip: int = 0,
-            limit: int = 100
+            limit: int = 100,
+            include_facets: bool = False
     ) -> Dict[str, Any]:
-        """Search subtypes with multiple filters"""
-        return await self.repository.find_with_filters(
+        """
+        Search subtypes with multiple filters, in code order. With include_facets,
+        also returns how many matches have each location type, theme, rarity and tag.
+        """
+        index = await self.get_index()
+        mask = index.match(
             location_type_id=location_type_id,
             theme_id=theme_id,
             rarity=rarity,
             tags=tags,
-            match_all_tags=match_all_tags,
-            skip=skip,
-            limit=limit
+            match_all_tags=match_all_tags
         )
+        result = {
+            "items": index.page(mask, skip, limit),
+            "total": index.count(mask),
+            "limit": limit,
+            "skip": skip,
+        }
+        if include_facets:
+            result["facets"] = index.facet_counts(mask)
+        return result
 
     async def bulk_create_subtypes(self, subtypes_data: List[LocationSubtypeCreate]) -> List[LocationSubtype]:
         """Bulk create location subtypes"""
@@ -127,18 +176,20 @@ class LocationSubTypeService(BaseService[LocationSubtype, LocationSubtypeCreate,
 
         # Validate all codes are unique
         codes = [subtype.code for subtype in subtypes_data]
-        if len(codes) != len(set(codes)):
-            raise ValueError("Duplicate codes found in bulk create request")
+        duplicates = LocationSubtypeIndexManager.find_duplicate_codes(codes)
+        if duplicates:
+            raise ValueError(f"Duplicate codes found in bulk create request: {', '.join(duplicates)}")
 
-        # Check for existing codes
-        for subtype_data in subtypes_data:
-            existing = await self.repository.get_by_code(subtype_data.code)
-            if existing:
-                raise ValueError(f"Location subtype with code '{subtype_data.code}' already exists")
+        # Check for existing codes against the index rather than one query per code;
+        # the unique constraint still catches codes created elsewhere since it was built
+        existing = LocationSubtypeIndexManager.find_existing_codes(await self.get_index(), codes)
+        if existing:
+            raise ValueError(f"Location subtypes with these codes already exist: {', '.join(existing)}")
 
         # Convert to entities and bulk save
         entities = [LocationSubtype(**data.model_dump()) for data in subtypes_data]
         created_subtypes = await self.repository.bulk_save(entities)
+        self._invalidate_index()
 
         self.logger.info(f"Successfully bulk created {len(created_subtypes)} location subtypes")
         return created_subtypes
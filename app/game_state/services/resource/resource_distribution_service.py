@@ -0,0 +1,69 @@
+# app/game_state/services/resource/resource_distribution_service.py
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.game_state.cache.biome_sampler_cache import BiomeSamplerCache
+from app.game_state.managers.resource_distribution_manager import AliasTable, ResourceDistributionManager
+from app.game_state.repositories.resource.resource_distribution_repository import ResourceDistributionRepository
+from app.game_state.repositories.resource_node_blueprint_repository import ResourceNodeBlueprintRepository
+
+
+class ResourceDistributionService:
+    """
+    Service for weighted resource node blueprint picks per biome.
+    Each biome's blueprints and resource_types are compiled into an alias table
+    once and cached in BiomeSamplerCache; all missing biomes load together in
+    three queries, after which samples cost O(1) each without touching the DB.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.repository = ResourceDistributionRepository(db)
+        self.blueprint_repository = ResourceNodeBlueprintRepository(db)
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def get_tables(self, biome_types: Iterable[str]) -> Dict[str, AliasTable]:
+        """Alias tables for the given biome codes; biomes without blueprints are left out."""
+        biome_types = {biome_type for biome_type in biome_types if biome_type}
+        missing = sorted(BiomeSamplerCache.missing(biome_types))
+
+        if missing:
+            blueprints_by_biome = await self.blueprint_repository.find_grouped_by_biome_types(missing)
+            resource_types = await self.repository.find_resource_types(missing)
+            resource_names = await self.repository.find_blueprint_resource_names(missing)
+
+            for biome_type in missing:
+                table = ResourceDistributionManager.build_biome_table(
+                    blueprints_by_biome.get(biome_type, []),
+                    resource_types.get(biome_type),
+                    resource_names,
+                )
+                BiomeSamplerCache.set(biome_type, table)
+            self.logger.info(f"[ResourceDistribution] Built samplers for {len(missing)} biomes")
+
+        tables = {biome_type: BiomeSamplerCache.get(biome_type) for biome_type in biome_types}
+        return {biome_type: table for biome_type, table in tables.items() if table is not None}
+
+    async def sample(self, biome_type: str, count: int, seed: Optional[int] = None) -> List[Any]:
+        """
+        Draw `count` blueprints for a biome. The same seed gives the same picks
+        as long as the biome's blueprints and weights are unchanged.
+        """
+        table = (await self.get_tables([biome_type])).get(biome_type)
+        if table is None or count <= 0:
+            return []
+        return table.sample(np.random.default_rng(seed), count)
+
+    @staticmethod
+    def invalidate_biome(biome_type: Optional[str]) -> None:
+        """Drop one biome's sampler after its resource_types changed."""
+        BiomeSamplerCache.invalidate(biome_type)
+
+    @staticmethod
+    def invalidate_all() -> None:
+        """Drop every sampler after a blueprint was created, changed or removed."""
+        BiomeSamplerCache.clear()
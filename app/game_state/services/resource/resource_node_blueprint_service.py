@@ -15,6 +15,7 @@ from app.api.schemas.resource_node_blueprint_schema import (
     ResourceLinkCreate
 )
 from app.game_state.enums.shared import StatusEnum
+from app.game_state.cache.biome_sampler_cache import BiomeSamplerCache
 
 
 class ResourceNodeBlueprintService(BaseService[ResourceNodeEntityPydantic, ResourceNodeBlueprintCreate, ResourceNodeBlueprintRead]):
@@ -59,6 +60,8 @@ class ResourceNodeBlueprintService(BaseService[ResourceNodeEntityPydantic, Resou
         # Post-creation processing (handle resource links)
         await self._post_create_processing(created_entity, blueprint_data)
         
+        BiomeSamplerCache.clear()
+
         # Build response with full details
         response = await self._build_blueprint_response(created_entity)
         
@@ -134,6 +137,7 @@ class ResourceNodeBlueprintService(BaseService[ResourceNodeEntityPydantic, Resou
             )
 
             if updated_entity:
+                BiomeSamplerCache.clear()
                 self.logger.info(f"Added resource {resource_link.resource_id} to blueprint {blueprint_id}")
                 return await self._build_blueprint_response(updated_entity)
             
@@ -148,6 +152,7 @@ class ResourceNodeBlueprintService(BaseService[ResourceNodeEntityPydantic, Resou
         try:
             success = await self.repository.remove_resource_link(blueprint_id, resource_id)
             if success:
+                BiomeSamplerCache.clear()
                 self.logger.info(f"Removed resource {resource_id} from blueprint {blueprint_id}")
             return success
 
@@ -255,9 +260,13 @@ class ResourceNodeBlueprintService(BaseService[ResourceNodeEntityPydantic, Resou
         update_dict = update_data.model_dump(exclude_unset=True)
         updated_entity = await self.update_entity(blueprint_id, update_dict)
         if updated_entity:
+            BiomeSamplerCache.clear()
             return await self._build_blueprint_response(updated_entity)
         return None
 
     async def delete_resource_node_blueprint(self, blueprint_id: UUID) -> bool:
         """Backward compatibility method"""
-        return await self.delete_entity(blueprint_id)
\ No newline at end of file
+        deleted = await self.delete_entity(blueprint_id)
+        if deleted:
+            BiomeSamplerCache.clear()
+        return deleted
\ No newline at end of file
@@ -0,0 +1,83 @@
+# app/game_state/services/resource/resource_node_lifecycle_service.py
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, Mapping, Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.game_state.managers.resource_node_lifecycle_manager import ResourceNodeLifecycleManager, RESPAWN_BATCH_SIZE
+from app.game_state.repositories.resource.resource_node_lifecycle_repository import ResourceNodeLifecycleRepository
+
+
+@dataclass
+class ExtractionOutcome:
+    """What an extraction actually took from a node."""
+    taken: Dict[UUID, int] = field(default_factory=dict)
+    remaining: Dict[UUID, int] = field(default_factory=dict)
+    depleted: bool = False
+    respawn_at: Optional[datetime] = None
+
+
+class ResourceNodeLifecycleService:
+    """
+    Service for resource node yield, depletion and respawn.
+    Extraction consumes yield and flips depletion with single locked statements,
+    and depleted nodes go into a respawn queue ordered by respawn time that the
+    lifecycle task drains in batches. Nothing here commits.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.repository = ResourceNodeLifecycleRepository(db)
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def extract(self, node_id: UUID, amounts: Mapping[UUID, int], now: Optional[datetime] = None) -> ExtractionOutcome:
+        """
+        Take up to `amounts` (resource_id -> units) from a node. Links that run
+        dry cap what is taken; if that exhausts the node it is marked depleted
+        and queued for respawn in the same transaction.
+        """
+        now = now or datetime.now(timezone.utc)
+        rows = await self.repository.consume_yield(node_id, amounts)
+
+        outcome = ExtractionOutcome(
+            taken={resource_id: taken for resource_id, taken, _, _ in rows if taken > 0},
+            remaining={resource_id: remaining for resource_id, _, remaining, _ in rows},
+        )
+
+        if any(remaining <= 0 for remaining in outcome.remaining.values()):
+            if await self.repository.deplete_if_exhausted(node_id, now):
+                outcome.depleted = True
+                outcome.respawn_at = await self._schedule_respawn(node_id, now)
+
+        return outcome
+
+    async def deplete(self, node_id: UUID, now: Optional[datetime] = None) -> Optional[datetime]:
+        """Deplete a node by hand and queue its respawn. Returns None if it was already depleted."""
+        now = now or datetime.now(timezone.utc)
+        if not await self.repository.mark_depleted(node_id, now):
+            return None
+        return await self._schedule_respawn(node_id, now)
+
+    async def respawn_due(self, now: Optional[datetime] = None, batch_size: int = RESPAWN_BATCH_SIZE) -> int:
+        """Respawn one batch of nodes whose respawn time has passed. Returns the number taken off the queue."""
+        now = now or datetime.now(timezone.utc)
+        node_ids = await self.repository.pop_due_respawns(now, batch_size)
+        if node_ids:
+            await self.repository.respawn_nodes(node_ids)
+        return len(node_ids)
+
+    async def get_queue_stats(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """Size of the due part of the respawn queue."""
+        now = now or datetime.now(timezone.utc)
+        return {"due": await self.repository.count_due(now), "checked_at": now.isoformat()}
+
+    async def _schedule_respawn(self, node_id: UUID, now: datetime) -> datetime:
+        rarities = (await self.repository.find_link_rarities([node_id])).get(node_id, [])
+        respawn_at = ResourceNodeLifecycleManager.respawn_at(now, rarities)
+        await self.repository.schedule_respawns([(node_id, respawn_at)])
+        self.logger.info(f"[NodeRespawn] Node {node_id} depleted, respawns at {respawn_at.isoformat()}")
+        return respawn_at
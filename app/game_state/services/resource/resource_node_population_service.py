@@ -0,0 +1,97 @@
+# app/game_state/services/resource/resource_node_population_service.py
+
+import logging
+import time
+from typing import Any, Dict, List
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.schemas.resource_node_schema import ResourceNodePopulationRequest, ResourceNodePopulationResult
+from app.game_state.managers.resource_node_population_manager import ResourceNodePopulationManager
+from app.game_state.repositories.location.location_repository import LocationRepository
+from app.game_state.repositories.resource_node_repository import ResourceNodeRepository
+from app.game_state.services.resource.resource_distribution_service import ResourceDistributionService
+
+
+class ResourceNodePopulationService:
+    """
+    Service for populating a world with resource nodes in bulk.
+    Blueprints come from the cached per-biome alias tables, rows are generated
+    with a seeded RNG and written with chunked multi-row INSERTs inside the caller's transaction.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.node_repository = ResourceNodeRepository(db)
+        self.distribution_service = ResourceDistributionService(db)
+        self.location_repository = LocationRepository(db)
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def populate_world(self, world_id: UUID, request: ResourceNodePopulationRequest) -> ResourceNodePopulationResult:
+        """
+        Spawn nodes for every active location in a world.
+
+        Does not commit. The request-scoped session (or the calling task) commits,
+        so the whole population either lands or rolls back as one transaction.
+        """
+        started = time.perf_counter()
+
+        locations = await self.location_repository.get_biome_types_by_world(world_id)
+        biome_types = sorted({biome for _, biome in locations if biome})
+        samplers = await self.distribution_service.get_tables(biome_types)
+        blueprints_by_biome = {biome: list(table.items) for biome, table in samplers.items()}
+
+        self.logger.info(
+            f"[PopulateWorld] World {world_id}: {len(locations)} locations, "
+            f"{sum(len(v) for v in blueprints_by_biome.values())} blueprints across {len(blueprints_by_biome)} biomes"
+        )
+
+        node_buffer: List[Dict[str, Any]] = []
+        link_buffer: List[Dict[str, Any]] = []
+        populated_locations = set()
+        nodes_created = 0
+        links_created = 0
+
+        rows = ResourceNodePopulationManager.generate_rows(
+            locations,
+            blueprints_by_biome,
+            seed=request.seed,
+            nodes_per_location=request.nodes_per_location,
+            status=request.status,
+            visibility=request.visibility,
+            samplers=samplers,
+        )
+
+        for node_row, link_rows in rows:
+            node_buffer.append(node_row)
+            link_buffer.extend(link_rows)
+            populated_locations.add(node_row["location_id"])
+
+            if len(node_buffer) >= request.chunk_size:
+                nodes_created += await self.node_repository.bulk_insert_nodes(node_buffer, request.chunk_size)
+                links_created += await self.node_repository.bulk_insert_links(link_buffer, request.chunk_size)
+                node_buffer, link_buffer = [], []
+
+        if node_buffer:
+            nodes_created += await self.node_repository.bulk_insert_nodes(node_buffer, request.chunk_size)
+            links_created += await self.node_repository.bulk_insert_links(link_buffer, request.chunk_size)
+
+        elapsed = time.perf_counter() - started
+        nodes_per_second = nodes_created / elapsed if elapsed > 0 else 0.0
+
+        self.logger.info(
+            f"[PopulateWorld] World {world_id}: inserted {nodes_created} nodes and {links_created} links "
+            f"in {elapsed:.2f}s ({nodes_per_second:.0f} nodes/s)"
+        )
+
+        return ResourceNodePopulationResult(
+            world_id=world_id,
+            seed=request.seed,
+            locations_considered=len(locations),
+            locations_populated=len(populated_locations),
+            nodes_created=nodes_created,
+            links_created=links_created,
+            elapsed_seconds=round(elapsed, 4),
+            nodes_per_second=round(nodes_per_second, 1),
+        )
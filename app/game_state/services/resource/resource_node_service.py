@@ -10,12 +10,14 @@ from app.game_state.entities.resource.resource_node_pydantic import ResourceNode
 from app.api.schemas.resource_node_schema import (
     ResourceNodeCreate, 
     ResourceNodeRead, 
+    ResourceNodeSummary,
     ResourceNodeUpdate,
     ResourceExtractionRequest,
     ResourceExtractionResult
 )
 from app.game_state.enums.shared import StatusEnum
 from app.game_state.enums.resource import ResourceNodeVisibilityEnum
+from app.game_state.services.resource.resource_node_lifecycle_service import ResourceNodeLifecycleService
 
 
 class ResourceNodeService(BaseService[ResourceNodeEntityPydantic, ResourceNodeCreate, ResourceNodeRead]):
@@ -31,6 +33,9 @@ class ResourceNodeService(BaseService[ResourceNodeEntityPydantic, ResourceNodeCr
             entity_class=ResourceNodeEntityPydantic,
             response_class=ResourceNodeRead
         )
+        self._blueprint_repository = None
+        # Blueprints fetched during this service's lifetime, keyed by id
+        self._blueprint_cache: Dict[UUID, ResourceNodeEntityPydantic] = {}
 
     # ==============================================================================
     # RESOURCE NODE CREATION (from blueprints)
@@ -68,11 +73,9 @@ class ResourceNodeService(BaseService[ResourceNodeEntityPydantic, ResourceNodeCr
 
     async def create_node_from_blueprint(self, location_id: UUID, blueprint_id: UUID, overrides: Optional[Dict[str, Any]] = None) -> ResourceNodeRead:
         """Create a resource node instance from a blueprint."""
+        overrides = overrides or {}
         try:
-            # Get the blueprint entity from base service
-            from app.game_state.services.resource.resource_node_blueprint_service import ResourceNodeBlueprintService
-            blueprint_service = ResourceNodeBlueprintService(self.db)
-            blueprint_entity = await blueprint_service.find_by_id(blueprint_id)
+            blueprint_entity = await self._get_blueprint(blueprint_id)
             
             if not blueprint_entity:
                 raise ValueError(f"Blueprint not found: {blueprint_id}")
@@ -134,10 +137,8 @@ class ResourceNodeService(BaseService[ResourceNodeEntityPydantic, ResourceNodeCr
 
     async def get_active_nodes_in_location(self, location_id: UUID, skip: int = 0, limit: int = 100) -> List[ResourceNodeRead]:
         """Get active (non-depleted) resource nodes in a location."""
-        entities = await self.repository.find_by_location_and_status(location_id, StatusEnum.ACTIVE, skip, limit)
-        # Filter out depleted nodes
-        active_entities = [entity for entity in entities if not entity.depleted]
-        return [await self._build_node_response(entity) for entity in active_entities]
+        entities = await self.repository.find_active_in_location(location_id, skip, limit)
+        return [await self._build_node_response(entity) for entity in entities]
 
     async def get_depleted_nodes_in_location(self, location_id: UUID, skip: int = 0, limit: int = 100) -> List[ResourceNodeRead]:
         """Get depleted resource nodes in a location."""
@@ -177,57 +178,52 @@ class ResourceNodeService(BaseService[ResourceNodeEntityPydantic, ResourceNodeCr
                     message=f"Resource node is not active (status: {node_entity.status})"
                 )
 
-            # Simulate resource extraction
-            extracted_resources = []
-            total_extraction_attempts = 0
+            # Roll what each link would yield, then take it atomically from the node's remaining yield
+            import random
+            rolled: Dict[UUID, int] = {}
+            qualities: Dict[UUID, float] = {}
+            names: Dict[UUID, str] = {}
 
             for resource_link in node_entity.resource_links:
-                total_extraction_attempts += 1
-                
                 # Calculate extraction chance with modifiers
                 base_chance = resource_link.chance
                 modified_chance = base_chance * extraction_request.tool_efficiency * extraction_request.character_skill
                 modified_chance = min(modified_chance, 1.0)  # Cap at 100%
 
-                # Simulate chance roll
-                import random
                 if random.random() <= modified_chance:
                     # Calculate extraction amount
                     base_amount = random.randint(resource_link.amount_min, resource_link.amount_max)
                     modified_amount = int(base_amount * extraction_request.tool_efficiency)
-                    modified_amount = max(1, modified_amount)  # Minimum 1
+                    rolled[resource_link.resource_id] = max(1, modified_amount)  # Minimum 1
 
                     # Calculate quality
-                    base_quality = resource_link.purity
-                    modified_quality = min(base_quality * extraction_request.character_skill, 1.0)
-
-                    extracted_resource = {
-                        "resource_id": str(resource_link.resource_id),
-                        "resource_name": getattr(resource_link, 'resource_name', 'Unknown Resource'),
-                        "amount": modified_amount,
-                        "quality": round(modified_quality, 2)
-                    }
-                    extracted_resources.append(extracted_resource)
-
-                    # Update extraction statistics
-                    await self.repository.update_extraction_stats(
-                        node_id, 
-                        resource_link.resource_id, 
-                        modified_amount
-                    )
-
-            # Check if node should be depleted (simple logic - can be enhanced)
-            if total_extraction_attempts > 0 and not extracted_resources:
-                # Multiple failed extractions might indicate depletion
-                pass  # Could implement depletion logic here
+                    qualities[resource_link.resource_id] = min(resource_link.purity * extraction_request.character_skill, 1.0)
+                    names[resource_link.resource_id] = getattr(resource_link, 'resource_name', 'Unknown Resource')
+
+            outcome = await ResourceNodeLifecycleService(self.db).extract(node_id, rolled)
+
+            extracted_resources = []
+            for resource_id, amount in outcome.taken.items():
+                extracted_resources.append({
+                    "resource_id": str(resource_id),
+                    "resource_name": names[resource_id],
+                    "amount": amount,
+                    "quality": round(qualities[resource_id], 2)
+                })
+
+                # Update extraction statistics
+                await self.repository.update_extraction_stats(node_id, resource_id, amount)
 
             success = len(extracted_resources) > 0
             message = f"Successfully extracted {len(extracted_resources)} resource types" if success else "No resources extracted"
+            if outcome.depleted:
+                message += "; the node is now depleted"
 
             return ResourceExtractionResult(
                 success=success,
                 resources_extracted=extracted_resources,
-                node_depleted=False,  # Would need more complex logic
+                node_depleted=outcome.depleted,
+                respawn_at=outcome.respawn_at,
                 message=message
             )
 
@@ -238,6 +234,11 @@ class ResourceNodeService(BaseService[ResourceNodeEntityPydantic, ResourceNodeCr
                 message=f"Extraction failed: {str(e)}"
             )
 
+    async def deplete_node(self, node_id: UUID) -> Optional[ResourceNodeRead]:
+        """Deplete a node by hand and queue its respawn like an exhausted node."""
+        await ResourceNodeLifecycleService(self.db).deplete(node_id)
+        return await self.find_by_id(node_id)
+
     # ==============================================================================
     # OVERRIDE HOOK METHODS FOR NODE-SPECIFIC LOGIC
     # ==============================================================================
@@ -296,16 +297,15 @@ class ResourceNodeService(BaseService[ResourceNodeEntityPydantic, ResourceNodeCr
     async def _inherit_from_blueprint(self, node_entity: ResourceNodeEntityPydantic, original_data: ResourceNodeCreate):
         """Inherit resource links from blueprint with any overrides."""
         try:
-            # Get blueprint details
-            from app.game_state.services.resource.resource_node_blueprint_service import ResourceNodeBlueprintService
-            blueprint_service = ResourceNodeBlueprintService(self.db)
-            blueprint = await blueprint_service.find_by_id(original_data.blueprint_id)
+            # Reuses the blueprint fetched by create_node_from_blueprint
+            blueprint = await self._get_blueprint(original_data.blueprint_id)
             
             if not blueprint:
                 return
 
             # Create resource links based on blueprint
             overrides = original_data.resource_link_overrides or {}
+            link_rows = []
             
             for blueprint_link in blueprint.resource_links:
                 # Apply any overrides for this resource
@@ -313,6 +313,7 @@ class ResourceNodeService(BaseService[ResourceNodeEntityPydantic, ResourceNodeCr
                 
                 # Create link data with blueprint defaults and overrides
                 link_data = {
+                    'node_id': node_entity.id,
                     'resource_id': blueprint_link.resource_id,
                     'is_primary': resource_overrides.get('is_primary', blueprint_link.is_primary),
                     'chance': resource_overrides.get('chance', blueprint_link.chance),
@@ -320,14 +321,35 @@ class ResourceNodeService(BaseService[ResourceNodeEntityPydantic, ResourceNodeCr
                     'amount_max': resource_overrides.get('amount_max', blueprint_link.amount_max),
                     'purity': resource_overrides.get('purity', blueprint_link.purity),
                     'rarity': resource_overrides.get('rarity', blueprint_link.rarity),
-                    'metadata': resource_overrides.get('metadata', {})
+                    '_metadata': resource_overrides.get('metadata', {})
                 }
+                link_rows.append(link_data)
 
-                # Add resource link to node (would need to be implemented in repository)
-                # await self.repository.add_resource_link(node_entity.id, blueprint_link.resource_id, link_data)
+            # Insert all links for the node in one statement
+            await self.repository.bulk_insert_links(link_rows)
 
         except Exception as e:
-            self.logger.warning(f"Failed to inherit from blueprint: {e}")
+            # A node without its links must not be committed; the caller's transaction rolls both back
+            self.logger.error(f"Failed to inherit from blueprint {original_data.blueprint_id} for node {node_entity.id}: {e}")
+            raise
+
+    async def _get_blueprint(self, blueprint_id: UUID) -> Optional[ResourceNodeEntityPydantic]:
+        """Fetch a blueprint with its resource links, cached for the lifetime of this service."""
+        if blueprint_id in self._blueprint_cache:
+            return self._blueprint_cache[blueprint_id]
+
+        if self._blueprint_repository is None:
+            from app.game_state.repositories.resource_node_blueprint_repository import ResourceNodeBlueprintRepository
+            self._blueprint_repository = ResourceNodeBlueprintRepository(self.db)
+
+        blueprint = await self._blueprint_repository.find_by_id(blueprint_id)
+        if blueprint:
+            self._blueprint_cache[blueprint_id] = blueprint
+        return blueprint
+
+    def to_summaries(self, nodes: List[ResourceNodeRead]) -> List[ResourceNodeSummary]:
+        """Listing summaries of already-built node responses (fields are copied, not re-derived)."""
+        return [ResourceNodeSummary.model_validate(node, from_attributes=True) for node in nodes]
 
     async def _build_node_response(self, entity: ResourceNodeEntityPydantic) -> ResourceNodeRead:
         """Build detailed node response with statistics."""
@@ -7,7 +7,9 @@ import logging
 
 # Import domain entity and repository
 from app.game_state.repositories.settlement_repository import SettlementRepository
+from app.game_state.repositories.core.outbox_repository import OutboxRepository
 from app.game_state.managers.settlement_manager import SettlementManager
+from app.game_state.managers.domain_event_manager import SETTLEMENT_BUILDING_CONSTRUCTED
 
 # Import API schemas
 from app.api.schemas.settlement import SettlementRead
@@ -18,6 +20,7 @@ class SettlementService:
         """Initialize the service with a database session."""
         self.db = db
         self.repository = SettlementRepository(db=self.db)
+        self.outbox = OutboxRepository(self.db)
         logging.debug("SettlementService initialized with SettlementRepository.")
 
     async def create(self, name: str, description: Optional[str], world_id: UUID, population: Optional[int],resources: Optional[dict]) -> SettlementRead:
@@ -122,6 +125,12 @@ class SettlementService:
             # Construct the building
             settlement_entity = await self.repository.construct_building(settlement_id=settlement_id, building_id=building_id)
             if settlement_entity:
+                # Committed with the construction; consumers react after the request returns
+                self.outbox.append(
+                    SETTLEMENT_BUILDING_CONSTRUCTED, settlement_id,
+                    building_id=building_id,
+                    costs={str(resource_id): cost for resource_id, cost in (building_costs or {}).items()},
+                )
                 return SettlementRead.model_validate(settlement_entity.to_dict())
             return None
         except Exception as e:
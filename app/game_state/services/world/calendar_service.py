@@ -0,0 +1,96 @@
+# app/game_state/services/world/calendar_service.py
+
+import logging
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache_invalidation import CacheInvalidationBus
+from app.game_state.cache.calendar_cache import WORLD_STATE_KIND, CalendarCache, WorldStateCache
+from app.game_state.managers.calendar_manager import CalendarManager, CalendarTable, WorldStateSnapshot
+from app.game_state.repositories.world.calendar_repository import CalendarRepository
+
+
+class CalendarService:
+    """
+    Service for world calendars.
+    Each theme's day -> (season, celestial events) table is built once and
+    cached. A tick resolves every world from one clock query plus cached
+    tables, writes changed seasons in one UPDATE and publishes the snapshots
+    to WorldStateCache. Readers go through get_snapshot, which falls back to a
+    read-only resolve when the snapshot isn't cached in their process.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.repository = CalendarRepository(db)
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def get_tables(self, theme_ids: Iterable[Optional[UUID]]) -> Dict[Optional[UUID], CalendarTable]:
+        """Calendar tables for the given themes; all missing themes load in two queries."""
+        theme_ids = set(theme_ids)
+        missing = CalendarCache.missing(theme_ids)
+
+        if missing:
+            themed = [theme_id for theme_id in missing if theme_id is not None]
+            seasons = await self.repository.find_seasons_by_theme(themed)
+            events = await self.repository.find_event_names_by_theme(themed)
+            for theme_id in missing:
+                table = CalendarManager.build_table(seasons.get(theme_id, []), events.get(theme_id, []))
+                CalendarCache.set(theme_id, table)
+            self.logger.info(f"[Calendar] Built calendar tables for {len(missing)} themes")
+
+        return {theme_id: CalendarCache.get(theme_id) for theme_id in theme_ids}
+
+    async def resolve_worlds(self, world_ids: Optional[Sequence[UUID]] = None) -> Dict[UUID, WorldStateSnapshot]:
+        """
+        Resolve the season and celestial events of the given worlds (or all worlds)
+        for their current day, persist changed seasons and publish the snapshots.
+        Used by the tick. Does not commit.
+        """
+        resolved = await self._resolve(world_ids)
+        snapshots = [snapshot for snapshot, _ in resolved]
+        season_changes = [
+            (snapshot.world_id, snapshot.season_index)
+            for snapshot, stored_season in resolved if snapshot.season_index != stored_season
+        ]
+
+        await self.repository.bulk_update_seasons(season_changes)
+        # Published here for the rest of the tick; other processes drop their
+        # older snapshots once the tick commits
+        WorldStateCache.publish(snapshots)
+        for snapshot in snapshots:
+            CacheInvalidationBus.record(self.db, WORLD_STATE_KIND, snapshot.world_id, snapshot.day)
+
+        if season_changes:
+            self.logger.info(f"[Calendar] Season changed in {len(season_changes)} of {len(snapshots)} worlds")
+        return {snapshot.world_id: snapshot for snapshot in snapshots}
+
+    async def get_snapshot(self, world_id: UUID) -> Optional[WorldStateSnapshot]:
+        """
+        A world's current calendar snapshot. On a cache miss it is computed
+        from the world's clock without writing anything, so this is safe on
+        read-only and replica sessions, and cached in this process.
+        """
+        snapshot = WorldStateCache.get(world_id)
+        if snapshot is None:
+            resolved = await self._resolve([world_id])
+            if resolved:
+                snapshot = resolved[0][0]
+                WorldStateCache.publish([snapshot])
+        return snapshot
+
+    async def _resolve(self, world_ids: Optional[Sequence[UUID]]) -> List[Tuple[WorldStateSnapshot, int]]:
+        """(snapshot, stored season index) per world, from one clock query plus cached tables. Read-only."""
+        clocks = await self.repository.find_world_clocks(world_ids)
+        tables = await self.get_tables(theme_id for _, theme_id, _, _ in clocks)
+        return [
+            (CalendarManager.resolve(tables[theme_id], world_id, theme_id, day), season)
+            for world_id, theme_id, day, season in clocks
+        ]
+
+    @staticmethod
+    def invalidate_theme(theme_id: Optional[UUID]) -> None:
+        """Drop a theme's table after its seasons or celestial events change."""
+        CalendarCache.invalidate(theme_id)
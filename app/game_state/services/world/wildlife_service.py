@@ -0,0 +1,121 @@
+# app/game_state/services/world/wildlife_service.py
+
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.world import World
+from app.game_state.cache.calendar_cache import WorldStateCache
+from app.core.cache_invalidation import CacheInvalidationBus
+from app.game_state.cache.danger_cache import LOCATION_DANGER_KIND, DangerCache
+from app.game_state.managers.wildlife_manager import WildlifeManager
+from app.game_state.repositories.wildlife_repository import WildlifeRepository
+
+
+class WildlifeService:
+    """
+    Service for the daily wildlife step and the location danger map.
+    A tick loads all wildlife of a world in one query, grows every population
+    with array math, writes changed populations with one bulk UPDATE and
+    publishes a fresh location -> danger map to DangerCache.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.repository = WildlifeRepository(db)
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def run_wildlife_tick(self, world_id: UUID) -> Dict[str, Any]:
+        """
+        Advance every wildlife population of a world by one day. Does not commit.
+
+        Growth is seeded from the world id and day, so replaying a day gives the same result.
+
+        Raises:
+            ValueError: If the world does not exist
+        """
+        started = time.perf_counter()
+        day, season, season_name = await self._world_clock(world_id)
+
+        rows = await self.repository.find_tick_rows(world_id)
+        arrays = WildlifeManager.build_arrays(rows, season, season_name)
+
+        rng = np.random.default_rng([world_id.int & 0xFFFFFFFF, day])
+        population = WildlifeManager.grow(arrays, rng)
+
+        changed = np.flatnonzero(population != arrays.population)
+        updates = [
+            (arrays.ids[i], int(population[i]), bool(population[i] > arrays.population[i]))
+            for i in changed.tolist()
+        ]
+        updated = await self.repository.bulk_update_populations(updates, datetime.now(timezone.utc))
+
+        danger_map = await self._build_danger_map(world_id, arrays, population)
+        DangerCache.set_world(world_id, danger_map, day=day)
+        CacheInvalidationBus.record(self.db, LOCATION_DANGER_KIND, world_id, day)
+
+        elapsed = time.perf_counter() - started
+        self.logger.info(
+            f"[WildlifeTick] World {world_id} day {day}: {len(rows)} wildlife rows, "
+            f"{updated} updated, {len(danger_map)} locations scored in {elapsed * 1000:.1f} ms"
+        )
+
+        return {
+            "world_id": world_id,
+            "wildlife": len(rows),
+            "updated": updated,
+            "total_population": int(population.sum()),
+            "locations": len(danger_map),
+            "elapsed_seconds": round(elapsed, 4),
+        }
+
+    async def get_danger_map(self, world_id: UUID) -> Dict[UUID, Tuple[float, float]]:
+        """
+        (day_danger, night_danger) per location of a world. Served from DangerCache;
+        on a miss the map is rebuilt from current populations without advancing them.
+        """
+        danger_map = DangerCache.get_world(world_id)
+        if danger_map is not None:
+            return danger_map
+
+        day, season, season_name = await self._world_clock(world_id)
+        arrays = WildlifeManager.build_arrays(await self.repository.find_tick_rows(world_id), season, season_name)
+        danger_map = await self._build_danger_map(world_id, arrays, arrays.population)
+        DangerCache.set_world(world_id, danger_map, day=day)
+        return danger_map
+
+    async def get_location_danger(self, world_id: UUID, location_id: UUID, night: bool = False) -> Optional[float]:
+        """Danger of one location, loading its world's map if needed."""
+        danger = DangerCache.get(location_id, night)
+        if danger is None:
+            entry = (await self.get_danger_map(world_id)).get(location_id)
+            danger = entry[1 if night else 0] if entry else None
+        return danger
+
+    async def _build_danger_map(self, world_id: UUID, arrays, population: np.ndarray) -> Dict[UUID, Tuple[float, float]]:
+        bases = await self.repository.find_location_base_danger(world_id)
+        location_ids = [location_id for location_id, _ in bases]
+        base_danger = np.array([base for _, base in bases], dtype=np.float64)
+
+        day, night = WildlifeManager.location_danger(location_ids, base_danger, arrays, population)
+        return {
+            location_id: (round(float(d), 2), round(float(n), 2))
+            for location_id, d, n in zip(location_ids, day.tolist(), night.tolist())
+        }
+
+    async def _world_clock(self, world_id: UUID) -> Tuple[int, int, Optional[str]]:
+        """(day, season index, season name), from the calendar snapshot when one is published."""
+        snapshot = WorldStateCache.get(world_id)
+        if snapshot is not None:
+            return snapshot.day, snapshot.season_index, snapshot.season_name
+
+        row = (await self.db.execute(select(World.day, World.season).where(World.id == world_id))).first()
+        if row is None:
+            raise ValueError(f"World with ID {world_id} not found")
+        return row.day, row.season, None
@@ -0,0 +1,87 @@
+# app/game_state/services/world/world_export_service.py
+
+import logging
+import time
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence
+from uuid import UUID
+
+from pydantic_core import to_json
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.game_state.repositories.world.world_export_repository import EXPORT_KINDS, WorldExportRepository
+
+# Rows fetched per cursor round trip, and emitted per response chunk
+EXPORT_CHUNK_SIZE = 1000
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def encode_ndjson(rows: Iterable[Dict[str, Any]], kind: Optional[str] = None) -> bytes:
+    """
+    One JSON document per line. With a kind, each row is wrapped as
+    {"kind": ..., "row": ...} so several kinds can share one stream.
+    """
+    if kind is None:
+        return b"".join(to_json(row) + b"\n" for row in rows)
+    return b"".join(to_json({"kind": kind, "row": row}) + b"\n" for row in rows)
+
+
+class WorldExportService:
+    """
+    Service for streaming a world's content as NDJSON.
+    Rows are read through server-side cursors and encoded chunk by chunk, so
+    an export never holds more than one chunk of rows in memory.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.repository = WorldExportRepository(db)
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @staticmethod
+    def resolve_kinds(kinds: Optional[Sequence[str]] = None) -> List[str]:
+        """Requested kinds in export order; None or empty means all. Raises ValueError for unknown kinds."""
+        if not kinds:
+            return list(EXPORT_KINDS)
+        unknown = set(kinds) - set(EXPORT_KINDS)
+        if unknown:
+            raise ValueError(f"Unknown export kinds: {', '.join(sorted(unknown))}. Expected: {', '.join(EXPORT_KINDS)}")
+        return [kind for kind in EXPORT_KINDS if kind in kinds]
+
+    async def world_exists(self, world_id: UUID) -> bool:
+        return await self.repository.find_world_row(world_id) is not None
+
+    async def stream_kind(self, world_id: UUID, kind: str, chunk_size: int = EXPORT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """NDJSON of one kind of world content, one bare row per line."""
+        async for rows in self.repository.stream_rows(kind, world_id, chunk_size):
+            yield encode_ndjson(rows)
+
+    async def stream_world(
+        self,
+        world_id: UUID,
+        kinds: Optional[Sequence[str]] = None,
+        chunk_size: int = EXPORT_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """
+        NDJSON of the world and the requested kinds of its content. The first
+        line is the world itself; every line is {"kind": ..., "row": ...}.
+        """
+        kinds = self.resolve_kinds(kinds)
+        started = time.perf_counter()
+
+        world = await self.repository.find_world_row(world_id)
+        if world is None:
+            return
+        yield encode_ndjson([world], kind="world")
+
+        counts = {}
+        for kind in kinds:
+            counts[kind] = 0
+            async for rows in self.repository.stream_rows(kind, world_id, chunk_size):
+                counts[kind] += len(rows)
+                yield encode_ndjson(rows, kind=kind)
+
+        self.logger.info(
+            f"[WorldExport] Exported world {world_id} in {time.perf_counter() - started:.2f}s: "
+            + ", ".join(f"{kind}={count}" for kind, count in counts.items())
+        )
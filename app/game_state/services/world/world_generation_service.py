@@ -0,0 +1,135 @@
+# app/game_state/services/world/world_generation_service.py
+
+import logging
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.schemas.world import WorldGenerationRequest, WorldGenerationResult
+from app.game_state.managers.world_generation_manager import (
+    GenerationBiome,
+    GenerationTier,
+    WorldGenerationManager,
+)
+from app.game_state.repositories.biome_repository import BiomeRepository
+from app.game_state.repositories.location.location_repository import LocationRepository
+from app.game_state.repositories.location.location_type_repository import LocationTypeRepository
+from app.game_state.repositories.resource_node_blueprint_repository import ResourceNodeBlueprintRepository
+from app.game_state.repositories.resource_node_repository import ResourceNodeRepository
+from app.game_state.repositories.settlement_repository import SettlementRepository
+from app.game_state.repositories.world_repository import WorldRepository
+
+
+class WorldGenerationService:
+    """
+    Service for procedurally generating a world.
+    Lookups (location types, biomes, blueprints) are loaded once, then the
+    generator's row batches are written as they arrive with chunked multi-row
+    INSERTs, so memory stays bounded by the batch size whatever the world size.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.world_repository = WorldRepository(db)
+        self.location_repository = LocationRepository(db)
+        self.location_type_repository = LocationTypeRepository(db)
+        self.biome_repository = BiomeRepository(db)
+        self.blueprint_repository = ResourceNodeBlueprintRepository(db)
+        self.settlement_repository = SettlementRepository(db)
+        self.node_repository = ResourceNodeRepository(db)
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def generate_world(self, world_id: UUID, request: WorldGenerationRequest) -> WorldGenerationResult:
+        """
+        Generate and persist a world's locations, settlements, travel links and resource nodes.
+
+        Does not commit. The request-scoped session (or the calling task) commits,
+        so a generation run either lands completely or not at all.
+
+        Raises:
+            ValueError: If the world or a tier's location type does not exist
+        """
+        started = time.perf_counter()
+
+        world = await self.world_repository.find_by_id(world_id)
+        if not world:
+            raise ValueError(f"World with ID {world_id} not found")
+
+        tiers: List[GenerationTier] = []
+        for tier in request.tiers:
+            location_type = await self.location_type_repository.get_by_code(tier.location_type_code)
+            if not location_type:
+                raise ValueError(f"Location type with code '{tier.location_type_code}' not found")
+            tiers.append(GenerationTier(location_type_id=location_type.id, count=tier.count))
+
+        biomes = await self._load_biomes(world.theme_id)
+        blueprints_by_biome: Dict[str, List[Any]] = {}
+        if request.nodes_per_location > 0 and biomes:
+            blueprints_by_biome = await self.blueprint_repository.find_grouped_by_biome_types([b.code for b in biomes])
+
+        self.logger.info(
+            f"[GenerateWorld] World {world_id}: seed {request.seed}, {len(tiers)} tiers, "
+            f"{len(biomes)} biomes, {sum(len(v) for v in blueprints_by_biome.values())} blueprints"
+        )
+
+        writers = {
+            "location_entities": self.location_repository.bulk_insert_rows,
+            "settlements": self.settlement_repository.bulk_insert_rows,
+            "travel_links": self.location_repository.bulk_insert_travel_links,
+            "resource_nodes": self.node_repository.bulk_insert_nodes,
+            "resource_node_resources": self.node_repository.bulk_insert_links,
+        }
+
+        batches = WorldGenerationManager.generate_batches(
+            world_id=world_id,
+            seed=request.seed,
+            tiers=tiers,
+            biomes=biomes,
+            theme_id=world.theme_id,
+            blueprints_by_biome=blueprints_by_biome,
+            settlement_chance=request.settlement_chance,
+            nodes_per_location=request.nodes_per_location,
+            batch_size=request.batch_size,
+            world_size_km=request.world_size_km,
+            noise_scale=request.noise_scale,
+        )
+
+        rows_by_table: Counter = Counter()
+        for table, rows in batches:
+            rows_by_table[table] += await writers[table](rows, request.chunk_size)
+
+        elapsed = time.perf_counter() - started
+        locations_created = rows_by_table["location_entities"]
+        locations_per_second = locations_created / elapsed if elapsed > 0 else 0.0
+
+        self.logger.info(
+            f"[GenerateWorld] World {world_id}: inserted {dict(rows_by_table)} "
+            f"in {elapsed:.2f}s ({locations_per_second:.0f} locations/s)"
+        )
+
+        return WorldGenerationResult(
+            world_id=world_id,
+            seed=request.seed,
+            rows_by_table=dict(rows_by_table),
+            locations_created=locations_created,
+            elapsed_seconds=round(elapsed, 4),
+            locations_per_second=round(locations_per_second, 1),
+        )
+
+    async def _load_biomes(self, theme_id: Optional[UUID]) -> List[GenerationBiome]:
+        """Biomes for the world's theme, falling back to every biome when none are tagged with it."""
+        biomes = await self.biome_repository.find_all(limit=10000)
+        themed = [b for b in biomes if theme_id and theme_id in (b.theme_ids or [])]
+
+        return [
+            GenerationBiome(
+                id=biome.id,
+                code=biome.biome_id,
+                danger_level_base=biome.danger_level_base,
+                movement_modifier=biome.base_movement_modifier,
+            )
+            for biome in (themed or biomes)
+        ]
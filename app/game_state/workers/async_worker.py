@@ -0,0 +1,309 @@
+# app/game_state/workers/async_worker.py
+"""
+Native asyncio job worker.
+
+Celery's gevent pool ran every async task through run_until_complete on a
+thread-global loop, one task at a time per worker, with asyncpg under gevent.
+This worker is one process with one event loop: it pops jobs from a Redis
+list and runs up to `concurrency` of them at once as asyncio tasks, sharing
+the process's engine and connection pool. The periodic game ticks are
+scheduled from the same loop.
+
+    python -m app.game_state.workers.async_worker --concurrency 16
+
+Jobs are registered with @async_job and enqueued with enqueue_job (sync
+code: API routes, Celery tasks) or enqueue_job_async. Job locks share their
+Redis keys with with_task_lock, so a tick never overlaps a Celery run of the
+same task.
+
+Scheduled ticks are coordinated through Redis, like Celery beat's persisted
+last_run_at: a tick is enqueued only once its interval has passed since the
+last one (across restarts and across every scheduling worker), and not while
+an earlier tick of the same job is still queued or running.
+"""
+import argparse
+import asyncio
+import importlib
+import json
+import logging
+import signal
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Set
+
+from app.core.config import get_settings
+from app.core.redis import create_async_task_lock, get_async_redis, redis_client
+
+logger = logging.getLogger(__name__)
+
+# Modules whose @async_job functions the worker serves (cf. the Celery app's imports)
+JOB_MODULES = (
+    "app.game_state.workers.world_worker",
+    "app.game_state.workers.resource_worker",
+    "app.game_state.workers.settlement_worker",
+    "app.game_state.workers.snapshot_worker",
+    "app.game_state.workers.outbox_worker",
+)
+
+# Seconds a BLPOP waits before checking for shutdown
+POLL_TIMEOUT = 1.0
+
+# Redis keys of the schedule: <prefix>:<job>:last_run expires when the next
+# tick is due; <prefix>:<job>:pending exists while a tick is queued or running
+SCHEDULE_KEY_PREFIX = "async_schedule"
+
+
+class AsyncJob(NamedTuple):
+    """A registered job: the coroutine function and the lock it runs under."""
+    func: Callable[..., Awaitable[Any]]
+    lock_name: Optional[str] = None
+    lock_timeout: int = 3600
+
+
+class ScheduledJob(NamedTuple):
+    """A job enqueued every `interval` seconds by the worker's schedule."""
+    job: str
+    interval: float
+    kwargs: Dict[str, Any] = {}
+
+
+# The periodic game ticks (previously the Celery beat schedule)
+SCHEDULE: List[ScheduledJob] = [
+    ScheduledJob("advance_game_day", 3660.0),
+    ScheduledJob("respawn_resource_nodes", 60.0),
+    # Domain events wait in the outbox until this relay moves them to the stream
+    ScheduledJob("relay_outbox", 1.0),
+]
+
+_JOBS: Dict[str, AsyncJob] = {}
+
+
+def async_job(name: str, lock_name: Optional[str] = None, lock_timeout: int = 3600):
+    """
+    Register a coroutine function as a job. With lock_name, the job holds the
+    task lock for its world_id (or for all worlds) and is skipped while
+    another run holds it. The function is returned unchanged.
+    """
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        _JOBS[name] = AsyncJob(func, lock_name, lock_timeout)
+        return func
+    return decorator
+
+
+def get_job(name: str) -> Optional[AsyncJob]:
+    return _JOBS.get(name)
+
+
+def encode_job(name: str, kwargs: Dict[str, Any], pending_key: Optional[str] = None) -> str:
+    message = {"id": str(uuid.uuid4()), "job": name, "kwargs": kwargs, "enqueued_at": time.time()}
+    if pending_key:
+        # Deleted by the worker once the job is done, whatever the outcome
+        message["pending_key"] = pending_key
+    return json.dumps(message, default=str)
+
+
+def enqueue_job(name: str, queue: Optional[str] = None, **kwargs: Any) -> None:
+    """Queue a job from sync code. Arguments must be JSON-serializable (UUIDs become strings)."""
+    redis_client.rpush(queue or get_settings().ASYNC_WORKER_QUEUE, encode_job(name, kwargs))
+
+
+async def enqueue_job_async(name: str, queue: Optional[str] = None, **kwargs: Any) -> None:
+    """Queue a job from a coroutine."""
+    await get_async_redis().rpush(queue or get_settings().ASYNC_WORKER_QUEUE, encode_job(name, kwargs))
+
+
+class AsyncJobWorker:
+    """
+    Pulls jobs off one queue and runs at most `concurrency` at a time. A job
+    is only popped once a slot is free, so jobs this process can't start yet
+    stay in Redis for other workers.
+    """
+
+    def __init__(
+        self,
+        redis,
+        queue: str,
+        concurrency: int,
+        schedule: Optional[List[ScheduledJob]] = None,
+        lock_factory: Callable[..., Any] = create_async_task_lock,
+    ):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.redis = redis
+        self.queue = queue
+        self.concurrency = concurrency
+        self.schedule = schedule or []
+        self.lock_factory = lock_factory
+        self._slots = asyncio.Semaphore(concurrency)
+        self._running: Set[asyncio.Task] = set()
+        self._stopping = asyncio.Event()
+        self.stats = {"completed": 0, "failed": 0, "skipped": 0, "unknown": 0}
+
+    @property
+    def running(self) -> int:
+        return len(self._running)
+
+    def stop(self) -> None:
+        """Stop taking jobs; run() returns once the running ones finish."""
+        self._stopping.set()
+
+    async def run(self, shutdown_grace: float = 30.0) -> None:
+        logger.info(f"Async worker consuming {self.queue} with concurrency {self.concurrency}")
+        schedulers = [asyncio.create_task(self._enqueue_every(entry)) for entry in self.schedule]
+        try:
+            await self._consume()
+        finally:
+            for scheduler in schedulers:
+                scheduler.cancel()
+            if self._running:
+                logger.info(f"Async worker waiting for {len(self._running)} running jobs")
+                done, pending = await asyncio.wait(set(self._running), timeout=shutdown_grace)
+                for task in pending:
+                    task.cancel()
+            logger.info(f"Async worker stopped: {self.stats}")
+
+    async def _consume(self) -> None:
+        while not self._stopping.is_set():
+            await self._slots.acquire()
+            try:
+                item = await self.redis.blpop([self.queue], timeout=POLL_TIMEOUT)
+            except Exception as e:
+                self._slots.release()
+                logger.error(f"Async worker could not read {self.queue}: {e}")
+                await asyncio.sleep(POLL_TIMEOUT)
+                continue
+            if item is None:
+                self._slots.release()
+                continue
+
+            task = asyncio.create_task(self._run_job(item[1]))
+            self._running.add(task)
+            task.add_done_callback(self._job_done)
+
+    def _job_done(self, task: asyncio.Task) -> None:
+        self._running.discard(task)
+        self._slots.release()
+
+    async def _run_job(self, raw: str) -> Optional[Any]:
+        try:
+            message = json.loads(raw)
+            name, kwargs, task_id = message["job"], message.get("kwargs") or {}, message.get("id")
+        except (ValueError, KeyError, TypeError):
+            self.stats["unknown"] += 1
+            logger.error(f"Malformed job dropped: {raw!r:.200}")
+            return None
+
+        try:
+            return await self._execute(name, kwargs, task_id)
+        finally:
+            if message.get("pending_key"):
+                try:
+                    await self.redis.delete(message["pending_key"])
+                except Exception as e:
+                    logger.warning(f"Task {task_id}: could not clear {message['pending_key']} - it expires on its own: {e}")
+
+    async def _execute(self, name: str, kwargs: Dict[str, Any], task_id: Optional[str]) -> Optional[Any]:
+        job = get_job(name)
+        if job is None:
+            self.stats["unknown"] += 1
+            logger.error(f"Task {task_id}: unknown job '{name}', dropped")
+            return None
+
+        lock = None
+        if job.lock_name:
+            lock = self.lock_factory(task_name=job.lock_name, resource_id=kwargs.get("world_id"), timeout=job.lock_timeout)
+            if not await lock.acquire():
+                self.stats["skipped"] += 1
+                logger.info(f"Task {task_id}: {name} already running for {kwargs.get('world_id') or 'ALL'}, skipped")
+                return None
+
+        started = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(job.func(**kwargs, task_id=task_id), timeout=job.lock_timeout)
+            self.stats["completed"] += 1
+            logger.info(f"Task {task_id}: {name} finished in {time.perf_counter() - started:.2f}s")
+            return result
+        except Exception as e:
+            self.stats["failed"] += 1
+            logger.exception(f"Task {task_id}: {name} failed after {time.perf_counter() - started:.2f}s: {e}")
+            return None
+        finally:
+            if lock is not None:
+                try:
+                    await lock.release()
+                except Exception:
+                    logger.warning(f"Task {task_id}: failed to release the {job.lock_name} lock - it may have expired")
+
+    async def _enqueue_every(self, entry: ScheduledJob) -> None:
+        while not self._stopping.is_set():
+            try:
+                wait = await self._enqueue_if_due(entry)
+            except Exception as e:
+                logger.error(f"Could not schedule {entry.job}: {e}")
+                wait = entry.interval
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=wait)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _enqueue_if_due(self, entry: ScheduledJob) -> float:
+        """Enqueue a tick of `entry` if one is due. Returns the seconds until the next check."""
+        last_run_key = f"{SCHEDULE_KEY_PREFIX}:{entry.job}:last_run"
+        pending_key = f"{SCHEDULE_KEY_PREFIX}:{entry.job}:pending"
+
+        # The key lives for one interval, so it can only be set once the previous tick is due again
+        if not await self.redis.set(last_run_key, time.time(), nx=True, px=max(1, int(entry.interval * 1000))):
+            remaining_ms = await self.redis.pttl(last_run_key)
+            return remaining_ms / 1000 if remaining_ms and remaining_ms > 0 else entry.interval
+
+        # Expires with the job's lock, so a tick lost with a crashed worker doesn't block the schedule for good
+        job = get_job(entry.job)
+        pending_ttl = job.lock_timeout if job else AsyncJob._field_defaults["lock_timeout"]
+        if not await self.redis.set(pending_key, time.time(), nx=True, ex=pending_ttl):
+            logger.info(f"Schedule: {entry.job} is still queued or running, tick skipped")
+            return entry.interval
+        try:
+            await self.redis.rpush(self.queue, encode_job(entry.job, entry.kwargs, pending_key=pending_key))
+        except Exception:
+            await self.redis.delete(pending_key)
+            raise
+        return entry.interval
+
+
+async def serve(concurrency: int, queue: str, schedule: bool, shutdown_grace: float) -> None:
+    from app.core.cache_invalidation import CacheInvalidationBus
+    from app.db.async_session import dispose_engine, init_engine
+
+    for module in JOB_MODULES:
+        importlib.import_module(module)
+    init_engine()
+    CacheInvalidationBus.start_listener()
+
+    worker = AsyncJobWorker(get_async_redis(), queue, concurrency, SCHEDULE if schedule else None)
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, worker.stop)
+        except NotImplementedError:  # Windows
+            pass
+    try:
+        await worker.run(shutdown_grace)
+    finally:
+        CacheInvalidationBus.stop()
+        await dispose_engine()
+
+
+def main() -> None:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Run game jobs on a native asyncio worker")
+    parser.add_argument("--concurrency", type=int, default=settings.ASYNC_WORKER_CONCURRENCY)
+    parser.add_argument("--queue", default=settings.ASYNC_WORKER_QUEUE)
+    parser.add_argument("--no-schedule", action="store_true", help="Don't enqueue the periodic game ticks")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    asyncio.run(serve(args.concurrency, args.queue, not args.no_schedule, settings.ASYNC_WORKER_SHUTDOWN_GRACE))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+# app/game_state/workers/outbox_worker.py
+"""
+Outbox relay and domain event consumers.
+
+relay_outbox is an async job the async worker schedules every
+OUTBOX_RELAY_INTERVAL seconds. It moves outbox rows to the domain event
+stream in batches: take a batch, XADD it in one pipeline, commit the delete.
+A failed XADD rolls the batch back into the outbox; a commit that fails after
+the XADD publishes the batch again, so delivery is at-least-once.
+
+Consumers read the stream through Redis consumer groups: every group sees
+every event, and the consumers of one group share them. Entries a consumer
+took but never acknowledged (it crashed, or its handler failed) are claimed
+again by the group after CLAIM_IDLE_MS.
+
+    python -m app.game_state.workers.outbox_worker --group analytics
+"""
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import socket
+import time
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from redis.exceptions import ResponseError
+
+from app.core.redis import get_async_redis
+from app.db.async_session import get_session_factory
+from app.game_state.managers.domain_event_manager import (
+    DOMAIN_EVENT_STREAM,
+    OUTBOX_BATCH_SIZE,
+    STREAM_MAX_LENGTH,
+    DomainEvent,
+    DomainEventManager,
+)
+from app.game_state.repositories.core.outbox_repository import OutboxRepository
+from app.game_state.workers.async_worker import async_job
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on batches per relay run so one run can't hold the lock indefinitely
+MAX_RELAY_BATCHES = 20
+
+# Stream entries a consumer handles per call
+CONSUMER_BATCH_SIZE = 100
+
+# Milliseconds a consumer blocks waiting for new entries
+CONSUMER_BLOCK_MS = 1000
+
+# Unacknowledged entries idle this long are claimed by another consumer of the group
+CLAIM_IDLE_MS = 60_000
+
+EventHandler = Callable[[List[DomainEvent]], Awaitable[None]]
+
+# Consumer group name -> handler of a batch of events
+CONSUMER_GROUPS: Dict[str, EventHandler] = {}
+
+
+def consumer_group(name: str):
+    """Register a coroutine function as the handler of a consumer group."""
+    def decorator(handler: EventHandler) -> EventHandler:
+        CONSUMER_GROUPS[name] = handler
+        return handler
+    return decorator
+
+
+@async_job("relay_outbox", lock_name="relay_outbox", lock_timeout=60)
+async def _relay_outbox_async(batch_size=OUTBOX_BATCH_SIZE, task_id=None) -> Dict[str, Any]:
+    """Move committed outbox events to the domain event stream, oldest first."""
+    started = time.perf_counter()
+    redis = get_async_redis()
+    relayed = 0
+    batches = 0
+
+    while batches < MAX_RELAY_BATCHES:
+        async with get_session_factory()() as session:
+            events = await OutboxRepository(session).take_batch(batch_size)
+            if not events:
+                break
+            pipeline = redis.pipeline(transaction=False)
+            for event in events:
+                pipeline.xadd(
+                    DOMAIN_EVENT_STREAM, DomainEventManager.to_stream_fields(event),
+                    maxlen=STREAM_MAX_LENGTH, approximate=True,
+                )
+            await pipeline.execute()
+            await session.commit()
+        relayed += len(events)
+        batches += 1
+        if len(events) < batch_size:
+            break
+
+    elapsed = time.perf_counter() - started
+    if relayed:
+        logger.info(f"Task {task_id}: Relayed {relayed} domain events in {batches} batches ({elapsed:.2f}s)")
+    return {"success": True, "relayed": relayed, "batches": batches, "elapsed_seconds": round(elapsed, 4)}
+
+
+class DomainEventConsumer:
+    """One consumer of a consumer group on the domain event stream."""
+
+    def __init__(
+        self,
+        redis,
+        group: str,
+        handler: EventHandler,
+        consumer: Optional[str] = None,
+        batch_size: int = CONSUMER_BATCH_SIZE,
+        block_ms: int = CONSUMER_BLOCK_MS,
+        claim_idle_ms: int = CLAIM_IDLE_MS,
+    ):
+        self.redis = redis
+        self.group = group
+        self.handler = handler
+        self.consumer = consumer or f"{socket.gethostname()}-{os.getpid()}"
+        self.batch_size = batch_size
+        self.block_ms = block_ms
+        self.claim_idle_ms = claim_idle_ms
+        self._stopping = asyncio.Event()
+        self.stats = {"handled": 0, "batches": 0, "failed_batches": 0}
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+    async def ensure_group(self) -> None:
+        """Create the group at the start of the stream unless it exists."""
+        try:
+            await self.redis.xgroup_create(DOMAIN_EVENT_STREAM, self.group, id="0", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def run_once(self) -> int:
+        """Handle and acknowledge one batch. Returns the number of entries acknowledged."""
+        # Entries left unacknowledged by a failed or crashed consumer come first
+        claimed = await self.redis.xautoclaim(
+            DOMAIN_EVENT_STREAM, self.group, self.consumer,
+            min_idle_time=self.claim_idle_ms, start_id="0-0", count=self.batch_size,
+        )
+        entries = claimed[1] if claimed else []
+        if not entries:
+            response = await self.redis.xreadgroup(
+                self.group, self.consumer, {DOMAIN_EVENT_STREAM: ">"},
+                count=self.batch_size, block=self.block_ms,
+            )
+            entries = response[0][1] if response else []
+        if not entries:
+            return 0
+
+        # Entries trimmed off the stream while pending come back without fields
+        events = [DomainEventManager.from_stream_fields(fields) for _, fields in entries if fields]
+        if events:
+            await self.handler(events)
+        await self.redis.xack(DOMAIN_EVENT_STREAM, self.group, *[entry_id for entry_id, _ in entries])
+        self.stats["handled"] += len(events)
+        self.stats["batches"] += 1
+        return len(entries)
+
+    async def run(self) -> None:
+        await self.ensure_group()
+        logger.info(f"Consumer {self.consumer} of group '{self.group}' reading {DOMAIN_EVENT_STREAM}")
+        while not self._stopping.is_set():
+            try:
+                await self.run_once()
+            except Exception as e:
+                # Unacknowledged entries are claimed again after claim_idle_ms
+                self.stats["failed_batches"] += 1
+                logger.exception(f"Consumer group '{self.group}' failed a batch: {e}")
+                await asyncio.sleep(1.0)
+        logger.info(f"Consumer {self.consumer} of group '{self.group}' stopped: {self.stats}")
+
+
+@consumer_group("analytics")
+async def count_domain_events(events: List[DomainEvent]) -> None:
+    """
+    Daily event counts per type, in the hashes domain_events:counts:<date>.
+    A redelivered batch is counted again; the counts are approximate.
+    """
+    counts = Counter((event.occurred_at.date().isoformat(), event.event_type) for event in events)
+    pipeline = get_async_redis().pipeline(transaction=False)
+    for (day, event_type), count in counts.items():
+        pipeline.hincrby(f"{DOMAIN_EVENT_STREAM}:counts:{day}", event_type, count)
+    await pipeline.execute()
+
+
+async def serve(group: str, consumer: Optional[str]) -> None:
+    worker = DomainEventConsumer(get_async_redis(), group, CONSUMER_GROUPS[group], consumer)
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, worker.stop)
+        except NotImplementedError:  # Windows
+            pass
+    await worker.run()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Consume domain events with a Redis consumer group")
+    parser.add_argument("--group", required=True, choices=sorted(CONSUMER_GROUPS))
+    parser.add_argument("--consumer", help="Consumer name within the group (default: host-pid)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    asyncio.run(serve(args.group, args.consumer))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# app/game_state/workers/resource_worker.py
+import logging
+import time
+from typing import Dict, Any
+
+from app.core.celery_app import app
+from app.db.async_session import get_session_factory
+from app.game_state.managers.resource_node_lifecycle_manager import RESPAWN_BATCH_SIZE
+from app.game_state.services.resource.resource_node_lifecycle_service import ResourceNodeLifecycleService
+from app.game_state.workers.async_worker import async_job
+from app.game_state.workers.worker_utils import with_task_lock, run_async_task
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Upper bound on batches per run so one run can't hold the lock indefinitely
+MAX_RESPAWN_BATCHES = 100
+
+@app.task
+@with_task_lock(task_name="respawn_resource_nodes", timeout=600)
+def respawn_resource_nodes(batch_size=RESPAWN_BATCH_SIZE, task_id=None):
+    """Task entry point - respawns every resource node whose respawn time has passed"""
+    return run_async_task(_respawn_resource_nodes_async, batch_size, task_id)
+
+@async_job("respawn_resource_nodes", lock_name="respawn_resource_nodes", lock_timeout=600)
+async def _respawn_resource_nodes_async(batch_size=RESPAWN_BATCH_SIZE, task_id=None) -> Dict[str, Any]:
+    """
+    Drain the due part of the respawn queue in batches, committing after each
+    batch so row locks stay short and a failure only loses the current batch.
+    """
+    started = time.perf_counter()
+    session = get_session_factory()()
+
+    try:
+        lifecycle = ResourceNodeLifecycleService(session)
+        respawned = 0
+        batches = 0
+
+        while batches < MAX_RESPAWN_BATCHES:
+            count = await lifecycle.respawn_due(batch_size=batch_size)
+            await session.commit()
+            if count == 0:
+                break
+            respawned += count
+            batches += 1
+
+        elapsed = time.perf_counter() - started
+        if respawned:
+            logger.info(f"Task {task_id}: Respawned {respawned} resource nodes in {batches} batches ({elapsed:.2f}s)")
+        return {"success": True, "respawned": respawned, "batches": batches, "elapsed_seconds": round(elapsed, 4)}
+    finally:
+        await session.close()
@@ -1,19 +1,33 @@
 # app/game_state/workers/settlement_worker.py
+import asyncio
 import logging
-from typing import Optional, Dict, Any
+import time
+from typing import Optional, Dict, Any, List, Tuple
 import uuid
 from uuid import UUID
 
 from app.core.celery_app import app
-from app.db.async_session import get_db_session
+from app.db.async_session import get_read_session_factory, get_session_factory
+from app.game_state.managers.settlement_expansion_manager import (
+    EXPANSION_CHUNK_SIZE,
+    BlueprintProfile,
+    SettlementExpansionManager,
+)
+from app.game_state.repositories.building_blueprint_repository import BuildingBlueprintRepository
+from app.game_state.repositories.character_repository import CharacterRepository
+from app.game_state.repositories.settlement_repository import SettlementRepository
 from app.game_state.services.settlement_service import SettlementService
 #from app.api.schemas.settlement import SettlementBase
 from app.api.schemas.settlement import SettlementRead
+from app.game_state.workers.async_worker import async_job
 from app.game_state.workers.worker_utils import with_task_lock, run_async_task
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Chunks of the expansion task evaluated at once, each on its own pooled session
+EXPANSION_SESSIONS = 4
+
 @app.task
 @with_task_lock(task_name="expand_settlement", timeout=20)
 def expand_settlement(world_id=None, task_id=None):
@@ -28,7 +42,7 @@ async def expand_settlement_async(settlement_id: UUID) -> SettlementRead:
     Asynchronous function to expand a settlement.
     """
     # Get a database session
-    async with get_db_session() as session:
+    async with get_session_factory()() as session:
         # Create an instance of SettlementService
         settlement_service = SettlementService(db=session)
         
@@ -37,109 +51,117 @@ async def expand_settlement_async(settlement_id: UUID) -> SettlementRead:
         
         return result
     
-async def _expand_settlement_async(world_id: Optional[uuid], task_id: str) -> Dict[str, Any]:
+@async_job("expand_settlement", lock_name="expand_settlement", lock_timeout=20)
+async def _expand_settlement_async(world_id: Optional[uuid.UUID] = None, task_id: str = None) -> Dict[str, Any]:
     """
-    Asynchronous function to expand a settlement based on leader traits.
-    
-    This worker:
-    1. Gets settlements in the world
-    2. For each settlement with a leader, evaluates building options
-    3. Selects and constructs the highest-scoring building
-    
+    Pick the best building for every settlement with a leader, in one world or all.
+
+    Settlements are streamed in chunks of EXPANSION_CHUNK_SIZE. Each chunk loads
+    its leaders' traits in one query on its own read session and is ranked against
+    blueprint profiles loaded once per run; up to EXPANSION_SESSIONS chunks are in
+    flight at a time. Construction isn't implemented yet, so the decisions are
+    reported in the result rather than written.
+
     Args:
         world_id: Optional world ID to filter settlements
         task_id: Task identifier for logging
-        
+
     Returns:
-        Dict containing results of the settlement expansion
+        Dict containing results of the settlement expansion, with per-settlement timings
     """
-    print(f"Task {task_id}: Starting expansion for world: {world_id or 'ALL WORLDS'}")
-    
-    # Get a database session
-    async with get_db_session() as session:
-        # Create service instances
-        settlement_service = SettlementService(db=session)
-        from app.game_state.services.building.building_evaluation_service import BuildingEvaluationService
-        building_evaluation_service = BuildingEvaluationService(db=session)
-        #from app.game_state.services.building_instance_service import BuildingInstanceService
-        #building_service = BuildingInstanceService(db=session)
-        
-        # Get settlements to process
-        #settlements = []
-        if world_id:
-            # Get settlements in specific world
-            settlements = await settlement_service.get_settlements_by_world(world_id)
+    started = time.perf_counter()
+    logger.info(f"Task {task_id}: Starting expansion for world: {world_id or 'ALL WORLDS'}")
+    session_factory = get_read_session_factory()
+    world_id = UUID(str(world_id)) if world_id else None
+
+    async with session_factory() as session:
+        profiles = SettlementExpansionManager.profile_blueprints(
+            await BuildingBlueprintRepository(session).find_metadata_rows()
+        )
+
+    slots = asyncio.Semaphore(EXPANSION_SESSIONS)
+    chunks: List[asyncio.Task] = []
+
+    def release_slot(_task):
+        slots.release()
+
+    try:
+        async with session_factory() as cursor:
+            settlement_repo = SettlementRepository(cursor)
+            after_id = None
+            while True:
+                rows = await settlement_repo.find_expansion_chunk(world_id, after_id, EXPANSION_CHUNK_SIZE)
+                if not rows:
+                    break
+                after_id = rows[-1][0]
+                # Waiting for a free session here keeps at most EXPANSION_SESSIONS chunks in memory
+                await slots.acquire()
+                chunk = asyncio.create_task(_evaluate_settlement_chunk(session_factory, rows, profiles, task_id))
+                chunk.add_done_callback(release_slot)
+                chunks.append(chunk)
+                if len(rows) < EXPANSION_CHUNK_SIZE:
+                    break
+    except BaseException:
+        for chunk in chunks:
+            chunk.cancel()
+        raise
+
+    results = [result for chunk_results in await asyncio.gather(*chunks) for result in chunk_results]
+    elapsed = time.perf_counter() - started
+    logger.info(f"Task {task_id}: Evaluated {len(results)} settlements in {len(chunks)} chunks ({elapsed:.2f}s)")
+
+    return {
+        "success": True,
+        "processed_settlements": len(results),
+        "pending_construction": len([r for r in results if r.get("action") == "identified"]),
+        "skipped_settlements": len([r for r in results if r.get("action") == "skipped"]),
+        "error_settlements": len([r for r in results if r.get("action") == "error"]),
+        "chunks": len(chunks),
+        "blueprints": len(profiles),
+        "elapsed_seconds": round(elapsed, 4),
+        "settlement_timings": SettlementExpansionManager.summarize_timings([r["elapsed_ms"] for r in results]),
+        "results": results
+    }
+
+async def _evaluate_settlement_chunk(
+    session_factory,
+    rows: List[Tuple[UUID, str, Optional[UUID]]],
+    profiles: List[BlueprintProfile],
+    task_id: str
+) -> List[Dict[str, Any]]:
+    """Rank blueprints for one chunk of (id, name, leader_id) settlement rows."""
+    try:
+        async with session_factory() as session:
+            traits = await CharacterRepository(session).find_traits_by_ids(
+                [leader_id for _, _, leader_id in rows if leader_id]
+            )
+    except Exception as e:
+        logger.error(f"Task {task_id}: Could not load leaders for a chunk of {len(rows)} settlements: {e}")
+        return [
+            {"settlement_id": str(settlement_id), "name": name, "action": "error", "error": str(e), "elapsed_ms": 0.0}
+            for settlement_id, name, _ in rows
+        ]
+
+    results = []
+    for settlement_id, name, leader_id in rows:
+        started = time.perf_counter()
+        result = {"settlement_id": str(settlement_id), "name": name}
+        if not leader_id:
+            result.update(action="skipped", reason="No leader assigned")
         else:
-            # Get all settlements
-            settlements = await settlement_service.get_all_settlements()
-            
-        print(f"Task {task_id}: Found {len(settlements)} settlements to process")
-        
-        # Process each settlement
-        results = []
-        for settlement in settlements:
-            try:
-                settlement_id = settlement.entity_id
-                print(f"Task {task_id}: Processing settlement {settlement.name} (ID: {settlement_id})")
-                
-                # Skip settlements without a leader
-                if not settlement.leader_id:
-                    print(f"Task {task_id}: Settlement {settlement.name} has no leader, skipping")
-                    results.append({
-                        "settlement_id": str(settlement_id),
-                        "name": settlement.name,
-                        "action": "skipped",
-                        "reason": "No leader assigned"
-                    })
-                    continue
-                
-                # Get building recommendations based on leader traits
-                recommendations = await building_evaluation_service.get_recommended_building_ids(settlement_id)
-                
-                if not recommendations:
-                    print(f"Task {task_id}: No recommended buildings for settlement {settlement.name}")
-                    results.append({
-                        "settlement_id": str(settlement_id),
-                        "name": settlement.name,
-                        "action": "skipped",
-                        "reason": "No suitable buildings available"
-                    })
-                    continue
-                
-                # Select highest scored building
+            recommendations = SettlementExpansionManager.rank_blueprints(profiles, traits.get(leader_id, []))
+            if not recommendations:
+                result.update(action="skipped", reason="No suitable buildings available")
+            else:
+                # TODO: Check if the settlement can afford the building and construct it
+                # once the resource management and construction systems are completed
                 top_blueprint_id, score = recommendations[0]
-                
-                print(f"Task {task_id}: Selected building blueprint {top_blueprint_id} with score {score}")
-                
-                # TODO: Check if settlement can afford this building
-                # This would be added when the resource management system is completed
-                
-                # TODO: Create a new building instance
-                # This would be added when the building construction system is completed
-                
-                results.append({
-                    "settlement_id": str(settlement_id),
-                    "name": settlement.name,
-                    "action": "identified",
-                    "building_blueprint_id": str(top_blueprint_id),
-                    "score": score,
-                    "status": "Identified optimal building, but construction not yet implemented"
-                })
-                
-            except Exception as e:
-                print(f"Task {task_id}: Error processing settlement {settlement.name if settlement else 'Unknown'}: {e}")
-                results.append({
-                    "settlement_id": str(settlement.entity_id) if settlement else "unknown",
-                    "name": settlement.name if settlement else "Unknown",
-                    "action": "error",
-                    "error": str(e)
-                })
-        
-        return {
-            "success": True,
-            "processed_settlements": len(settlements),
-            "pending_construction": len([r for r in results if r.get("action") == "identified"]),
-            "skipped_settlements": len([r for r in results if r.get("action") == "skipped"]),
-            "error_settlements": len([r for r in results if r.get("action") == "error"]),
-            "results": results
-        }
\ No newline at end of file
+                result.update(
+                    action="identified",
+                    building_blueprint_id=str(top_blueprint_id),
+                    score=score,
+                    status="Identified optimal building, but construction not yet implemented"
+                )
+        result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 3)
+        results.append(result)
+    return results
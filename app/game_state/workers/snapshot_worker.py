@@ -0,0 +1,63 @@
+# app/game_state/workers/snapshot_worker.py
+import logging
+import os
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from app.core.celery_app import app
+from app.core.config import get_settings
+from app.db.async_session import get_session_factory
+from app.game_state.services.world.world_snapshot_service import WorldSnapshotService
+from app.game_state.workers.async_worker import async_job
+from app.game_state.workers.worker_utils import run_async_task
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+@app.task
+def export_world_snapshot(world_id: str, path: str, codec: Optional[str] = None, task_id=None):
+    """Task entry point - writes a snapshot of a world to `path` (relative paths go under SNAPSHOT_DIR)"""
+    return run_async_task(_export_world_snapshot_async, world_id, path, codec, task_id)
+
+@app.task
+def restore_world_snapshot(path: str, name: Optional[str] = None, remap_ids: bool = True, task_id=None):
+    """Task entry point - restores a world snapshot, by default as a clone with fresh ids"""
+    return run_async_task(_restore_world_snapshot_async, path, name, remap_ids, task_id)
+
+@async_job("export_world_snapshot")
+async def _export_world_snapshot_async(world_id: str, path: str, codec: Optional[str] = None, task_id=None) -> Dict[str, Any]:
+    path = get_settings().snapshot_path(path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    session = get_session_factory()()
+    partial = f"{path}.partial"
+    try:
+        # Written under a temporary name so a failed export never leaves a truncated snapshot behind
+        with open(partial, "wb") as fileobj:
+            result = await WorldSnapshotService(session).export_world(UUID(world_id), fileobj, codec=codec)
+        os.replace(partial, path)
+        logger.info(f"Task {task_id}: Snapshot of world {world_id} written to {path}")
+        return {"success": True, "path": path, **result.to_dict()}
+    except Exception as e:
+        logger.exception(f"Task {task_id}: Snapshot of world {world_id} failed: {e}")
+        if os.path.exists(partial):
+            os.remove(partial)
+        return {"success": False, "error": str(e)}
+    finally:
+        await session.close()
+
+@async_job("restore_world_snapshot")
+async def _restore_world_snapshot_async(path: str, name: Optional[str] = None, remap_ids: bool = True, task_id=None) -> Dict[str, Any]:
+    path = get_settings().snapshot_path(path)
+    session = get_session_factory()()
+    try:
+        with open(path, "rb") as fileobj:
+            result = await WorldSnapshotService(session).restore_world(fileobj, remap_ids=remap_ids, name=name)
+        await session.commit()
+        logger.info(f"Task {task_id}: Restored {path} as world {result.world_id}")
+        return {"success": True, "path": path, **result.to_dict()}
+    except Exception as e:
+        await session.rollback()
+        logger.exception(f"Task {task_id}: Restore of {path} failed: {e}")
+        return {"success": False, "error": str(e)}
+    finally:
+        await session.close()
@@ -3,8 +3,12 @@ import logging
 from typing import Dict, Any
 
 from app.core.celery_app import app
-from app.db.async_session import get_session
+from app.db.async_session import get_session_factory
 from app.game_state.services.core.world_service import WorldService
+from app.game_state.services.economy.market_simulation_service import MarketSimulationService
+from app.game_state.services.world.calendar_service import CalendarService
+from app.game_state.services.world.wildlife_service import WildlifeService
+from app.game_state.workers.async_worker import async_job
 from app.game_state.workers.worker_utils import with_task_lock, run_async_task
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -19,15 +23,15 @@ def advance_game_day(world_id=None, task_id=None):
     # Run the async implementation using the utility function
     return run_async_task(_advance_game_day_async, world_id, task_id)
 
+@async_job("advance_game_day", lock_name="advance_game_day", lock_timeout=3660)
 async def _advance_game_day_async(world_id=None, task_id=None) -> Dict[str, Any]:
     """Async implementation of the task"""
     # Log that we're starting
     print(f"Task {task_id}: Processing advance game day for world: {world_id or 'ALL'}")
     print(f"Task {task_id}: Creating fresh DB session...")
     
-    # Get a fresh session for this specific task execution
-    # This creates a new session bound to the current event loop
-    session = await get_session()
+    # Session on the process's shared engine
+    session = get_session_factory()()
     
     try:
         print(f"Task {task_id}: DB session {session} acquired. Calling WorldService...")
@@ -40,12 +44,16 @@ async def _advance_game_day_async(world_id=None, task_id=None) -> Dict[str, Any]
             print(f"Task {task_id}: Advancing world {world_id}...")
             result = await world_service.advance_game_day(world_id)
             if result:
+                calendar = await CalendarService(session).resolve_worlds([result.id])
+                systems = await _run_daily_systems(session, result.id, calendar.get(result.id), task_id)
+                await session.commit()
                 return {
                     "success": True, 
                     "results": [{
                         "world_id": result.id, 
                         "day": result.day, 
-                        "success": True
+                        "success": True,
+                        **systems
                     }]
                 }
             else:
@@ -59,20 +67,46 @@ async def _advance_game_day_async(world_id=None, task_id=None) -> Dict[str, Any]
             print(f"Task {task_id}: No worlds found to advance.")
             return {"success": False, "error": "No worlds found to advance."}
         
-        results = []
+        advanced = []
         for world_id in worlds:
             print(f"Task {task_id}: Advancing world {world_id}...")
             updated_world = await world_service.advance_game_day(world_id=world_id)
             if updated_world:
-                results.append({
-                    "world_id": updated_world.id,
-                    "day": updated_world.day,
-                    "success": True
-                })
+                advanced.append(updated_world)
+
+        # Resolve every advanced world's season and celestial events in one pass
+        calendar = await CalendarService(session).resolve_worlds([world.id for world in advanced])
+
+        results = []
+        for updated_world in advanced:
+            systems = await _run_daily_systems(session, updated_world.id, calendar.get(updated_world.id), task_id)
+            await session.commit()
+            results.append({
+                "world_id": updated_world.id,
+                "day": updated_world.day,
+                "success": True,
+                **systems
+            })
         
         print(f"Task {task_id}: All worlds advanced. Task finished.")
         return {"success": True, "results": results}
     finally:
         # Ensure the session is properly closed
         await session.close()
-        print(f"Task {task_id}: DB session closed")
\ No newline at end of file
+        print(f"Task {task_id}: DB session closed")
+
+async def _run_daily_systems(session, world_id, snapshot=None, task_id=None) -> Dict[str, Any]:
+    """
+    Run the once-a-day simulation steps for a world inside the tick's transaction.
+    The steps read the world's calendar from the snapshot published to WorldStateCache.
+    """
+    print(f"Task {task_id}: Running daily systems for world {world_id}...")
+    market = await MarketSimulationService(session).run_market_tick(world_id)
+    wildlife = await WildlifeService(session).run_wildlife_tick(world_id)
+    calendar = {
+        "season": snapshot.season_name,
+        "day_of_season": snapshot.day_of_season,
+        "year": snapshot.year,
+        "celestial_events": list(snapshot.celestial_events),
+    } if snapshot else None
+    return {"calendar": calendar, "market": market, "wildlife": wildlife}
@@ -72,8 +72,7 @@ def start_celery_worker():
         "-A", celery_app_path,    
         "worker",
         "--loglevel=INFO",
-        "-P", "gevent",
-        "--concurrency=1"
+        "-P", "prefork"
     ]
     logging.info(f"Celery Worker command: {' '.join(cmd)}")
     try:
@@ -91,6 +90,21 @@ def start_celery_worker():
         logging.error(f"An unexpected error occurred starting the Celery worker: {e}")
         sys.exit(1)
 
+def start_async_worker():
+    """Starts the asyncio job worker, which also schedules the periodic game ticks."""
+    logging.info("Starting async job worker...")
+    cmd = [sys.executable, "-m", "app.game_state.workers.async_worker"]
+    logging.info(f"Async worker command: {' '.join(cmd)}")
+    try:
+        subprocess.run(cmd, check=True, cwd=PROJECT_ROOT)
+    except subprocess.CalledProcessError as e:
+        logging.error(f"Async worker process failed with exit code {e.returncode}.")
+        logging.error("Check if Redis and the database are running and accessible.")
+        sys.exit(e.returncode)
+    except Exception as e:
+        logging.error(f"An unexpected error occurred starting the async worker: {e}")
+        sys.exit(1)
+
 def start_uvicorn():
     logging.info("Starting Uvicorn server…")
     uvicorn.run(
@@ -160,7 +174,8 @@ def main():
     logging.info("Initializing processes...")
     process_targets = {
         "Celery_Beat": start_celery_beat,
-        "Celery_Worker": start_celery_worker
+        "Celery_Worker": start_celery_worker,
+        "Async_Worker": start_async_worker
     }
 
     global child_processes
@@ -5,13 +5,17 @@ Imports ALL location subtypes and provides detailed analysis
 """
 
 import asyncio
-import httpx
 import json
+import os
 from typing import List, Dict, Any, Optional
 from collections import defaultdict, Counter
 import sys
 from datetime import datetime
 
+# Shared seed client lives in the repo's utils directory
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "utils"))
+from seed_client import SeedClient
+
 # Configuration
 API_BASE_URL = "http://localhost:8000/api/v1"
 TIMEOUT = 60.0  # Increased for large imports
@@ -56,12 +60,16 @@ class ComprehensiveLocationSubtypeManager:
         self.import_stats = {}
 
     async def __aenter__(self):
-        self.client = httpx.AsyncClient(timeout=TIMEOUT)
+        # Pooled keep-alive client with retries; the bulk import POST is only
+        # resent if the connection failed before it was sent
+        self.client = SeedClient(timeout=TIMEOUT)
+        await self.client.__aenter__()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if self.client:
-            await self.client.aclose()
+            print(f"\n📈 {self.client.stats.report()}")
+            await self.client.__aexit__(exc_type, exc_val, exc_tb)
 
     def print_header(self, title: str, emoji: str = "🔥"):
         """Print a formatted header"""
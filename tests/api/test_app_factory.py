@@ -0,0 +1,70 @@
+import subprocess
+import sys
+
+import pytest
+
+from app.api.app_factory import ROUTER_GROUPS, ROUTER_SPECS, create_app, select_router_specs
+from app.core.config import Settings
+
+
+def _paths(app):
+    return set(app.openapi()["paths"])
+
+
+class TestAppFactory:
+    """Test suite for the FastAPI application factory."""
+
+    def test_router_groups_cover_every_router_once(self):
+        """Test that each router belongs to exactly one group and all are selected by default."""
+        modules = [spec.module for spec in ROUTER_SPECS]
+        assert len(modules) == len(set(modules))
+        assert sum(len(specs) for specs in ROUTER_GROUPS.values()) == len(ROUTER_SPECS)
+        assert select_router_specs(None) == ROUTER_SPECS
+
+    def test_selected_groups_keep_mount_order(self):
+        """Test that a subset keeps the global mount order of its routers."""
+        specs = select_router_specs(["economy", "world"])
+        assert [spec for spec in ROUTER_SPECS if spec.group in {"economy", "world"}] == specs
+
+    def test_unknown_group_is_rejected(self):
+        """Test that a misspelt group fails loudly instead of serving nothing."""
+        with pytest.raises(ValueError):
+            select_router_specs(["wrold"])
+
+    def test_create_app_mounts_only_selected_groups(self):
+        """Test that create_app mounts the configured groups and always serves /status."""
+        settings = Settings(API_ROUTER_GROUPS="economy", API_SWAGGER_DARK=False)
+        app = create_app(settings)
+
+        paths = _paths(app)
+        assert "/status" in paths
+        assert any(path.startswith("/api/v1/pricing") for path in paths)
+        assert not any(path.startswith("/api/v1/worlds") for path in paths)
+        assert app.state.router_groups == ["economy"]
+
+    def test_worker_modules_do_not_import_web_stack(self):
+        """Test that Celery task modules import without FastAPI or the routers."""
+        code = (
+            "import sys, importlib\n"
+            "from app.core.celery_app import app\n"
+            "for module in app.conf.imports: importlib.import_module(module)\n"
+            "web = [m for m in sys.modules if m.split('.')[0] in ('fastapi', 'starlette') or m.startswith('app.api.routes')]\n"
+            "print(','.join(sorted(web)))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == ""
+
+    def test_compression_settings(self):
+        """Test that gzip is installed by default, brotli falls back to it, and typos are rejected."""
+        from fastapi.middleware.gzip import GZipMiddleware
+
+        for method in ("gzip", "br"):
+            app = create_app(Settings(API_ROUTER_GROUPS="economy", API_SWAGGER_DARK=False, API_COMPRESSION=method))
+            middleware = [m.cls for m in app.user_middleware]
+            assert any(cls is GZipMiddleware or cls.__name__ == "BrotliMiddleware" for cls in middleware)
+
+        app = create_app(Settings(API_ROUTER_GROUPS="economy", API_SWAGGER_DARK=False, API_COMPRESSION=""))
+        assert GZipMiddleware not in [m.cls for m in app.user_middleware]
+        with pytest.raises(ValueError):
+            create_app(Settings(API_ROUTER_GROUPS="economy", API_COMPRESSION="zip"))
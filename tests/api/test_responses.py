@@ -0,0 +1,44 @@
+import json
+from typing import List, Optional
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from app.api.responses import dump_json, model_response
+
+
+class Item(BaseModel):
+    id: int
+    name: Optional[str] = None
+
+
+class DetailedItem(Item):
+    secret: str = "internal"
+
+
+class TestModelResponse:
+    """Test suite for serializing pre-validated models."""
+
+    def test_matches_response_model_output(self):
+        """Test that model_response produces the same body as FastAPI's response_model path."""
+        items = [Item(id=i, name=f"item {i}") for i in range(3)]
+        app = FastAPI()
+        app.get("/default", response_model=List[Item])(lambda: items)
+        app.get("/fast", response_model=List[Item])(lambda: model_response(items, List[Item]))
+
+        client = TestClient(app)
+        fast = client.get("/fast")
+        assert fast.headers["content-type"] == "application/json"
+        assert fast.json() == client.get("/default").json()
+
+    def test_only_declared_fields_are_written(self):
+        """Test that subclass fields are filtered out like response_model does."""
+        body = json.loads(dump_json([DetailedItem(id=1)], List[Item]))
+        assert body == [{"id": 1, "name": None}]
+
+    def test_status_code_and_headers(self):
+        """Test that status code and headers are passed through."""
+        response = model_response(Item(id=1), Item, status_code=201, headers={"X-Total": "1"})
+        assert response.status_code == 201
+        assert response.headers["x-total"] == "1"
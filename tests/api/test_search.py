@@ -0,0 +1,90 @@
+import asyncio
+import uuid
+
+import pytest
+from sqlalchemy.dialects.postgresql import asyncpg
+
+from app.api.app_factory import create_app
+from app.core.config import Settings
+from app.game_state.repositories.base_repository import escape_like
+from app.game_state.repositories.core.search_repository import SEARCH_KINDS, SearchRepository
+from app.game_state.services.core.search_service import SearchService
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=asyncpg.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+class FakeSession:
+    """Async-context session that only records being opened and closed."""
+
+    def __init__(self, log):
+        self.log = log
+
+    async def __aenter__(self):
+        self.log.append("open")
+        return self
+
+    async def __aexit__(self, *exc):
+        self.log.append("close")
+
+
+class TestSearch:
+    """Test suite for trigram name search."""
+
+    def test_statement_uses_indexable_predicates_and_ranks(self):
+        """Test that the query filters with ILIKE / <% (GIN-indexable) and orders by similarity."""
+        sql = _sql(SearchRepository.search_statement("characters", "Aldr", 5))
+
+        assert "characters.name ILIKE '%Aldr%'" in sql
+        assert "<% characters.name" in sql
+        assert "ORDER BY word_similarity(" in sql and "LIMIT 5" in sql
+
+    def test_world_filter_only_applies_to_world_content(self):
+        """Test that world_id narrows characters but is ignored for shared blueprints."""
+        world_id = uuid.uuid4()
+        assert "world_id" in _sql(SearchRepository.search_statement("characters", "abc", 5, world_id))
+        assert "world_id" not in _sql(SearchRepository.search_statement("building_blueprints", "abc", 5, world_id))
+        assert "SELECT resources.id, resources.name" in _sql(SearchRepository.search_statement("resources", "abc", 5))
+
+    def test_user_wildcards_match_literally(self):
+        """Test that % and _ in a query are escaped rather than acting as wildcards."""
+        assert escape_like("100%_a\\b") == "100\\%\\_a\\\\b"
+
+    def test_kinds_and_query_validation(self):
+        """Test that kinds keep registry order, unknown kinds raise and short queries are refused."""
+        assert SearchService.resolve_kinds(None) == list(SEARCH_KINDS)
+        assert SearchService.resolve_kinds(["resources", "characters"]) == ["characters", "resources"]
+        with pytest.raises(ValueError):
+            SearchService.resolve_kinds(["wizards"])
+        with pytest.raises(ValueError):
+            SearchRepository.search_statement("wizards", "abc", 5)
+        assert SearchService.normalize_query("  old   mill ") == "old mill"
+        with pytest.raises(ValueError):
+            SearchService.normalize_query(" ab ")
+
+    async def test_search_kinds_runs_each_kind_on_its_own_session(self, monkeypatch):
+        """Test that kinds are searched concurrently, bounded, one session each."""
+        log, running, peak = [], [0], [0]
+
+        async def fake_search(self, kind, q, limit, world_id):
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+            await asyncio.sleep(0.01)
+            running[0] -= 1
+            return [{"id": uuid.uuid4(), "name": f"{kind}:{q}", "score": 1.0}]
+
+        monkeypatch.setattr(SearchRepository, "search", fake_search)
+        kinds = list(SEARCH_KINDS)
+
+        results = await SearchService.search_kinds(lambda: FakeSession(log), kinds, " Mill ", 3, max_concurrency=2)
+
+        assert list(results) == kinds
+        assert results["characters"][0]["name"] == "characters:Mill"
+        assert log.count("open") == log.count("close") == len(kinds)
+        assert peak[0] == 2
+
+    def test_search_route_is_mounted_in_its_group(self):
+        """Test that /api/v1/search is served by the search router group."""
+        app = create_app(Settings(API_ROUTER_GROUPS="search", API_SWAGGER_DARK=False))
+        assert "/api/v1/search/" in app.openapi()["paths"]
@@ -0,0 +1,81 @@
+import json
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from app.game_state.repositories.world.world_export_repository import EXPORT_KINDS
+from app.game_state.services.world.world_export_service import WorldExportService, encode_ndjson
+
+
+class FakeExportRepository:
+    """Serves fixed chunks per kind, like the server-side cursor would."""
+
+    def __init__(self, world, chunks):
+        self.world = world
+        self.chunks = chunks
+        self.streamed = []
+
+    async def find_world_row(self, world_id):
+        return self.world
+
+    async def stream_rows(self, kind, world_id, chunk_size):
+        self.streamed.append(kind)
+        for chunk in self.chunks.get(kind, []):
+            yield chunk
+
+
+def _service(world, chunks):
+    service = WorldExportService(db=None)
+    service.repository = FakeExportRepository(world, chunks)
+    return service
+
+
+async def _collect(stream):
+    return b"".join([chunk async for chunk in stream])
+
+
+class TestWorldExport:
+    """Test suite for NDJSON world export."""
+
+    def test_encode_ndjson_handles_db_types(self):
+        """Test that UUIDs and datetimes encode and each row is one line."""
+        row_id = uuid.uuid4()
+        body = encode_ndjson([{"id": row_id, "at": datetime(2025, 1, 1, tzinfo=timezone.utc)}, {"id": None}])
+
+        lines = body.decode().splitlines()
+        assert len(lines) == 2 and body.endswith(b"\n")
+        assert json.loads(lines[0]) == {"id": str(row_id), "at": "2025-01-01T00:00:00Z"}
+
+    def test_resolve_kinds_keeps_export_order_and_rejects_unknown(self):
+        """Test that kinds follow EXPORT_KINDS order and typos raise."""
+        assert WorldExportService.resolve_kinds(None) == list(EXPORT_KINDS)
+        assert WorldExportService.resolve_kinds(["buildings", "locations"]) == ["locations", "buildings"]
+        with pytest.raises(ValueError):
+            WorldExportService.resolve_kinds(["location"])
+
+    async def test_stream_world_emits_world_then_each_chunk(self):
+        """Test that the full export starts with the world and wraps each row with its kind."""
+        world_id = uuid.uuid4()
+        service = _service(
+            {"id": world_id, "name": "Aerth"},
+            {"locations": [[{"id": 1}, {"id": 2}], [{"id": 3}]], "characters": [[{"id": 9}]]},
+        )
+
+        lines = [json.loads(line) for line in (await _collect(service.stream_world(world_id))).splitlines()]
+
+        assert lines[0] == {"kind": "world", "row": {"id": str(world_id), "name": "Aerth"}}
+        assert [line["kind"] for line in lines[1:]] == ["locations"] * 3 + ["characters"]
+        assert service.repository.streamed == list(EXPORT_KINDS)
+
+    async def test_stream_world_of_missing_world_is_empty(self):
+        """Test that a missing world streams nothing rather than partial content."""
+        service = _service(None, {"locations": [[{"id": 1}]]})
+        assert await _collect(service.stream_world(uuid.uuid4())) == b""
+        assert service.repository.streamed == []
+
+    async def test_stream_kind_emits_bare_rows(self):
+        """Test that a single-kind export writes rows without the envelope."""
+        service = _service({"id": 1}, {"settlements": [[{"id": 1}], [{"id": 2}]]})
+        body = await _collect(service.stream_kind(uuid.uuid4(), "settlements"))
+        assert [json.loads(line) for line in body.splitlines()] == [{"id": 1}, {"id": 2}]
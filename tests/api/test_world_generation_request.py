@@ -0,0 +1,42 @@
+import uuid
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+
+from app.api.routes import world_routes
+from app.api.schemas.world import MAX_GENERATED_LOCATIONS, MAX_GENERATION_TIERS, WorldGenerationRequest
+from app.db.dependencies import get_async_db
+
+
+def _tiers(*counts):
+    return [{"location_type_code": f"tier{depth}", "count": count} for depth, count in enumerate(counts)]
+
+
+class TestWorldGenerationRequest:
+    """Test suite for the bounds on world generation requests."""
+
+    def test_schema_example_is_within_bounds(self):
+        """Test that the documented example (101,010 locations) is accepted."""
+        example = WorldGenerationRequest.model_config["json_schema_extra"]["examples"][0]
+        assert len(WorldGenerationRequest.model_validate(example).tiers) == 3
+
+    def test_location_total_and_tier_count_are_capped(self):
+        """Test that the total across all tiers and the number of tiers are bounded."""
+        with pytest.raises(ValidationError, match=str(MAX_GENERATED_LOCATIONS)):
+            WorldGenerationRequest(seed=1, tiers=_tiers(10_000, 10_000))
+        with pytest.raises(ValidationError, match=str(MAX_GENERATED_LOCATIONS)):
+            WorldGenerationRequest(seed=1, tiers=_tiers(500, 500))  # 250,500 with the roots
+        with pytest.raises(ValidationError):
+            WorldGenerationRequest(seed=1, tiers=_tiers(*[1] * (MAX_GENERATION_TIERS + 1)))
+
+    def test_oversized_requests_are_rejected_with_422(self):
+        """Test that the endpoint refuses an oversized request before generating anything."""
+        app = FastAPI()
+        app.include_router(world_routes.router, prefix="/worlds")
+        app.dependency_overrides[get_async_db] = lambda: None
+
+        response = TestClient(app).post(f"/worlds/{uuid.uuid4()}/generate", json={"seed": 1, "tiers": _tiers(1000, 1000)})
+
+        assert response.status_code == 422
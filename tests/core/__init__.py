@@ -0,0 +1 @@
+# Tests for core infrastructure
\ No newline at end of file
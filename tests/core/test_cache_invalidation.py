@@ -0,0 +1,129 @@
+import json
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.core.cache_invalidation import PENDING_KEY, CacheInvalidationBus
+from app.game_state.cache.calendar_cache import CalendarCache, WorldStateCache
+from app.game_state.cache.danger_cache import DangerCache
+from app.game_state.cache.location_subtype_index_cache import LocationSubtypeIndexCache
+from app.game_state.cache.price_table_cache import PriceTableCache
+from app.game_state.cache.reputation_cache import ReputationCache
+from app.game_state.managers.pricing_manager import ModifierVector
+from app.game_state.managers.calendar_manager import WorldStateSnapshot
+
+ENGINE = create_engine("sqlite://")
+
+
+@pytest.fixture
+def bus(monkeypatch):
+    """Capture publishes and record evictions of a test entity kind."""
+    published, evicted, cleared = [], [], []
+    monkeypatch.setattr(CacheInvalidationBus, "publish", classmethod(lambda cls, entries: published.append(list(entries))))
+    monkeypatch.setattr(CacheInvalidationBus, "_handlers", {})
+    monkeypatch.setattr(CacheInvalidationBus, "_last_generation", 5)
+    CacheInvalidationBus.register("widgets", lambda entity_id, version: evicted.append((entity_id, version)),
+                                  lambda: cleared.append(True))
+    return published, evicted, cleared
+
+
+def _snapshot(world_id, day):
+    return WorldStateSnapshot(world_id, None, day, 1, day, 0, "spring", day, 90)
+
+
+def _message(generation, entries, origin="another-process"):
+    return f"{generation}|" + json.dumps({"o": origin, "e": entries})
+
+
+class TestCacheInvalidationBus:
+    """Test suite for cross-process cache invalidation."""
+
+    def test_writes_are_applied_and_published_on_commit(self, bus):
+        """Test that recorded writes evict locally and publish once, only after commit."""
+        published, evicted, _ = bus
+        widget_id = uuid4()
+        with Session(ENGINE) as session:
+            CacheInvalidationBus.record(session, "widgets", widget_id, 3)
+            CacheInvalidationBus.record(session, "widgets", widget_id, 4)
+            assert evicted == [] and published == []
+            session.commit()
+
+        assert evicted == [(str(widget_id), 3), (str(widget_id), 4)]
+        assert published == [[("widgets", str(widget_id), 3), ("widgets", str(widget_id), 4)]]
+
+    def test_rolled_back_writes_are_dropped(self, bus):
+        """Test that a rollback discards the records, so the next commit doesn't publish them."""
+        published, evicted, _ = bus
+        with Session(ENGINE) as session:
+            session.begin()
+            CacheInvalidationBus.record(session, "widgets", uuid4())
+            session.rollback()
+            assert PENDING_KEY not in session.info
+            session.commit()
+
+        assert evicted == [] and published == []
+
+    def test_messages_from_other_processes_evict(self, bus):
+        """Test that other processes' messages evict, and this process's own are skipped."""
+        _, evicted, cleared = bus
+        CacheInvalidationBus._receive(_message(6, [["widgets", "w1", 2]]))
+        CacheInvalidationBus._receive(_message(7, [["widgets", "w2", None]], origin=CacheInvalidationBus._origin))
+
+        assert evicted == [("w1", 2)]
+        assert cleared == []
+        assert CacheInvalidationBus._last_generation == 7
+
+    def test_missed_generations_clear_every_cache(self, bus):
+        """Test that a gap in generations, or a counter that moved while disconnected, clears everything."""
+        _, evicted, cleared = bus
+        CacheInvalidationBus._receive(_message(9, [["widgets", "w1", 1]]))
+        assert cleared == [True] and evicted == [("w1", 1)]
+
+        CacheInvalidationBus._resync(9)
+        assert cleared == [True]
+        CacheInvalidationBus._resync(12)
+        assert cleared == [True, True]
+
+    def test_game_caches_are_registered(self):
+        """Test that the game caches evict on writes to the rows they derive from."""
+        world_id, theme_id = uuid4(), uuid4()
+        WorldStateCache._cache[world_id] = (_snapshot(world_id, 7), float("inf"))
+        CalendarCache._cache[theme_id] = (object(), float("inf"))
+        generation = LocationSubtypeIndexCache.generation()
+
+        CacheInvalidationBus.apply([
+            ("world_state", str(world_id), 8), ("themes", str(theme_id), None), ("location_sub_types", "x", None),
+        ])
+
+        assert WorldStateCache.get(world_id) is None
+        assert CalendarCache.get(theme_id) is None
+        assert LocationSubtypeIndexCache.generation() == generation + 1
+
+    def test_published_world_snapshots_survive_the_ticks_commit(self):
+        """Test that committing a tick keeps the snapshot it published, and only older ones are dropped."""
+        world_id = uuid4()
+        WorldStateCache.publish([_snapshot(world_id, 12)])
+
+        CacheInvalidationBus.apply([("worlds", str(world_id), 30), ("world_state", str(world_id), 12)])
+        assert WorldStateCache.get(world_id).day == 12
+
+        CacheInvalidationBus.apply([("world_state", str(world_id), 13)])
+        assert WorldStateCache.get(world_id) is None
+
+    def test_reputation_price_and_danger_caches_are_registered(self):
+        """Test that reputation writes drop the character's row and price tables, and danger maps follow the tick's day."""
+        character_id, world_id, location_id = uuid4(), uuid4(), uuid4()
+        ReputationCache.set_many({character_id: {uuid4(): 10}})
+        price_key = (character_id, uuid4(), uuid4(), None)
+        PriceTableCache.set(price_key, ModifierVector())
+        DangerCache.set_world(world_id, {location_id: (1.0, 2.0)}, day=5)
+
+        CacheInvalidationBus.apply([("character_faction_relationships", str(character_id), None), ("location_danger", str(world_id), 5)])
+        assert ReputationCache.get_many([character_id]) == ({}, [character_id])
+        assert PriceTableCache.get(price_key) is None
+        assert DangerCache.get(location_id) == 1.0
+
+        CacheInvalidationBus.apply([("location_danger", str(world_id), 6)])
+        assert DangerCache.get(location_id) is None
@@ -0,0 +1 @@
+# Tests for database layer
\ No newline at end of file
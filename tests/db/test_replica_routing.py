@@ -0,0 +1,77 @@
+from sqlalchemy import select, text, update
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.db.models.settlement import Settlement
+from app.db.replica_routing import READ_ONLY, WROTE, RoutingSession, create_replica_set
+
+
+def _engine(host):
+    # Engines connect lazily, so these never touch the network
+    return create_async_engine(f"postgresql+asyncpg://user:secret@{host}:5432/game")
+
+
+PRIMARY = _engine("primary")
+
+
+def _replicas(*lags, max_lag=5.0):
+    replicas = create_replica_set(
+        [(f"replica{number}", _engine(f"replica{number}")) for number in range(1, len(lags) + 1)],
+        max_lag=max_lag, probe_interval=2.0,
+    )
+    for number, lag in enumerate(lags, 1):
+        replicas.record_lag(f"replica{number}", lag)
+    return replicas
+
+
+def _session(replicas, read_only=True):
+    return RoutingSession(bind=PRIMARY.sync_engine, replicas=replicas, info={READ_ONLY: read_only})
+
+
+def _host(engine):
+    return engine.url.host
+
+
+READ = select(Settlement).where(Settlement.name == "Oakvale")
+
+
+class TestReplicaRouting:
+    """Test suite for routing read-only sessions to replicas."""
+
+    def test_read_only_selects_go_to_one_replica(self):
+        """Test that a read-only session reads from a single replica and others stay on the primary."""
+        replicas = _replicas(0.0, 0.5)
+        session = _session(replicas)
+
+        assert _host(session.get_bind(clause=READ)) == "replica1"
+        assert _host(session.get_bind(clause=READ.limit(1))) == "replica1"
+        assert _host(_session(replicas).get_bind(clause=READ)) == "replica2"
+        assert _host(_session(replicas, read_only=False).get_bind(clause=READ)) == "primary"
+
+    def test_writes_pin_the_session_to_the_primary(self):
+        """Test read-your-writes: after a write, locking read or opaque SQL, reads use the primary."""
+        for statement in (update(Settlement).values(name="x"), READ.with_for_update(), text("SELECT 1")):
+            session = _session(_replicas(0.0))
+            assert _host(session.get_bind(clause=READ)) == "replica1"
+
+            assert _host(session.get_bind(clause=statement)) == "primary"
+            assert session.info[WROTE]
+            assert _host(session.get_bind(clause=READ)) == "primary"
+
+    def test_lagging_or_unprobed_replicas_fall_back_to_the_primary(self):
+        """Test that replicas over the lag limit, unreachable or never probed aren't used."""
+        lagging = _replicas(12.0, None)
+        assert _host(_session(lagging).get_bind(clause=READ)) == "primary"
+        assert lagging.stats == {"replica_sessions": 0, "primary_fallbacks": 1}
+
+        unprobed = create_replica_set([("replica1", _engine("replica1"))], max_lag=5.0, probe_interval=2.0)
+        assert _host(_session(unprobed).get_bind(clause=READ)) == "primary"
+        assert _host(_session(create_replica_set([], 5.0, 2.0)).get_bind(clause=READ)) == "primary"
+
+    def test_measurements_go_stale(self):
+        """Test that a replica whose probes stopped arriving is treated as unhealthy."""
+        replicas = _replicas(0.0)
+        replicas.record_lag("replica1", 0.0, now=100.0)
+
+        assert replicas.is_healthy("replica1", now=105.0)
+        assert not replicas.is_healthy("replica1", now=107.0)
+        assert replicas.pick(now=107.0) is None
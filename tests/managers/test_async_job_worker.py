@@ -0,0 +1,168 @@
+import asyncio
+import json
+
+import pytest
+
+from app.game_state.workers import async_worker
+from app.game_state.workers.async_worker import AsyncJobWorker, ScheduledJob, async_job, encode_job
+
+QUEUE = "async_jobs:test"
+
+
+class FakeRedis:
+    """In-memory list queue and expiring keys, with the commands the worker uses."""
+
+    def __init__(self):
+        self.lists = {}
+        self.keys = {}  # key -> expiry in fake milliseconds
+        self.now_ms = 0
+
+    async def set(self, key, value, nx=False, px=None, ex=None):
+        if nx and self.keys.get(key, -1) > self.now_ms:
+            return None
+        self.keys[key] = self.now_ms + (px if px is not None else ex * 1000)
+        return True
+
+    async def pttl(self, key):
+        return self.keys[key] - self.now_ms if self.keys.get(key, -1) > self.now_ms else -2
+
+    async def delete(self, key):
+        self.keys.pop(key, None)
+
+    async def rpush(self, key, value):
+        self.lists.setdefault(key, []).append(value)
+
+    async def blpop(self, keys, timeout=0):
+        items = self.lists.get(keys[0])
+        if items:
+            return keys[0], items.pop(0)
+        await asyncio.sleep(0.001)
+        return None
+
+
+class FakeLock:
+    held = set()
+
+    def __init__(self, task_name, resource_id=None, timeout=60):
+        self.key = f"{task_name}:{resource_id or 'all'}"
+
+    async def acquire(self):
+        if self.key in self.held:
+            return False
+        self.held.add(self.key)
+        return True
+
+    async def release(self):
+        self.held.discard(self.key)
+
+
+@pytest.fixture
+def jobs():
+    """Register test jobs and remove them afterwards."""
+    registered = dict(async_worker._JOBS)
+    FakeLock.held = set()
+    state = {"running": 0, "peak": 0, "done": []}
+
+    @async_job("test_sleep")
+    async def sleep_job(label=None, task_id=None):
+        state["running"] += 1
+        state["peak"] = max(state["peak"], state["running"])
+        await asyncio.sleep(0.01)
+        state["running"] -= 1
+        state["done"].append(label)
+
+    @async_job("test_fail")
+    async def failing_job(task_id=None):
+        raise RuntimeError("boom")
+
+    @async_job("test_locked", lock_name="test_locked")
+    async def locked_job(world_id=None, task_id=None):
+        await asyncio.sleep(0.01)
+        state["done"].append(world_id)
+
+    yield state
+    async_worker._JOBS.clear()
+    async_worker._JOBS.update(registered)
+
+
+async def _drain(redis, concurrency):
+    worker = AsyncJobWorker(redis, QUEUE, concurrency, lock_factory=FakeLock)
+    runner = asyncio.create_task(worker.run(shutdown_grace=1.0))
+    while redis.lists.get(QUEUE) or worker.running:
+        await asyncio.sleep(0.002)
+    worker.stop()
+    await runner
+    return worker
+
+
+class TestAsyncJobWorker:
+    """Test suite for the native asyncio job worker."""
+
+    def test_runs_jobs_concurrently_up_to_the_limit(self, jobs):
+        """Test that jobs overlap, but never more than `concurrency` at once."""
+        redis = FakeRedis()
+        for label in range(10):
+            asyncio.run(redis.rpush(QUEUE, encode_job("test_sleep", {"label": label})))
+
+        worker = asyncio.run(_drain(redis, concurrency=3))
+
+        assert jobs["peak"] == 3
+        assert sorted(jobs["done"]) == list(range(10))
+        assert worker.stats["completed"] == 10
+
+    def test_failures_and_unknown_jobs_are_isolated(self, jobs):
+        """Test that a failing, unknown or malformed job doesn't stop the others."""
+        redis = FakeRedis()
+        for message in (encode_job("test_fail", {}), encode_job("no_such_job", {}), "not json",
+                        encode_job("test_sleep", {"label": "after"})):
+            asyncio.run(redis.rpush(QUEUE, message))
+
+        worker = asyncio.run(_drain(redis, concurrency=2))
+
+        assert jobs["done"] == ["after"]
+        assert worker.stats == {"completed": 1, "failed": 1, "skipped": 0, "unknown": 2}
+
+    def test_locked_jobs_are_skipped_while_running_for_the_same_world(self, jobs):
+        """Test that a locked job runs once per world at a time, and other worlds proceed."""
+        redis = FakeRedis()
+        for world_id in ("w1", "w1", "w2"):
+            asyncio.run(redis.rpush(QUEUE, encode_job("test_locked", {"world_id": world_id})))
+
+        worker = asyncio.run(_drain(redis, concurrency=3))
+
+        assert sorted(jobs["done"]) == ["w1", "w2"]
+        assert worker.stats["skipped"] == 1
+        assert FakeLock.held == set()
+
+    def test_encoded_jobs_are_json(self):
+        """Test the queue message format."""
+        message = json.loads(encode_job("advance_game_day", {"world_id": None}))
+        assert message["job"] == "advance_game_day"
+        assert message["kwargs"] == {"world_id": None}
+        assert message["id"] and message["enqueued_at"] > 0
+
+    def test_scheduled_ticks_survive_restarts(self, jobs):
+        """Test that a restarted worker doesn't enqueue a tick before its interval has passed."""
+        redis, tick = FakeRedis(), ScheduledJob("test_sleep", 3600.0)
+
+        first = AsyncJobWorker(redis, QUEUE, 1, [tick], lock_factory=FakeLock)
+        assert asyncio.run(first._enqueue_if_due(tick)) == 3600.0
+        redis.now_ms += 60_000
+        restarted = AsyncJobWorker(redis, QUEUE, 1, [tick], lock_factory=FakeLock)
+        assert asyncio.run(restarted._enqueue_if_due(tick)) == 3540.0
+
+        assert len(redis.lists[QUEUE]) == 1
+
+    def test_no_tick_is_enqueued_while_one_is_pending(self, jobs):
+        """Test that due ticks are skipped while the previous one is queued, and resume once it ran."""
+        redis, tick = FakeRedis(), ScheduledJob("test_sleep", 1.0)
+        worker = AsyncJobWorker(redis, QUEUE, 1, [tick], lock_factory=FakeLock)
+
+        for _ in range(5):
+            asyncio.run(worker._enqueue_if_due(tick))
+            redis.now_ms += 1000
+        assert len(redis.lists[QUEUE]) == 1
+
+        asyncio.run(_drain(redis, concurrency=1))
+        asyncio.run(worker._enqueue_if_due(tick))
+        assert len(redis.lists[QUEUE]) == 1 and jobs["done"] == [None]
@@ -0,0 +1,55 @@
+import pytest
+from uuid import uuid4
+
+from app.game_state.cache.calendar_cache import WorldStateCache
+from app.game_state.managers.calendar_manager import DEFAULT_SEASONS, CalendarManager
+
+
+class TestCalendarManager:
+    """Test suite for theme calendar tables and day resolution."""
+
+    @pytest.fixture
+    def table(self):
+        return CalendarManager.build_table(
+            [("Thaw", 10), ("Bloom", 20), ("Frost", 5)],
+            ["Red Moon", "Eclipse"],
+        )
+
+    def test_table_covers_the_year(self, table):
+        """Test that every day of the year maps to its season and day within it."""
+        assert table.year_length == 35
+        assert table.season_index[:10].tolist() == [0] * 10
+        assert table.season_index[10:30].tolist() == [1] * 20
+        assert table.day_of_season[10] == 1
+        assert table.day_of_season[34] == 5
+
+    def test_theme_without_seasons_uses_default(self):
+        """Test that themes without usable seasons fall back to the default calendar."""
+        table = CalendarManager.build_table([("Void", 0)])
+
+        assert table.season_names == tuple(name for name, _ in DEFAULT_SEASONS)
+        assert table.year_length == 360
+
+    def test_resolve_wraps_years_and_places_events(self, table):
+        """Test that days past the year length wrap and events fall on their day every year."""
+        world_id = uuid4()
+
+        first = CalendarManager.resolve(table, world_id, None, 1)
+        assert (first.year, first.season_name, first.day_of_season) == (1, "Thaw", 1)
+
+        # Two events over 35 days fall on day-of-year indexes 11 and 23
+        later = CalendarManager.resolve(table, world_id, None, 35 + 12)
+        assert later.year == 2
+        assert later.season_name == "Bloom"
+        assert later.celestial_events == ("Red Moon",)
+
+    def test_world_state_cache_publishes_snapshots(self, table):
+        """Test that published snapshots are served until invalidated."""
+        WorldStateCache.clear()
+        snapshot = CalendarManager.resolve(table, uuid4(), None, 31)
+
+        WorldStateCache.publish([snapshot])
+        assert WorldStateCache.get(snapshot.world_id).season_name == "Frost"
+
+        WorldStateCache.invalidate(snapshot.world_id)
+        assert WorldStateCache.get(snapshot.world_id) is None
@@ -0,0 +1,204 @@
+import asyncio
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects.postgresql import asyncpg
+
+from app.game_state.managers.domain_event_manager import (
+    DOMAIN_EVENT_STREAM,
+    WORLD_DAY_ADVANCED,
+    DomainEvent,
+    DomainEventManager,
+)
+from app.game_state.repositories.core.outbox_repository import OutboxRepository
+from app.game_state.repositories.settlement_repository import SettlementRepository
+from app.game_state.workers import outbox_worker
+from app.game_state.workers.outbox_worker import DomainEventConsumer
+
+NOW = datetime(2026, 10, 18, 12, 0, tzinfo=timezone.utc)
+
+
+def _event(event_id, world_id=None):
+    return DomainEvent(event_id, WORLD_DAY_ADVANCED, "world", world_id or uuid4(), {"day": event_id}, NOW)
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+
+class FakeSession:
+    """Session stand-in holding outbox rows; take_batch statements pop them."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+        self.added = []
+        self.committed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def add(self, obj):
+        self.added.append(obj)
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        batch, self.rows[:] = list(self.rows[:2]), self.rows[2:]
+        return FakeResult(batch)
+
+    async def flush(self):
+        pass
+
+    async def commit(self):
+        self.committed = True
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def xadd(self, name, fields, maxlen=None, approximate=True):
+        self.commands.append((name, fields))
+
+    async def execute(self):
+        if self.redis.fail:
+            raise ConnectionError("redis is down")
+        self.redis.stream.extend(self.commands)
+
+
+class FakeStreamRedis:
+    """The stream and consumer group commands the consumer uses, for one group."""
+
+    def __init__(self, entries=()):
+        self.stream = list(entries)
+        self.fail = False
+        self.delivered = 0
+        self.pending = {}
+        self.acked = []
+
+    def pipeline(self, transaction=False):
+        return FakePipeline(self)
+
+    async def xgroup_create(self, name, groupname, id="$", mkstream=False):
+        pass
+
+    async def xautoclaim(self, name, groupname, consumername, min_idle_time, start_id="0-0", count=None):
+        # Idle time is ignored: anything pending is claimable
+        return ["0-0", list(self.pending.items())[:count], []]
+
+    async def xreadgroup(self, groupname, consumername, streams, count=None, block=None):
+        batch = self.stream[self.delivered:self.delivered + count]
+        self.delivered += len(batch)
+        entries = [(f"{self.delivered - len(batch) + number}-0", fields) for number, (_, fields) in enumerate(batch)]
+        self.pending.update(entries)
+        return [[DOMAIN_EVENT_STREAM, entries]] if entries else []
+
+    async def xack(self, name, groupname, *ids):
+        for entry_id in ids:
+            self.pending.pop(entry_id, None)
+        self.acked.extend(ids)
+
+
+class TestDomainEvents:
+    """Test suite for the domain event outbox, relay and consumers."""
+
+    def test_stream_fields_round_trip(self):
+        """Test that an event survives encoding as flat stream fields."""
+        event = _event(7)
+        fields = DomainEventManager.to_stream_fields(event)
+        assert all(isinstance(value, str) for value in fields.values())
+        assert DomainEventManager.from_stream_fields(fields) == event
+
+    def test_append_stays_in_the_callers_transaction(self):
+        """Test that appending adds a row to the session without executing or committing."""
+        session = FakeSession([])
+        world_id = uuid4()
+        OutboxRepository(session).append(WORLD_DAY_ADVANCED, world_id, day=3)
+
+        (row,) = session.added
+        assert (row.event_type, row.aggregate_type, row.aggregate_id, row.payload) == (WORLD_DAY_ADVANCED, "world", world_id, {"day": 3})
+        assert session.statements == [] and not session.committed
+
+    def test_cost_deduction_commits_with_the_callers_event(self):
+        """Test that paying for a construction leaves the commit to the caller, so its event commits with it."""
+        session = FakeSession([])
+        repository = SettlementRepository(session)
+
+        async def update_with_retry(settlement_id, mutate):
+            return object()
+
+        async def find_by_id(settlement_id):
+            return "paid"
+
+        repository.update_with_retry, repository.find_by_id = update_with_retry, find_by_id
+
+        assert asyncio.run(repository.apply_resource_costs(uuid4(), {uuid4(): 5})) == "paid"
+        assert not session.committed
+
+    def test_batches_are_taken_with_skip_locked(self):
+        """Test that a batch is deleted and returned oldest first, skipping rows another relay holds."""
+        session = FakeSession([tuple(_event(2)), tuple(_event(1))])
+        events = asyncio.run(OutboxRepository(session).take_batch(2))
+
+        assert [event.event_id for event in events] == [1, 2]
+        sql = str(session.statements[0].compile(dialect=asyncpg.dialect()))
+        assert sql.startswith("DELETE FROM outbox_events")
+        assert "FOR UPDATE SKIP LOCKED" in sql and "RETURNING" in sql
+
+    def test_relay_moves_batches_to_the_stream(self, monkeypatch):
+        """Test that the relay drains the outbox in batches and commits each after the XADD."""
+        rows = [tuple(_event(number)) for number in range(1, 6)]
+        sessions, redis = [], FakeStreamRedis()
+
+        def session_factory():
+            sessions.append(FakeSession(rows))
+            return sessions[-1]
+
+        monkeypatch.setattr(outbox_worker, "get_session_factory", lambda: session_factory)
+        monkeypatch.setattr(outbox_worker, "get_async_redis", lambda: redis)
+
+        result = asyncio.run(outbox_worker._relay_outbox_async(batch_size=2))
+
+        assert result["relayed"] == 5 and result["batches"] == 3
+        assert [int(fields["id"]) for _, fields in redis.stream] == [1, 2, 3, 4, 5]
+        assert all(session.committed for session in sessions)
+
+    def test_failed_publish_leaves_the_batch_in_the_outbox(self, monkeypatch):
+        """Test that the delete isn't committed when the stream can't be written."""
+        session, redis = FakeSession([tuple(_event(1))]), FakeStreamRedis()
+        redis.fail = True
+        monkeypatch.setattr(outbox_worker, "get_session_factory", lambda: lambda: session)
+        monkeypatch.setattr(outbox_worker, "get_async_redis", lambda: redis)
+
+        with pytest.raises(ConnectionError):
+            asyncio.run(outbox_worker._relay_outbox_async())
+        assert not session.committed
+
+    def test_failed_batches_are_redelivered(self):
+        """Test that a consumer acknowledges handled batches and retries a failed one."""
+        redis = FakeStreamRedis([(DOMAIN_EVENT_STREAM, DomainEventManager.to_stream_fields(_event(n))) for n in (1, 2, 3)])
+        seen, failures = [], [True]
+
+        async def handler(events):
+            if failures:
+                failures.pop()
+                raise RuntimeError("downstream unavailable")
+            seen.extend(event.event_id for event in events)
+
+        consumer = DomainEventConsumer(redis, "analytics", handler, consumer="c1", batch_size=2)
+        with pytest.raises(RuntimeError):
+            asyncio.run(consumer.run_once())
+        assert redis.acked == [] and len(redis.pending) == 2
+
+        assert asyncio.run(consumer.run_once()) == 2  # the claimed, unacknowledged batch
+        assert asyncio.run(consumer.run_once()) == 1
+        assert seen == [1, 2, 3] and redis.pending == {}
@@ -0,0 +1,91 @@
+import pytest
+from uuid import uuid4
+
+from app.db.models.character_faction_relationship import RelationshipStatusEnum
+from app.game_state.cache.reputation_cache import ReputationCache
+from app.game_state.managers.faction_influence_manager import (
+    NEUTRAL_REPUTATION,
+    FactionInfluenceManager,
+)
+
+
+class TestFactionInfluenceManager:
+    """Test suite for faction influence domain logic."""
+
+    @pytest.mark.parametrize("score,expected", [
+        (100, RelationshipStatusEnum.ALLY),
+        (75, RelationshipStatusEnum.ALLY),
+        (74, RelationshipStatusEnum.FRIENDLY),
+        (0, RelationshipStatusEnum.NEUTRAL),
+        (-24, RelationshipStatusEnum.NEUTRAL),
+        (-25, RelationshipStatusEnum.HOSTILE),
+        (-75, RelationshipStatusEnum.ENEMY),
+    ])
+    def test_status_for_score(self, score, expected):
+        """Test that reputation thresholds map to the expected status."""
+        assert FactionInfluenceManager.status_for_score(score) == expected
+
+    def test_build_matrix_includes_characters_without_rows(self):
+        """Test that every requested character gets a row, even with no relationships."""
+        hero, stranger, faction = uuid4(), uuid4(), uuid4()
+
+        matrix = FactionInfluenceManager.build_matrix([hero, stranger], [(hero, faction, 40)])
+
+        assert matrix == {hero: {faction: 40}, stranger: {}}
+
+    def test_select_factions_fills_neutral(self):
+        """Test that requested factions missing from a row are neutral."""
+        known, unknown = uuid4(), uuid4()
+
+        selected = FactionInfluenceManager.select_factions({known: -60}, [known, unknown])
+
+        assert selected == {known: -60, unknown: NEUTRAL_REPUTATION}
+
+    def test_to_dense_preserves_order(self):
+        """Test that the dense grid follows the requested character and faction order."""
+        a, b, f1, f2 = uuid4(), uuid4(), uuid4(), uuid4()
+        matrix = {a: {f1: 10, f2: -5}, b: {f2: 90}}
+
+        assert FactionInfluenceManager.to_dense(matrix, [b, a], [f1, f2]) == [[0, 90], [10, -5]]
+
+    def test_controllers_picks_rank_one(self):
+        """Test that only the top-ranked faction controls a scope."""
+        scope, winner, loser = uuid4(), uuid4(), uuid4()
+        rows = [
+            {"scope_id": scope, "faction_id": winner, "rank": 1},
+            {"scope_id": scope, "faction_id": loser, "rank": 2},
+        ]
+
+        assert FactionInfluenceManager.controllers(rows) == {scope: winner}
+
+
+class TestReputationCache:
+    """Test suite for the shared reputation matrix cache."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        ReputationCache.clear()
+        yield
+        ReputationCache.clear()
+
+    def test_get_many_splits_hits_and_misses(self):
+        """Test that one lookup returns cached rows and the ids still to load."""
+        cached, missing, faction = uuid4(), uuid4(), uuid4()
+        ReputationCache.set_many({cached: {faction: 5}})
+
+        hits, misses = ReputationCache.get_many([cached, missing])
+
+        assert hits == {cached: {faction: 5}}
+        assert misses == [missing]
+
+    def test_expired_and_invalidated_rows_are_misses(self):
+        """Test that expired or invalidated rows are reloaded."""
+        expired, changed = uuid4(), uuid4()
+        ReputationCache.set_many({expired: {}}, ttl=-1)
+        ReputationCache.set_many({changed: {}})
+        ReputationCache.invalidate(changed)
+
+        hits, misses = ReputationCache.get_many([expired, changed])
+
+        assert hits == {}
+        assert misses == [expired, changed]
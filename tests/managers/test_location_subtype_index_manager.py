@@ -0,0 +1,128 @@
+import pytest
+from uuid import uuid4
+
+from app.game_state.cache.location_subtype_index_cache import LocationSubtypeIndexCache
+from app.api.schemas.location.location_sub_types import LocationSubtypeCreate
+from app.game_state.entities.geography.location_sub_type import LocationSubtype
+from app.game_state.managers.location_subtype_index_manager import LocationSubtypeIndexManager
+from app.game_state.services.geography.location_sub_type_service import LocationSubTypeService
+
+CITY, RUIN = uuid4(), uuid4()
+FANTASY, SCIFI = uuid4(), uuid4()
+
+
+def subtype(code, location_type_id=CITY, theme_id=FANTASY, rarity="common", tags=None):
+    return LocationSubtype(
+        code=code, name=code.title(), description=code,
+        location_type_id=location_type_id, theme_id=theme_id, rarity=rarity, tags=tags or [],
+    )
+
+
+SUBTYPES = [
+    subtype("port_city", tags=["coastal", "trade"]),
+    subtype("hill_fort", rarity="uncommon", tags=["highland", "military"]),
+    subtype("sunken_temple", location_type_id=RUIN, rarity="rare", tags=["coastal", "sacred"]),
+    subtype("orbital_city", theme_id=SCIFI, tags=["trade"]),
+    subtype("market_town", tags=["trade"]),
+]
+
+
+class FakeSubtypeRepository:
+    def __init__(self, subtypes):
+        self.subtypes = subtypes
+        self.loads = 0
+
+    async def find_all_for_index(self):
+        self.loads += 1
+        return list(self.subtypes)
+
+    async def bulk_save(self, entities):
+        self.subtypes.extend(entities)
+        return entities
+
+
+def _service(subtypes):
+    service = LocationSubTypeService(db=None)
+    service.repository = FakeSubtypeRepository(subtypes)
+    return service
+
+
+@pytest.fixture(autouse=True)
+def clear_index_cache():
+    LocationSubtypeIndexCache.clear()
+    yield
+    LocationSubtypeIndexCache.clear()
+
+
+class TestLocationSubtypeIndexManager:
+    """Test suite for the location subtype facet index."""
+
+    def test_filters_combine_like_the_sql_query(self):
+        """Test that facet filters AND together and tags match any (or all) of the given tags."""
+        index = LocationSubtypeIndexManager.build_index(SUBTYPES)
+        codes = lambda mask: [s.code for s in index.page(mask)]
+
+        assert codes(index.match(location_type_id=CITY, theme_id=FANTASY)) == ["hill_fort", "market_town", "port_city"]
+        assert codes(index.match(tags=["coastal", "highland"])) == ["hill_fort", "port_city", "sunken_temple"]
+        assert codes(index.match(tags=["coastal", "trade"], match_all_tags=True)) == ["port_city"]
+        assert codes(index.match(rarity="legendary")) == []
+        assert codes(index.match(tags=["coastal", "unknown"], match_all_tags=True)) == []
+        assert index.count(index.match()) == len(SUBTYPES)
+
+    def test_page_skips_and_limits_in_code_order(self):
+        """Test that pagination walks the matches in code order."""
+        index = LocationSubtypeIndexManager.build_index(SUBTYPES)
+        trade = index.match(tags=["trade"])
+
+        assert [s.code for s in index.page(trade, skip=1, limit=1)] == ["orbital_city"]
+        assert [s.code for s in index.page(trade, skip=2, limit=5)] == ["port_city"]
+        assert index.page(trade, skip=3) == []
+
+    def test_facet_counts_cover_only_the_matches(self):
+        """Test that facet counts are computed over the filtered subtypes."""
+        index = LocationSubtypeIndexManager.build_index(SUBTYPES)
+        facets = index.facet_counts(index.match(theme_id=FANTASY, tags=["coastal", "trade"]))
+
+        assert facets["rarity"] == {"common": 2, "rare": 1}
+        assert facets["tags"] == {"coastal": 2, "trade": 2, "sacred": 1}
+        assert facets["location_type_id"] == {str(CITY): 2, str(RUIN): 1}
+        assert facets["theme_id"] == {str(FANTASY): 3}
+
+    def test_duplicate_codes_are_rejected(self):
+        """Test that the index refuses duplicate codes and the helper lists them once."""
+        with pytest.raises(ValueError):
+            LocationSubtypeIndexManager.build_index([subtype("a"), subtype("a")])
+        assert LocationSubtypeIndexManager.find_duplicate_codes(["a", "b", "a", "a", "c", "b"]) == ["a", "b"]
+
+    async def test_service_serves_reads_from_one_cached_load(self):
+        """Test that searches hit the cached index and a stale build isn't stored after a clear."""
+        service = _service(list(SUBTYPES))
+
+        result = await service.search_subtypes(tags=["trade"], limit=2, include_facets=True)
+        again = await service.search_subtypes(rarity="rare")
+        by_type = await service.get_subtypes_by_location_type(RUIN)
+
+        assert [s.code for s in result["items"]] == ["market_town", "orbital_city"]
+        assert result["total"] == 3 and result["facets"]["rarity"] == {"common": 3}
+        assert [s.code for s in again["items"]] == ["sunken_temple"] == [s.code for s in by_type]
+        assert service.repository.loads == 1
+
+        generation = LocationSubtypeIndexCache.generation()
+        LocationSubtypeIndexCache.clear()
+        assert not LocationSubtypeIndexCache.set(LocationSubtypeIndexManager.build_index(SUBTYPES), generation)
+
+    async def test_bulk_create_validates_codes_against_the_index(self):
+        """Test that bulk create rejects taken and repeated codes without per-code lookups."""
+        service = _service(list(SUBTYPES))
+        new = lambda code: LocationSubtypeCreate(code=code, name=code, description=code, location_type_id=CITY, theme_id=FANTASY)
+
+        with pytest.raises(ValueError, match="port_city"):
+            await service.bulk_create_subtypes([new("harbour"), new("port_city")])
+        with pytest.raises(ValueError, match="harbour"):
+            await service.bulk_create_subtypes([new("harbour"), new("harbour")])
+
+        created = await service.bulk_create_subtypes([new("harbour")])
+
+        assert [s.code for s in created] == ["harbour"]
+        assert LocationSubtypeIndexCache.get() is None
+        assert (await service.get_index()).has_code("harbour")
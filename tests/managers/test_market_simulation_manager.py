@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+from uuid import uuid4
+
+from app.game_state.managers.market_simulation_manager import MarketSimulationManager
+
+
+class TestMarketSimulationManager:
+    """Test suite for the vectorized market clearing step."""
+
+    @pytest.fixture
+    def settlements(self):
+        return [uuid4(), uuid4(), uuid4()]
+
+    def test_build_state_uses_union_of_resources(self, settlements):
+        """Test that every settlement gets a column for every resource in the world."""
+        rows = [
+            (settlements[0], 100, {"wood": 50}),
+            (settlements[1], 200, {"stone": 5, "wood": 1}),
+            (settlements[2], 0, None),
+        ]
+
+        state = MarketSimulationManager.build_state(rows)
+
+        assert state.resource_ids == ["stone", "wood"]
+        assert state.stock.tolist() == [[0, 50], [5, 1], [0, 0]]
+        assert state.population.tolist() == [100, 200, 0]
+
+    def test_goods_flow_to_scarce_market_and_are_conserved(self, settlements):
+        """Test that trade moves goods from the glutted to the starved settlement without creating any."""
+        rows = [
+            (settlements[0], 100, {"grain": 1000}),
+            (settlements[1], 1000, {"grain": 0}),
+        ]
+        state = MarketSimulationManager.build_state(rows)
+        sources, targets, distances = MarketSimulationManager.edge_arrays(
+            state.settlement_ids, [(settlements[0], settlements[1], 10.0), (settlements[1], settlements[0], 10.0)]
+        )
+
+        result = MarketSimulationManager.clear_market(state, sources, targets, distances)
+
+        assert len(sources) == 1
+        assert result.traded_units > 0
+        assert result.stock.sum() == state.stock.sum() - result.consumed_units
+        assert np.all(result.stock >= 0)
+        assert np.all(result.stock == np.floor(result.stock))
+
+    def test_exports_never_exceed_surplus(self, settlements):
+        """Test that a seller with many buyers never exports below its reserve."""
+        hub = settlements[0]
+        rows = [(hub, 100, {"ore": 40})] + [(s, 5000, {"ore": 0}) for s in settlements[1:]]
+        state = MarketSimulationManager.build_state(rows)
+        routes = [(hub, other, 1.0) for other in settlements[1:]]
+        sources, targets, distances = MarketSimulationManager.edge_arrays(state.settlement_ids, routes)
+
+        result = MarketSimulationManager.clear_market(state, sources, targets, distances)
+
+        assert 40 - result.traded_units >= 0
+        assert result.stock[0, 0] >= 0
+
+    def test_distant_routes_do_not_trade(self, settlements):
+        """Test that transport cost blocks trade when the price gap is too small."""
+        rows = [(settlements[0], 100, {"salt": 60}), (settlements[1], 100, {"salt": 40})]
+        state = MarketSimulationManager.build_state(rows)
+        sources, targets, distances = MarketSimulationManager.edge_arrays(
+            state.settlement_ids, [(settlements[0], settlements[1], 100000.0)]
+        )
+
+        result = MarketSimulationManager.clear_market(state, sources, targets, distances)
+
+        assert result.traded_units == 0
+
+    def test_resource_deltas_only_report_changes(self, settlements):
+        """Test that untouched settlements and resources are not written back."""
+        rows = [(settlements[0], 0, {"wood": 5}), (settlements[1], 500, {"wood": 10})]
+        state = MarketSimulationManager.build_state(rows)
+        empty = np.zeros(0, dtype=np.int64)
+
+        result = MarketSimulationManager.clear_market(state, empty, empty, np.zeros(0))
+        deltas = MarketSimulationManager.resource_deltas(state, result)
+
+        assert deltas == [(settlements[1], {"wood": -5})]
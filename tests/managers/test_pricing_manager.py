@@ -0,0 +1,86 @@
+import random
+
+import pytest
+from uuid import uuid4
+
+from app.game_state.cache.price_table_cache import PriceTableCache
+from app.game_state.managers.pricing_manager import (
+    MAX_FACTION_SURCHARGE,
+    MAX_REPUTATION_DISCOUNT,
+    MIN_PRICE,
+    ModifierVector,
+    PricingManager,
+)
+
+
+class TestPricingManager:
+    """Test suite for pricing domain logic."""
+
+    def test_reputation_discount_is_symmetric_and_clamped(self):
+        """Test that reputation gives a discount when positive and a surcharge when negative."""
+        assert PricingManager.discount_for_reputation(100) == pytest.approx(MAX_REPUTATION_DISCOUNT)
+        assert PricingManager.discount_for_reputation(-250) == pytest.approx(-MAX_REPUTATION_DISCOUNT)
+        assert PricingManager.discount_for_reputation(None) == 0.0
+
+    def test_build_modifiers_uses_worst_disliked_faction(self):
+        """Test that the faction surcharge comes from the most liked disliked faction."""
+        settlement_faction, mild, hated = uuid4(), uuid4(), uuid4()
+        reputations = {settlement_faction: 50, mild: 20, hated: 100}
+
+        modifiers = PricingManager.build_modifiers(
+            reputations,
+            settlement_faction_id=settlement_faction,
+            disliked_faction_ids=[mild, hated],
+        )
+
+        assert modifiers.settlement_discount == pytest.approx(0.5 * MAX_REPUTATION_DISCOUNT)
+        assert modifiers.trader_discount == 0.0
+        assert modifiers.faction_modifier == pytest.approx(-MAX_FACTION_SURCHARGE)
+
+    def test_price_catalog_matches_per_item_formula(self):
+        """Test that catalog pricing equals the multiplicative per-item formula."""
+        modifiers = ModifierVector(settlement_discount=0.1, trader_discount=0.05, race_discount=0.0, faction_modifier=-0.2)
+        base_prices = [10.0, 99.99, None, 0.5]
+
+        prices = PricingManager.price_catalog(base_prices, modifiers)
+
+        expected = [round((b or 0.0) * 0.9 * 0.95 * 1.0 * 1.2, 2) for b in base_prices]
+        assert prices == expected
+
+    def test_price_catalog_matches_price_item(self):
+        """Test that the vectorized catalog prices every item exactly as price_item does."""
+        rng = random.Random(7)
+        modifiers = ModifierVector(settlement_discount=0.13, trader_discount=-0.07, race_discount=0.05, faction_modifier=-0.25)
+        base_prices = [round(rng.uniform(0, 500), 2) for _ in range(5000)] + [None, 0.0]
+
+        prices = PricingManager.price_catalog(base_prices, modifiers)
+
+        assert prices == [PricingManager.price_item(base, modifiers) for base in base_prices]
+
+    def test_prices_never_go_below_the_floor(self):
+        """Test that stacked discounts past 100% clip to MIN_PRICE."""
+        modifiers = ModifierVector(settlement_discount=0.8, trader_discount=0.5, race_discount=2.0)
+
+        assert PricingManager.price_catalog([10.0, 3.0], modifiers) == [MIN_PRICE, MIN_PRICE]
+        assert PricingManager.price_item(10.0, modifiers) == MIN_PRICE
+
+
+class TestPriceTableCache:
+    """Test suite for the modifier vector cache."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        PriceTableCache.clear()
+        yield
+        PriceTableCache.clear()
+
+    def test_invalidate_player_drops_only_their_tables(self):
+        """Test that a reputation change only evicts that player's vectors."""
+        player, other, settlement, trader = uuid4(), uuid4(), uuid4(), uuid4()
+        PriceTableCache.set((player, settlement, trader, None), ModifierVector())
+        PriceTableCache.set((other, settlement, trader, None), ModifierVector())
+
+        PriceTableCache.invalidate_player(player)
+
+        assert PriceTableCache.get((player, settlement, trader, None)) is None
+        assert PriceTableCache.get((other, settlement, trader, None)) == ModifierVector()
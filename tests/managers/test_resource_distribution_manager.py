@@ -0,0 +1,78 @@
+import random
+
+import numpy as np
+import pytest
+from uuid import uuid4
+
+from app.game_state.cache.biome_sampler_cache import BiomeSamplerCache
+from app.game_state.managers.resource_distribution_manager import ResourceDistributionManager
+from app.game_state.managers.resource_node_population_manager import ResourceNodePopulationManager
+from app.game_state.entities.resource.resource_node_pydantic import (
+    ResourceNodeEntityPydantic,
+    ResourceNodeResourceEntityPydantic,
+)
+
+
+def blueprint(name, chance=1.0, tags=None):
+    return ResourceNodeEntityPydantic(
+        id=uuid4(),
+        name=name,
+        tags=tags or [],
+        resource_links=[ResourceNodeResourceEntityPydantic(resource_id=uuid4(), chance=chance)],
+    )
+
+
+class TestResourceDistributionManager:
+    """Test suite for biome alias tables."""
+
+    def test_alias_table_matches_weights(self):
+        """Test that vectorized draws follow the given weights."""
+        table = ResourceDistributionManager.build_alias_table(["a", "b", "c", "d"], [1, 2, 3, 4])
+
+        indices = table.sample_indices(np.random.default_rng(0), 200_000)
+        frequencies = np.bincount(indices, minlength=4) / len(indices)
+
+        assert frequencies == pytest.approx([0.1, 0.2, 0.3, 0.4], abs=0.005)
+
+    def test_zero_weights_are_never_drawn(self):
+        """Test that zero-weight items never come up and all-zero weights fall back to uniform."""
+        table = ResourceDistributionManager.build_alias_table(["never", "always"], [0, 5])
+        rng = random.Random(1)
+        assert {table.draw(rng) for _ in range(1000)} == {"always"}
+
+        uniform = ResourceDistributionManager.build_alias_table(["x", "y"], [0, 0])
+        assert uniform.weights.tolist() == [0.5, 0.5]
+
+    def test_biome_resource_types_scale_blueprint_weight(self):
+        """Test that abundance multipliers apply to blueprints whose tags or resources match."""
+        resource_types = {"wood": 3.0, "herbs": 0.5}
+
+        assert ResourceDistributionManager.blueprint_weight(blueprint("Oak Grove", tags=["wood"]), resource_types) == 3.0
+        assert ResourceDistributionManager.blueprint_weight(blueprint("Patch", 0.5), resource_types, ["wild herbs"]) == 0.25
+        assert ResourceDistributionManager.blueprint_weight(blueprint("Iron Vein"), resource_types) == 1.0
+
+    def test_population_uses_sampler_reproducibly(self):
+        """Test that node generation with samplers is seedable and respects weights."""
+        common, rare = blueprint("Common", 9.0), blueprint("Rare", 1.0)
+        table = ResourceDistributionManager.build_biome_table([rare, common])
+        locations = [(uuid4(), "forest") for _ in range(500)]
+        blueprints = {"forest": list(table.items)}
+
+        def picks(seed):
+            rows = ResourceNodePopulationManager.generate_rows(
+                locations, blueprints, seed=seed, nodes_per_location=2, samplers={"forest": table}
+            )
+            return [node["name"].split()[0] for node, _ in rows]
+
+        first = picks(5)
+        assert first == picks(5)
+        assert first.count("Common") / len(first) == pytest.approx(0.9, abs=0.03)
+
+    def test_cache_remembers_empty_biomes(self):
+        """Test that biomes without blueprints are cached and cleared on invalidation."""
+        BiomeSamplerCache.clear()
+        BiomeSamplerCache.set("desert", None)
+
+        assert BiomeSamplerCache.missing(["desert", "forest"]) == {"forest"}
+        BiomeSamplerCache.invalidate("desert")
+        assert BiomeSamplerCache.missing(["desert"]) == {"desert"}
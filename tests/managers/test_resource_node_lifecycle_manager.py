@@ -0,0 +1,39 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+from app.game_state.managers.resource_node_lifecycle_manager import (
+    RESPAWN_JITTER,
+    YIELD_EXTRACTIONS,
+    ResourceNodeLifecycleManager,
+)
+
+
+class TestResourceNodeLifecycleManager:
+    """Test suite for resource node yield, depletion and respawn rules."""
+
+    def test_initial_yield_scales_with_largest_extraction(self):
+        """Test that a link holds YIELD_EXTRACTIONS maximum-size extractions."""
+        assert ResourceNodeLifecycleManager.initial_yield(5) == 5 * YIELD_EXTRACTIONS
+        assert ResourceNodeLifecycleManager.initial_yield(0) == YIELD_EXTRACTIONS
+
+    def test_depletion_follows_primary_links(self):
+        """Test that only primary links decide depletion when a node has any."""
+        assert ResourceNodeLifecycleManager.is_exhausted([(True, 0), (False, 40)])
+        assert not ResourceNodeLifecycleManager.is_exhausted([(True, 0), (True, 3)])
+        # Never-extracted links (None) are full
+        assert not ResourceNodeLifecycleManager.is_exhausted([(True, None)])
+
+    def test_depletion_without_primary_links_needs_all_exhausted(self):
+        """Test that nodes without primary links deplete once every link is exhausted."""
+        assert not ResourceNodeLifecycleManager.is_exhausted([(False, 0), (False, 2)])
+        assert ResourceNodeLifecycleManager.is_exhausted([(False, 0), (False, 0)])
+        assert not ResourceNodeLifecycleManager.is_exhausted([])
+
+    def test_respawn_time_follows_rarest_link(self):
+        """Test that the rarest resource sets the respawn delay, within the jitter band."""
+        now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        respawn_at = ResourceNodeLifecycleManager.respawn_at(now, ["common", "Rare"], random.Random(3))
+
+        delay = respawn_at - now
+        assert timedelta(hours=24 * (1 - RESPAWN_JITTER)) <= delay <= timedelta(hours=24 * (1 + RESPAWN_JITTER))
+        assert ResourceNodeLifecycleManager.respawn_delay([None]) == timedelta(hours=6)
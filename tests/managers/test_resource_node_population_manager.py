@@ -0,0 +1,82 @@
+import pytest
+from uuid import uuid4
+
+from app.game_state.managers.resource_node_population_manager import ResourceNodePopulationManager
+from app.game_state.entities.resource.resource_node_pydantic import (
+    ResourceNodeEntityPydantic,
+    ResourceNodeResourceEntityPydantic,
+)
+
+
+class TestResourceNodePopulationManager:
+    """Test suite for bulk resource node row generation."""
+
+    @pytest.fixture
+    def blueprints_by_biome(self):
+        """Two forest blueprints and one mountain blueprint."""
+        def blueprint(name, amount_min=1, amount_max=10):
+            return ResourceNodeEntityPydantic(
+                id=uuid4(),
+                name=name,
+                description=f"{name} description",
+                tags=["generated"],
+                resource_links=[
+                    ResourceNodeResourceEntityPydantic(
+                        resource_id=uuid4(), amount_min=amount_min, amount_max=amount_max, purity=0.9
+                    )
+                ],
+            )
+
+        return {
+            "forest": [blueprint("Oak Grove"), blueprint("Herb Patch")],
+            "mountains": [blueprint("Iron Vein", 5, 20)],
+        }
+
+    @pytest.fixture
+    def locations(self):
+        return [(uuid4(), "forest"), (uuid4(), "mountains"), (uuid4(), "desert"), (uuid4(), None)]
+
+    def test_same_seed_reproduces_rows(self, locations, blueprints_by_biome):
+        """Test that two runs with the same seed generate identical rows."""
+        first = list(ResourceNodePopulationManager.generate_rows(locations, blueprints_by_biome, seed=7))
+        second = list(ResourceNodePopulationManager.generate_rows(list(reversed(locations)), blueprints_by_biome, seed=7))
+
+        assert first == second
+
+    def test_different_seed_changes_rows(self, locations, blueprints_by_biome):
+        """Test that a different seed produces different node ids."""
+        first = [node["id"] for node, _ in ResourceNodePopulationManager.generate_rows(locations, blueprints_by_biome, seed=1)]
+        second = [node["id"] for node, _ in ResourceNodePopulationManager.generate_rows(locations, blueprints_by_biome, seed=2)]
+
+        assert first != second
+
+    def test_blueprints_picked_by_biome(self, locations, blueprints_by_biome):
+        """Test that nodes only spawn where the biome has blueprints."""
+        rows = list(ResourceNodePopulationManager.generate_rows(
+            locations, blueprints_by_biome, seed=3, nodes_per_location=4
+        ))
+        populated = {node["location_id"] for node, _ in rows}
+
+        assert populated == {locations[0][0], locations[1][0]}
+        assert len(rows) == 8
+        for node, _ in rows:
+            biome = node["biome_type"]
+            names = {bp.name for bp in blueprints_by_biome[biome]}
+            assert any(node["name"].startswith(name) for name in names)
+
+    def test_node_names_unique_and_links_within_range(self, locations, blueprints_by_biome):
+        """Test that node names are unique and rolled amounts respect blueprint bounds."""
+        rows = list(ResourceNodePopulationManager.generate_rows(
+            locations, blueprints_by_biome, seed=11, nodes_per_location=20
+        ))
+        names = [node["name"] for node, _ in rows]
+
+        assert len(names) == len(set(names))
+        for node, links in rows:
+            assert len(links) == 1
+            link = links[0]
+            assert link["node_id"] == node["id"]
+            if node["biome_type"] == "mountains":
+                assert 5 <= link["amount_min"] <= link["amount_max"] <= 20
+            else:
+                assert 1 <= link["amount_min"] <= link["amount_max"] <= 10
@@ -0,0 +1,90 @@
+import asyncio
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.game_state.managers.settlement_expansion_manager import SettlementExpansionManager
+from app.game_state.workers import settlement_worker
+
+BARRACKS, MARKET, SHRINE = uuid4(), uuid4(), uuid4()
+PROFILES = SettlementExpansionManager.profile_blueprints([
+    (BARRACKS, {"attributes": ["MILITARY", "DEFENSIVE"]}),
+    (MARKET, {"attributes": ["ECONOMIC"]}),
+    (SHRINE, None),
+])
+
+
+class TestSettlementExpansionManager:
+    """Test suite for settlement expansion scoring."""
+
+    def test_scores_match_the_weighted_building_score(self):
+        """Test trait affinity weighted 0.6 plus the placeholder resource (1.0) and needs (0.5) scores."""
+        # DEFENSIVE prefers {DEFENSIVE, MILITARY}: full match; ECONOMICAL prefers {ECONOMIC, PRODUCTION}: none
+        attributes = PROFILES[0].attributes
+        assert SettlementExpansionManager.trait_affinity(attributes, ["DEFENSIVE", "ECONOMICAL"]) == 0.5
+        assert SettlementExpansionManager.score(attributes, ["DEFENSIVE"]) == pytest.approx(0.6 + 0.2 + 0.1)
+        assert SettlementExpansionManager.score(frozenset(), ["DEFENSIVE"]) == pytest.approx(0.3)
+
+    def test_ranking_is_by_score_then_blueprint_order(self):
+        """Test that blueprints are ranked highest first, ties in blueprint order, and limited."""
+        ranked = SettlementExpansionManager.rank_blueprints(PROFILES, ["ECONOMICAL"])
+        assert [blueprint_id for blueprint_id, _ in ranked] == [MARKET, BARRACKS, SHRINE]
+        assert SettlementExpansionManager.rank_blueprints(PROFILES, ["ECONOMICAL"], limit=1)[0][0] == MARKET
+        assert SettlementExpansionManager.rank_blueprints(PROFILES, []) == []
+
+    def test_timings_summary(self):
+        """Test the per-settlement timing summary."""
+        assert SettlementExpansionManager.summarize_timings([1.0, 3.0]) == {"count": 2, "mean_ms": 2.0, "max_ms": 3.0}
+        assert SettlementExpansionManager.summarize_timings([])["count"] == 0
+
+
+class FakeSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def test_expansion_streams_chunks_with_bounded_sessions(monkeypatch):
+    """Test that the expansion task pages through settlements and evaluates chunks concurrently, bounded."""
+    leader = uuid4()
+    settlements = sorted(
+        [(uuid4(), f"Town {number}", leader if number % 2 else None) for number in range(7)],
+        key=lambda row: row[0],
+    )
+    state = {"running": 0, "peak": 0, "trait_queries": 0}
+
+    async def find_metadata_rows(self):
+        return [(BARRACKS, {"attributes": ["MILITARY", "DEFENSIVE"]}), (MARKET, {"attributes": ["ECONOMIC"]})]
+
+    async def find_expansion_chunk(self, world_id, after_id, limit):
+        remaining = [row for row in settlements if after_id is None or row[0] > after_id]
+        return remaining[:limit]
+
+    async def find_traits_by_ids(self, character_ids):
+        state["trait_queries"] += 1
+        state["running"] += 1
+        state["peak"] = max(state["peak"], state["running"])
+        await asyncio.sleep(0.01)
+        state["running"] -= 1
+        return {leader: ["DEFENSIVE"]}
+
+    monkeypatch.setattr(settlement_worker, "get_read_session_factory", lambda: FakeSession)
+    monkeypatch.setattr(settlement_worker.BuildingBlueprintRepository, "__init__", lambda self, db: None)
+    monkeypatch.setattr(settlement_worker.SettlementRepository, "__init__", lambda self, db: None)
+    monkeypatch.setattr(settlement_worker.CharacterRepository, "__init__", lambda self, db: None)
+    monkeypatch.setattr(settlement_worker.BuildingBlueprintRepository, "find_metadata_rows", find_metadata_rows)
+    monkeypatch.setattr(settlement_worker.SettlementRepository, "find_expansion_chunk", find_expansion_chunk)
+    monkeypatch.setattr(settlement_worker.CharacterRepository, "find_traits_by_ids", find_traits_by_ids)
+    monkeypatch.setattr(settlement_worker, "EXPANSION_CHUNK_SIZE", 2)
+    monkeypatch.setattr(settlement_worker, "EXPANSION_SESSIONS", 2)
+
+    result = asyncio.run(settlement_worker._expand_settlement_async(task_id="test"))
+
+    assert result["chunks"] == 4 and state["trait_queries"] == 4
+    assert state["peak"] == 2
+    assert [UUID(r["settlement_id"]) for r in result["results"]] == [row[0] for row in settlements]
+    assert result["pending_construction"] == 3 and result["skipped_settlements"] == 4
+    assert all(r["building_blueprint_id"] == str(BARRACKS) for r in result["results"] if r["action"] == "identified")
+    assert result["settlement_timings"]["count"] == 7
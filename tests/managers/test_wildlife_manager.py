@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+from uuid import uuid4
+
+from app.game_state.managers.wildlife_manager import MAX_DANGER, WildlifeManager
+
+
+def wildlife_row(location_id, **overrides):
+    row = {
+        "id": uuid4(),
+        "location_id": location_id,
+        "population": 5,
+        "max_population": 10,
+        "spawn_rate": 0.5,
+        "danger_rating": 2,
+        "pack_behavior": False,
+        "pack_size_min": 1,
+        "nocturnal": False,
+        "seasonal_activity": None,
+    }
+    row.update(overrides)
+    return row
+
+
+class TestWildlifeManager:
+    """Test suite for wildlife growth and danger."""
+
+    @pytest.fixture
+    def location(self):
+        return uuid4()
+
+    def test_season_modifier_accepts_index_or_name(self):
+        """Test that seasonal activity can be keyed by season index or name."""
+        assert WildlifeManager.season_modifier({"winter": 0.2}, 3) == 0.2
+        assert WildlifeManager.season_modifier({"1": 1.5}, 1) == 1.5
+        assert WildlifeManager.season_modifier(None, 0) == 1.0
+
+    def test_growth_is_logistic_and_bounded(self, location):
+        """Test that populations grow below capacity, stay at capacity, and never exceed it."""
+        rows = [wildlife_row(location, population=p) for p in (2, 5, 10)]
+        arrays = WildlifeManager.build_arrays(rows * 200, season=0)
+
+        grown = WildlifeManager.grow(arrays, np.random.default_rng(1))
+
+        assert np.all(grown <= arrays.max_population)
+        assert np.all(grown >= arrays.population)
+        assert np.all(grown[2::3] == 10)
+        # Expected growth of N=5, K=10, r=0.5 is 1.25 per day
+        assert grown[1::3].mean() == pytest.approx(6.25, abs=0.15)
+
+    def test_dormant_season_stops_growth(self, location):
+        """Test that a zero seasonal modifier freezes the population, including respawns."""
+        rows = [wildlife_row(location, population=p, seasonal_activity={"winter": 0}) for p in (0, 4)]
+        arrays = WildlifeManager.build_arrays(rows, season=3)
+
+        assert WildlifeManager.grow(arrays, np.random.default_rng(0)).tolist() == [0, 4]
+
+    def test_location_danger_combines_biome_and_wildlife(self, location):
+        """Test that wildlife raises danger above the base and nocturnal wildlife is worse at night."""
+        quiet = uuid4()
+        rows = [wildlife_row(location, nocturnal=True, danger_rating=3)]
+        arrays = WildlifeManager.build_arrays(rows, season=0)
+
+        day, night = WildlifeManager.location_danger(
+            [location, quiet], np.array([4.0, 2.0]), arrays, arrays.population
+        )
+
+        assert day[1] == night[1] == 2.0
+        assert 4.0 < day[0] < night[0] <= MAX_DANGER
+
+    def test_pack_bonus_matches_model(self, location):
+        """Test that the vectorized danger matches Wildlife.get_effective_danger."""
+        rows = [wildlife_row(location, population=6, pack_behavior=True, pack_size_min=2)]
+        arrays = WildlifeManager.build_arrays(rows, season=0)
+
+        # danger 2 * 6 = 12, three pack steps -> x2.5
+        assert WildlifeManager.effective_danger(arrays, arrays.population).tolist() == [30.0]
@@ -0,0 +1,138 @@
+import pytest
+from collections import deque
+from uuid import uuid4, UUID
+
+from app.game_state.entities.resource.resource_node_pydantic import (
+    ResourceNodeEntityPydantic,
+    ResourceNodeResourceEntityPydantic,
+)
+from app.game_state.managers.world_generation_manager import (
+    GenerationBiome,
+    GenerationTier,
+    TABLE_ORDER,
+    WorldGenerationManager,
+)
+
+
+class TestWorldGenerationManager:
+    """Test suite for procedural world generation."""
+
+    @pytest.fixture
+    def tiers(self):
+        return [GenerationTier(uuid4(), 3), GenerationTier(uuid4(), 4), GenerationTier(uuid4(), 9)]
+
+    @pytest.fixture
+    def biomes(self):
+        return [
+            GenerationBiome(uuid4(), "forest", danger_level_base=2, movement_modifier=0.8),
+            GenerationBiome(uuid4(), "plains"),
+            GenerationBiome(uuid4(), "mountains", danger_level_base=4, movement_modifier=0.5),
+        ]
+
+    @staticmethod
+    def collect(batches):
+        rows = {table: [] for table in TABLE_ORDER}
+        for table, batch in batches:
+            rows[table].extend(batch)
+        return rows
+
+    def test_same_seed_reproduces_world(self, tiers, biomes):
+        """Test that the same seed and world produce identical rows, whatever the biome order."""
+        world_id = uuid4()
+        first = self.collect(WorldGenerationManager.generate_batches(world_id, 42, tiers, biomes, settlement_chance=0.5))
+        second = self.collect(WorldGenerationManager.generate_batches(world_id, 42, tiers, list(reversed(biomes)), settlement_chance=0.5))
+
+        assert first == second
+
+    def test_resource_nodes_do_not_depend_on_batch_size(self, tiers, biomes):
+        """Test that one world and seed get the same resource nodes whatever the flush boundaries."""
+        def blueprint(name):
+            return ResourceNodeEntityPydantic(
+                id=uuid4(), name=name,
+                resource_links=[ResourceNodeResourceEntityPydantic(resource_id=uuid4(), amount_min=1, amount_max=50, purity=0.9)],
+            )
+
+        blueprints_by_biome = {biome.code: [blueprint(f"{biome.code} a"), blueprint(f"{biome.code} b")] for biome in biomes}
+        world_id = uuid4()
+
+        def nodes(batch_size):
+            rows = self.collect(WorldGenerationManager.generate_batches(
+                world_id, 42, tiers, biomes, blueprints_by_biome=blueprints_by_biome,
+                nodes_per_location=2, batch_size=batch_size,
+            ))
+            key = lambda row: str(row["node_id"] if "node_id" in row else row["id"])
+            return sorted(rows["resource_nodes"], key=key), sorted(rows["resource_node_resources"], key=key)
+
+        small, large = nodes(7), nodes(5000)
+        assert len(small[0]) == 2 * 3 * 4 * 9
+        assert small == large
+
+    def test_layout_depends_only_on_seed(self, tiers, biomes):
+        """Test that two worlds from one seed share a layout but not primary keys."""
+        first = self.collect(WorldGenerationManager.generate_batches(uuid4(), 42, tiers, biomes))
+        second = self.collect(WorldGenerationManager.generate_batches(uuid4(), 42, tiers, biomes))
+
+        def layout(rows):
+            return [(r["name"], r["attributes"]["x"], r["attributes"]["y"], r["biome_id"]) for r in rows]
+
+        assert layout(first["location_entities"]) == layout(second["location_entities"])
+        assert not {r["id"] for r in first["location_entities"]} & {r["id"] for r in second["location_entities"]}
+
+    def test_hierarchy_counts_and_parent_order(self, tiers, biomes):
+        """Test that every tier is fully generated and parents are emitted before children."""
+        rows = self.collect(WorldGenerationManager.generate_batches(uuid4(), 1, tiers, biomes, batch_size=10))
+        locations = rows["location_entities"]
+
+        assert len(locations) == 3 + 3 * 4 + 3 * 4 * 9
+        seen = set()
+        for location in locations:
+            assert location["parent_id"] is None or location["parent_id"] in seen
+            seen.add(location["id"])
+
+    def test_batches_respect_foreign_key_order(self, tiers, biomes):
+        """Test that links only reference locations from earlier or same-flush batches."""
+        emitted = set()
+        for table, batch in WorldGenerationManager.generate_batches(uuid4(), 3, tiers, biomes, batch_size=25, settlement_chance=1.0):
+            if table == "location_entities":
+                emitted.update(row["id"] for row in batch)
+            elif table == "travel_links":
+                for row in batch:
+                    assert row["from_location_id"] in emitted
+                    assert row["to_location_id"] in emitted
+
+    def test_travel_graph_is_connected(self, tiers, biomes):
+        """Test that every leaf location can reach every other one."""
+        rows = self.collect(WorldGenerationManager.generate_batches(uuid4(), 9, tiers, biomes))
+        leaf_type = tiers[-1].location_type_id
+        leaves = {r["id"] for r in rows["location_entities"] if r["location_type_id"] == leaf_type}
+
+        graph = {leaf: set() for leaf in leaves}
+        for link in rows["travel_links"]:
+            graph[link["from_location_id"]].add(link["to_location_id"])
+
+        start = next(iter(leaves))
+        reached, queue = {start}, deque([start])
+        while queue:
+            for neighbour in graph[queue.popleft()] - reached:
+                reached.add(neighbour)
+                queue.append(neighbour)
+
+        assert reached == leaves
+
+    def test_settlements_are_linked_from_locations(self, tiers, biomes):
+        """Test that each settlement is referenced by exactly one leaf location."""
+        rows = self.collect(WorldGenerationManager.generate_batches(uuid4(), 5, tiers, biomes, settlement_chance=1.0))
+        referenced = [
+            UUID(r["attributes"]["settlement_id"])
+            for r in rows["location_entities"] if "settlement_id" in r["attributes"]
+        ]
+
+        assert rows["settlements"]
+        assert sorted(referenced, key=str) == sorted((s["id"] for s in rows["settlements"]), key=str)
+
+    def test_noise_is_bounded_and_deterministic(self):
+        """Test that fractal noise stays in [0, 1] and repeats for the same inputs."""
+        samples = [WorldGenerationManager.fractal_noise(11, x * 0.37, x * 0.91) for x in range(200)]
+
+        assert all(0.0 <= value <= 1.0 for value in samples)
+        assert samples == [WorldGenerationManager.fractal_noise(11, x * 0.37, x * 0.91) for x in range(200)]
@@ -0,0 +1,96 @@
+import io
+import uuid
+
+import pytest
+
+from app.game_state.managers.world_snapshot_manager import (
+    SNAPSHOT_CODECS,
+    SnapshotFormatError,
+    SnapshotReader,
+    SnapshotWriter,
+    WorldSnapshotManager,
+)
+from app.game_state.repositories.world.world_snapshot_repository import (
+    SNAPSHOT_SCOPES,
+    SNAPSHOT_TABLES,
+    WorldSnapshotRepository,
+)
+
+INSTALLED_CODECS = [name for name, codec in SNAPSHOT_CODECS.items() if codec.available()]
+
+
+def _write(codec_name, batches):
+    buffer = io.BytesIO()
+    writer = SnapshotWriter(buffer, WorldSnapshotManager.get_codec(codec_name))
+    writer.write_manifest({"world_id": str(uuid.uuid4())})
+    for table, columns, rows in batches:
+        writer.write_batch(table, columns, rows)
+    writer.close()
+    return buffer.getvalue()
+
+
+class TestWorldSnapshotManager:
+    """Test suite for the world snapshot file format and row transforms."""
+
+    @pytest.mark.parametrize("codec_name", INSTALLED_CODECS)
+    def test_round_trip_keeps_text_and_nulls(self, codec_name):
+        """Test that batches come back column by column, with NULL and '' kept apart."""
+        rows = [("a", None), ("", '{"x": 1}'), ("é\n\"q\"", "{1,2}")]
+        reader = SnapshotReader(io.BytesIO(_write(codec_name, [("zones", ["id", "attrs"], rows)])))
+
+        batches = list(reader.batches())
+        assert reader.codec.name == codec_name
+        assert batches == [("zones", ["id", "attrs"], {"id": ["a", "", "é\n\"q\""], "attrs": [None, '{"x": 1}', "{1,2}"]})]
+        assert reader.counts == {"zones": 3}
+
+    def test_truncated_and_foreign_files_are_rejected(self):
+        """Test that a cut-off snapshot or another file type fails loudly."""
+        data = _write("json", [("zones", ["id"], [("a",)])])
+        with pytest.raises(SnapshotFormatError):
+            list(SnapshotReader(io.BytesIO(data[:-3])).batches())
+        with pytest.raises(SnapshotFormatError):
+            SnapshotReader(io.BytesIO(b"PAR1 not a snapshot\n"))
+
+    def test_remap_gives_fresh_ids_and_follows_references(self):
+        """Test that primary keys are renewed and references to remapped rows follow them."""
+        id_map = {}
+        parent_rows, _ = WorldSnapshotManager.remap_batch(
+            ["id", "theme_id"], {"id": ["w1"], "theme_id": ["shared"]}, {"id", "theme_id"}, id_map
+        )
+        child_rows, later = WorldSnapshotManager.remap_batch(
+            ["id", "world_id", "parent_id"],
+            {"id": ["c1", "c2"], "world_id": ["w1", "w1"], "parent_id": [None, "c1"]},
+            {"id", "world_id", "parent_id"}, id_map, deferred=["parent_id"],
+        )
+
+        new_world = parent_rows[0][0]
+        assert new_world != "w1" and parent_rows[0][1] == "shared"
+        assert [row[1] for row in child_rows] == [new_world, new_world]
+        assert [row[2] for row in child_rows] == [None, None]
+        assert later == {"parent_id": [(id_map["c2"], "c1")]}
+
+    def test_keep_ids_leaves_values_alone(self):
+        """Test that restoring without remapping keeps every id."""
+        rows, _ = WorldSnapshotManager.remap_batch(["id", "world_id"], {"id": ["a"], "world_id": ["w"]}, {"id", "world_id"}, {}, remap_ids=False)
+        assert rows == [["a", "w"]]
+
+    def test_encode_csv_quotes_values_and_leaves_nulls_bare(self):
+        """Test the CSV that COPY reads: quoted values, unquoted empty NULL."""
+        assert WorldSnapshotManager.encode_csv([["a", None, 'say "hi"', ""]]) == b'"a",,"say ""hi""",""\n'
+
+    def test_restore_order_defers_only_nullable_cycles(self):
+        """Test that the snapshot tables restore in an order whose back-references can be deferred."""
+        foreign_keys = {table: WorldSnapshotRepository.foreign_keys(table) for table in SNAPSHOT_TABLES}
+        deferred = WorldSnapshotManager.deferred_columns(SNAPSHOT_TABLES, foreign_keys)
+
+        assert "parent_id" in deferred["location_entities"]
+        assert "leader_id" in deferred["settlements"]
+        for table in deferred:
+            assert WorldSnapshotRepository.primary_key(table) == "id"
+
+    def test_scopes_reference_real_columns(self):
+        """Test that every scope names an existing column and an earlier parent table."""
+        for table, (column, parent) in SNAPSHOT_SCOPES.items():
+            assert column in WorldSnapshotRepository.table(table).c
+            if parent is not None:
+                assert SNAPSHOT_TABLES.index(parent) < SNAPSHOT_TABLES.index(table)
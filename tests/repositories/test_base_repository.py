@@ -7,12 +7,13 @@ from typing import Dict, Any, Optional, List
 from sqlalchemy.exc import SQLAlchemyError, OperationalError
 
 # Import the BaseRepository and required components
+from app.game_state.repositories import base_repository
 from app.game_state.repositories.base_repository import BaseRepository
 from app.game_state.entities.base import BaseEntity
 from app.db.async_session import AsyncSession
 
 from sqlalchemy import Column, String, JSON
-from sqlalchemy.dialects.postgresql import UUID as pgUUID
+from sqlalchemy.dialects.postgresql import UUID as pgUUID, asyncpg
 from sqlalchemy.orm import DeclarativeBase
 
 # Create test models and entities for testing
@@ -278,6 +279,23 @@ class TestBulkOperations:
         # Flush should be called to commit the deletion
         assert mock_db_session.flush.await_count == 1
 
+    @pytest.mark.asyncio
+    async def test_bulk_insert_rows_sends_one_multi_row_insert_per_chunk(self, repository, mock_db_session, monkeypatch):
+        """Test bulk_insert_rows renders multi-row VALUES, with chunks capped by the bind parameter limit."""
+        monkeypatch.setattr(base_repository, "MAX_BIND_PARAMETERS", 6)  # 2 rows of 3 columns
+        rows = [{"id": uuid4(), "name": f"Row {i}", "json_data": None} for i in range(5)]
+
+        inserted = await repository.bulk_insert_rows(rows, chunk_size=1000)
+
+        assert inserted == 5
+        assert mock_db_session.execute.await_count == 3
+        for call in mock_db_session.execute.await_args_list:
+            # One statement and no executemany parameter list
+            assert len(call.args) == 1
+        sql = str(mock_db_session.execute.await_args_list[0].args[0].compile(dialect=asyncpg.dialect()))
+        assert sql.count("), (") == 1
+        assert mock_db_session.commit.await_count == 0
+
 class TestErrorHandling:
     @pytest.mark.asyncio
     async def test_save_raises_on_db_connection_failure(self, repository, sample_entity):
@@ -0,0 +1,138 @@
+import pytest
+from uuid import uuid4
+from sqlalchemy.dialects.postgresql import asyncpg
+
+from app.game_state.entities.character.character_pydantic import CharacterEntityPydantic
+from app.game_state.entities.geography.settlement_pydantic import SettlementEntityPydantic
+from app.game_state.enums.character import CharacterTypeEnum
+from app.game_state.repositories import base_repository
+from app.game_state.repositories.base_repository import ConcurrentUpdateError
+from app.game_state.repositories.character_repository import CharacterRepository
+from app.game_state.repositories.settlement_repository import SettlementRepository
+
+SETTLEMENT_ID = uuid4()
+IRON = str(uuid4())
+
+
+def _compiled(stmt):
+    compiled = stmt.compile(dialect=asyncpg.dialect())
+    return str(compiled), compiled.params
+
+
+def _row(version, resources):
+    return {"id": SETTLEMENT_ID, "name": "Oakvale", "world_id": uuid4(), "resources": resources, "version": version}
+
+
+class FakeResult:
+    def __init__(self, row):
+        self.row = row
+
+    def mappings(self):
+        return self
+
+    def one_or_none(self):
+        return self.row
+
+    def first(self):
+        return self.row
+
+
+class FakeSyncSession:
+    identity_map = {}
+
+    @staticmethod
+    def identity_key(model_cls, pk):
+        return (model_cls, (pk,))
+
+
+class FakeSession:
+    """Answers executes from a queue of rows and records the statements."""
+
+    def __init__(self, rows):
+        self.rows = list(rows)
+        self.statements = []
+        self.sync_session = FakeSyncSession()
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return FakeResult(self.rows.pop(0))
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(base_repository, "OPTIMISTIC_RETRY_BACKOFF", 0)
+
+
+class TestOptimisticConcurrency:
+    """Test suite for versioned writes and update_with_retry."""
+
+    async def test_versioned_update_is_a_compare_and_set(self):
+        """Test that the UPDATE checks the read version, bumps it and returns the row."""
+        db = FakeSession([_row(4, {IRON: 3})])
+        repository = SettlementRepository(db)
+
+        row = await repository.update_versioned(SETTLEMENT_ID, 3, {"resources": {IRON: 3}, "id": uuid4()})
+
+        sql, params = _compiled(db.statements[0])
+        assert "settlements.version = $4" in sql and params["version_2"] == 3
+        assert "version=(settlements.version + $2::INTEGER)" in sql and params["version_1"] == 1
+        assert "RETURNING" in sql and "SET id" not in sql
+        assert row["version"] == 4
+
+    async def test_versioned_update_leaves_timestamps_to_the_database(self):
+        """Test that update() doesn't write back the timestamps it read, so onupdate refreshes updated_at."""
+        character = CharacterEntityPydantic(name="Mira", character_type=CharacterTypeEnum.NPC, world_id=uuid4(), version=2)
+        db = FakeSession([{"id": character.id, "version": 3}])
+
+        saved = await CharacterRepository(db).update(character)
+
+        sql, params = _compiled(db.statements[0])
+        set_clause = sql.split(" WHERE ")[0]
+        assert "created_at=" not in set_clause
+        assert "updated_at=now()" in set_clause and "updated_at" not in params
+        assert saved.version == 3
+
+    async def test_zero_rows_distinguishes_conflict_from_missing(self):
+        """Test that an unmatched UPDATE raises only if the row still exists."""
+        repository = SettlementRepository(FakeSession([None, (SETTLEMENT_ID,)]))
+        with pytest.raises(ConcurrentUpdateError):
+            await repository.update_versioned(SETTLEMENT_ID, 3, {"name": "x"})
+
+        repository = SettlementRepository(FakeSession([None, None]))
+        assert await repository.update_versioned(SETTLEMENT_ID, 3, {"name": "x"}) is None
+
+    async def test_retry_reapplies_the_change_to_a_fresh_read(self):
+        """Test that a conflict re-reads the row and re-runs the domain method on it."""
+        db = FakeSession([
+            _row(1, {IRON: 5}),            # first read
+            None, (SETTLEMENT_ID,),        # write loses: version moved on
+            _row(2, {IRON: 7}),            # second read sees the other writer's change
+            _row(3, {IRON: 9}),            # write wins
+        ])
+        repository = SettlementRepository(db)
+
+        saved = await repository.update_with_retry(SETTLEMENT_ID, lambda s: s.add_resource(IRON, 2))
+
+        assert saved.resources == {IRON: 9} and saved.version == 3
+        sql, params = _compiled(db.statements[4])
+        assert params["version_2"] == 2 and params["resources"] == {IRON: 9}
+        assert "SET resources=" in sql and "name=" not in sql
+
+    async def test_domain_refusal_and_exhausted_retries(self):
+        """Test that mutate returning False writes nothing and repeated conflicts give up."""
+        db = FakeSession([_row(1, {IRON: 1})])
+        repository = SettlementRepository(db)
+        assert await repository.update_with_retry(SETTLEMENT_ID, lambda s: s.remove_resource(IRON, 5)) is None
+        assert len(db.statements) == 1
+
+        repository = SettlementRepository(FakeSession([_row(1, None), None, (SETTLEMENT_ID,)] * 2))
+        with pytest.raises(ConcurrentUpdateError):
+            await repository.update_with_retry(SETTLEMENT_ID, lambda s: s.add_resource(IRON), max_attempts=2)
+
+    def test_new_entities_leave_version_to_the_database(self):
+        """Test that an unset version isn't inserted and only opted-in models are versioned."""
+        repository = SettlementRepository(FakeSession([]))
+        data = SettlementEntityPydantic(name="Oakvale").model_dump(include=repository._model_column_keys)
+
+        assert "version" not in repository._strip_unset_version(data)
+        assert repository.is_versioned and CharacterRepository(FakeSession([])).is_versioned
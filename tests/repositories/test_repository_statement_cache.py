@@ -0,0 +1,78 @@
+from uuid import uuid4
+
+from sqlalchemy.dialects.postgresql import asyncpg
+
+from app.db.models.character import Character
+from app.game_state.entities.character.character_pydantic import CharacterEntityPydantic
+from app.game_state.repositories.base_repository import BaseRepository
+
+
+class EmptyResult:
+    def scalar_one_or_none(self):
+        return None
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return []
+
+
+class RecordingSession:
+    def __init__(self):
+        self.executed = []
+
+    async def execute(self, stmt, params=None):
+        self.executed.append((stmt, params))
+        return EmptyResult()
+
+
+def _repository(session):
+    return BaseRepository(session, Character, CharacterEntityPydantic)
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=asyncpg.dialect()))
+
+
+class TestRepositoryStatementCache:
+    """Test suite for the prebuilt, parameterized repository reads."""
+
+    async def test_statements_are_shared_across_repositories(self):
+        """Test that each query shape is built once per model and only the parameters change."""
+        session = RecordingSession()
+        first, second = uuid4(), uuid4()
+
+        await _repository(session).exists(first)
+        await _repository(session).exists(second)
+        await _repository(session).get_by_field("name", "Aldric")
+        await _repository(session).get_by_field("name", "Brenna")
+
+        (exists_a, params_a), (exists_b, params_b), (field_a, value_a), (field_b, value_b) = session.executed
+        assert exists_a is exists_b and field_a is field_b
+        assert params_a == {"pk": first} and params_b == {"pk": second}
+        assert value_a == {"value": "Aldric"} and value_b == {"value": "Brenna"}
+
+    async def test_none_values_compare_with_is_null(self):
+        """Test that None becomes IS NULL instead of a parameter that never matches."""
+        session = RecordingSession()
+        repository = _repository(session)
+
+        await repository.get_by_field("description", None)
+        await repository.find_by_multiple_fields({"name": "Aldric", "description": None})
+
+        assert "characters.description IS NULL" in _sql(session.executed[0][0])
+        stmt, params = session.executed[1]
+        assert "characters.description IS NULL" in _sql(stmt) and params == {"value_0": "Aldric"}
+
+    async def test_in_lists_use_one_expanding_statement(self):
+        """Test that lists of any length reuse the same statement."""
+        session = RecordingSession()
+        repository = _repository(session)
+
+        await repository.find_by_field_list("name", ["a"])
+        await repository.find_by_field_list("name", ["a", "b", "c"])
+
+        (one, one_params), (three, three_params) = session.executed
+        assert one is three and three_params == {"values": ["a", "b", "c"]}
+        assert "POSTCOMPILE_values" in _sql(one)
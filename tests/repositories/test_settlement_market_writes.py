@@ -0,0 +1,77 @@
+import json
+from uuid import uuid4
+
+import pytest
+
+from app.core.cache_invalidation import CacheInvalidationBus
+from app.game_state.repositories.settlement_repository import SettlementRepository
+
+
+class RowsResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+
+class RecordingSession:
+    """Answers each execute with the next list of rows and records the statements."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.executed = []
+
+    async def execute(self, stmt, params=None):
+        self.executed.append((str(stmt), params))
+        return RowsResult(self.results.pop(0))
+
+
+@pytest.fixture(autouse=True)
+def recorded(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(CacheInvalidationBus, "record", classmethod(lambda cls, session, kind, pk, version=None: recorded.append((kind, pk, version))))
+    return recorded
+
+
+class TestSettlementMarketWrites:
+    """Test suite for the market tick's bulk resource writes."""
+
+    async def test_deltas_are_summed_in_sql_at_the_read_version(self, recorded):
+        """Test that the tick sends changes, not snapshots, and checks and bumps the row version."""
+        settlement_id = uuid4()
+        session = RecordingSession([(settlement_id, 8)])
+
+        updated, skipped = await SettlementRepository(session).bulk_apply_resource_deltas([(settlement_id, 7, {"wood": -5, "iron": 2})])
+
+        (sql, params), = session.executed
+        assert (updated, skipped) == (1, [])
+        assert json.loads(params["payload"]) == [{"id": str(settlement_id), "version": 7, "deltas": {"wood": -5, "iron": 2}}]
+        assert "jsonb_each_text(COALESCE(s.resources" in sql and "SUM(" in sql
+        assert "version = s.version + 1" in sql and "s.version = v.version" in sql
+        assert recorded == [("settlements", settlement_id, 8)]
+
+    async def test_conflicting_rows_are_retried_then_skipped(self):
+        """Test that rows another writer changed get their deltas re-applied at the new version, up to a limit."""
+        won, raced, contended = uuid4(), uuid4(), uuid4()
+        session = RecordingSession(
+            [(won, 2)],                      # first UPDATE: two rows had moved on
+            [(raced, 5), (contended, 9)],    # re-read versions
+            [(raced, 6)],                    # second UPDATE: one still loses
+        )
+        rows = [(won, 1, {"wood": 1}), (raced, 1, {"wood": 2}), (contended, 1, {"wood": 3})]
+
+        updated, skipped = await SettlementRepository(session).bulk_apply_resource_deltas(rows, max_attempts=2)
+
+        assert (updated, skipped) == (2, [contended])
+        retried = json.loads(session.executed[2][1]["payload"])
+        assert retried == [
+            {"id": str(raced), "version": 5, "deltas": {"wood": 2}},
+            {"id": str(contended), "version": 9, "deltas": {"wood": 3}},
+        ]
+
+    async def test_nothing_to_write_issues_no_statement(self):
+        """Test that an idle tick doesn't touch the table."""
+        session = RecordingSession()
+        assert await SettlementRepository(session).bulk_apply_resource_deltas([]) == (0, [])
+        assert session.executed == []
@@ -0,0 +1 @@
+# Tests for service layer
\ No newline at end of file
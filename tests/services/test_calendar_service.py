@@ -0,0 +1,86 @@
+import pytest
+from uuid import uuid4
+
+from app.core.cache_invalidation import PENDING_KEY
+from app.game_state.cache.calendar_cache import CalendarCache, WorldStateCache
+from app.game_state.services.world.calendar_service import CalendarService
+
+
+class FakeCalendarRepository:
+    """Serves fixed world clocks and records season writes."""
+
+    def __init__(self, clocks):
+        self.clocks = clocks
+        self.season_writes = []
+
+    async def find_world_clocks(self, world_ids=None):
+        return [clock for clock in self.clocks if world_ids is None or clock[0] in world_ids]
+
+    async def find_seasons_by_theme(self, theme_ids):
+        return {}
+
+    async def find_event_names_by_theme(self, theme_ids):
+        return {}
+
+    async def bulk_update_seasons(self, rows):
+        self.season_writes.append(list(rows))
+        return len(rows)
+
+
+class FakeSession:
+    def __init__(self):
+        self.info = {}
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    CalendarCache.clear()
+    WorldStateCache.clear()
+    yield
+    CalendarCache.clear()
+    WorldStateCache.clear()
+
+
+def _service(clocks):
+    service = CalendarService(FakeSession())
+    service.repository = FakeCalendarRepository(clocks)
+    return service
+
+
+class TestGetSnapshot:
+    """Test suite for reading world snapshots outside the tick."""
+
+    async def test_cache_miss_resolves_without_writing(self):
+        """Test that a miss computes the snapshot from the clock, caches it locally and writes nothing."""
+        world_id = uuid4()
+        # Stored season 3 is stale for day 200, so the tick would rewrite it
+        service = _service([(world_id, None, 200, 3)])
+
+        snapshot = await service.get_snapshot(world_id)
+
+        assert snapshot.world_id == world_id and snapshot.day == 200
+        assert service.repository.season_writes == []
+        assert PENDING_KEY not in service.db.info
+        assert WorldStateCache.get(world_id) == snapshot
+
+    async def test_cached_snapshot_skips_the_clock_query(self):
+        """Test that a published snapshot is returned as is."""
+        world_id = uuid4()
+        service = _service([(world_id, None, 200, 3)])
+        expected = await service.get_snapshot(world_id)
+        service.repository.clocks = []
+
+        assert await service.get_snapshot(world_id) == expected
+
+    async def test_unknown_world_has_no_snapshot(self):
+        """Test that a world without a clock row resolves to None."""
+        assert await _service([]).get_snapshot(uuid4()) is None
+
+    async def test_tick_persists_changed_seasons(self):
+        """Test that resolve_worlds still writes the seasons that moved."""
+        world_id = uuid4()
+        service = _service([(world_id, None, 200, 3)])
+
+        snapshot = (await service.resolve_worlds())[world_id]
+
+        assert service.repository.season_writes == [[(world_id, snapshot.season_index)]]
@@ -0,0 +1,70 @@
+import pytest
+from uuid import uuid4
+
+from app.core.cache_invalidation import PENDING_KEY
+from app.db.models.character_faction_relationship import CharacterFactionRelationship, RelationshipStatusEnum
+from app.game_state.cache.reputation_cache import ReputationCache
+from app.game_state.services.faction.faction_influence_service import FactionInfluenceService
+
+
+class ScalarResult:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar(self):
+        return self.value
+
+
+class FakeSession:
+    """Answers the UPDATE ... RETURNING with a fixed score (None: no row) and records inserts."""
+
+    def __init__(self, updated_score):
+        self.updated_score = updated_score
+        self.statements, self.added = [], []
+        self.flushed = False
+        self.info = {}
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return ScalarResult(self.updated_score)
+
+    def add(self, obj):
+        self.added.append(obj)
+
+    async def flush(self):
+        self.flushed = True
+
+
+class TestAdjustReputation:
+    """Test suite for in-place reputation changes."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        ReputationCache.clear()
+        yield
+        ReputationCache.clear()
+
+    async def test_existing_relationship_is_updated_in_sql(self):
+        """Test that an existing row is changed by the UPDATE alone, and the cache waits for the commit."""
+        character, faction = uuid4(), uuid4()
+        ReputationCache.set_many({character: {faction: 10}})
+        session = FakeSession(updated_score=30)
+
+        assert await FactionInfluenceService(session).adjust_reputation(character, faction, 20) == 30
+
+        assert len(session.statements) == 1 and session.added == []
+        assert ReputationCache.get_many([character])[0] == {character: {faction: 10}}
+        assert session.info[PENDING_KEY] == [("character_faction_relationships", str(character), None)]
+
+    async def test_missing_relationship_falls_back_to_an_insert(self):
+        """Test that with no row to update, a clamped relationship is inserted with its status."""
+        character, faction = uuid4(), uuid4()
+        session = FakeSession(updated_score=None)
+
+        assert await FactionInfluenceService(session).adjust_reputation(character, faction, 150) == 100
+
+        (row,) = session.added
+        assert isinstance(row, CharacterFactionRelationship) and session.flushed
+        assert (row.character_id, row.faction_id, row.reputation_score) == (character, faction, 100)
+        assert row.relationship_status == RelationshipStatusEnum.ALLY
+        assert session.info[PENDING_KEY] == [("character_faction_relationships", str(character), None)]
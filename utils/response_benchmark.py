@@ -0,0 +1,153 @@
+# response_benchmark.py
+"""
+Serialization benchmark for the heaviest list routes.
+
+Serves the same synthetic pages of location and resource node responses
+through three small FastAPI apps:
+
+- classic: an explicit JSONResponse class, so FastAPI re-validates against
+  response_model, builds Python dicts and json.dumps them (the only path
+  on older FastAPI versions)
+- default: FastAPI's own default; recent versions validate and then dump
+  straight to JSON bytes with Pydantic
+- model: the route returns model_response(...) from app.api.responses
+
+and reports the median request time of each, plus the gzip size of a page.
+No database is needed.
+
+Usage:
+    python utils/response_benchmark.py              # 1000 rows, 20 requests each
+    python utils/response_benchmark.py -r 5000 -n 50
+"""
+import argparse
+import gzip
+import json
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from app.api.responses import model_response
+from app.api.schemas.location.location_schema import (
+    LocationResponse,
+    Reference,
+    ResourceNodeResponse,
+    TravelConnectionResponse,
+)
+from app.api.schemas.resource_node_schema import ResourceNodeSummary
+from app.game_state.enums.resource import ResourceNodeVisibilityEnum
+from app.game_state.enums.shared import StatusEnum
+
+
+def _ref(name: str) -> Reference:
+    return Reference(id=uuid.uuid4(), name=name, code=name.lower())
+
+
+def build_locations(rows: int) -> List[LocationResponse]:
+    """Locations with a realistic amount of nested related data."""
+    now = datetime.now(timezone.utc)
+    return [
+        LocationResponse(
+            id=uuid.uuid4(),
+            name=f"Location {i}",
+            description="A windswept ridge above the river valley.",
+            location_type=_ref("Settlement"),
+            theme=_ref("Fantasy"),
+            world=_ref("Aerth"),
+            biome=_ref("Hills"),
+            attributes={"population": i * 7, "prosperity": 0.5, "founded": "year 12"},
+            tags=["river", "trade"],
+            coordinates={"x": float(i), "y": float(-i)},
+            created_at=now,
+            resource_nodes=[
+                ResourceNodeResponse(
+                    node_id=uuid.uuid4(), resource_id=uuid.uuid4(), name=f"Vein {n}",
+                    extraction_rate=3, max_extraction_rate=8, unit="kg", depleted=False,
+                )
+                for n in range(4)
+            ],
+            travel_connections=[
+                TravelConnectionResponse(
+                    travel_link_id=uuid.uuid4(), name=f"Road {n}", biomes=[_ref("Hills")],
+                    speed=1.0, path_type="road", terrain_modifier=1.1, danger_level=2, visibility="visible",
+                )
+                for n in range(2)
+            ],
+        )
+        for i in range(rows)
+    ]
+
+
+def build_nodes(rows: int) -> List[ResourceNodeSummary]:
+    now = datetime.now(timezone.utc)
+    return [
+        ResourceNodeSummary(
+            id=uuid.uuid4(), name=f"Node {i}", description="Copper-streaked outcrop",
+            location_id=uuid.uuid4(), location_name="Location", blueprint_id=uuid.uuid4(),
+            blueprint_name="Copper Vein", depleted=False, status=StatusEnum.ACTIVE,
+            visibility=ResourceNodeVisibilityEnum.DISCOVERED, total_resources=3, primary_resources=1,
+            total_extractions=i, last_extraction_at=now, created_at=now,
+        )
+        for i in range(rows)
+    ]
+
+
+def build_apps(locations: List[LocationResponse], nodes: List[ResourceNodeSummary]):
+    apps = {}
+    for name, response_class in (("classic", JSONResponse), ("default", None)):
+        app = FastAPI(default_response_class=response_class) if response_class else FastAPI()
+        app.get("/locations", response_model=List[LocationResponse])(lambda: locations)
+        app.get("/nodes", response_model=List[ResourceNodeSummary])(lambda: nodes)
+        apps[name] = app
+
+    model = FastAPI()
+    model.get("/locations", response_model=List[LocationResponse])(lambda: model_response(locations, List[LocationResponse]))
+    model.get("/nodes", response_model=List[ResourceNodeSummary])(lambda: model_response(nodes, List[ResourceNodeSummary]))
+    apps["model"] = model
+    return apps
+
+
+def time_requests(client: TestClient, path: str, requests: int) -> float:
+    client.get(path)  # warm-up (adapter and schema caches)
+    samples = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        response = client.get(path)
+        samples.append(time.perf_counter() - started)
+        response.raise_for_status()
+    return statistics.median(samples) * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="List route serialization benchmark")
+    parser.add_argument("-r", "--rows", type=int, default=1000)
+    parser.add_argument("-n", "--requests", type=int, default=20)
+    args = parser.parse_args()
+
+    clients = {name: TestClient(app) for name, app in build_apps(build_locations(args.rows), build_nodes(args.rows)).items()}
+
+    print(f"{args.rows} rows per page, median of {args.requests} requests")
+    for path in ("/locations", "/nodes"):
+        body = clients["model"].get(path).content
+        if any(json.loads(body) != client.get(path).json() for client in clients.values()):
+            print(f"  {path}: responses differ between apps")
+            return 1
+        timings = {name: time_requests(client, path, args.requests) for name, client in clients.items()}
+        print(
+            f"  {path:<11} " + " | ".join(f"{name} {ms:7.1f} ms" for name, ms in timings.items())
+            + f" | {len(body) / 1024:6.0f} KiB, gzip {len(gzip.compress(body)) / 1024:5.0f} KiB"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,17 +7,17 @@ IMPORTANT: Run this script AFTER running migrations with 'alembic upgrade head',
 and AFTER starting the FastAPI server.
 
 Usage:
-    python utils/seed_biomes_api.py [--api-base-url http://localhost:8081]
+    python utils/seed_biomes_api.py [--api-base-url http://localhost:8081] [--concurrency 16]
 """
 
 import argparse
+import asyncio
 import json
 import logging
 import os
-import sys
-import time
-import requests
-from typing import List, Dict, Any, Optional
+from typing import Any, Dict
+
+from seed_client import SeedClient, error_detail
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -26,27 +26,17 @@ logger = logging.getLogger(__name__)
 # Path to biomes data file
 BIOMES_DATA_FILE = os.path.join(os.path.dirname(__file__), "data", "09_biomes.json")
 
-def seed_biomes(api_base_url: str = "http://localhost:8000") -> None:
+async def seed_biomes(api_base_url: str = "http://localhost:8000", concurrency: int = 16) -> None:
     """
     Seed biomes by calling the API endpoints.
+    Biomes don't depend on each other, so they are sent concurrently.
     
     Args:
         api_base_url: Base URL of the API server
+        concurrency: Maximum number of requests in flight
     """
     logger.info(f"Starting biome seeding using API at {api_base_url}")
     
-    # Check if API server is running
-    try:
-        response = requests.get(f"{api_base_url}/status")
-        if response.status_code != 200:
-            logger.error(f"API server at {api_base_url} returned status code {response.status_code}")
-            return
-    except requests.exceptions.ConnectionError:
-        logger.error(f"Cannot connect to API server at {api_base_url}. Is the server running?")
-        return
-    
-    biomes_endpoint = f"{api_base_url}/api/v1/biomes"
-    
     # Read biomes data from JSON file
     try:
         with open(BIOMES_DATA_FILE, 'r') as f:
@@ -59,44 +49,43 @@ def seed_biomes(api_base_url: str = "http://localhost:8000") -> None:
         logger.error(f"Invalid JSON format in biomes data file at {BIOMES_DATA_FILE}")
         return
     
-    # Process each biome
-    successful_count = 0
-    for biome_data in biomes_data:
-        try:
+    async with SeedClient(api_base_url, concurrency=concurrency) as client:
+        # Check if API server is running
+        if not await client.is_up():
+            return
+        
+        async def seed_biome(biome_data: Dict[str, Any]) -> bool:
             # Check if biome already exists with this biome_id
             string_id = biome_data["biome_id"]
-            response = requests.get(f"{biomes_endpoint}/by-biome-id/{string_id}")
-            
+            response = await client.get(f"/api/v1/biomes/by-biome-id/{string_id}")
             if response.status_code == 200:
                 logger.info(f"Biome with ID '{string_id}' already exists. Skipping.")
-                successful_count += 1
-                continue
+                return True
             
             # Create the biome
-            response = requests.post(biomes_endpoint, json=biome_data)
-            
-            if response.status_code == 200 or response.status_code == 201:
+            response = await client.post("/api/v1/biomes", json=biome_data)
+            if response.status_code in (200, 201):
                 result = response.json()
                 logger.info(f"Created biome: {result.get('name')} (ID: {result.get('id')})")
-                successful_count += 1
-            else:
-                error_detail = response.json().get("detail", response.text) if response.content else "No content"
-                logger.error(f"Failed to create biome '{biome_data.get('name', 'unknown')}': {error_detail}")
-        except Exception as e:
-            logger.error(f"Error processing biome '{biome_data.get('name', 'unknown')}': {str(e)}")
+                return True
+            
+            logger.error(f"Failed to create biome '{biome_data.get('name', 'unknown')}': {error_detail(response)}")
+            return False
         
-        # Small delay to avoid overwhelming the server
-        time.sleep(0.1)
+        results = await client.run_stage("biomes", biomes_data, seed_biome)
+        print(client.stats.report())
     
+    successful_count = sum(1 for result in results if result)
     logger.info(f"Biome seeding completed. Successfully processed {successful_count} out of {len(biomes_data)} biomes.")
 
 def main():
     """Parse arguments and run the seeding script."""
     parser = argparse.ArgumentParser(description="Seed biomes using the API.")
     parser.add_argument("--api-base-url", default="http://localhost:8000", help="Base URL of the API server")
+    parser.add_argument("--concurrency", type=int, default=16, help="Maximum concurrent API requests")
     args = parser.parse_args()
     
-    seed_biomes(api_base_url=args.api_base_url)
+    asyncio.run(seed_biomes(api_base_url=args.api_base_url, concurrency=args.concurrency))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
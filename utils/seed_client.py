@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Shared async HTTP client for the API-based seed scripts.
+
+Wraps a single httpx.AsyncClient so every request reuses pooled keep-alive
+connections, bounds in-flight requests with a semaphore, retries transient
+failures with exponential backoff and keeps throughput stats.
+
+Independent entities are sent concurrently with run_stage(); callers await
+stages in dependency order (themes -> resources -> buildings -> settlements).
+
+Usage:
+    async with SeedClient("http://localhost:8000", concurrency=16) as client:
+        themes = await client.run_stage("themes", THEMES, create_theme)
+        ...
+        print(client.stats.report())
+"""
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, TypeVar
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Statuses that mean the server did not handle the request and it is safe to resend
+RETRY_STATUSES = {429, 502, 503, 504}
+
+# Methods that can be resent after the request may have reached the server
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+# Errors raised before the request left the client, safe to retry for any method
+CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+@dataclass
+class SeedStats:
+    """Request counters for one client session."""
+    requests: int = 0
+    retries: int = 0
+    failures: int = 0
+    started: float = field(default_factory=time.perf_counter)
+    stages: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    @property
+    def requests_per_second(self) -> float:
+        elapsed = self.elapsed
+        return self.requests / elapsed if elapsed > 0 else 0.0
+
+    def report(self) -> str:
+        lines = [f"{name:<24}{seconds * 1000:>10.1f} ms" for name, seconds in self.stages.items()]
+        lines.append(
+            f"{self.requests} requests in {self.elapsed:.2f}s "
+            f"({self.requests_per_second:.1f} req/s, {self.retries} retries, {self.failures} failures)"
+        )
+        return "\n".join(lines)
+
+
+class SeedClient:
+    """Pooled, bounded-concurrency, retrying HTTP client for seeding through the API."""
+
+    def __init__(
+        self,
+        base_url: str = "",
+        concurrency: int = 16,
+        timeout: float = 30.0,
+        retries: int = 3,
+        backoff: float = 0.25,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.base_url = base_url
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.transport = transport
+        self.stats = SeedStats()
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def __aenter__(self) -> "SeedClient":
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency),
+            transport=self.transport,
+        )
+        self.stats = SeedStats()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
+    # ==============================================================================
+    # REQUESTS
+    # ==============================================================================
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        Send a request, retrying transient failures.
+
+        Connect errors and 429/502/503/504 responses are retried for every method.
+        Other transport errors (e.g. read timeouts) are only retried for idempotent
+        methods, since a POST may already have been applied.
+
+        Raises:
+            httpx.TransportError: If the request still fails after all retries
+        """
+        if self._client is None:
+            raise RuntimeError("SeedClient must be used as an async context manager")
+
+        method = method.upper()
+        attempt = 0
+        while True:
+            async with self._semaphore:
+                self.stats.requests += 1
+                try:
+                    response = await self._client.request(method, url, **kwargs)
+                except httpx.TransportError as e:
+                    retryable = isinstance(e, CONNECT_ERRORS) or method in IDEMPOTENT_METHODS
+                    if not retryable or attempt >= self.retries:
+                        self.stats.failures += 1
+                        logger.error(f"{method} {url} failed after {attempt + 1} attempts: {e!r}")
+                        raise
+                    delay = self._delay(attempt)
+                else:
+                    if response.status_code not in RETRY_STATUSES or attempt >= self.retries:
+                        if response.status_code >= 400:
+                            self.stats.failures += 1
+                        return response
+                    delay = self._delay(attempt, response.headers.get("Retry-After"))
+
+            # Back off outside the semaphore so waiting retries don't block other requests
+            attempt += 1
+            self.stats.retries += 1
+            logger.debug(f"Retrying {method} {url} in {delay:.2f}s (attempt {attempt + 1})")
+            await asyncio.sleep(delay)
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("PUT", url, **kwargs)
+
+    async def patch(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("PATCH", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("DELETE", url, **kwargs)
+
+    def _delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Exponential backoff with jitter, honouring a numeric Retry-After header."""
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+        return self.backoff * (2 ** attempt) * (0.5 + random.random())
+
+    # ==============================================================================
+    # STAGES
+    # ==============================================================================
+
+    async def run_stage(self, name: str, items: Iterable[T], worker: Callable[[T], Awaitable[R]]) -> List[Optional[R]]:
+        """
+        Run worker(item) for every item concurrently and wait for all of them.
+        Concurrency is bounded by the client's semaphore. A worker that raises is
+        logged and yields None, so one bad entity doesn't abort the stage.
+        Results are returned in input order.
+        """
+        items = list(items)
+        started = time.perf_counter()
+
+        async def guarded(item: T) -> Optional[R]:
+            try:
+                return await worker(item)
+            except Exception as e:
+                logger.error(f"[{name}] Error seeding {item!r:.80}: {e}")
+                return None
+
+        results = await asyncio.gather(*(guarded(item) for item in items))
+        self.stats.stages[name] = time.perf_counter() - started
+        logger.info(f"[{name}] {len(items)} items in {self.stats.stages[name]:.2f}s")
+        return list(results)
+
+    async def is_up(self, status_path: str = "/status") -> bool:
+        """Check the API's status endpoint."""
+        try:
+            response = await self.get(status_path)
+        except httpx.TransportError:
+            logger.error(f"Cannot connect to API server at {self.base_url}. Is the server running?")
+            return False
+        if response.status_code != 200:
+            logger.error(f"API server at {self.base_url} returned status code {response.status_code}")
+            return False
+        return True
+
+
+def response_items(payload: Any) -> List[Dict[str, Any]]:
+    """List endpoints return either a bare list or a page with an 'items' key."""
+    if isinstance(payload, dict) and "items" in payload:
+        payload = payload["items"]
+    return [item for item in payload if isinstance(item, dict)] if isinstance(payload, list) else []
+
+
+def error_detail(response: httpx.Response) -> str:
+    """Best-effort error message from an API error response."""
+    if not response.content:
+        return "No content"
+    try:
+        body = response.json()
+    except ValueError:
+        return response.text
+    return body.get("detail", response.text) if isinstance(body, dict) else response.text
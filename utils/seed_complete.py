@@ -15,21 +15,28 @@ This two-phase approach ensures that characters are properly committed to the da
 before they are assigned as settlement leaders, avoiding race conditions and
 foreign key constraint violations.
 
+By default everything is written straight to the database with bulk upserts in a
+single transaction (see seed_db.py). The API mode posts one entity at a time and is
+kept as a smoke test of the create endpoints.
+
 Usage:
-    python utils/seed_complete.py [--api-base-url http://localhost:8000] [--phase {1,2}] [--skip-truncate] [--force]
+    python utils/seed_complete.py [--mode {db,api}] [--api-base-url http://localhost:8000] [--concurrency 16] [--phase {1,2}] [--skip-truncate] [--force]
     
 Arguments:
+    --mode {db,api}       Seed directly through the database (default) or through the API
     --api-base-url URL    Base URL of the API server (default: http://localhost:8000)
+    --concurrency N       Maximum concurrent API requests in API mode (default: 16)
     --phase {1,2}         Run only a specific phase (1 for foundation entities, 2 for settlements)
     --skip-truncate       Skip truncating tables before seeding
     --force               Continue seeding even if truncation fails
 """
 
 import argparse
+import asyncio
 import logging
-import requests
-import time
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
+
+from seed_client import SeedClient, error_detail, response_items
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -409,7 +416,7 @@ BUILDING_TEMPLATES = {
     ]
 }
 
-def create_world(api_base_url: str, theme_id: str) -> Optional[str]:
+async def create_world(client: SeedClient, theme_id: str) -> Optional[str]:
     """Create a game world and return its ID"""
     # Use the new WorldCreateRequest format
     world_data = {
@@ -420,663 +427,388 @@ def create_world(api_base_url: str, theme_id: str) -> Optional[str]:
     }
     
     logger.info(f"Attempting to create world with theme_id: {theme_id}")
-    response = requests.post(f"{api_base_url}/api/v1/worlds/", json=world_data)
-
-    world_name = None
+    response = await client.post("/api/v1/worlds/", json=world_data)
 
-    if response.status_code == 200 or response.status_code == 201:
+    if response.status_code in (200, 201):
         result = response.json()
-        logger.info(f"World creation response: {result}")
         
-        # Check various response formats
-        world_id = None
+        # Response has either a nested 'world' object or the world itself
+        world = result.get("world") if isinstance(result, dict) and isinstance(result.get("world"), dict) else result
+        world_id = world.get("id") if isinstance(world, dict) else None
         
-        # Option 1: Response has a nested 'world' object with id field
-        if isinstance(result, dict) and "world" in result and isinstance(result["world"], dict):
-            world_id = result["world"].get("id")
-            world_name = result["world"].get("name")
-            
-        # Option 2: Direct ID in response
-        elif isinstance(result, dict) and "id" in result:
-            world_id = result.get("id")
-            world_name = result.get("name", "Unknown")
-            
-        # Log success if we found an ID
         if world_id:
-            logger.info(f"Created world: {world_name if 'world_name' in locals() else 'Unknown'} (ID: {world_id})")
+            logger.info(f"Created world: {world.get('name', 'Unknown')} (ID: {world_id})")
             return world_id
-        else:
-            logger.error(f"Created world but couldn't extract ID from response: {result}")
-            return None
-    else:
-        try:
-            error_json = response.json() if response.content else {}
-            error_detail = error_json.get("detail", response.text) if error_json else response.text
-        except:
-            error_detail = response.text if response.content else "Unknown error"
-            
-        logger.error(f"Failed to create world: {error_detail}")
-        logger.error(f"Request data: {world_data}")
-        
-        # Let's try a different approach for debugging - fetch all worlds
-        try:
-            logger.info("Attempting to fetch existing worlds...")
-            worlds_response = requests.get(f"{api_base_url}/api/v1/worlds/")
-            if worlds_response.status_code == 200:
-                worlds = worlds_response.json()
-                logger.info(f"Found existing worlds: {worlds}")
-                
-                # If any worlds exist, return the first one's ID
-                if isinstance(worlds, list) and len(worlds) > 0:
-                    first_world = worlds[0]
-                    if isinstance(first_world, dict) and "id" in first_world:
-                        world_id = first_world["id"]
-                        logger.info(f"Using existing world with ID: {world_id}")
-                        return world_id
-        except Exception as e:
-            logger.error(f"Error fetching existing worlds: {e}")
-        
+        logger.error(f"Created world but couldn't extract ID from response: {result}")
         return None
 
-def create_themes(api_base_url: str) -> Dict[str, str]:
-    """Create themes and return a mapping of theme names to IDs"""
-    theme_map = {}
+    logger.error(f"Failed to create world: {error_detail(response)}")
+    logger.error(f"Request data: {world_data}")
+    
+    # Fall back to the first existing world
+    try:
+        logger.info("Attempting to fetch existing worlds...")
+        worlds_response = await client.get("/api/v1/worlds/")
+        if worlds_response.status_code == 200:
+            worlds = response_items(worlds_response.json())
+            if worlds and "id" in worlds[0]:
+                world_id = worlds[0]["id"]
+                logger.info(f"Using existing world with ID: {world_id}")
+                return world_id
+    except Exception as e:
+        logger.error(f"Error fetching existing worlds: {e}")
     
-    for theme_data in THEMES:
+    return None
+
+async def create_themes(client: SeedClient) -> Dict[str, str]:
+    """Create themes and return a mapping of theme names to IDs"""
+    async def create_theme(theme_data: Dict) -> Optional[Tuple[str, str]]:
         theme_name = theme_data.get("theme_name")
-        response = requests.post(f"{api_base_url}/api/v1/themes/", json=theme_data)
+        response = await client.post("/api/v1/themes/", json=theme_data)
         
-        if response.status_code == 200 or response.status_code == 201:
-            result = response.json()
-            # Check if the API returns the ID directly or in a nested structure
-            theme_id = None
-            if isinstance(result, dict):
-                theme_id = result.get("id") or result.get("theme_id")
-                
-                # If we still don't have an ID, try to log the response for debugging
-                if theme_id is None:
-                    logger.info(f"Received API response: {result}")
-                    
-                    # Maybe we need to get the ID from the created theme
-                    if "theme" in result:
-                        theme_id = result["theme"].get("id")
-            
-            logger.info(f"Created theme: {theme_name} (ID: {theme_id})")
-            
-            if theme_id and theme_name:
-                theme_map[theme_name] = theme_id
-            else:
-                logger.warning(f"Theme '{theme_name}' was created but ID was not returned by API.")
-        else:
-            error_detail = response.json().get("detail", response.text) if response.content else "No content"
-            logger.error(f"Failed to create theme '{theme_name}': {error_detail}")
+        if response.status_code not in (200, 201):
+            logger.error(f"Failed to create theme '{theme_name}': {error_detail(response)}")
+            return None
+        
+        result = response.json()
+        # The API returns the ID directly or in a nested 'theme' object
+        theme_id = None
+        if isinstance(result, dict):
+            theme_id = result.get("id") or result.get("theme_id") or (result.get("theme") or {}).get("id")
         
-        time.sleep(0.2)
+        if not theme_id:
+            logger.warning(f"Theme '{theme_name}' was created but ID was not returned by API: {result}")
+            return None
+        logger.info(f"Created theme: {theme_name} (ID: {theme_id})")
+        return theme_name, theme_id
+
+    results = await client.run_stage("themes", THEMES, create_theme)
+    theme_map = dict(result for result in results if result)
     
     # If we didn't get any theme IDs from the API, try to fetch them
     if not theme_map:
         logger.info("No theme IDs returned during creation, attempting to fetch existing themes...")
         try:
-            response = requests.get(f"{api_base_url}/api/v1/themes/")
+            response = await client.get("/api/v1/themes/")
             if response.status_code == 200:
-                themes = response.json()
-                # Check if it's a list or wrapped in another object
-                if isinstance(themes, dict) and "items" in themes:
-                    themes = themes["items"]
-                    
-                for theme in themes:
-                    if isinstance(theme, dict):
-                        name = theme.get("name")
-                        theme_id = theme.get("id")
-                        if name and theme_id:
-                            theme_map[name] = theme_id
-                            logger.info(f"Found existing theme: {name} (ID: {theme_id})")
+                for theme in response_items(response.json()):
+                    if theme.get("name") and theme.get("id"):
+                        theme_map[theme["name"]] = theme["id"]
+                        logger.info(f"Found existing theme: {theme['name']} (ID: {theme['id']})")
         except Exception as e:
             logger.error(f"Error fetching existing themes: {e}")
     
     return theme_map
 
-def create_characters(api_base_url: str, world_id: str, theme_map: Dict[str, str]) -> Dict[str, str]:
+async def fetch_world_characters(client: SeedClient, world_id: str) -> Dict[str, str]:
+    """Fetch name -> ID for every character already in the world"""
+    response = await client.get("/api/v1/characters/", params={"world_id": world_id})
+    if response.status_code != 200:
+        logger.warning(f"Failed to fetch characters for world {world_id}: {response.status_code}, {response.text}")
+        return {}
+    return {char["name"]: char["id"] for char in response_items(response.json()) if "name" in char and "id" in char}
+
+async def create_characters(client: SeedClient, world_id: str, theme_map: Dict[str, str]) -> Dict[str, str]:
     """Create characters and return a mapping of character names to IDs"""
-    character_map = {}
     logger.info("Creating characters with world_id: %s", world_id)
-    
-    for char_template in CHARACTER_TEMPLATES:
+
+    async def create_character(char_template: Dict) -> Optional[Tuple[str, str]]:
         # Make a copy of the template to avoid modifying the original
         char_template_copy = char_template.copy()
         theme_name = char_template_copy.pop("theme_name")
         traits = char_template_copy.pop("traits")
         char_name = char_template_copy.get("name")
         
-        if theme_name in theme_map:
-            char_data = {
-                **char_template_copy,
-                "world_id": world_id,
-                "theme_id": theme_map[theme_name]
-            }
-            
-            # Create character
-            response = requests.post(f"{api_base_url}/api/v1/characters/", json=char_data)
-            
-            if response.status_code == 200 or response.status_code == 201:
-                result = response.json()
-                char_id = result.get("id")
-                if not char_id:
-                    logger.error(f"Created character but no ID returned: {result}")
-                    continue
-                    
-                logger.info(f"Created character: {char_name} (ID: {char_id})")
-                character_map[char_name] = char_id
-                # Print the character ID for debugging
-                logger.info(f"Added character to map: {char_name} -> {char_id}")
-                
-                # Add traits - use the proper schema format for adding traits
-                trait_data = {"traits": traits}
-                
-                # Try PUT first (replace all traits)
-                trait_response = requests.put(
-                    f"{api_base_url}/api/v1/characters/{char_id}/traits", 
-                    json=trait_data
-                )
-                
-                # If PUT fails, try POST (add traits)
-                if trait_response.status_code >= 400:
-                    trait_response = requests.post(
-                        f"{api_base_url}/api/v1/characters/{char_id}/traits", 
-                        json=trait_data
-                    )
-                
-                if trait_response.status_code == 200 or trait_response.status_code == 201:
-                    logger.info(f"Added traits to {char_name}: {traits}")
-                else:
-                    error_detail = trait_response.json().get("detail", trait_response.text) if trait_response.content else "No content"
-                    logger.error(f"Failed to add traits to '{char_name}': {error_detail}")
-                    logger.error(f"Trait data: {trait_data}")
-            else:
-                error_detail = response.json().get("detail", response.text) if response.content else "No content"
-                logger.error(f"Failed to create character '{char_name}': {error_detail}")
-                logger.error(f"Request data: {char_data}")
-            
-            time.sleep(0.2)
+        if theme_name not in theme_map:
+            return None
+        
+        char_data = {**char_template_copy, "world_id": world_id, "theme_id": theme_map[theme_name]}
+        response = await client.post("/api/v1/characters/", json=char_data)
+        
+        if response.status_code not in (200, 201):
+            logger.error(f"Failed to create character '{char_name}': {error_detail(response)}")
+            logger.error(f"Request data: {char_data}")
+            return None
+        
+        char_id = response.json().get("id")
+        if not char_id:
+            logger.error(f"Created character but no ID returned: {response.json()}")
+            return None
+        logger.info(f"Created character: {char_name} (ID: {char_id})")
+        
+        # Add traits - try PUT first (replace all traits), then POST (add traits)
+        trait_data = {"traits": traits}
+        trait_response = await client.put(f"/api/v1/characters/{char_id}/traits", json=trait_data)
+        if trait_response.status_code >= 400:
+            trait_response = await client.post(f"/api/v1/characters/{char_id}/traits", json=trait_data)
+        
+        if trait_response.status_code in (200, 201):
+            logger.info(f"Added traits to {char_name}: {traits}")
+        else:
+            logger.error(f"Failed to add traits to '{char_name}': {error_detail(trait_response)}")
+            logger.error(f"Trait data: {trait_data}")
+        
+        return char_name, char_id
+
+    results = await client.run_stage("characters", CHARACTER_TEMPLATES, create_character)
+    character_map = dict(result for result in results if result)
     
-    # Explicitly verify characters are committed by fetching them
-    logger.info("Verifying that characters have been committed to the database...")
+    # Pick up characters that already existed (e.g. a rerun without truncation)
     try:
-        # Fetch all characters for the world to verify they exist
-        response = requests.get(f"{api_base_url}/api/v1/characters/?world_id={world_id}")
-        if response.status_code == 200:
-            characters = response.json()
-            
-            # Check the response format and handle both list and dict with items key
-            if isinstance(characters, dict) and 'items' in characters:
-                characters = characters['items']
-            
-            if isinstance(characters, list):
-                logger.info(f"Verified {len(characters)} characters in the database for world {world_id}")
-                
-                # Add any characters found that weren't in our map
-                for char in characters:
-                    if isinstance(char, dict):
-                        char_id = char.get("id")
-                        char_name = char.get("name")
-                        if char_name and char_id and char_name not in character_map:
-                            character_map[char_name] = char_id
-                            logger.info(f"Added missing character from database to map: {char_name} -> {char_id}")
-            else:
-                logger.warning(f"Unexpected response format when verifying characters: {characters}")
-        else:
-            logger.warning(f"Failed to verify characters: {response.status_code}, {response.text}")
+        for char_name, char_id in (await fetch_world_characters(client, world_id)).items():
+            if char_name not in character_map:
+                character_map[char_name] = char_id
+                logger.info(f"Added existing character from database to map: {char_name} -> {char_id}")
     except Exception as e:
         logger.warning(f"Error verifying characters: {e}")
     
     return character_map
 
-def create_resources(api_base_url: str, theme_map: Dict[str, str]) -> Dict[str, str]:
+async def create_resources(client: SeedClient, theme_map: Dict[str, str]) -> Dict[str, str]:
     """Create resources for each theme and return a mapping of resource names to IDs"""
-    resource_map = {}
-    
-    for theme_name, resources in RESOURCE_TEMPLATES.items():
-        if theme_name in theme_map:
-            theme_id = theme_map[theme_name]
-            
-            for resource_template in resources:
-                resource_name = resource_template.get("name")
-                resource_data = {
-                    **resource_template,
-                    "theme_id": theme_id
-                }
-                
-                # First try to check if the resource already exists
-                try:
-                    search_response = requests.get(f"{api_base_url}/api/v1/resources/?name={resource_name}&theme_id={theme_id}")
-                    if search_response.status_code == 200:
-                        search_results = search_response.json()
-                        
-                        # Check if results are in a nested 'items' field
-                        if isinstance(search_results, dict) and 'items' in search_results:
-                            existing_resources = search_results.get('items', [])
-                        else:
-                            existing_resources = search_results if isinstance(search_results, list) else []
-                        
-                        # Look for matching resources
-                        for resource in existing_resources:
-                            if isinstance(resource, dict) and resource.get("name") == resource_name:
-                                # Resource ID can be in "id" or "resource_id" field
-                                resource_id = resource.get("id") or resource.get("resource_id")
-                                if resource_id:
-                                    logger.info(f"Resource '{resource_name}' already exists (ID: {resource_id}) for theme: {theme_name}")
-                                    resource_map[resource_name] = resource_id
-                                else:
-                                    logger.warning(f"Resource '{resource_name}' found but has no ID!")
-                                break
-                        else:
-                            # If we didn't break out of the loop, the resource doesn't exist
-                            # Create a new resource
-                            response = requests.post(f"{api_base_url}/api/v1/resources/", json=resource_data)
-                            
-                            if response.status_code == 200 or response.status_code == 201:
-                                result = response.json()
-                                # Resource ID can be in "id" or "resource_id" field depending on API response
-                                resource_id = result.get("id") or result.get("resource_id")
-                                if resource_id:
-                                    logger.info(f"Created resource: {resource_name} (ID: {resource_id}) for theme: {theme_name}")
-                                    resource_map[resource_name] = resource_id
-                                else:
-                                    logger.warning(f"Created resource '{resource_name}' but got no ID in response: {result}")
-                            else:
-                                error_detail = response.json().get("detail", response.text) if response.content else "No content"
-                                logger.error(f"Failed to create resource '{resource_name}': {error_detail}")
-                                logger.error(f"Request data: {resource_data}")
-                except Exception as e:
-                    logger.error(f"Error checking for existing resource '{resource_name}': {e}")
-                    # Try to create it directly
-                    try:
-                        response = requests.post(f"{api_base_url}/api/v1/resources/", json=resource_data)
-                        
-                        if response.status_code == 200 or response.status_code == 201:
-                            result = response.json()
-                            resource_id = result.get("id")
-                            logger.info(f"Created resource: {resource_name} (ID: {resource_id}) for theme: {theme_name}")
-                            resource_map[resource_name] = resource_id
-                        else:
-                            error_detail = response.json().get("detail", response.text) if response.content else "No content"
-                            logger.error(f"Failed to create resource '{resource_name}': {error_detail}")
-                    except Exception as e2:
-                        logger.error(f"Error creating resource '{resource_name}': {e2}")
-                
-                time.sleep(0.2)
+    templates = [
+        (theme_name, resource_template)
+        for theme_name, resources in RESOURCE_TEMPLATES.items() if theme_name in theme_map
+        for resource_template in resources
+    ]
+
+    async def create_resource(item: Tuple[str, Dict]) -> Optional[Tuple[str, str]]:
+        theme_name, resource_template = item
+        theme_id = theme_map[theme_name]
+        resource_name = resource_template.get("name")
+        resource_data = {**resource_template, "theme_id": theme_id}
+        
+        # Check if the resource already exists
+        search_response = await client.get("/api/v1/resources/", params={"name": resource_name, "theme_id": theme_id})
+        if search_response.status_code == 200:
+            for resource in response_items(search_response.json()):
+                if resource.get("name") == resource_name:
+                    # Resource ID can be in "id" or "resource_id" field
+                    resource_id = resource.get("id") or resource.get("resource_id")
+                    if not resource_id:
+                        logger.warning(f"Resource '{resource_name}' found but has no ID!")
+                        return None
+                    logger.info(f"Resource '{resource_name}' already exists (ID: {resource_id}) for theme: {theme_name}")
+                    return resource_name, resource_id
+        
+        response = await client.post("/api/v1/resources/", json=resource_data)
+        if response.status_code not in (200, 201):
+            logger.error(f"Failed to create resource '{resource_name}': {error_detail(response)}")
+            logger.error(f"Request data: {resource_data}")
+            return None
+        
+        result = response.json()
+        resource_id = result.get("id") or result.get("resource_id")
+        if not resource_id:
+            logger.warning(f"Created resource '{resource_name}' but got no ID in response: {result}")
+            return None
+        logger.info(f"Created resource: {resource_name} (ID: {resource_id}) for theme: {theme_name}")
+        return resource_name, resource_id
+
+    results = await client.run_stage("resources", templates, create_resource)
+    resource_map = dict(result for result in results if result)
     
     # Check if we found any resources, if not try fetching them all
     if not resource_map:
         try:
             logger.info("No resources created/found, attempting to fetch all existing resources...")
-            response = requests.get(f"{api_base_url}/api/v1/resources/")
+            response = await client.get("/api/v1/resources/")
             if response.status_code == 200:
-                resources_data = response.json()
-                
-                # Check if results are in a nested 'items' field
-                if isinstance(resources_data, dict) and 'items' in resources_data:
-                    resources = resources_data.get('items', [])
-                else:
-                    resources = resources_data if isinstance(resources_data, list) else []
-                
-                for resource in resources:
+                for resource in response_items(response.json()):
                     name = resource.get("name")
-                    # Resource ID can be in "id" or "resource_id" field
                     resource_id = resource.get("id") or resource.get("resource_id")
                     if name and resource_id:
                         resource_map[name] = resource_id
                         logger.info(f"Found existing resource: {name} (ID: {resource_id})")
-                    elif name and not resource_id:
-                        logger.warning(f"Resource '{name}' found but has no ID!")
         except Exception as e:
             logger.error(f"Error fetching all resources: {e}")
     
     return resource_map
 
-def create_buildings(api_base_url: str, theme_map: Dict[str, str], resource_map: Dict[str, str]) -> None:
+async def create_buildings(client: SeedClient, theme_map: Dict[str, str], resource_map: Dict[str, str]) -> None:
     """Create building blueprints for each theme with resource requirements"""
-    for theme_name, buildings in BUILDING_TEMPLATES.items():
-        if theme_name in theme_map:
-            theme_id = theme_map[theme_name]
-            
-            for building_template in buildings:
-                building_name = building_template["name"]
-                
-                # Check if building already exists
-                try:
-                    search_response = requests.get(f"{api_base_url}/api/v1/building-blueprints/?name={building_name}&theme_id={theme_id}")
-                    building_exists = False
-                    
-                    if search_response.status_code == 200:
-                        search_results = search_response.json()
-                        
-                        # Check if results are in a nested 'items' field
-                        if isinstance(search_results, dict) and 'items' in search_results:
-                            existing_buildings = search_results.get('items', [])
-                        else:
-                            existing_buildings = search_results if isinstance(search_results, list) else []
-                        
-                        # Look for matching buildings
-                        for building in existing_buildings:
-                            if isinstance(building, dict) and building.get("name") == building_name:
-                                building_id = building.get("id")
-                                logger.info(f"Building '{building_name}' already exists (ID: {building_id}) for theme: {theme_name}")
-                                building_exists = True
-                                break
-                        
-                        if building_exists:
-                            continue  # Skip to next building if it already exists
-                except Exception as e:
-                    logger.error(f"Error checking for existing building '{building_name}': {e}")
-                
-                # Make a copy of the template to avoid modifying the original
-                building_template_copy = building_template.copy()
-                
-                # Get and remove the resource requirements 
-                resource_requirements = building_template_copy.pop("resource_requirements")
-                attributes = building_template_copy.pop("attributes", [])
-                
-                # Convert the building template into a proper blueprint with stages
-                building_data = {
-                    "name": building_template_copy["name"],
-                    "description": building_template_copy["description"],
-                    "theme_id": theme_id,
-                    "is_unique_per_settlement": False,
-                    "_metadata": {
-                        "category": attributes[0] if attributes else "BASIC",
-                        "attributes": attributes
-                    },
-                    # Create a single stage with all resource requirements
-                    "stages": [
-                        {
-                            "stage_number": 1,
-                            "name": f"Build {building_template_copy['name']}",
-                            "description": f"Construction of {building_template_copy['name']}",
-                            "duration_days": 3.0,
-                            # Convert dictionary of resource name->amount to the required format
-                            "resource_costs": [
-                                {"resource_id": resource_map[res_name], "amount": res_amount}
-                                for res_name, res_amount in resource_requirements.items()
-                                if res_name in resource_map
-                            ],
-                            "profession_time_bonus": [],
-                            "stage_completion_bonuses": [],
-                            "optional_features": []
-                        }
-                    ]
+    templates = [
+        (theme_name, building_template)
+        for theme_name, buildings in BUILDING_TEMPLATES.items() if theme_name in theme_map
+        for building_template in buildings
+    ]
+
+    async def create_building(item: Tuple[str, Dict]) -> Optional[str]:
+        theme_name, building_template = item
+        theme_id = theme_map[theme_name]
+        building_name = building_template["name"]
+        
+        # Check if building already exists
+        search_response = await client.get("/api/v1/building-blueprints/", params={"name": building_name, "theme_id": theme_id})
+        if search_response.status_code == 200:
+            for building in response_items(search_response.json()):
+                if building.get("name") == building_name:
+                    logger.info(f"Building blueprint '{building_name}' already exists (ID: {building.get('id')})")
+                    return building.get("id")
+        
+        attributes = building_template.get("attributes", [])
+        resource_requirements = building_template["resource_requirements"]
+        
+        # Convert the building template into a proper blueprint with a single stage
+        building_data = {
+            "name": building_name,
+            "description": building_template["description"],
+            "theme_id": theme_id,
+            "is_unique_per_settlement": False,
+            "_metadata": {
+                "category": attributes[0] if attributes else "BASIC",
+                "attributes": attributes
+            },
+            "stages": [
+                {
+                    "stage_number": 1,
+                    "name": f"Build {building_name}",
+                    "description": f"Construction of {building_name}",
+                    "duration_days": 3.0,
+                    # Convert dictionary of resource name->amount to the required format
+                    "resource_costs": [
+                        {"resource_id": resource_map[res_name], "amount": res_amount}
+                        for res_name, res_amount in resource_requirements.items()
+                        if res_name in resource_map
+                    ],
+                    "profession_time_bonus": [],
+                    "stage_completion_bonuses": [],
+                    "optional_features": []
                 }
-                
-                # Remove created_at and updated_at if present in the request
-                # Let the server handle setting these timestamps
-                building_data.pop('created_at', None)
-                building_data.pop('updated_at', None)
-                
-                # Also check and remove timestamps from stages
-                for stage in building_data['stages']:
-                    stage.pop('created_at', None)
-                    stage.pop('updated_at', None)
-                
-                try:
-                    response = requests.post(f"{api_base_url}/api/v1/building-blueprints/", json=building_data)
-                    
-                    if response.status_code == 200 or response.status_code == 201:
-                        result = response.json()
-                        building_id = result.get("id")
-                        logger.info(f"Created building blueprint: {building_name} (ID: {building_id}) for theme: {theme_name}")
-                        logger.info(f"Added resource requirements: {resource_requirements}")
-                    else:
-                        error_detail = response.json().get("detail", response.text) if response.content else "No content"
-                        logger.error(f"Failed to create building blueprint '{building_name}': {error_detail}")
-                        logger.error(f"Request data: {building_data}")
-                except Exception as e:
-                    logger.error(f"Exception creating building '{building_name}': {e}")
-                
-                time.sleep(0.2)
+            ]
+        }
+        
+        response = await client.post("/api/v1/building-blueprints/", json=building_data)
+        if response.status_code not in (200, 201):
+            logger.error(f"Failed to create building blueprint '{building_name}': {error_detail(response)}")
+            return None
+        
+        building_id = response.json().get("id")
+        logger.info(f"Created building blueprint: {building_name} (ID: {building_id}) for theme: {theme_name}")
+        return building_id
 
-def create_settlements(api_base_url: str, world_id: str, theme_map: Dict[str, str], character_map: Dict[str, str], resource_map: Dict[str, str]) -> None:
-    """Create settlements with leaders and resources"""
-    # Double check character_map before starting
-    logger.info(f"Character map at beginning of settlement creation: {character_map}")
-    
-    for settlement_template in SETTLEMENT_TEMPLATES:
-        # Make a copy to avoid modifying the original
-        settlement_template_copy = settlement_template.copy()
+    await client.run_stage("buildings", templates, create_building)
+
+def settlement_starting_resources(theme_name: str, resource_map: Dict[str, str]) -> Dict[str, int]:
+    """Initial stock of each of the theme's resources, scaled down by rarity"""
+    resources = {}
+    for i, resource_template in enumerate(RESOURCE_TEMPLATES.get(theme_name, [])):
+        resource_id = resource_map.get(resource_template["name"])
+        if not resource_id:
+            continue
         
-        theme_name = settlement_template_copy.pop("theme_name")
-        leader_name = settlement_template_copy.pop("leader_name")
-        settlement_name = settlement_template_copy.get("name")
+        if resource_template["rarity"] == "Common":
+            quantity = 50 + (i * 10)  # Starting with 50, increasing by 10
+        elif resource_template["rarity"] == "Uncommon":
+            quantity = 25 + (i * 5)   # Starting with 25, increasing by 5
+        elif resource_template["rarity"] == "Rare":
+            quantity = 10 + (i * 2)   # Starting with 10, increasing by 2
+        else:  # Epic or Legendary
+            quantity = 5              # Fixed small amount for rare resources
+        
+        # Convert to string explicitly to ensure no None keys
+        resources[str(resource_id)] = quantity
+    return resources
+
+async def create_settlements(client: SeedClient, world_id: str, theme_map: Dict[str, str], character_map: Dict[str, str], resource_map: Dict[str, str]) -> None:
+    """Create settlements with leaders and resources"""
+    async def create_settlement(settlement_template: Dict) -> Optional[str]:
+        theme_name = settlement_template["theme_name"]
+        leader_name = settlement_template["leader_name"]
+        settlement_name = settlement_template["name"]
         
-        # Verify the character exists in our map
+        if theme_name not in theme_map:
+            logger.error(f"Theme '{theme_name}' not found for settlement '{settlement_name}'")
+            return None
         if leader_name not in character_map:
-            logger.error(f"Leader '{leader_name}' not found in character map for settlement '{settlement_name}'")
-            # Try one more time to fetch the character from the database
-            try:
-                search_char_response = requests.get(f"{api_base_url}/api/v1/characters/?name={leader_name}&world_id={world_id}")
-                if search_char_response.status_code == 200:
-                    char_results = search_char_response.json()
-                    if isinstance(char_results, dict) and 'items' in char_results:
-                        char_results = char_results['items']
-                    
-                    for char in char_results:
-                        if char.get("name") == leader_name:
-                            char_id = char.get("id")
-                            logger.info(f"Found character '{leader_name}' in database with ID: {char_id}")
-                            character_map[leader_name] = char_id
-                            break
-            except Exception as e:
-                logger.error(f"Error searching for character '{leader_name}': {e}")
+            logger.error(f"Leader '{leader_name}' not found for settlement '{settlement_name}'")
+            return None
+        leader_id = character_map[leader_name]
         
-        if theme_name in theme_map and leader_name in character_map:
-            leader_id = character_map[leader_name]
-            logger.info(f"Preparing settlement '{settlement_name}' with leader '{leader_name}' (ID: {leader_id})")
-            
-            # Check if settlement already exists
-            try:
-                search_response = requests.get(f"{api_base_url}/api/v1/settlements/?name={settlement_name}&world_id={world_id}")
-                settlement_exists = False
-                existing_settlement_id = None
-                
-                if search_response.status_code == 200:
-                    search_results = search_response.json()
-                    
-                    # Check if results are in a nested 'items' field
-                    if isinstance(search_results, dict) and 'items' in search_results:
-                        existing_settlements = search_results.get('items', [])
-                    else:
-                        existing_settlements = search_results if isinstance(search_results, list) else []
-                    
-                    # Look for matching settlements
-                    for settlement in existing_settlements:
-                        if isinstance(settlement, dict) and settlement.get("name") == settlement_name:
-                            existing_settlement_id = settlement.get("id")
-                            logger.info(f"Settlement '{settlement_name}' already exists (ID: {existing_settlement_id})")
-                            settlement_exists = True
-                            break
-                    
-                    if settlement_exists:
-                        # If settlement exists but has no leader, try to set it
-                        if existing_settlement_id:
-                            # Check if settlement already has a leader
-                            if "leader_id" not in settlement or not settlement.get("leader_id"):
-                                logger.info(f"Existing settlement '{settlement_name}' has no leader. Attempting to set leader.")
-                                # Try to assign the leader to the existing settlement
-                                # (Reuse leader assignment code later)
-                                try_assign_leader(api_base_url, existing_settlement_id, leader_id, leader_name, settlement_name)
-                        continue  # Skip to next settlement if it already exists
-            except Exception as e:
-                logger.error(f"Error checking for existing settlement '{settlement_name}': {e}")
-            
-            # Create settlement data that matches the API expectations
-            # Add population and resources to the settlement
-            population = settlement_template_copy.get("population", 10)
-            
-            # Get resources for this settlement based on its theme
-            resources = {}
-            if theme_name in RESOURCE_TEMPLATES:
-                # Add initial quantities of each resource from the theme
-                for i, resource_template in enumerate(RESOURCE_TEMPLATES[theme_name]):
-                    resource_name = resource_template["name"]
-                    if resource_name in resource_map:
-                        resource_id = resource_map[resource_name]
-                        
-                        # Skip if resource_id is None
-                        if resource_id is None:
-                            logger.warning(f"Resource '{resource_name}' has None ID - skipping")
-                            continue
-                            
-                        # Add varying quantities based on resource rarity
-                        if resource_template["rarity"] == "Common":
-                            quantity = 50 + (i * 10)  # Starting with 50, increasing by 10
-                        elif resource_template["rarity"] == "Uncommon":
-                            quantity = 25 + (i * 5)   # Starting with 25, increasing by 5
-                        elif resource_template["rarity"] == "Rare":
-                            quantity = 10 + (i * 2)   # Starting with 10, increasing by 2
-                        else:  # Epic or Legendary
-                            quantity = 5              # Fixed small amount for rare resources
-                        
-                        # Convert to string explicitly to ensure no None keys
-                        if resource_id:
-                            resource_id_str = str(resource_id)
-                            resources[resource_id_str] = quantity
-                            logger.debug(f"Added resource {resource_name} ({resource_id_str}) with quantity {quantity}")
-            
-            # Print debug information about resources
-            logger.info(f"Resources for settlement '{settlement_template_copy['name']}': {resources}")
-            logger.info(f"Resource keys type check: {[(k, type(k)) for k in resources.keys()]}")
-            
-            settlement_data = {
-                "name": settlement_template_copy["name"],
-                "description": settlement_template_copy["description"],
-                "world_id": world_id,
-                "population": population,
-                "resources": resources
-            }
-            
-            # Remove timestamps if present
-            settlement_data.pop('created_at', None)
-            settlement_data.pop('updated_at', None)
-            
-            try:
-                # Step 1: Create the basic settlement
-                logger.info(f"Creating settlement {settlement_name} with data: {settlement_data}")
-                response = requests.post(f"{api_base_url}/api/v1/settlements/", json=settlement_data)
-                
-                if response.status_code == 200 or response.status_code == 201:
-                    result = response.json()
-                    # Check if the settlement is in a nested field
-                    if isinstance(result, dict) and "settlement" in result:
-                        settlement_info = result["settlement"]
-                        settlement_id = settlement_info.get("id")
-                    else:
-                        settlement_id = result.get("id")
-                        
-                    if not settlement_id:
-                        logger.error(f"Failed to get settlement ID from response: {result}")
-                        continue
-                        
-                    logger.info(f"Created settlement: {settlement_name} (ID: {settlement_id})")
-                    
-                    # Step 2: Set the leader for the settlement
-                    try_assign_leader(api_base_url, settlement_id, leader_id, leader_name, settlement_name)
-                else:
-                    error_detail = response.json().get("detail", response.text) if response.content else "No content"
-                    logger.error(f"Failed to create settlement '{settlement_name}': {error_detail}")
-                    logger.error(f"Request data: {settlement_data}")
-            except Exception as e:
-                logger.error(f"Exception creating settlement '{settlement_name}': {e}")
-            
-            time.sleep(0.5)  # Slightly longer delay to ensure settlement is committed
-        else:
-            if theme_name not in theme_map:
-                logger.error(f"Theme '{theme_name}' not found for settlement '{settlement_name}'")
-            if leader_name not in character_map:
-                logger.error(f"Leader '{leader_name}' not found for settlement '{settlement_name}'")
+        # Check if settlement already exists
+        search_response = await client.get("/api/v1/settlements/", params={"name": settlement_name, "world_id": world_id})
+        if search_response.status_code == 200:
+            for settlement in response_items(search_response.json()):
+                if settlement.get("name") == settlement_name:
+                    logger.info(f"Settlement '{settlement_name}' already exists (ID: {settlement.get('id')})")
+                    if settlement.get("id") and not settlement.get("leader_id"):
+                        logger.info(f"Existing settlement '{settlement_name}' has no leader. Attempting to set leader.")
+                        await try_assign_leader(client, settlement["id"], leader_id, leader_name, settlement_name)
+                    return settlement.get("id")
+        
+        settlement_data = {
+            "name": settlement_name,
+            "description": settlement_template["description"],
+            "world_id": world_id,
+            "population": settlement_template.get("population", 10),
+            "resources": settlement_starting_resources(theme_name, resource_map)
+        }
+        
+        # Step 1: Create the basic settlement
+        response = await client.post("/api/v1/settlements/", json=settlement_data)
+        if response.status_code not in (200, 201):
+            logger.error(f"Failed to create settlement '{settlement_name}': {error_detail(response)}")
+            logger.error(f"Request data: {settlement_data}")
+            return None
+        
+        result = response.json()
+        # Check if the settlement is in a nested field
+        settlement_id = (result.get("settlement") or result).get("id") if isinstance(result, dict) else None
+        if not settlement_id:
+            logger.error(f"Failed to get settlement ID from response: {result}")
+            return None
+        logger.info(f"Created settlement: {settlement_name} (ID: {settlement_id})")
+        
+        # Step 2: Set the leader for the settlement
+        await try_assign_leader(client, settlement_id, leader_id, leader_name, settlement_name)
+        return settlement_id
 
-def try_assign_leader(api_base_url: str, settlement_id: str, leader_id: str, leader_name: str, settlement_name: str) -> bool:
+    await client.run_stage("settlements", SETTLEMENT_TEMPLATES, create_settlement)
+
+async def try_assign_leader(client: SeedClient, settlement_id: str, leader_id: str, leader_name: str, settlement_name: str) -> bool:
     """Helper function to attempt to assign a leader to a settlement with multiple fallback methods"""
     logger.info(f"Attempting to set leader: {leader_name} (ID: {leader_id}) for settlement: {settlement_name} (ID: {settlement_id})")
     
     # Verify the character exists first
     try:
-        char_response = requests.get(f"{api_base_url}/api/v1/characters/{leader_id}")
+        char_response = await client.get(f"/api/v1/characters/{leader_id}")
         if char_response.status_code != 200:
             logger.error(f"Character {leader_name} (ID: {leader_id}) not found in database, cannot assign as leader")
             return False
-        logger.info(f"Verified character {leader_name} (ID: {leader_id}) exists in database")
     except Exception as e:
         logger.error(f"Error verifying character {leader_id} exists: {e}")
         return False
-        
-    success = False
+    
     leader_data = {"leader_id": leader_id}
     
-    # Method 1: Try dedicated leader endpoint with PUT
-    try:
-        logger.info(f"Method 1: Trying PUT to /settlements/{settlement_id}/leader")
-        leader_response = requests.put(
-            f"{api_base_url}/api/v1/settlements/{settlement_id}/leader", 
-            json=leader_data
-        )
-        
-        if leader_response.status_code == 200 or leader_response.status_code == 201:
-            logger.info(f"Successfully set leader {leader_name} (ID: {leader_id}) for settlement {settlement_name} using Method 1")
-            return True
-        else:
-            logger.warning(f"Method 1 failed with status {leader_response.status_code}: {leader_response.text}")
-    except Exception as e:
-        logger.warning(f"Error in Method 1 for setting leader: {e}")
-        
-    # Method 2: Try dedicated leader endpoint with PATCH
-    try:
-        logger.info(f"Method 2: Trying PATCH to /settlements/{settlement_id}/leader")
-        leader_response = requests.patch(
-            f"{api_base_url}/api/v1/settlements/{settlement_id}/leader", 
-            json=leader_data
-        )
-        
-        if leader_response.status_code == 200 or leader_response.status_code == 201:
-            logger.info(f"Successfully set leader {leader_name} (ID: {leader_id}) for settlement {settlement_name} using Method 2")
-            return True
-        else:
-            logger.warning(f"Method 2 failed with status {leader_response.status_code}: {leader_response.text}")
-    except Exception as e:
-        logger.warning(f"Error in Method 2 for setting leader: {e}")
-        
-    # Method 3: Try updating the whole settlement with PATCH
-    try:
-        logger.info(f"Method 3: Trying PATCH to /settlements/{settlement_id}")
-        leader_response = requests.patch(
-            f"{api_base_url}/api/v1/settlements/{settlement_id}", 
-            json={"leader_id": leader_id}
-        )
-        
-        if leader_response.status_code == 200 or leader_response.status_code == 201:
-            logger.info(f"Successfully set leader {leader_name} (ID: {leader_id}) for settlement {settlement_name} using Method 3")
-            return True
-        else:
-            logger.warning(f"Method 3 failed with status {leader_response.status_code}: {leader_response.text}")
-    except Exception as e:
-        logger.warning(f"Error in Method 3 for setting leader: {e}")
+    # Methods 1-3: dedicated leader endpoint (PUT, PATCH), then PATCH on the settlement itself
+    attempts = [
+        ("PUT", f"/api/v1/settlements/{settlement_id}/leader"),
+        ("PATCH", f"/api/v1/settlements/{settlement_id}/leader"),
+        ("PATCH", f"/api/v1/settlements/{settlement_id}"),
+    ]
+    for method_number, (method, url) in enumerate(attempts, start=1):
+        try:
+            leader_response = await client.request(method, url, json=leader_data)
+            if leader_response.status_code in (200, 201):
+                logger.info(f"Successfully set leader {leader_name} (ID: {leader_id}) for settlement {settlement_name} using Method {method_number}")
+                return True
+            logger.warning(f"Method {method_number} failed with status {leader_response.status_code}: {leader_response.text}")
+        except Exception as e:
+            logger.warning(f"Error in Method {method_number} for setting leader: {e}")
     
-    # Method 4: Try creating with leader_id directly
+    # Method 4: PUT the whole settlement back with leader_id set
     try:
-        logger.info(f"Method 4: Trying to update settlement {settlement_id} with direct leader_id attribute")
-        settlement_response = requests.get(f"{api_base_url}/api/v1/settlements/{settlement_id}")
+        settlement_response = await client.get(f"/api/v1/settlements/{settlement_id}")
         if settlement_response.status_code == 200:
             settlement_data = settlement_response.json()
             settlement_data["leader_id"] = leader_id
             
-            update_response = requests.put(
-                f"{api_base_url}/api/v1/settlements/{settlement_id}",
-                json=settlement_data
-            )
-            
-            if update_response.status_code == 200 or update_response.status_code == 201:
+            update_response = await client.put(f"/api/v1/settlements/{settlement_id}", json=settlement_data)
+            if update_response.status_code in (200, 201):
                 logger.info(f"Successfully set leader {leader_name} (ID: {leader_id}) for settlement {settlement_name} using Method 4")
                 return True
-            else:
-                logger.warning(f"Method 4 failed with status {update_response.status_code}: {update_response.text}")
+            logger.warning(f"Method 4 failed with status {update_response.status_code}: {update_response.text}")
         else:
             logger.warning(f"Failed to get settlement data for Method 4: {settlement_response.status_code}")
     except Exception as e:
@@ -1085,6 +817,27 @@ def try_assign_leader(api_base_url: str, settlement_id: str, leader_id: str, lea
     logger.warning(f"All methods failed to assign leader {leader_name} to settlement {settlement_name}")
     return False
 
+# Tables in reverse dependency order (child tables first)
+TABLES_TO_TRUNCATE = [
+    # Child tables (many-to-one relationships)
+    "character_skills",
+    "building_instances",
+    "settlements",
+    "characters",
+    "blueprint_stage_features",
+    "blueprint_stages",
+    "building_upgrade_blueprints",
+    "building_blueprints",
+    "resources",
+    "skills",
+    "profession_definitions",
+    "locations",
+    "worlds",
+    # Parent tables
+    "biomes",
+    "themes"
+]
+
 def truncate_tables() -> None:
     """Truncate database tables in the correct order to remove existing data"""
     import psycopg2
@@ -1130,27 +883,6 @@ def truncate_tables() -> None:
         "port": db_port
     }
     
-    # Tables in reverse dependency order (child tables first)
-    tables_to_truncate = [
-        # Child tables (many-to-one relationships)
-        "character_skills",
-        "building_instances",
-        "settlements",
-        "characters",
-        "blueprint_stage_features",
-        "blueprint_stages",
-        "building_upgrade_blueprints",
-        "building_blueprints",
-        "resources",
-        "skills",
-        "profession_definitions",
-        "locations",
-        "worlds",
-        # Parent tables
-        "biomes",
-        "themes"
-    ]
-    
     try:
         # Connect to PostgreSQL
         conn = psycopg2.connect(**db_params)
@@ -1161,7 +893,7 @@ def truncate_tables() -> None:
         cursor.execute("SET CONSTRAINTS ALL DEFERRED;")
         
         # Truncate each table
-        for table in tables_to_truncate:
+        for table in TABLES_TO_TRUNCATE:
             try:
                 cursor.execute(f'TRUNCATE TABLE "{table}" CASCADE;')
                 logger.info(f"Truncated table: {table}")
@@ -1190,70 +922,65 @@ def truncate_tables() -> None:
         if conn:
             conn.close()
 
-def seed_world(api_base_url: str = "http://localhost:8000", skip_truncate: bool = False, force: bool = False) -> None:
+def seed_world(api_base_url: str = "http://localhost:8000", skip_truncate: bool = False, force: bool = False,
+               concurrency: int = 16, phase: Optional[int] = None) -> None:
     """
     Seed a complete game world with themes, characters, resources, buildings, and settlements
-    using a two-phase approach to avoid leader assignment issues.
-    
-    Phase 1: Create themes, world, characters, and resources
-    Phase 2: Create settlements with leaders and buildings
     
     Args:
         api_base_url: Base URL of the API server
         skip_truncate: Skip truncating tables before seeding
         force: Continue seeding even if truncation fails
+        concurrency: Maximum number of requests in flight
+        phase: Stop after this phase (only 1 is supported)
     """
     logger.info(f"Starting world seeding using API at {api_base_url}")
     
-    # Check if API server is running
-    try:
-        response = requests.get(f"{api_base_url}/status")
-        if response.status_code != 200:
-            logger.error(f"API server at {api_base_url} returned status code {response.status_code}")
-            return
-        logger.info(f"API server is running at {api_base_url}")
-    except requests.exceptions.ConnectionError:
-        logger.error(f"Cannot connect to API server at {api_base_url}. Is the server running?")
-        return
-    
     # Truncate tables before seeding
-    truncation_successful = True
     if not skip_truncate:
         try:
             truncate_tables()
         except Exception as e:
-            truncation_successful = False
             logger.error(f"Error during table truncation: {e}")
             
             if not force:
                 logger.error("Aborting seeding process. Use --force to continue anyway or --skip-truncate to skip truncation.")
                 return
-            else:
-                logger.warning("Continuing with seeding despite truncation failure (--force was specified)")
+            logger.warning("Continuing with seeding despite truncation failure (--force was specified)")
     else:
         logger.info("Skipping table truncation (--skip-truncate was specified)")
     
-    # Phase 1: Create foundation - themes, world, characters, and resources
-    logger.info("====== Starting Phase 1: Creating foundation entities ======")
-    theme_map, world_id, character_map, resource_map = phase1_create_foundation(api_base_url)
-    
-    if not all([theme_map, world_id, character_map, resource_map]):
-        logger.error("Phase 1 failed. Aborting seeding process.")
-        return
+    asyncio.run(seed_world_api(api_base_url, concurrency, phase))
+
+async def seed_world_api(api_base_url: str, concurrency: int = 16, phase: Optional[int] = None) -> None:
+    """Run the API phases on one pooled client and report throughput"""
+    async with SeedClient(api_base_url, concurrency=concurrency) as client:
+        if not await client.is_up():
+            return
+        logger.info(f"API server is running at {api_base_url}")
         
-    logger.info("Phase 1 completed successfully. Foundation entities created.")
-    
-    # Add a short pause to ensure database transactions are fully committed
-    logger.info("Pausing for 2 seconds to ensure database transactions are fully committed...")
-    time.sleep(2)
-    
-    # Phase 2: Create settlements with leaders and buildings
-    logger.info("====== Starting Phase 2: Creating settlements and buildings ======")
-    phase2_create_settlements_and_buildings(api_base_url, world_id, theme_map, character_map, resource_map)
-    
-    logger.info("World seeding completed successfully.")
+        # Phase 1: Create foundation - themes, world, characters, and resources
+        logger.info("====== Starting Phase 1: Creating foundation entities ======")
+        theme_map, world_id, character_map, resource_map = await phase1_create_foundation(client)
+        
+        if not all([theme_map, world_id, character_map, resource_map]):
+            logger.error("Phase 1 failed. Aborting seeding process.")
+        elif phase == 1:
+            # Print important IDs for reference when running phase 2 separately
+            logger.info("Phase 1 completed successfully.")
+            logger.info(f"World ID for phase 2: {world_id}")
+            logger.info(f"Character map for reference: {character_map}")
+        else:
+            logger.info("Phase 1 completed successfully. Foundation entities created.")
+            
+            # Every create call commits before it responds, so phase 2 can start straight away
+            logger.info("====== Starting Phase 2: Creating settlements and buildings ======")
+            await phase2_create_settlements_and_buildings(client, world_id, theme_map, character_map, resource_map)
+            logger.info("World seeding completed successfully.")
+        
+        print(client.stats.report())
 
-def phase1_create_foundation(api_base_url: str):
+async def phase1_create_foundation(client: SeedClient):
     """
     Phase 1 of the seeding process: Create all foundation entities
     
@@ -1261,45 +988,41 @@ def phase1_create_foundation(api_base_url: str):
         tuple: (theme_map, world_id, character_map, resource_map)
     """
     # Step 1: Create themes first
-    theme_map = create_themes(api_base_url)
+    theme_map = await create_themes(client)
     if not theme_map:
         logger.error("Failed to create themes. Phase 1 failed.")
         return None, None, None, None
     
     # Step 2: Create a world (requires a theme_id)
-    default_theme_id = next(iter(theme_map.values())) if theme_map else None
-    if not default_theme_id:
-        logger.error("No themes available to use for world creation. Phase 1 failed.")
-        return theme_map, None, None, None
-        
-    world_id = create_world(api_base_url, default_theme_id)
+    default_theme_id = next(iter(theme_map.values()))
+    world_id = await create_world(client, default_theme_id)
     if not world_id:
         logger.error("Failed to create world. Phase 1 failed.")
         return theme_map, None, None, None
     
-    # Step 3: Create characters with traits
-    character_map = create_characters(api_base_url, world_id, theme_map)
+    # Step 3: Characters and resources don't depend on each other, so create them together
+    character_map, resource_map = await asyncio.gather(
+        create_characters(client, world_id, theme_map),
+        create_resources(client, theme_map),
+    )
     if not character_map:
         logger.error("Failed to create characters. Phase 1 failed.")
         return theme_map, world_id, None, None
-        
     logger.info(f"Character map after creation: {character_map}")
     
-    # Step 4: Create resources for each theme
-    resource_map = create_resources(api_base_url, theme_map)
     if not resource_map:
         logger.error("Failed to create resources. Phase 1 failed.")
         return theme_map, world_id, character_map, None
     
     return theme_map, world_id, character_map, resource_map
 
-def phase2_create_settlements_and_buildings(api_base_url: str, world_id: str, theme_map: Dict[str, str], 
-                                           character_map: Dict[str, str], resource_map: Dict[str, str]):
+async def phase2_create_settlements_and_buildings(client: SeedClient, world_id: str, theme_map: Dict[str, str], 
+                                                  character_map: Dict[str, str], resource_map: Dict[str, str]):
     """
     Phase 2 of the seeding process: Create settlements with leaders and buildings
     
     Args:
-        api_base_url: Base URL of the API server
+        client: Seed client connected to the API server
         world_id: ID of the world to create settlements in
         theme_map: Mapping of theme names to IDs
         character_map: Mapping of character names to IDs
@@ -1310,39 +1033,19 @@ def phase2_create_settlements_and_buildings(api_base_url: str, world_id: str, th
         logger.error("Missing required data for Phase 2. Cannot proceed.")
         return
     
-    # Double-check that character_map contains all the characters we need
     required_characters = [template["leader_name"] for template in SETTLEMENT_TEMPLATES]
     missing_characters = [name for name in required_characters if name not in character_map]
     
-    # Print debug information about all the characters we have
-    logger.info(f"Character map before creating settlements: {character_map}")
-    logger.info(f"Required characters for leaders: {required_characters}")
-    
-    # One more verification - fetch all characters from the database to ensure they exist
-    try:
-        response = requests.get(f"{api_base_url}/api/v1/characters/?world_id={world_id}")
-        if response.status_code == 200:
-            characters = response.json()
-            if isinstance(characters, dict) and 'items' in characters:
-                characters = characters['items']
-            
-            if isinstance(characters, list):
-                logger.info(f"Database contains {len(characters)} characters for world {world_id}")
-                db_character_ids = {char['name']: char['id'] for char in characters if isinstance(char, dict) and 'name' in char}
-                logger.info(f"Characters in database: {db_character_ids}")
-                
-                # Update character_map with database values
-                for name, db_id in db_character_ids.items():
-                    if name in required_characters and name not in character_map:
-                        logger.info(f"Found missing character in database: {name} -> {db_id}")
-                        character_map[name] = db_id
-        else:
-            logger.warning(f"Failed to verify characters in database: {response.status_code}, {response.text}")
-    except Exception as e:
-        logger.warning(f"Error verifying characters in database: {e}")
-    
-    # Check again after database verification
-    missing_characters = [name for name in required_characters if name not in character_map]
+    # Fill any gaps from the database before giving up
+    if missing_characters:
+        try:
+            for name, db_id in (await fetch_world_characters(client, world_id)).items():
+                if name in missing_characters:
+                    logger.info(f"Found missing character in database: {name} -> {db_id}")
+                    character_map[name] = db_id
+        except Exception as e:
+            logger.warning(f"Error verifying characters in database: {e}")
+        missing_characters = [name for name in required_characters if name not in character_map]
     
     if missing_characters:
         logger.error(f"Missing required characters for settlements: {', '.join(missing_characters)}")
@@ -1351,53 +1054,60 @@ def phase2_create_settlements_and_buildings(api_base_url: str, world_id: str, th
     
     # Step 1: Create building blueprints for each theme with resource requirements
     logger.info("Creating building blueprints...")
-    create_buildings(api_base_url, theme_map, resource_map)
+    await create_buildings(client, theme_map, resource_map)
     
     # Step 2: Create settlements with leaders
     logger.info("Creating settlements with leaders...")
-    create_settlements(api_base_url, world_id, theme_map, character_map, resource_map)
+    await create_settlements(client, world_id, theme_map, character_map, resource_map)
     
     logger.info("Phase 2 completed successfully.")
 
+def seed_world_db(skip_truncate: bool = False) -> None:
+    """
+    Seed the same world straight into the database in one transaction.
+    Truncation runs inside that transaction, so a failed run keeps the old data.
+    """
+    from seed_db import run_seed_database
+
+    templates = {
+        "themes": THEMES,
+        "resources": RESOURCE_TEMPLATES,
+        "characters": CHARACTER_TEMPLATES,
+        "buildings": BUILDING_TEMPLATES,
+        "settlements": SETTLEMENT_TEMPLATES,
+    }
+    logger.info("Starting world seeding directly through the database")
+    run_seed_database(templates, truncate_tables=None if skip_truncate else TABLES_TO_TRUNCATE)
+    logger.info("World seeding completed successfully.")
+
 def main():
     """Parse arguments and run the seeding script."""
     parser = argparse.ArgumentParser(description="Seed a complete game world.")
+    parser.add_argument("--mode", choices=["db", "api"], default="db", help="Seed directly through the database (default) or through the API as a smoke test")
     parser.add_argument("--api-base-url", default="http://localhost:8000", help="Base URL of the API server")
+    parser.add_argument("--concurrency", type=int, default=16, help="Maximum concurrent API requests (API mode)")
     parser.add_argument("--skip-truncate", action="store_true", help="Skip truncating tables before seeding")
     parser.add_argument("--force", action="store_true", help="Continue seeding even if truncation fails")
     parser.add_argument("--phase", type=int, choices=[1, 2], help="Run only a specific phase (1 for foundation, 2 for settlements)")
     args = parser.parse_args()
     
-    if args.phase == 1:
+    if args.mode == "db":
+        # Phases only exist to work around per-request commits in the API path
+        if args.phase:
+            logger.warning("--phase is ignored in db mode; everything is seeded in one transaction")
+        seed_world_db(skip_truncate=args.skip_truncate)
+    elif args.phase == 1:
         # Run only phase 1
         logger.info("Running only Phase 1: Creating foundation entities")
-        api_base_url = args.api_base_url
-        
-        # Truncate if needed
-        if not args.skip_truncate:
-            try:
-                truncate_tables()
-            except Exception as e:
-                logger.error(f"Error during table truncation: {e}")
-                if not args.force:
-                    logger.error("Aborting seeding process. Use --force to continue anyway.")
-                    return
-        
-        # Run phase 1
-        theme_map, world_id, character_map, resource_map = phase1_create_foundation(api_base_url)
-        if all([theme_map, world_id, character_map, resource_map]):
-            logger.info("Phase 1 completed successfully.")
-            # Print important IDs for reference when running phase 2 separately
-            logger.info(f"World ID for phase 2: {world_id}")
-            logger.info(f"Character map for reference: {character_map}")
-        else:
-            logger.error("Phase 1 failed.")
+        seed_world(api_base_url=args.api_base_url, skip_truncate=args.skip_truncate, force=args.force,
+                   concurrency=args.concurrency, phase=1)
     elif args.phase == 2:
         logger.error("Running only Phase 2 directly is not supported yet.")
         logger.error("Please run Phase 1 first, then modify this script to use the generated IDs for Phase 2.")
     else:
         # Run the full seeding process
-        seed_world(api_base_url=args.api_base_url, skip_truncate=args.skip_truncate, force=args.force)
+        seed_world(api_base_url=args.api_base_url, skip_truncate=args.skip_truncate, force=args.force,
+                   concurrency=args.concurrency)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+Direct-to-database seeding used by seed_complete.py.
+
+Reads utils/data/*.json and writes every table with bulk upserts, in dependency
+order, inside a single transaction. Files that are still empty fall back to the
+templates defined in seed_complete.py, so both seeding modes produce the same world.
+
+Name -> UUID maps (themes, resources, characters, blueprints) are resolved in
+memory from RETURNING clauses, so dependants are built without extra lookups.
+Every table is upserted on a natural key, which makes the run idempotent:
+seeding twice leaves the database unchanged.
+
+Usage:
+    python utils/seed_complete.py --mode db [--skip-truncate]
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Add the parent directory to the path so we can import from app
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.biome import Biome
+from app.db.models.blueprint_stage import BlueprintStage
+from app.db.models.building_blueprint import BuildingBlueprint
+from app.db.models.character import Character
+from app.db.models.resources.resource_blueprint import ResourceBlueprint
+from app.db.models.settlement import Settlement
+from app.db.models.theme import ThemeDB
+from app.db.models.world import World
+from app.game_state.enums.character import CharacterStatusEnum, CharacterTraitEnum, CharacterTypeEnum
+from app.game_state.enums.shared import RarityEnum, StatusEnum
+
+logger = logging.getLogger(__name__)
+
+# Path to the seed data files
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+SEED_WORLD_NAME = "Seed World"
+
+# Rows per multi-row INSERT statement
+CHUNK_SIZE = 500
+
+
+# ==============================================================================
+# DATA LOADING
+# ==============================================================================
+
+def load_data_files(data_dir: str = DATA_DIR) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Load every non-empty utils/data/NN_<kind>.json file, keyed by <kind>.
+    e.g. 00_themes.json -> "themes", 09_biomes.json -> "biomes".
+    """
+    data: Dict[str, List[Dict[str, Any]]] = {}
+    for filename in sorted(os.listdir(data_dir)):
+        if not filename.endswith(".json"):
+            continue
+        path = os.path.join(data_dir, filename)
+        if os.path.getsize(path) == 0:
+            continue
+
+        kind = os.path.splitext(filename)[0].split("_", 1)[-1]
+        with open(path, "r") as f:
+            data[kind] = json.load(f)
+        logger.info(f"Loaded {len(data[kind])} {kind} from {filename}")
+    return data
+
+
+def build_seed_data(files: Dict[str, List[Dict[str, Any]]], templates: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Merge data files with the seed_complete.py templates into flat per-kind lists.
+    Data files win; templates fill in kinds whose files are empty.
+    """
+    def flatten_by_theme(by_theme: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        return [{**item, "theme_name": theme_name} for theme_name, items in by_theme.items() for item in items]
+
+    themes = files.get("themes") or [
+        {"name": t["theme_name"], "description": t.get("theme_description")} for t in templates.get("themes", [])
+    ]
+
+    return {
+        "themes": themes,
+        "biomes": files.get("biomes", []),
+        "resources": files.get("resources") or flatten_by_theme(templates.get("resources", {})),
+        "characters": files.get("npcs") or list(templates.get("characters", [])),
+        "building_blueprints": files.get("building_blueprints") or flatten_by_theme(templates.get("buildings", {})),
+        "settlements": files.get("settlements") or list(templates.get("settlements", [])),
+    }
+
+
+# ==============================================================================
+# UPSERT HELPERS
+# ==============================================================================
+
+class TableTimings:
+    """Collects (table, rows, seconds) for the end-of-run report."""
+
+    def __init__(self):
+        self.entries: List[Tuple[str, int, float]] = []
+
+    def add(self, table: str, rows: int, started: float) -> None:
+        self.entries.append((table, rows, time.perf_counter() - started))
+
+    def report(self) -> str:
+        lines = [f"{'table':<24}{'rows':>8}{'ms':>12}"]
+        for table, rows, seconds in self.entries:
+            lines.append(f"{table:<24}{rows:>8}{seconds * 1000:>12.1f}")
+        total = sum(seconds for _, _, seconds in self.entries)
+        lines.append(f"{'total':<24}{sum(r for _, r, _ in self.entries):>8}{total * 1000:>12.1f}")
+        return "\n".join(lines)
+
+
+async def upsert_rows(
+    session: AsyncSession,
+    table,
+    rows: List[Dict[str, Any]],
+    conflict_columns: Sequence[str],
+    returning: Sequence[str] = ("id",),
+) -> List[Any]:
+    """
+    INSERT ... ON CONFLICT (conflict_columns) DO UPDATE in chunks, returning the
+    requested columns for every row. On conflict the existing primary key is kept,
+    so returned ids are always the ones stored in the database.
+    """
+    if not rows:
+        return []
+
+    # Postgres rejects a statement that hits the same conflict key twice; last row wins
+    rows = list({tuple(row[c] for c in conflict_columns): row for row in rows}.values())
+
+    returned: List[Any] = []
+    for start in range(0, len(rows), CHUNK_SIZE):
+        chunk = rows[start:start + CHUNK_SIZE]
+        stmt = pg_insert(table).values(chunk)
+        update_columns = {
+            name: stmt.excluded[name]
+            for name in chunk[0]
+            if name not in conflict_columns and name != "id"
+        }
+        stmt = stmt.on_conflict_do_update(index_elements=list(conflict_columns), set_=update_columns)
+        stmt = stmt.returning(*(table.c[name] for name in returning))
+        result = await session.execute(stmt)
+        returned.extend(result.all())
+    return returned
+
+
+async def existing_ids_by_name(session: AsyncSession, table, world_id: uuid.UUID) -> Dict[str, uuid.UUID]:
+    """name -> id for a world-scoped table that has no unique constraint on name."""
+    result = await session.execute(select(table.c.name, table.c.id).where(table.c.world_id == world_id))
+    return {name: row_id for name, row_id in result.all()}
+
+
+# ==============================================================================
+# TABLE SEEDERS (dependency order)
+# ==============================================================================
+
+async def seed_themes(session: AsyncSession, themes: List[Dict[str, Any]]) -> Dict[str, uuid.UUID]:
+    rows = [{"id": uuid.uuid4(), "name": t["name"], "description": t.get("description")} for t in themes]
+    returned = await upsert_rows(session, ThemeDB.__table__, rows, ["name"], returning=("id", "name"))
+    return {name: theme_id for theme_id, name in returned}
+
+
+async def seed_biomes(session: AsyncSession, biomes: List[Dict[str, Any]]) -> Dict[str, uuid.UUID]:
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "biome_id": b["biome_id"],
+            "name": b["name"],
+            "display_name": b.get("display_name", b["name"]),
+            "description": b.get("description"),
+            "base_movement_modifier": b.get("base_movement_modifier", 1.0),
+            "danger_level_base": b.get("danger_level_base", 1),
+            "resource_types": b.get("resource_types", {}),
+            "color_hex": b.get("color_hex"),
+            "icon_path": b.get("icon_path"),
+        }
+        for b in biomes
+    ]
+    returned = await upsert_rows(session, Biome.__table__, rows, ["biome_id"], returning=("id", "biome_id"))
+    return {code: biome_id for biome_id, code in returned}
+
+
+async def seed_world_row(session: AsyncSession, theme_id: uuid.UUID) -> uuid.UUID:
+    """The seed world has no unique key, so reuse the first world with the seed name."""
+    result = await session.execute(
+        select(World.id).where(World.name == SEED_WORLD_NAME).order_by(World.created_at).limit(1)
+    )
+    world_id = result.scalar_one_or_none() or uuid.uuid4()
+    row = {"id": world_id, "name": SEED_WORLD_NAME, "theme_id": theme_id, "size": 1000}
+    await upsert_rows(session, World.__table__, [row], ["id"])
+    return world_id
+
+
+async def seed_resources(session: AsyncSession, resources: List[Dict[str, Any]], theme_map: Dict[str, uuid.UUID]) -> Dict[str, uuid.UUID]:
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "name": r["name"],
+            "description": r.get("description"),
+            "rarity": RarityEnum(r.get("rarity", "Common")),
+            "stack_size": r.get("stack_size", 100),
+            "status": StatusEnum(r.get("status", "Active")),
+            "theme_id": theme_map[r["theme_name"]],
+        }
+        for r in resources if r.get("theme_name") in theme_map
+    ]
+    returned = await upsert_rows(session, ResourceBlueprint.__table__, rows, ["name"], returning=("id", "name"))
+    return {name: resource_id for resource_id, name in returned}
+
+
+async def seed_characters(session: AsyncSession, characters: List[Dict[str, Any]], world_id: uuid.UUID) -> Dict[str, uuid.UUID]:
+    existing = await existing_ids_by_name(session, Character.__table__, world_id)
+    rows = [
+        {
+            "id": existing.get(c["name"], uuid.uuid4()),
+            "name": c["name"],
+            "description": c.get("description"),
+            "character_type": CharacterTypeEnum(c.get("character_type", "NPC")),
+            "character_traits": [CharacterTraitEnum(t) for t in c.get("traits", [])],
+            "status": CharacterStatusEnum.ALIVE,
+            "stats": {},
+            "equipment": {},
+            "world_id": world_id,
+        }
+        for c in characters
+    ]
+    returned = await upsert_rows(session, Character.__table__, rows, ["id"], returning=("id", "name"))
+    return {name: character_id for character_id, name in returned}
+
+
+async def seed_building_blueprints(
+    session: AsyncSession,
+    buildings: List[Dict[str, Any]],
+    theme_map: Dict[str, uuid.UUID],
+    resource_map: Dict[str, uuid.UUID],
+    timings: TableTimings,
+) -> Dict[Tuple[str, uuid.UUID], uuid.UUID]:
+    """Blueprints plus their single construction stage, mirroring what the API path creates."""
+    started = time.perf_counter()
+    buildings = [b for b in buildings if b.get("theme_name") in theme_map]
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "name": b["name"],
+            "description": b.get("description"),
+            "theme_id": theme_map[b["theme_name"]],
+            "is_unique_per_settlement": False,
+            "_metadata": {
+                "category": b["attributes"][0] if b.get("attributes") else "BASIC",
+                "attributes": b.get("attributes", []),
+            },
+        }
+        for b in buildings
+    ]
+    returned = await upsert_rows(
+        session, BuildingBlueprint.__table__, rows, ["name", "theme_id"], returning=("id", "name", "theme_id")
+    )
+    blueprint_map = {(name, theme_id): blueprint_id for blueprint_id, name, theme_id in returned}
+    timings.add("building_blueprints", len(rows), started)
+
+    started = time.perf_counter()
+    stage_rows = [
+        {
+            "id": uuid.uuid4(),
+            "building_blueprint_id": blueprint_map[(b["name"], theme_map[b["theme_name"]])],
+            "stage_number": 1,
+            "name": f"Build {b['name']}",
+            "description": f"Construction of {b['name']}",
+            "duration_days": 3.0,
+            "resource_costs": [
+                {"resource_id": str(resource_map[name]), "amount": amount}
+                for name, amount in b.get("resource_requirements", {}).items()
+                if name in resource_map
+            ],
+            "profession_time_bonus": [],
+            "stage_completion_bonuses": [],
+        }
+        for b in buildings
+    ]
+    await upsert_rows(session, BlueprintStage.__table__, stage_rows, ["building_blueprint_id", "stage_number"])
+    timings.add("blueprint_stages", len(stage_rows), started)
+
+    return blueprint_map
+
+
+async def seed_settlements(
+    session: AsyncSession,
+    settlements: List[Dict[str, Any]],
+    world_id: uuid.UUID,
+    character_map: Dict[str, uuid.UUID],
+) -> Dict[str, uuid.UUID]:
+    existing = await existing_ids_by_name(session, Settlement.__table__, world_id)
+    rows = [
+        {
+            "id": existing.get(s["name"], uuid.uuid4()),
+            "name": s["name"],
+            "world_id": world_id,
+            "population": s.get("population", 0),
+            "resources": s.get("resources", {}),
+            "leader_id": character_map.get(s.get("leader_name")),
+        }
+        for s in settlements
+    ]
+    returned = await upsert_rows(session, Settlement.__table__, rows, ["id"], returning=("id", "name"))
+    return {name: settlement_id for settlement_id, name in returned}
+
+
+# ==============================================================================
+# ENTRY POINT
+# ==============================================================================
+
+async def seed_database(
+    templates: Dict[str, Any],
+    truncate_tables: Optional[Sequence[str]] = None,
+    data_dir: str = DATA_DIR,
+) -> TableTimings:
+    """
+    Seed everything in one transaction. If truncate_tables is given, those tables
+    are truncated first inside the same transaction, so a failed run leaves the
+    previous data in place.
+    """
+    from app.db.async_session import get_session
+
+    data = build_seed_data(load_data_files(data_dir), templates)
+    timings = TableTimings()
+
+    session = await get_session()
+    async with session:
+        async with session.begin():
+            if truncate_tables:
+                started = time.perf_counter()
+                # Some legacy table names may not exist; a failing TRUNCATE would abort the transaction
+                result = await session.execute(
+                    text("SELECT tablename FROM pg_tables WHERE schemaname = current_schema() AND tablename = ANY(:names)"),
+                    {"names": list(truncate_tables)},
+                )
+                present = [row[0] for row in result.all()]
+                if present:
+                    quoted = ", ".join(f'"{table}"' for table in present)
+                    await session.execute(text(f"TRUNCATE TABLE {quoted} CASCADE"))
+                timings.add("(truncate)", len(present), started)
+
+            started = time.perf_counter()
+            theme_map = await seed_themes(session, data["themes"])
+            timings.add("themes", len(theme_map), started)
+            if not theme_map:
+                raise ValueError("No themes to seed; every other table depends on them")
+
+            started = time.perf_counter()
+            biome_map = await seed_biomes(session, data["biomes"])
+            timings.add("biomes", len(biome_map), started)
+
+            started = time.perf_counter()
+            world_id = await seed_world_row(session, next(iter(theme_map.values())))
+            timings.add("worlds", 1, started)
+
+            started = time.perf_counter()
+            resource_map = await seed_resources(session, data["resources"], theme_map)
+            timings.add("resources", len(resource_map), started)
+
+            started = time.perf_counter()
+            character_map = await seed_characters(session, data["characters"], world_id)
+            timings.add("characters", len(character_map), started)
+
+            await seed_building_blueprints(session, data["building_blueprints"], theme_map, resource_map, timings)
+
+            started = time.perf_counter()
+            settlement_map = await seed_settlements(session, data["settlements"], world_id, character_map)
+            timings.add("settlements", len(settlement_map), started)
+
+    logger.info(f"Seeded world {world_id} with {len(settlement_map)} settlements")
+    return timings
+
+
+def run_seed_database(templates: Dict[str, Any], truncate_tables: Optional[Sequence[str]] = None) -> None:
+    """Blocking wrapper for scripts; prints per-table timings."""
+    timings = asyncio.run(seed_database(templates, truncate_tables))
+    print(timings.report())
@@ -4,9 +4,9 @@ Seed script to create resource node blueprints for existing resources via API.
 """
 
 import asyncio
-import httpx
-import json
-from typing import List, Dict, Any
+from typing import Dict, Any
+
+from seed_client import SeedClient
 
 # Base API URL
 BASE_URL = "http://localhost:8000/api/v1"
@@ -217,57 +217,43 @@ RESOURCE_NODE_BLUEPRINTS = [
     }
 ]
 
-async def create_resource_node_blueprint(client: httpx.AsyncClient, blueprint_data: Dict[str, Any]) -> bool:
+async def create_resource_node_blueprint(client: SeedClient, blueprint_data: Dict[str, Any]) -> bool:
     """Create a single resource node blueprint via API."""
-    try:
-        response = await client.post(
-            f"{BASE_URL}/resource-node-blueprints/",
-            json=blueprint_data
-        )
-        if response.status_code == 201:
-            result = response.json()
-            print(f"✅ Created blueprint: {blueprint_data['name']} (ID: {result.get('id', 'unknown')})")
-            return True
-        else:
-            print(f"❌ Failed to create {blueprint_data['name']}: {response.status_code} - {response.text}")
-            return False
-    except Exception as e:
-        print(f"❌ Error creating {blueprint_data['name']}: {e}")
-        return False
+    response = await client.post("/resource-node-blueprints/", json=blueprint_data)
+    if response.status_code == 201:
+        result = response.json()
+        print(f"✅ Created blueprint: {blueprint_data['name']} (ID: {result.get('id', 'unknown')})")
+        return True
+    print(f"❌ Failed to create {blueprint_data['name']}: {response.status_code} - {response.text}")
+    return False
 
-async def seed_resource_node_blueprints():
+async def seed_resource_node_blueprints(concurrency: int = 16):
     """Main function to seed all resource node blueprints."""
     print("🌱 Starting resource node blueprint seeding...")
     print(f"📡 API Base URL: {BASE_URL}")
     print(f"📦 Total blueprints to create: {len(RESOURCE_NODE_BLUEPRINTS)}")
     print("-" * 60)
     
-    success_count = 0
-    
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with SeedClient(BASE_URL, concurrency=concurrency) as client:
         # Test API connectivity
-        try:
-            health_response = await client.get(f"{BASE_URL.replace('/api/v1', '')}/status")
-            if health_response.status_code != 200:
-                print(f"❌ API health check failed: {health_response.status_code}")
-                return
-            print("✅ API connectivity confirmed")
-            print("-" * 60)
-        except Exception as e:
-            print(f"❌ Cannot connect to API: {e}")
+        if not await client.is_up(f"{BASE_URL.replace('/api/v1', '')}/status"):
+            print("❌ Cannot connect to API")
             return
+        print("✅ API connectivity confirmed")
+        print("-" * 60)
         
-        # Create each blueprint
-        for blueprint in RESOURCE_NODE_BLUEPRINTS:
-            success = await create_resource_node_blueprint(client, blueprint)
-            if success:
-                success_count += 1
-            
-            # Small delay between requests
-            await asyncio.sleep(0.1)
+        # Blueprints are independent of each other, so create them concurrently
+        results = await client.run_stage(
+            "resource_node_blueprints",
+            RESOURCE_NODE_BLUEPRINTS,
+            lambda blueprint: create_resource_node_blueprint(client, blueprint),
+        )
+        stats_report = client.stats.report()
     
+    success_count = sum(1 for result in results if result)
     print("-" * 60)
     print(f"🎉 Seeding complete! {success_count}/{len(RESOURCE_NODE_BLUEPRINTS)} blueprints created successfully")
+    print(stats_report)
     
     if success_count < len(RESOURCE_NODE_BLUEPRINTS):
         failed_count = len(RESOURCE_NODE_BLUEPRINTS) - success_count
@@ -0,0 +1,118 @@
+# startup_benchmark.py
+"""
+Import-time benchmark for the API and the Celery workers.
+
+Each target is imported in a fresh interpreter under `python -X importtime`,
+so the numbers are true cold starts. Reports the total import time, the
+slowest modules by cumulative time and any web-stack modules a worker target
+pulled in (workers must not import FastAPI or the routers).
+
+Usage:
+    python utils/startup_benchmark.py                 # all targets, 5 runs each
+    python utils/startup_benchmark.py api worker -n 10 --top 20
+    API_ROUTER_GROUPS=world,resources python utils/startup_benchmark.py api
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Code run by each target; it must end with the process fully started
+TARGETS: Dict[str, str] = {
+    "api": "from app.api.fastapi import fastapi",
+    "worker": (
+        "from app.core.celery_app import app\n"
+        "import importlib\n"
+        "for module in app.conf.imports: importlib.import_module(module)"
+    ),
+    "models": "import app.db.models",
+}
+
+# Modules a worker process must never import
+WEB_STACK_PREFIXES = ("fastapi", "starlette", "fastapi_swagger_dark", "app.api.routes", "app.api.fastapi", "app.api.app_factory")
+
+# "import time: self [us] | cumulative | imported package"
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def run_target(code: str) -> List[Tuple[str, int, int, int]]:
+    """Import a target in a fresh interpreter; returns (module, self_us, cumulative_us, depth) rows."""
+    env = dict(os.environ)
+    # The engine is created lazily, but keep targets importable without a .env
+    for key, value in (("DBNAME", "bench"), ("DBHOST", "localhost"), ("DBPORT", "5432"), ("DBUSER", "bench"), ("DBPASSWORD", "bench")):
+        env.setdefault(key, value)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        tail = result.stderr.strip().splitlines()[-5:]
+        raise RuntimeError("Target failed to import:\n" + "\n".join(tail))
+
+    rows = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append((module, int(self_us), int(cumulative_us), len(indent) // 2))
+    return rows
+
+
+def summarize(name: str, runs: int, top: int) -> Dict[str, object]:
+    """Run a target `runs` times and summarize the import timings."""
+    totals = []
+    cumulative: Dict[str, List[int]] = {}
+    modules: List[str] = []
+    for _ in range(runs):
+        rows = run_target(TARGETS[name])
+        # Top-level imports (depth 0) add up to the whole import time
+        totals.append(sum(cum for _, _, cum, depth in rows if depth == 0))
+        for module, _, cum, _ in rows:
+            cumulative.setdefault(module, []).append(cum)
+        modules = [module for module, _, _, _ in rows]
+
+    slowest = sorted(
+        ((module, statistics.median(values)) for module, values in cumulative.items()),
+        key=lambda item: item[1], reverse=True,
+    )[:top]
+    web_stack = sorted({m for m in modules if m.startswith(WEB_STACK_PREFIXES)})
+    return {
+        "target": name,
+        "median_ms": statistics.median(totals) / 1000,
+        "min_ms": min(totals) / 1000,
+        "modules": len(modules),
+        "slowest": slowest,
+        "web_stack": web_stack,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Cold-start import benchmark")
+    parser.add_argument("targets", nargs="*", help=f"any of {', '.join(TARGETS)} (default: all)")
+    parser.add_argument("-n", "--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+    unknown = set(args.targets) - TARGETS.keys()
+    if unknown:
+        parser.error(f"unknown targets: {', '.join(sorted(unknown))}")
+
+    failed = False
+    for name in args.targets or list(TARGETS):
+        report = summarize(name, args.runs, args.top)
+        print(f"\n=== {name}: median {report['median_ms']:.1f} ms, min {report['min_ms']:.1f} ms, "
+              f"{report['modules']} modules ({args.runs} runs)")
+        for module, cum in report["slowest"]:
+            print(f"  {cum / 1000:8.1f} ms  {module}")
+        if name == "worker" and report["web_stack"]:
+            failed = True
+            print(f"  !! worker imports the web stack: {', '.join(report['web_stack'])}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+# world_snapshot.py
+"""
+World snapshot CLI.
+
+    python utils/world_snapshot.py export <world_id> [-o FILE] [--codec arrow|msgpack|json]
+    python utils/world_snapshot.py restore <FILE> [--name NAME] [--keep-ids]
+    python utils/world_snapshot.py info <FILE>
+
+Relative files are read from and written to SNAPSHOT_DIR. A restore runs in
+one transaction: it either loads the whole world or nothing.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+from uuid import UUID
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import get_settings
+from app.game_state.workers.snapshot_worker import _export_world_snapshot_async, _restore_world_snapshot_async
+
+
+def info(path: str) -> dict:
+    from app.game_state.managers.world_snapshot_manager import SnapshotReader
+
+    with open(path, "rb") as fileobj:
+        reader = SnapshotReader(fileobj)
+        for _ in reader.batches():
+            pass
+    manifest = {key: value for key, value in reader.manifest.items() if key != "tables"}
+    return {**manifest, "counts": reader.counts, "size_bytes": os.path.getsize(path)}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="World snapshot export/restore")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser("export", help="Write a snapshot of a world")
+    export.add_argument("world_id", type=UUID)
+    export.add_argument("-o", "--output", help="Snapshot file (default: world-<id>.snap)")
+    export.add_argument("--codec", choices=["arrow", "msgpack", "json"], help="Default: best installed")
+
+    restore = commands.add_parser("restore", help="Load a snapshot")
+    restore.add_argument("file")
+    restore.add_argument("--name", help="Name of the restored world (default: '<name> (copy)')")
+    restore.add_argument("--keep-ids", action="store_true", help="Keep the original UUIDs instead of cloning")
+
+    show = commands.add_parser("info", help="Show a snapshot's manifest and row counts")
+    show.add_argument("file")
+
+    args = parser.parse_args()
+
+    if args.command == "export":
+        result = asyncio.run(_export_world_snapshot_async(
+            str(args.world_id), args.output or f"world-{args.world_id}.snap", args.codec
+        ))
+    elif args.command == "restore":
+        result = asyncio.run(_restore_world_snapshot_async(args.file, args.name, not args.keep_ids))
+    else:
+        result = info(get_settings().snapshot_path(args.file))
+        result["success"] = True
+
+    print(json.dumps(result, indent=2, default=str))
+    return 0 if result.get("success") else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())